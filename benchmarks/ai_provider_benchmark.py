@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+AI provider retry benchmark
+Sends concurrent HuggingFace requests through OptimizedHuggingFaceClient's
+retry loop against the in-process provider stand-in, with a seeded latency,
+error rate and rate limit, and reports end-to-end latency, success rate and
+how many requests the stand-in rate-limited or failed.
+
+Usage:
+    python benchmarks/ai_provider_benchmark.py [--requests 40] [--concurrency 8] [--latency-ms 200]
+                                               [--jitter-ms 50] [--error-rate 0.05] [--rate-limit 5] [--seed 0]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'family_manager'))
+
+from ai_providers import OptimizedHuggingFaceClient
+from mock_ai_server import FaultProfile, ReplayEngine, ReplayTransport
+from provider_transport import HUGGINGFACE, set_transport
+
+# A reply the client's meal plan validation accepts
+MEAL_PLAN = '{"meals": {"Dinner": {"name": "Mock stew", "ingredients": ["2 cups rice"], "recipe": "Simmer"}}}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure provider retries against a faulty stand-in")
+    parser.add_argument('--requests', type=int, default=40)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--latency-ms', type=float, default=200.0)
+    parser.add_argument('--jitter-ms', type=float, default=50.0)
+    parser.add_argument('--error-rate', type=float, default=0.05)
+    parser.add_argument('--rate-limit', type=float, default=5.0, help="Requests per second before 429s")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    recordings = {f"{HUGGINGFACE}/v1/chat/completions": [{'status': 200, 'body': {
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': MEAL_PLAN}}]}}]}
+    profile = FaultProfile(args.latency_ms, args.jitter_ms, args.error_rate, rate_limit=args.rate_limit,
+                           seed=args.seed)
+    engine = ReplayEngine(recordings, profile)
+    previous = set_transport(ReplayTransport(engine))
+
+    client = OptimizedHuggingFaceClient(api_key="hf_mock")
+    model = client.models['balanced']
+
+    def one_request(i):
+        start = time.perf_counter()
+        content = client._make_request_with_retry(f"Plan dinner {i}", model, 'meal_plan')
+        return time.perf_counter() - start, content is not None
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            results = list(pool.map(one_request, range(args.requests)))
+        wall = time.perf_counter() - start
+    finally:
+        set_transport(previous)
+
+    latencies = sorted(seconds * 1000 for seconds, _ in results)
+    succeeded = sum(ok for _, ok in results)
+    stats = engine.stats().get(HUGGINGFACE, {})
+    print(f"{args.requests} requests, concurrency {args.concurrency}, "
+          f"stand-in latency {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms, "
+          f"error rate {args.error_rate:.0%}, rate limit {args.rate_limit:g}/s")
+    print(f"  succeeded        {succeeded}/{args.requests}")
+    print(f"  latency p50      {statistics.median(latencies):8.0f} ms")
+    print(f"  latency p95      {latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]:8.0f} ms")
+    print(f"  wall time        {wall * 1000:8.0f} ms")
+    print(f"  provider calls   {stats.get('requests', 0)} "
+          f"({stats.get('rate_limited', 0)} rate limited, {stats.get('errors', 0)} failed)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
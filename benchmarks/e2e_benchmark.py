@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark suite
+Generates a seeded synthetic household (see synthetic_household.py) and
+times the app's real code paths against it headlessly: the reporting and
+forecasting queries, notification triggers and feeds, smart shopping list
+generation, the inventory tab and the mobile API. Results are written as
+JSON and compared with a recorded baseline; scenarios whose dependencies
+(PyQt6, Flask, numpy) are not installed are reported as skipped.
+
+Usage:
+    python benchmarks/e2e_benchmark.py [--size medium] [--seed 42] [--runs 5] [--scenario reporting]
+                                       [--output e2e_results.json] [--tolerance 0.25] [--min-delta-ms 2]
+                                       [--update-baseline]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import sqlite3
+import argparse
+import platform
+import tempfile
+import statistics
+import importlib.util
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'family_manager'))
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from synthetic_household import PRESETS, build_household
+
+# Written to the current directory, not the source tree
+RESULTS_FILE = 'e2e_results.json'
+BASELINE_FILE = os.path.join(ROOT, 'benchmarks', 'e2e_baseline.json')
+
+# The app opens this relative path, so every scenario runs with the
+# temporary directory as the working directory
+DB_NAME = 'family_manager.db'
+
+
+class Scenario(NamedTuple):
+    """A timed end-to-end operation"""
+    name: str
+    prepare: Callable[[str], Callable[[], object]]  # db path -> the operation to time
+    requires: Tuple[str, ...] = ()
+    mutates: bool = False  # restore the database before every run
+
+
+SCENARIOS: List[Scenario] = []
+
+
+def scenario(name, requires=(), mutates=False):
+    """Register a prepare function as a scenario"""
+    def decorator(prepare):
+        SCENARIOS.append(Scenario(name, prepare, tuple(requires), mutates))
+        return prepare
+    return decorator
+
+
+def _year_ago():
+    return (date.today() - timedelta(days=365)).isoformat()
+
+
+@scenario('reporting')
+def reporting(db_path):
+    from analytics_service import AnalyticsService
+
+    def run():
+        # A fresh service each run, so nothing is served from its memo
+        service = AnalyticsService(db_path)
+        try:
+            since, today = _year_ago(), date.today().isoformat()
+            service.total_spent(since)
+            service.monthly_totals(since)
+            service.category_totals(since)
+            service.month_category_totals(since)
+            service.weekday_totals(since, today)
+            service.bills_summary()
+            service.inventory_value()
+            return service.budget_performance()
+        finally:
+            service.close()
+    return run
+
+
+@scenario('forecasting', requires=('numpy',))
+def forecasting(db_path):
+    from analytics_service import AnalyticsService
+    from forecasting import ExpenseSeries, forecast_all
+
+    def run():
+        service = AnalyticsService(db_path)
+        try:
+            # Same window as the dashboard's forecast panel
+            three_years_ago = (date.today() - timedelta(days=3 * 365)).replace(day=1).isoformat()
+            last_complete_month = (date.today().replace(day=1) - timedelta(days=1)).isoformat()[:7]
+            series = ExpenseSeries.from_rows(service.month_category_totals(three_years_ago),
+                                             through=last_complete_month)
+            return forecast_all(series, horizon=4)
+        finally:
+            service.close()
+    return run
+
+
+@scenario('notification_triggers', mutates=True)
+def notification_triggers(db_path):
+    from notification_manager import NotificationManager
+    from notification_triggers import NotificationTriggers
+
+    triggers = NotificationTriggers(db_path, NotificationManager(db_path))
+
+    def run():
+        if not triggers.check_all_triggers():
+            raise RuntimeError("check_all_triggers failed, see the log")
+    return run
+
+
+@scenario('notification_feed')
+def notification_feed(db_path):
+    from notification_manager import NotificationManager
+
+    manager = NotificationManager(db_path)
+    with sqlite3.connect(db_path) as conn:
+        members = [row[0] for row in conn.execute("SELECT id FROM family_members")]
+
+    def run():
+        for member in members:
+            manager.get_notifications(member, limit=50)
+            manager.get_notifications(member, unread_only=True, limit=50)
+            manager.get_unread_count(member)
+    return run
+
+
+@scenario('smart_shopping_list', requires=('PyQt6',))
+def smart_shopping_list(db_path):
+    from ai_providers import SmartShoppingListGenerator
+    from meal_ingredients import aggregate_ingredients
+
+    preferences = {'family_size': 4, 'bulk_purchase_preference': 'moderate'}
+
+    def run():
+        # Same inputs as FamilyManagerApp.auto_generate_shopping
+        conn = sqlite3.connect(db_path)
+        try:
+            start = date.today()
+            required = aggregate_ingredients(conn.cursor(), start.isoformat(),
+                                             (start + timedelta(days=14)).isoformat())
+            inventory = [
+                {'name': name, 'category': category or 'Uncategorized', 'qty': qty or 0, 'unit': unit or 'each',
+                 'exp_date': exp_date, 'location': location, 'purchase_price': price or 0}
+                for name, category, qty, unit, exp_date, location, price in conn.execute(
+                    "SELECT name, category, qty, unit, exp_date, location, purchase_price"
+                    " FROM inventory ORDER BY category, name")
+            ]
+        finally:
+            conn.close()
+        return SmartShoppingListGenerator().generate_optimized_list({}, inventory, preferences,
+                                                                    required_ingredients=required)
+    return run
+
+
+def _application():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([sys.argv[0]])
+
+
+@scenario('ui_startup', requires=('PyQt6',))
+def ui_startup(db_path):
+    app = _application()
+    import main
+
+    def run():
+        window = main.FamilyManagerApp()
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return run
+
+
+@scenario('ui_inventory', requires=('PyQt6',))
+def ui_inventory(db_path):
+    _application()
+    import main
+
+    window = main.FamilyManagerApp()
+    window.tabs.ensure_built('inventory')
+
+    def run():
+        window.load_inventory()
+        window.populate_category_tree()
+    run.window = window  # keep the window alive between runs
+    return run
+
+
+API_PATHS = [
+    '/api/inventory', '/api/meals', '/api/shopping', '/api/bills', '/api/expenses', '/api/suggestions',
+    '/api/notifications?recipient_id=1', '/api/notifications/unread-count?recipient_id=1', '/api/metrics',
+]
+
+
+@scenario('api', requires=('flask',))
+def api(db_path):
+    import api as api_module
+
+    client = api_module.app.test_client()
+
+    def run():
+        for path in API_PATHS:
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f"GET {path} returned {response.status_code}")
+    return run
+
+
+def missing_requirements(required) -> List[str]:
+    return [module for module in required if importlib.util.find_spec(module) is None]
+
+
+def run_scenario(item: Scenario, template: str, work_dir: str, runs: int) -> Dict:
+    """Time one scenario on a fresh copy of the household database"""
+    missing = missing_requirements(item.requires)
+    if missing:
+        return {'status': 'skipped', 'reason': f"missing {', '.join(missing)}"}
+
+    db_path = os.path.join(work_dir, DB_NAME)
+    shutil.copyfile(template, db_path)
+    try:
+        operation = item.prepare(db_path)
+        # Restore to the state after setup (indexes and tables the code creates itself)
+        prepared = os.path.join(work_dir, 'prepared.db')
+        shutil.copyfile(db_path, prepared)
+        operation()  # warm-up
+        samples = []
+        for _ in range(runs):
+            if item.mutates:
+                shutil.copyfile(prepared, db_path)
+            start = time.perf_counter()
+            operation()
+            samples.append((time.perf_counter() - start) * 1000)
+    except Exception as e:
+        return {'status': 'error', 'reason': f"{type(e).__name__}: {e}"}
+
+    samples.sort()
+    return {
+        'status': 'ok',
+        'runs': runs,
+        'median_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'min_ms': round(samples[0], 3),
+    }
+
+
+def run_suite(size_name: str, seed: int, runs: int, names=None) -> Dict:
+    """Build the household and run the selected scenarios in a temporary directory"""
+    size = PRESETS[size_name]
+    selected = [item for item in SCENARIOS if not names or item.name in names]
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            template = os.path.join(work_dir, 'household.db')
+            counts = build_household(template, size, seed)
+            results = {}
+            for item in selected:
+                results[item.name] = run_scenario(item, template, work_dir, runs)
+                print(_describe(item.name, results[item.name]), flush=True)
+        finally:
+            os.chdir(cwd)
+    return {
+        'meta': {
+            'size': size_name, 'seed': seed, 'runs': runs, 'counts': counts,
+            'python': platform.python_version(), 'sqlite': sqlite3.sqlite_version,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        },
+        'scenarios': results,
+    }
+
+
+def _describe(name, result):
+    if result['status'] != 'ok':
+        return f"{name:24s} {result['status'].upper()}: {result['reason']}"
+    return f"{name:24s} median {result['median_ms']:9.2f} ms  p95 {result['p95_ms']:9.2f} ms"
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float, min_delta_ms: float) -> List[str]:
+    """Regressions of the median over the baseline (beyond tolerance and the noise floor)"""
+    regressions = []
+    for name, result in results['scenarios'].items():
+        recorded = baseline.get('scenarios', {}).get(name, {})
+        if result['status'] != 'ok' or recorded.get('status') != 'ok':
+            continue
+        before, after = recorded['median_ms'], result['median_ms']
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"  {name:22s} {before:9.2f} -> {after:9.2f} ms ({change:+.0f}%)")
+        if after > before * (1 + tolerance) and after - before >= min_delta_ms:
+            regressions.append(f"{name} median grew to {after:.2f} ms (baseline {before:.2f} ms)")
+    return regressions
+
+
+def load_json(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the app's code paths on a synthetic household")
+    parser.add_argument('--size', choices=sorted(PRESETS), default='medium')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--runs', type=int, default=5, help="Timed runs per scenario after one warm-up")
+    parser.add_argument('--scenario', action='append', choices=[item.name for item in SCENARIOS],
+                        help="Only run this scenario (repeatable)")
+    parser.add_argument('--output', default=RESULTS_FILE,
+                        help="Where to write the results (default: e2e_results.json in the current directory)")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="Results to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed growth of the median")
+    parser.add_argument('--min-delta-ms', type=float, default=2.0, help="Ignore smaller changes as noise")
+    parser.add_argument('--update-baseline', action='store_true', help="Record these results as the baseline")
+    args = parser.parse_args()
+
+    results = run_suite(args.size, args.seed, args.runs, args.scenario)
+    save_json(args.output, results)
+    print(f"Results written to {os.path.relpath(args.output)}")
+
+    errors = [name for name, result in results['scenarios'].items() if result['status'] == 'error']
+    if args.update_baseline:
+        save_json(args.baseline, results)
+        print(f"Baseline written to {os.path.relpath(args.baseline)}")
+        return 2 if errors else 0
+
+    regressions = []
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        print("No baseline recorded; run with --update-baseline to create one")
+    elif (baseline['meta']['size'], baseline['meta']['seed']) != (args.size, args.seed):
+        print(f"Baseline was recorded for size {baseline['meta']['size']} seed {baseline['meta']['seed']};"
+              " not comparing")
+    else:
+        print(f"Compared with baseline from {baseline['meta']['timestamp']}:")
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    if errors:
+        print(f"FAILED: {', '.join(errors)}")
+        return 2
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
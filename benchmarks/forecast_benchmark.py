@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Expense forecasting benchmark
+Builds a seeded synthetic expense history, then times loading it into the
+category x month matrix and forecasting the total and every category.
+
+Usage:
+    python benchmarks/forecast_benchmark.py [--expenses 100000] [--years 5] [--categories 20]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'family_manager'))
+
+from forecasting import ExpenseSeries, forecast_all
+
+
+def synthetic_expenses(count, years, categories, seed=42):
+    rng = random.Random(seed)
+    start = date.today().replace(day=1) - timedelta(days=365 * years)
+    names = [f"Category {i}" for i in range(categories)] + [None]
+    dates, amounts, cats = [], [], []
+    for _ in range(count):
+        day = start + timedelta(days=rng.randrange(365 * years))
+        # Mild upward trend plus a December bump
+        scale = 1 + (day - start).days / (365 * years) * 0.3 + (0.5 if day.month == 12 else 0)
+        dates.append(day.isoformat())
+        amounts.append(round(rng.uniform(5, 150) * scale, 2))
+        cats.append(rng.choice(names))
+    return dates, amounts, cats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time vectorized expense forecasting")
+    parser.add_argument('--expenses', type=int, default=100000)
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--categories', type=int, default=20)
+    parser.add_argument('--horizon', type=int, default=3)
+    args = parser.parse_args()
+
+    dates, amounts, cats = synthetic_expenses(args.expenses, args.years, args.categories)
+
+    start = time.perf_counter()
+    series = ExpenseSeries.from_expenses(dates, amounts, cats)
+    loaded = time.perf_counter()
+    forecasts = forecast_all(series, horizon=args.horizon)
+    done = time.perf_counter()
+
+    total = forecasts['total']
+    print(f"{args.expenses} expenses, {len(series.categories)} categories, {series.n_months} months")
+    print(f"  load matrix:   {(loaded - start) * 1000:8.1f} ms")
+    print(f"  forecast all:  {(done - loaded) * 1000:8.1f} ms")
+    print(f"  total:         {(done - start) * 1000:8.1f} ms")
+    print(f"  seasonal: {total.seasonal}, next month ${total.predicted[0]:.2f} "
+          f"(${total.lower[0]:.2f}-${total.upper[0]:.2f})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
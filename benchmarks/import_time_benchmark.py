@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Cold-start import time benchmark
+Imports the app in fresh interpreters under `python -X importtime`, reports
+the cumulative import time and the heaviest modules, and fails when it has
+grown past the recorded baseline or the absolute budget (1500 ms by default,
+so a checkout without a baseline still fails on a slow cold start).
+
+Usage:
+    python benchmarks/import_time_benchmark.py [--module main] [--runs 5] [--tolerance 0.25]
+                                               [--max-ms 1500] [--update-baseline]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(ROOT, 'family_manager')
+BASELINE_FILE = os.path.join(ROOT, 'benchmarks', 'import_time_baseline.json')
+# Cold-start budget for importing main, including PyQt6 itself
+DEFAULT_MAX_MS = 1500.0
+
+# import time:       self [us] |  cumulative | imported package
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure(module):
+    """
+    Import `module` once in a fresh interpreter
+
+    Returns:
+        tuple: (cumulative µs for the module, {module: self µs} for everything it imported)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=APP_DIR, capture_output=True, text=True,
+        env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1', 'QT_QPA_PLATFORM': 'offscreen'},
+    )
+    timings, other = {}, []
+    cumulative = None
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            if not line.startswith('import time:'):
+                other.append(line)
+            continue
+        self_us, cumulative_us, _, name = match.groups()
+        timings[name] = timings.get(name, 0) + int(self_us)
+        if name == module:
+            cumulative = int(cumulative_us)
+    if result.returncode != 0 or cumulative is None:
+        raise RuntimeError(f"import {module} failed:\n" + "\n".join(other[-10:]))
+    return cumulative, timings
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_FILE):
+        return {}
+    with open(BASELINE_FILE) as f:
+        return json.load(f)
+
+
+def save_baseline(baseline):
+    with open(BASELINE_FILE, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Guard cold-start import time against regressions")
+    parser.add_argument('--module', action='append', help="Module to import (repeatable, default: main)")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per module; the median is used")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed growth over the baseline")
+    parser.add_argument('--max-ms', type=float, default=DEFAULT_MAX_MS,
+                        help="Absolute budget in ms, checked even without a baseline (0 disables)")
+    parser.add_argument('--top', type=int, default=10, help="Heaviest imports to list")
+    parser.add_argument('--update-baseline', action='store_true', help="Record the measured times as the baseline")
+    args = parser.parse_args()
+
+    modules = args.module or ['main']
+    baseline = load_baseline()
+    failures = []
+
+    for module in modules:
+        try:
+            runs = [measure(module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(e)
+            return 2
+        median_ms = statistics.median(cumulative for cumulative, _ in runs) / 1000
+
+        print(f"{module}: {median_ms:.1f} ms cumulative (median of {args.runs})")
+        _, timings = min(runs, key=lambda run: run[0])
+        for name, self_us in sorted(timings.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+            print(f"  {self_us / 1000:8.1f} ms  {name}")
+
+        recorded = baseline.get(module)
+        if recorded is not None:
+            limit = recorded * (1 + args.tolerance)
+            change = (median_ms - recorded) / recorded * 100 if recorded else 0.0
+            print(f"  baseline {recorded:.1f} ms ({change:+.0f}%), limit {limit:.1f} ms")
+            if median_ms > limit and not args.update_baseline:
+                failures.append(f"{module} import grew to {median_ms:.1f} ms (baseline {recorded:.1f} ms)")
+        if args.max_ms and median_ms > args.max_ms:
+            failures.append(f"{module} import took {median_ms:.1f} ms (budget {args.max_ms:.0f} ms)")
+        if args.update_baseline:
+            baseline[module] = round(median_ms, 1)
+
+    if args.update_baseline:
+        save_baseline(baseline)
+        print(f"Baseline written to {os.path.relpath(BASELINE_FILE, ROOT)}")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Notification trigger benchmark
+Times a full NotificationTriggers sweep over 10k chores and 20 family
+members against the previous per-entity loop, counting SQL statements.
+
+Usage:
+    python benchmarks/notification_triggers_benchmark.py [--chores 10000] [--members 20]
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'family_manager'))
+
+from notification_manager import NotificationManager
+from notification_triggers import NotificationTriggers
+
+SCHEMA = '''
+    CREATE TABLE family_members (id INTEGER PRIMARY KEY, name TEXT, role TEXT);
+    CREATE TABLE notification_settings (
+        id INTEGER PRIMARY KEY, user_id INTEGER UNIQUE,
+        reminder_enabled INTEGER DEFAULT 1, alert_enabled INTEGER DEFAULT 1,
+        task_assigned_enabled INTEGER DEFAULT 1, chore_due_enabled INTEGER DEFAULT 1,
+        event_upcoming_enabled INTEGER DEFAULT 1, bill_due_enabled INTEGER DEFAULT 1,
+        inventory_low_enabled INTEGER DEFAULT 1, recurring_event_enabled INTEGER DEFAULT 1,
+        advance_warning_hours INTEGER DEFAULT 24, notification_method TEXT DEFAULT 'in-app'
+    );
+    CREATE TABLE notifications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, notification_type TEXT, recipient_id INTEGER,
+        title TEXT, message TEXT, priority TEXT DEFAULT 'normal',
+        source_entity_type TEXT, source_entity_id INTEGER, action_url TEXT,
+        scheduled_for TEXT, expires_at TEXT, is_read INTEGER DEFAULT 0, read_at TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE chores (id INTEGER PRIMARY KEY, name TEXT, assignee_id INTEGER,
+                         status TEXT, due_date TEXT, due_time TEXT);
+    CREATE TABLE projects (id INTEGER PRIMARY KEY, name TEXT);
+    CREATE TABLE tasks (id INTEGER PRIMARY KEY, title TEXT, project_id INTEGER, status TEXT,
+                        due_date TEXT, assigned_to_id INTEGER, priority INTEGER);
+    CREATE TABLE bills (id INTEGER PRIMARY KEY, name TEXT, amount REAL, due_date TEXT, paid INTEGER DEFAULT 0);
+    CREATE TABLE inventory (id INTEGER PRIMARY KEY, name TEXT, qty REAL);
+    CREATE TABLE recurring_events (id INTEGER PRIMARY KEY, title TEXT, color TEXT, category TEXT,
+                                   pattern_type TEXT, start_date TEXT, end_date TEXT, rrule_string TEXT,
+                                   created_by INTEGER, is_active INTEGER);
+    CREATE TABLE recurring_patterns (id INTEGER PRIMARY KEY, recurring_event_id INTEGER, frequency INTEGER,
+                                     byday TEXT, bymonthday INTEGER, bymonth INTEGER, count INTEGER);
+    CREATE TABLE recurring_event_instances (id INTEGER PRIMARY KEY, recurring_event_id INTEGER,
+                                            event_date TEXT, event_time TEXT, is_completed INTEGER DEFAULT 0);
+'''
+
+
+def build_database(path, chores, members, seed=42):
+    """Create a household with `chores` chores (about a third due tomorrow) and `members` members"""
+    rng = random.Random(seed)
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany("INSERT INTO family_members (id, name, role) VALUES (?, ?, ?)",
+                     [(i, f"Member {i}", 'admin' if i <= 3 else 'member') for i in range(1, members + 1)])
+    conn.executemany("INSERT INTO notification_settings (user_id, chore_due_enabled) VALUES (?, ?)",
+                     [(i, 0 if i % 7 == 0 else 1) for i in range(1, members + 1)])
+    conn.executemany(
+        "INSERT INTO chores (name, assignee_id, status, due_date, due_time) VALUES (?, ?, ?, ?, ?)",
+        [(f"Chore {i}", rng.randint(1, members), 'pending',
+          tomorrow if i % 3 == 0 else (date.today() + timedelta(days=rng.randint(2, 30))).isoformat(), '18:00')
+         for i in range(chores)]
+    )
+    conn.executemany(
+        "INSERT INTO tasks (title, status, due_date, assigned_to_id, priority) VALUES (?, ?, ?, ?, ?)",
+        [(f"Task {i}", 'pending', tomorrow, rng.randint(1, members), rng.randint(1, 5)) for i in range(chores // 10)]
+    )
+    conn.executemany("INSERT INTO bills (name, amount, due_date) VALUES (?, ?, ?)",
+                     [(f"Bill {i}", rng.uniform(10, 900), tomorrow) for i in range(200)])
+    conn.executemany("INSERT INTO inventory (name, qty) VALUES (?, ?)",
+                     [(f"Item {i}", rng.choice([1, 2, 5, 10])) for i in range(2000)])
+    conn.commit()
+    conn.close()
+
+
+def legacy_chore_sweep(path):
+    """The previous per-chore loop: one settings SELECT and one INSERT per due chore"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    now = datetime.now()
+    cursor.execute('''
+        SELECT c.* FROM chores c
+        WHERE c.status = 'pending' AND c.due_date BETWEEN ? AND ?
+        AND NOT EXISTS (
+            SELECT 1 FROM notifications WHERE source_entity_type = 'chore'
+            AND source_entity_id = c.id AND created_at > datetime('now', '-24 hours')
+        )
+    ''', ((now + timedelta(hours=23)).isoformat()[:10], (now + timedelta(hours=25)).isoformat()[:10]))
+    for chore in cursor.fetchall():
+        cursor.execute("SELECT chore_due_enabled FROM notification_settings WHERE user_id = ?",
+                       (chore['assignee_id'],))
+        settings = cursor.fetchone()
+        if not settings or not settings['chore_due_enabled']:
+            continue
+        # create_notification re-checks the preference on its own connection
+        cursor.execute("SELECT chore_due_enabled FROM notification_settings WHERE user_id = ?",
+                       (chore['assignee_id'],))
+        cursor.execute('''
+            INSERT INTO notifications (notification_type, recipient_id, title, message, priority,
+                                       source_entity_type, source_entity_id, scheduled_for, expires_at)
+            VALUES ('chore_due', ?, ?, ?, 'normal', 'chore', ?, ?, ?)
+        ''', (chore['assignee_id'], f"Chore Due: {chore['name']}", f"Your chore '{chore['name']}' is due",
+              chore['id'], now.isoformat(), (now + timedelta(hours=72)).isoformat()))
+        conn.commit()
+    conn.close()
+
+
+def count_statements(path, func):
+    """Run func and return (seconds, statements issued from Python, notifications created)
+
+    Counted at the cursor rather than with set_trace_callback, which also
+    reports every statement run inside the unread-counter triggers.
+    """
+    statements = [0]
+    original_connect = sqlite3.connect
+
+    class CountingCursor(sqlite3.Cursor):
+        def execute(self, *args, **kwargs):
+            statements[0] += 1
+            return super().execute(*args, **kwargs)
+
+        def executemany(self, *args, **kwargs):
+            statements[0] += 1
+            return super().executemany(*args, **kwargs)
+
+    class CountingConnection(sqlite3.Connection):
+        def cursor(self, factory=CountingCursor):
+            return super().cursor(factory)
+
+        def execute(self, *args, **kwargs):
+            return self.cursor().execute(*args, **kwargs)
+
+        def executemany(self, *args, **kwargs):
+            return self.cursor().executemany(*args, **kwargs)
+
+    def counting_connect(*args, **kwargs):
+        return original_connect(*args, factory=CountingConnection, **kwargs)
+
+    sqlite3.connect = counting_connect
+    try:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+    finally:
+        sqlite3.connect = original_connect
+
+    conn = sqlite3.connect(path)
+    created = conn.execute("SELECT COUNT(*) FROM notifications").fetchone()[0]
+    conn.close()
+    return elapsed, statements[0], created
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark notification trigger sweeps")
+    parser.add_argument('--chores', type=int, default=10000)
+    parser.add_argument('--members', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db = os.path.join(tmp, 'legacy.db')
+        set_db = os.path.join(tmp, 'set_based.db')
+        build_database(legacy_db, args.chores, args.members)
+        build_database(set_db, args.chores, args.members)
+
+        print(f"Notification triggers: {args.chores} chores, {args.members} members")
+        t, stmts, created = count_statements(legacy_db, lambda: legacy_chore_sweep(legacy_db))
+        print(f"  legacy chore loop      {t * 1000:8.1f} ms  {stmts:7d} statements  {created:6d} notifications")
+
+        triggers = NotificationTriggers(set_db, NotificationManager(set_db))
+        conn = sqlite3.connect(set_db)
+        conn.execute("DELETE FROM notifications")
+        conn.commit()
+        conn.close()
+
+        t, stmts, created = count_statements(set_db, triggers.check_upcoming_chores)
+        print(f"  set-based chores       {t * 1000:8.1f} ms  {stmts:7d} statements  {created:6d} notifications")
+        t, stmts, created = count_statements(set_db, triggers.check_all_triggers)
+        print(f"  full sweep afterwards {t * 1000:8.1f} ms  {stmts:7d} statements  {created:6d} notifications")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+OCR preprocessing benchmark
+Compares Tesseract latency and keyword recall on the bundled sample images
+with and without the preprocessing stage, plus the AI payload size.
+
+Usage:
+    python benchmarks/ocr_preprocess_benchmark.py [--runs 3] [image ...]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'family_manager'))
+
+from ocr_preprocess import CV2_AVAILABLE, prepare_for_ai, preprocess_image
+
+# Words a correct reading of each handwritten sample should contain
+EXPECTED_WORDS = {
+    'inventory.jpeg': [
+        'kitchen', 'freezer', 'chicken', 'nugget', 'beef', 'pie', 'crust', 'milk',
+        'roast', 'sandwich', 'meat', 'tortilla', 'eggs', 'ranch', 'mayo', 'cheese',
+        'ketchup', 'mustard', 'sauce', 'pepper', 'rings', 'steak',
+    ],
+    'inventory2.jpeg': [
+        'inventory', 'green', 'beans', 'sweet', 'tomato', 'sauce', 'chicken', 'broth',
+        'soup', 'chili', 'beef', 'spaghetti', 'cheese', 'pumpkin', 'milk', 'box',
+        'noodle', 'penne', 'potatoe', 'turkey', 'stuffing', 'cornbread',
+    ],
+}
+
+
+def keyword_recall(text, words):
+    """Fraction of expected words found in the OCR text"""
+    lowered = text.lower()
+    return sum(1 for word in words if word in lowered) / float(len(words)) if words else 0.0
+
+
+def time_ocr(func, runs):
+    """Run func `runs` times and return (median seconds, last result)"""
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def benchmark_image(path, runs):
+    import pytesseract
+    from PIL import Image
+
+    def raw():
+        with Image.open(path) as image:
+            return pytesseract.image_to_string(image)
+
+    def preprocessed():
+        return pytesseract.image_to_string(preprocess_image(path))
+
+    words = EXPECTED_WORDS.get(os.path.basename(path), [])
+    raw_time, raw_text = time_ocr(raw, runs)
+    pre_time, pre_text = time_ocr(preprocessed, runs)
+    ai_payload, _ = prepare_for_ai(path)
+
+    return {
+        'image': os.path.basename(path),
+        'raw_seconds': raw_time,
+        'pre_seconds': pre_time,
+        'raw_recall': keyword_recall(raw_text, words),
+        'pre_recall': keyword_recall(pre_text, words),
+        'file_bytes': os.path.getsize(path),
+        'ai_bytes': len(ai_payload),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCR preprocessing on sample images")
+    parser.add_argument('images', nargs='*', help="Images to benchmark (default: bundled samples)")
+    parser.add_argument('--runs', type=int, default=3, help="Timed runs per image (median reported)")
+    args = parser.parse_args()
+
+    try:
+        import pytesseract
+        pytesseract.get_tesseract_version()
+    except Exception as e:
+        print(f"❌ Tesseract is not available: {e}")
+        return 1
+
+    images = args.images or [os.path.join(ROOT, name) for name in EXPECTED_WORDS]
+    print(f"OCR preprocessing benchmark (OpenCV: {'yes' if CV2_AVAILABLE else 'no'}, runs: {args.runs})")
+    print(f"{'image':<18}{'raw s':>8}{'pre s':>8}{'speedup':>9}{'raw recall':>12}{'pre recall':>12}"
+          f"{'file KB':>9}{'AI KB':>8}")
+
+    for path in images:
+        r = benchmark_image(path, args.runs)
+        speedup = r['raw_seconds'] / r['pre_seconds'] if r['pre_seconds'] else 0.0
+        print(f"{r['image']:<18}{r['raw_seconds']:>8.2f}{r['pre_seconds']:>8.2f}{speedup:>8.1f}x"
+              f"{r['raw_recall']:>12.0%}{r['pre_recall']:>12.0%}"
+              f"{r['file_bytes'] / 1024:>9.0f}{r['ai_bytes'] / 1024:>8.0f}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Password KDF calibration benchmark
+Finds, for each available KDF, the cheapest cost parameters that take at
+least the target latency on this host, and optionally writes the chosen
+scheme to the config read by auth.hash_password.
+
+Usage:
+    python benchmarks/password_kdf_benchmark.py [--target-ms 250] [--kdf scrypt] [--write]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'family_manager'))
+
+from password_kdf import BCRYPT_AVAILABLE, KDF_CONFIG_PATH, KDFS, calibrate, save_kdf_config
+
+
+def median_ms(kdf, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        kdf.hash('benchmark-password')
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate password KDF cost to a target latency")
+    parser.add_argument('--target-ms', type=float, default=250.0)
+    parser.add_argument('--kdf', choices=sorted(KDFS), default='scrypt', help="Scheme to write with --write")
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--write', action='store_true', help=f"Save the calibrated scheme to {KDF_CONFIG_PATH}")
+    args = parser.parse_args()
+
+    print(f"Password KDF calibration: target {args.target_ms:.0f} ms")
+    chosen = None
+    for name in sorted(KDFS):
+        if name == 'bcrypt' and not BCRYPT_AVAILABLE:
+            print(f"  {name:<15}skipped (pip install bcrypt)")
+            continue
+        params = calibrate(name, args.target_ms)
+        elapsed = median_ms(KDFS[name](**params), args.runs)
+        print(f"  {name:<15}{elapsed:8.1f} ms  {params}")
+        if name == args.kdf:
+            chosen = params
+
+    if args.write and chosen is not None:
+        save_kdf_config(args.kdf, chosen)
+        print(f"Wrote {args.kdf} {chosen} to {KDF_CONFIG_PATH}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
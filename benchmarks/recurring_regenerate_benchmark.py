@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Recurring event regeneration benchmark
+Times refreshing every recurring event with the per-event
+generate_instances/save_instances loop against regenerate_all, inline and
+across a process pool.
+
+Usage:
+    python benchmarks/recurring_regenerate_benchmark.py [--events 2000] [--months 24]
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import sqlite3
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'family_manager'))
+
+from recurring_events_manager import RecurringEventManager
+
+SCHEMA = '''
+    CREATE TABLE recurring_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, color TEXT, category TEXT,
+        pattern_type TEXT, start_date TEXT, end_date TEXT, rrule_string TEXT, created_by INTEGER,
+        is_active INTEGER DEFAULT 1
+    );
+    CREATE TABLE recurring_patterns (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, recurring_event_id INTEGER, frequency INTEGER DEFAULT 1,
+        byday TEXT, bymonthday INTEGER, bymonth INTEGER, count INTEGER, interval_description TEXT
+    );
+    CREATE TABLE recurring_event_instances (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, recurring_event_id INTEGER, event_date TEXT, event_time TEXT,
+        is_completed INTEGER DEFAULT 0, completion_date TEXT, completion_notes TEXT,
+        is_overridden INTEGER DEFAULT 0, override_title TEXT, override_description TEXT,
+        override_color TEXT, override_notes TEXT, updated_at TEXT
+    );
+'''
+
+PATTERNS = [
+    ('daily', {'frequency': 1}),
+    ('daily', {'frequency': 3}),
+    ('weekly', {'byday': 'MO,WE,FR'}),
+    ('weekly', {'frequency': 2, 'byday': 'SA'}),
+    ('monthly', {'bymonthday': 1}),
+    ('yearly', {}),
+]
+
+
+def build_database(path, events, seed=42):
+    """Create `events` recurring events spread over the pattern mix"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    for i in range(events):
+        pattern_type, pattern = PATTERNS[i % len(PATTERNS)]
+        cursor = conn.execute(
+            "INSERT INTO recurring_events (title, color, category, pattern_type, start_date, created_by) "
+            "VALUES (?, '#3498db', 'general', ?, ?, 1)",
+            (f"Event {i}", pattern_type, f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+        )
+        conn.execute(
+            "INSERT INTO recurring_patterns (recurring_event_id, frequency, byday, bymonthday) VALUES (?, ?, ?, ?)",
+            (cursor.lastrowid, pattern.get('frequency', 1), pattern.get('byday'), pattern.get('bymonthday'))
+        )
+    conn.commit()
+    conn.close()
+
+
+def per_event_loop(manager, months):
+    """The only path before regenerate_all: one generate/save round trip per event"""
+    conn = sqlite3.connect(manager.db_path)
+    event_ids = [row[0] for row in conn.execute("SELECT id FROM recurring_events WHERE is_active = 1")]
+    conn.close()
+    for event_id in event_ids:
+        manager.save_instances(event_id, manager.generate_instances(event_id, months))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark regenerating all recurring events")
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--months', type=int, default=24)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = os.path.join(tmp, 'template.db')
+        build_database(template, args.events)
+
+        print(f"Recurring regeneration: {args.events} events, {args.months} months ahead")
+        runs = [
+            ('per-event loop', lambda m: per_event_loop(m, args.months)),
+            ('regenerate_all inline', lambda m: m.regenerate_all(args.months, parallel_threshold=10 ** 9)),
+            ('regenerate_all pool', lambda m: m.regenerate_all(args.months, parallel_threshold=1)),
+        ]
+        report = None
+        for label, run in runs:
+            path = os.path.join(tmp, f"{label.replace(' ', '_')}.db")
+            shutil.copy(template, path)
+            manager = RecurringEventManager(path)
+            start = time.perf_counter()
+            result = run(manager)
+            elapsed = time.perf_counter() - start
+            report = result or report
+            print(f"  {label:<24}{elapsed * 1000:10.1f} ms")
+
+        print("  by pattern (pool run):")
+        for pattern_type, stats in sorted(report['by_pattern'].items()):
+            print(f"    {pattern_type:<10}{stats['events']:6d} events {stats['instances']:9d} instances "
+                  f"{stats['seconds'] * 1000:9.1f} ms expanding")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
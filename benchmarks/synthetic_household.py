@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Synthetic household generator
+Builds a reproducible family_manager.db for benchmarks: family members,
+inventory, years of expenses, meals with indexed ingredients, bills,
+budgets, chores, tasks, shopping history and notifications, all from one
+seed. The schema is the app's own (the same columns main.py creates, plus
+the Qt-free schema helpers for units, meal ingredients, expense rollups,
+notification counters and query indexes).
+
+Usage:
+    python benchmarks/synthetic_household.py OUTPUT.db [--size medium] [--seed 42]
+"""
+
+import os
+import sys
+import json
+import random
+import sqlite3
+import argparse
+from datetime import date, datetime, timedelta
+from typing import Dict, NamedTuple, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'family_manager'))
+
+from units import ensure_unit_schema
+from meal_ingredients import ensure_meal_ingredients_table, insert_meal
+from expense_rollups import ensure_expense_rollups
+from notification_manager import ensure_notification_schema
+from query_audit import ensure_query_indexes
+
+
+class HouseholdSize(NamedTuple):
+    """How much of everything to generate"""
+    members: int = 5
+    inventory: int = 2000
+    years: int = 3
+    expenses_per_day: int = 4
+    meals_per_day: int = 3
+    bills: int = 24             # recurring bills, one row per month of history each
+    notifications: int = 5000
+    chores: int = 500
+    tasks: int = 200
+    shopping: int = 400         # open shopping list items
+    shopping_history: int = 3000  # checked-off items the usage predictions learn from
+
+
+PRESETS: Dict[str, HouseholdSize] = {
+    'small': HouseholdSize(members=4, inventory=300, years=1, expenses_per_day=2, bills=10,
+                           notifications=500, chores=50, tasks=20, shopping=60, shopping_history=300),
+    'medium': HouseholdSize(),
+    'large': HouseholdSize(members=8, inventory=10000, years=5, expenses_per_day=8, bills=40,
+                           notifications=50000, chores=5000, tasks=2000, shopping=2000, shopping_history=20000),
+}
+
+# Tables as main.py's update_db_schema leaves them, and the notification
+# tables the notification modules expect
+SCHEMA = '''
+    CREATE TABLE inventory (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, category TEXT, qty REAL DEFAULT 1,
+        unit TEXT, exp_date TEXT, location TEXT, purchase_price REAL DEFAULT 0, purchase_date TEXT,
+        total_cost REAL DEFAULT 0, subcategory TEXT
+    );
+    CREATE TABLE meals (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL, meal_type TEXT NOT NULL, name TEXT NOT NULL,
+        time TEXT DEFAULT '', ingredients TEXT, recipe TEXT, nutrition TEXT, auto_generated INTEGER DEFAULT 0,
+        generation_date TEXT DEFAULT ''
+    );
+    CREATE TABLE shopping_list (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, item TEXT NOT NULL, qty REAL DEFAULT 1, price REAL DEFAULT 0,
+        checked INTEGER DEFAULT 0, aisle TEXT DEFAULT '', unit TEXT DEFAULT 'each', category TEXT, date TEXT
+    );
+    CREATE TABLE bills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, amount REAL NOT NULL, due_date TEXT NOT NULL,
+        category TEXT, paid INTEGER DEFAULT 0, recurring INTEGER DEFAULT 0, frequency TEXT DEFAULT ''
+    );
+    CREATE TABLE expenses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL, description TEXT NOT NULL,
+        amount REAL NOT NULL, category TEXT
+    );
+    CREATE TABLE budgets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, category TEXT NOT NULL, amount REAL NOT NULL,
+        period TEXT NOT NULL DEFAULT 'monthly', start_date TEXT NOT NULL, end_date TEXT,
+        is_active INTEGER DEFAULT 1, created_date TEXT DEFAULT CURRENT_TIMESTAMP, notes TEXT,
+        UNIQUE(name, category, period)
+    );
+    CREATE TABLE family_members (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, email TEXT UNIQUE, role TEXT DEFAULT 'member',
+        avatar_emoji TEXT DEFAULT '👤', color TEXT DEFAULT '#3498db', is_active INTEGER DEFAULT 1,
+        created_date TEXT DEFAULT CURRENT_TIMESTAMP, last_login TEXT, preferences TEXT, notes TEXT
+    );
+    CREATE TABLE notification_settings (
+        id INTEGER PRIMARY KEY, user_id INTEGER UNIQUE,
+        reminder_enabled INTEGER DEFAULT 1, alert_enabled INTEGER DEFAULT 1,
+        task_assigned_enabled INTEGER DEFAULT 1, chore_due_enabled INTEGER DEFAULT 1,
+        event_upcoming_enabled INTEGER DEFAULT 1, bill_due_enabled INTEGER DEFAULT 1,
+        inventory_low_enabled INTEGER DEFAULT 1, recurring_event_enabled INTEGER DEFAULT 1,
+        advance_warning_hours INTEGER DEFAULT 24, notification_method TEXT DEFAULT 'in-app',
+        quiet_hours_enabled INTEGER DEFAULT 0, quiet_hours_start TEXT, quiet_hours_end TEXT, updated_at TEXT
+    );
+    CREATE TABLE notifications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, notification_type TEXT, recipient_id INTEGER,
+        title TEXT, message TEXT, priority TEXT DEFAULT 'normal',
+        source_entity_type TEXT, source_entity_id INTEGER, action_url TEXT,
+        scheduled_for TEXT, expires_at TEXT, is_read INTEGER DEFAULT 0, read_at TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE notification_reminders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, recipient_id INTEGER, event_type TEXT,
+        event_id INTEGER, event_title TEXT, event_date TEXT, event_time TEXT,
+        reminder_time TEXT, is_sent INTEGER DEFAULT 0, sent_at TEXT,
+        is_dismissed INTEGER DEFAULT 0, dismissed_at TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE chores (id INTEGER PRIMARY KEY, name TEXT, assignee_id INTEGER,
+                         status TEXT, due_date TEXT, due_time TEXT);
+    CREATE TABLE projects (id INTEGER PRIMARY KEY, name TEXT);
+    CREATE TABLE tasks (id INTEGER PRIMARY KEY, title TEXT, project_id INTEGER, status TEXT,
+                        due_date TEXT, assigned_to_id INTEGER, priority INTEGER);
+    CREATE TABLE recurring_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, color TEXT, category TEXT,
+        pattern_type TEXT, start_date TEXT, end_date TEXT, rrule_string TEXT, created_by INTEGER,
+        is_active INTEGER DEFAULT 1
+    );
+    CREATE TABLE recurring_patterns (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, recurring_event_id INTEGER, frequency INTEGER DEFAULT 1,
+        byday TEXT, bymonthday INTEGER, bymonth INTEGER, count INTEGER, interval_description TEXT
+    );
+    CREATE TABLE recurring_event_instances (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, recurring_event_id INTEGER, event_date TEXT, event_time TEXT,
+        is_completed INTEGER DEFAULT 0, completion_date TEXT, completion_notes TEXT,
+        is_overridden INTEGER DEFAULT 0, override_title TEXT, override_description TEXT,
+        override_color TEXT, override_notes TEXT, updated_at TEXT
+    );
+    CREATE INDEX idx_inventory_name ON inventory(name);
+    CREATE INDEX idx_inventory_category ON inventory(category);
+    CREATE INDEX idx_meals_date ON meals(date);
+    CREATE INDEX idx_bills_due_date ON bills(due_date);
+    CREATE INDEX idx_expenses_date ON expenses(date);
+    CREATE INDEX idx_inventory_name_lower ON inventory(LOWER(name));
+'''
+
+# (category, subcategory, items) matching the inventory tab's category tree
+GROCERIES = [
+    ("🥬 Food & Groceries", "🥛 Dairy & Eggs", ["milk", "cheese", "eggs", "yogurt", "butter"]),
+    ("🥬 Food & Groceries", "🍖 Meat & Poultry", ["chicken", "beef", "pork", "turkey", "fish", "shrimp"]),
+    ("🥬 Food & Groceries", "🥦 Produce & Vegetables", ["lettuce", "tomatoes", "broccoli", "carrots", "potatoes"]),
+    ("🥬 Food & Groceries", "🍎 Fruits", ["apples", "bananas", "oranges", "berries"]),
+    ("🥬 Food & Groceries", "🥖 Bakery & Bread", ["bread", "rolls", "bagels"]),
+    ("🥬 Food & Groceries", "🍝 Pasta & Grains", ["pasta", "rice", "quinoa", "oats"]),
+    ("🥬 Food & Groceries", "🥫 Canned Goods", ["soup", "beans", "vegetables", "fruit"]),
+    ("🧹 Kitchen & Cleaning", "🧽 Dish Soap & Detergents", ["dish soap", "dishwasher pods"]),
+    ("👔 Laundry & Linens", "👕 Laundry Detergent", ["laundry detergent", "liquid detergent"]),
+    ("🛁 Bathroom & Personal Care", "🪥 Toothpaste & Oral Care", ["toothpaste", "mouthwash", "floss"]),
+    ("🏠 Household Essentials", "🔋 Batteries", ["aa batteries", "aaa batteries"]),
+]
+UNITS = ['each', 'lb', 'oz', 'kg', 'g', 'cup', 'l', 'ml', 'dozen', 'pack']
+LOCATIONS = ['Fridge', 'Freezer', 'Pantry', 'Garage', 'Bathroom']
+EXPENSE_CATEGORIES = ['Groceries', 'Dining', 'Utilities', 'Transport', 'Entertainment', 'Health', 'Kids',
+                      'Household', None]
+MEAL_TYPES = ['Breakfast', 'Lunch', 'Dinner', 'Snack']
+NOTIFICATION_TYPES = ['chore_due', 'task_assigned', 'bill_due', 'inventory_low', 'event_upcoming', 'reminder']
+
+
+def _grocery_names(count: int, rng: random.Random):
+    """`count` (category, subcategory, name) tuples; names repeat with brand suffixes"""
+    items = []
+    for i in range(count):
+        category, subcategory, names = GROCERIES[i % len(GROCERIES)]
+        name = rng.choice(names)
+        items.append((category, subcategory, name if i < len(GROCERIES) * 3 else f"{name} {i // 50}"))
+    return items
+
+
+def build_household(db_path: str, size: HouseholdSize = HouseholdSize(), seed: int = 42,
+                    today: Optional[date] = None) -> Dict[str, int]:
+    """
+    Create a synthetic household database
+
+    Args:
+        db_path: Database file to create (must not exist)
+        size: How much data to generate
+        seed: Random seed; the same seed, size and day give the same database
+        today: Day the history ends on (defaults to today, so due dates stay current)
+
+    Returns:
+        dict: Row count per generated table
+    """
+    if os.path.exists(db_path):
+        raise FileExistsError(db_path)
+    rng = random.Random(seed)
+    today = today or date.today()
+    start = today - timedelta(days=365 * size.years)
+    days = (today - start).days
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.executescript(SCHEMA)
+    ensure_unit_schema(cursor)
+    ensure_meal_ingredients_table(cursor, backfill=False)
+    ensure_expense_rollups(cursor)
+    ensure_notification_schema(cursor)
+    ensure_query_indexes(cursor)
+
+    # Timestamps are explicit so the same seed reproduces the same rows
+    members = [(f"Member {i}", f"member{i}@family.local", 'admin' if i <= 2 else rng.choice(['member', 'child']),
+                start.isoformat()) for i in range(1, size.members + 1)]
+    cursor.executemany("INSERT INTO family_members (name, email, role, created_date) VALUES (?, ?, ?, ?)", members)
+    cursor.executemany("INSERT INTO notification_settings (user_id, bill_due_enabled) VALUES (?, ?)",
+                       [(i, 0 if i % 4 == 0 else 1) for i in range(1, size.members + 1)])
+
+    groceries = _grocery_names(size.inventory, rng)
+    cursor.executemany('''
+        INSERT INTO inventory (name, category, subcategory, qty, unit, exp_date, location,
+                               purchase_price, purchase_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [(name, category, subcategory, rng.choice([0.5, 1, 2, 3, 5, 10]), rng.choice(UNITS),
+           (today + timedelta(days=rng.randint(-10, 120))).isoformat(), rng.choice(LOCATIONS),
+           round(rng.uniform(0.5, 25), 2), (today - timedelta(days=rng.randint(0, 60))).isoformat())
+          for category, subcategory, name in groceries])
+
+    # Spending drifts upward with a December bump, as in the forecasting benchmark
+    expenses = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        scale = 1 + offset / days * 0.3 + (0.5 if day.month == 12 else 0)
+        for _ in range(rng.randint(0, size.expenses_per_day * 2)):
+            category = rng.choice(EXPENSE_CATEGORIES)
+            expenses.append((day.isoformat(), f"{category or 'Misc'} purchase",
+                             round(rng.uniform(3, 120) * scale, 2), category))
+    cursor.executemany("INSERT INTO expenses (date, description, amount, category) VALUES (?, ?, ?, ?)", expenses)
+    cursor.executemany('''
+        INSERT INTO budgets (name, category, amount, period, start_date, created_date)
+        VALUES (?, ?, ?, 'monthly', ?, ?)
+    ''', [(f"{c} budget", c, rng.choice([200, 400, 600, 900]), start.isoformat(), start.isoformat())
+          for c in EXPENSE_CATEGORIES if c])
+
+    bills = []
+    for b in range(size.bills):
+        amount, due_day = round(rng.uniform(20, 1500), 2), rng.randint(1, 28)
+        month = date(start.year, start.month, 1)
+        while month <= today + timedelta(days=31):
+            due = month.replace(day=due_day)
+            bills.append((f"Bill {b}", amount, due.isoformat(), rng.choice(EXPENSE_CATEGORIES[:-1]),
+                          1 if due < today else 0, 1, 'Monthly'))
+            month = (month + timedelta(days=32)).replace(day=1)
+    # A few due tomorrow so the bill trigger has work to do
+    tomorrow = (today + timedelta(days=1)).isoformat()
+    bills += [(f"Due bill {b}", 99.0, tomorrow, 'Utilities', 0, 0, '') for b in range(max(size.bills // 4, 1))]
+    cursor.executemany('''
+        INSERT INTO bills (name, amount, due_date, category, paid, recurring, frequency) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', bills)
+
+    meal_names = [name for _, _, names in GROCERIES[:7] for name in names]
+    for offset in range(days + 14):
+        day = (start + timedelta(days=offset)).isoformat()
+        for meal_type in MEAL_TYPES[:size.meals_per_day]:
+            ingredients = [f"{rng.choice([1, 2, 0.5, 3])} {rng.choice(['cup', 'lb', 'oz', 'each'])} "
+                           f"{rng.choice(meal_names)}" for _ in range(rng.randint(2, 6))]
+            insert_meal(cursor, {
+                'date': day, 'meal_type': meal_type, 'name': f"{meal_type} {offset % 40}",
+                'ingredients': json.dumps(ingredients), 'recipe': 'Cook and serve',
+                'generation_date': day if rng.random() < 0.3 else '',
+            })
+
+    shopping = [(name, rng.choice([1, 2, 3]), round(rng.uniform(1, 15), 2), 0, rng.choice(UNITS), category,
+                 None) for category, _, name in rng.sample(groceries, min(size.shopping, len(groceries)))]
+    shopping += [(name, rng.choice([1, 2, 3]), round(rng.uniform(1, 15), 2), 1, rng.choice(UNITS), category,
+                  (start + timedelta(days=rng.randrange(days))).isoformat())
+                 for category, _, name in (rng.choice(groceries) for _ in range(size.shopping_history))]
+    cursor.executemany('''
+        INSERT INTO shopping_list (item, qty, price, checked, unit, category, date) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', shopping)
+
+    cursor.executemany("INSERT INTO chores (name, assignee_id, status, due_date, due_time) VALUES (?, ?, ?, ?, ?)",
+                       [(f"Chore {i}", rng.randint(1, size.members), rng.choice(['pending', 'pending', 'done']),
+                         (today + timedelta(days=rng.randint(-5, 30))).isoformat(), '18:00')
+                        for i in range(size.chores)])
+    cursor.executemany(
+        "INSERT INTO tasks (title, status, due_date, assigned_to_id, priority) VALUES (?, ?, ?, ?, ?)",
+        [(f"Task {i}", rng.choice(['pending', 'in_progress', 'done']),
+          (today + timedelta(days=rng.randint(-5, 30))).isoformat(), rng.randint(1, size.members),
+          rng.randint(1, 5)) for i in range(size.tasks)])
+
+    now = datetime.combine(today, datetime.min.time())
+    cursor.executemany('''
+        INSERT INTO notifications (notification_type, recipient_id, title, message, priority, is_read,
+                                   created_at, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [(kind, rng.randint(1, size.members), f"{kind} {i}", f"Synthetic notification {i}",
+           rng.choice(['low', 'normal', 'high']), 1 if rng.random() < 0.7 else 0,
+           (now - timedelta(days=rng.randint(0, 90), seconds=rng.randrange(86400))).isoformat(' '),
+           (today + timedelta(days=rng.randint(-30, 60))).isoformat() if rng.random() < 0.5 else None)
+          for i, kind in ((i, rng.choice(NOTIFICATION_TYPES)) for i in range(size.notifications))])
+
+    conn.commit()
+    counts = {table: cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+              for table in ('family_members', 'inventory', 'expenses', 'meals', 'meal_ingredients', 'bills',
+                            'shopping_list', 'chores', 'tasks', 'notifications')}
+    conn.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic family_manager.db")
+    parser.add_argument('output', help="Database file to create")
+    parser.add_argument('--size', choices=sorted(PRESETS), default='medium')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    counts = build_household(args.output, PRESETS[args.size], args.seed)
+    print(f"Created {args.output} ({args.size}, seed {args.seed})")
+    for table, count in counts.items():
+        print(f"  {table:18s} {count:8d}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
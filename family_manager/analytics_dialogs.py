@@ -0,0 +1,4499 @@
+"""
+Analytics Dialogs for Family Household Manager
+Savings goals, financial health, budgets, reporting, forecasting and AI
+insight dialogs opened from the finance tabs.
+"""
+
+import csv
+from datetime import datetime, timedelta
+
+from PyQt6.QtWidgets import (
+    QComboBox, QDateEdit, QDialog, QDoubleSpinBox, QFileDialog, QFormLayout, QGridLayout, QGroupBox,
+    QHBoxLayout, QInputDialog, QLabel, QLineEdit, QListWidgetItem, QMessageBox, QProgressBar, QPushButton,
+    QScrollArea, QTabWidget, QTableWidget, QTableWidgetItem, QTextEdit, QVBoxLayout, QWidget
+)
+from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtGui import QColor
+
+try:
+    from .theme import AppTheme
+    from .components import ModernButton, ModernCard
+    from .dialog_loader import DialogLoader
+    from .analytics_service import get_analytics_service
+    from .instrumentation import connect
+    from .expense_rollups import month_bounds
+    from .forecasting import ExpenseSeries, forecast_all, month_over_month_change, interval_confidence, skip_months
+except ImportError:
+    from theme import AppTheme
+    from components import ModernButton, ModernCard
+    from dialog_loader import DialogLoader
+    from analytics_service import get_analytics_service
+    from instrumentation import connect
+    from expense_rollups import month_bounds
+    from forecasting import ExpenseSeries, forecast_all, month_over_month_change, interval_confidence, skip_months
+
+
+class SavingsGoalDialog(QDialog):
+    def __init__(self, parent=None, goal_data=None):
+        super().__init__(parent)
+        self.goal_data = goal_data
+        self.setWindowTitle("Manage Savings Goal" if goal_data else "Add Savings Goal")
+        self.setModal(True)
+        self.resize(500, 500)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title
+        title = QLabel("🎯 Savings Goal Management")
+        title.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        layout.addWidget(title)
+
+        # Form layout
+        form_layout = QFormLayout()
+
+        # Goal name
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("e.g., Emergency Fund, Vacation, New Car")
+        if self.goal_data:
+            self.name_input.setText(self.goal_data.get('name', ''))
+        form_layout.addRow("Goal Name:", self.name_input)
+
+        # Description
+        self.description_input = QTextEdit()
+        self.description_input.setMaximumHeight(60)
+        self.description_input.setPlaceholderText("Optional description of this savings goal...")
+        if self.goal_data:
+            self.description_input.setPlainText(self.goal_data.get('description', ''))
+        form_layout.addRow("Description:", self.description_input)
+
+        # Target amount
+        self.target_amount_input = QDoubleSpinBox()
+        self.target_amount_input.setMinimum(0)
+        self.target_amount_input.setMaximum(1000000)
+        self.target_amount_input.setPrefix("$")
+        if self.goal_data:
+            self.target_amount_input.setValue(self.goal_data.get('target_amount', 0))
+        form_layout.addRow("Target Amount:", self.target_amount_input)
+
+        # Current amount
+        self.current_amount_input = QDoubleSpinBox()
+        self.current_amount_input.setMinimum(0)
+        self.current_amount_input.setMaximum(1000000)
+        self.current_amount_input.setPrefix("$")
+        if self.goal_data:
+            self.current_amount_input.setValue(self.goal_data.get('current_amount', 0))
+        form_layout.addRow("Current Amount:", self.current_amount_input)
+
+        # Target date
+        self.target_date_input = QDateEdit()
+        self.target_date_input.setCalendarPopup(True)
+        self.target_date_input.setDate(QDate.currentDate().addMonths(12))
+        if self.goal_data and self.goal_data.get('target_date'):
+            self.target_date_input.setDate(QDate.fromString(self.goal_data['target_date'], "yyyy-MM-dd"))
+        form_layout.addRow("Target Date:", self.target_date_input)
+
+        # Category
+        self.category_combo = QComboBox()
+        categories = ["Emergency Fund", "Vacation", "Vehicle", "Home", "Education", "Retirement", "Investment", "General"]
+        self.category_combo.addItems(categories)
+        if self.goal_data:
+            self.category_combo.setCurrentText(self.goal_data.get('category', 'General'))
+        form_layout.addRow("Category:", self.category_combo)
+
+        # Priority
+        self.priority_combo = QComboBox()
+        self.priority_combo.addItems(["Low", "Medium", "High"])
+        if self.goal_data:
+            priority = self.goal_data.get('priority', 'medium').title()
+            self.priority_combo.setCurrentText(priority)
+        else:
+            self.priority_combo.setCurrentText("Medium")
+        form_layout.addRow("Priority:", self.priority_combo)
+
+        # Notes
+        self.notes_input = QTextEdit()
+        self.notes_input.setMaximumHeight(60)
+        self.notes_input.setPlaceholderText("Additional notes...")
+        if self.goal_data:
+            self.notes_input.setPlainText(self.goal_data.get('notes', ''))
+        form_layout.addRow("Notes:", self.notes_input)
+
+        layout.addLayout(form_layout)
+
+        # Progress visualization (if editing)
+        if self.goal_data:
+            progress_layout = QVBoxLayout()
+            progress_layout.addWidget(QLabel("Current Progress:"))
+
+            # Progress bar
+            self.progress_bar = QProgressBar()
+            progress_pct = (self.goal_data.get('current_amount', 0) / self.goal_data.get('target_amount', 1) * 100)
+            self.progress_bar.setValue(min(100, int(progress_pct)))
+            self.progress_bar.setFormat(f"${self.goal_data.get('current_amount', 0):.2f} / ${self.goal_data.get('target_amount', 0):.2f} ({progress_pct:.1f}%)")
+            progress_layout.addWidget(self.progress_bar)
+
+            layout.addLayout(progress_layout)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+        save_btn = QPushButton("Save Goal")
+        save_btn.clicked.connect(self.save_goal)
+        save_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #4CAF50; color: white; }")
+        button_layout.addWidget(save_btn)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def save_goal(self):
+        """Save the savings goal to database"""
+        name = self.name_input.text().strip()
+        if not name:
+            QMessageBox.warning(self, "Validation Error", "Goal name is required.")
+            return
+
+        if self.target_amount_input.value() <= 0:
+            QMessageBox.warning(self, "Validation Error", "Target amount must be greater than zero.")
+            return
+
+        # Prepare data
+        goal_data = {
+            'name': name,
+            'description': self.description_input.toPlainText().strip(),
+            'target_amount': self.target_amount_input.value(),
+            'current_amount': self.current_amount_input.value(),
+            'target_date': self.target_date_input.date().toString("yyyy-MM-dd"),
+            'category': self.category_combo.currentText(),
+            'priority': self.priority_combo.currentText().lower(),
+            'notes': self.notes_input.toPlainText().strip()
+        }
+
+        try:
+            if self.goal_data:
+                # Update existing goal
+                self.parent().update_savings_goal(self.goal_data['id'], goal_data)
+            else:
+                # Create new goal
+                self.parent().create_savings_goal(goal_data)
+
+            QMessageBox.information(self, "Success", "Savings goal saved successfully!")
+            self.accept()
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save goal: {e}")
+
+
+class SavingsGoalsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Savings Goals Management")
+        self.setModal(True)
+        self.resize(900, 600)
+        self.setup_ui()
+        self.load_goals()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title and summary
+        title_layout = QHBoxLayout()
+        title = QLabel("🎯 Savings Goals")
+        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title_layout.addWidget(title)
+
+        title_layout.addStretch()
+
+        self.goals_summary_label = QLabel("Loading...")
+        title_layout.addWidget(self.goals_summary_label)
+
+        layout.addLayout(title_layout)
+
+        # Goals list and controls
+        content_layout = QVBoxLayout()
+
+        # Goals table
+        self.goals_table = QTableWidget()
+        self.goals_table.setColumnCount(7)
+        self.goals_table.setHorizontalHeaderLabels(["Goal", "Target", "Current", "Progress", "Priority", "Target Date", "Status"])
+        self.goals_table.setAlternatingRowColors(True)
+        self.goals_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.goals_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        content_layout.addWidget(self.goals_table)
+
+        # Control buttons
+        button_layout = QHBoxLayout()
+
+        add_btn = QPushButton("➕ Add Goal")
+        add_btn.clicked.connect(self.add_goal)
+        add_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #4CAF50; color: white; }")
+        button_layout.addWidget(add_btn)
+
+        edit_btn = QPushButton("✏️ Edit Selected")
+        edit_btn.clicked.connect(self.edit_selected_goal)
+        edit_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #2196F3; color: white; }")
+        button_layout.addWidget(edit_btn)
+
+        add_money_btn = QPushButton("💰 Add Money")
+        add_money_btn.clicked.connect(self.add_money_to_goal)
+        add_money_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #FF9800; color: white; }")
+        button_layout.addWidget(add_money_btn)
+
+        complete_btn = QPushButton("✅ Mark Complete")
+        complete_btn.clicked.connect(self.mark_goal_complete)
+        complete_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #8BC34A; color: white; }")
+        button_layout.addWidget(complete_btn)
+
+        delete_btn = QPushButton("🗑️ Delete Selected")
+        delete_btn.clicked.connect(self.delete_selected_goal)
+        delete_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #f44336; color: white; }")
+        button_layout.addWidget(delete_btn)
+
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.clicked.connect(self.load_goals)
+        refresh_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #607D8B; color: white; }")
+        button_layout.addWidget(refresh_btn)
+
+        content_layout.addLayout(button_layout)
+
+        # Goal details panel
+        details_group = QGroupBox("Goal Details")
+        details_layout = QVBoxLayout(details_group)
+
+        self.goal_details_text = QTextEdit()
+        self.goal_details_text.setReadOnly(True)
+        self.goal_details_text.setMaximumHeight(120)
+        self.goal_details_text.setPlainText("Select a goal to view details")
+        details_layout.addWidget(self.goal_details_text)
+
+        content_layout.addWidget(details_group)
+
+        layout.addLayout(content_layout)
+
+        # Connect table selection
+        self.goals_table.itemSelectionChanged.connect(self.on_goal_selected)
+
+        # Dialog buttons
+        button_layout2 = QHBoxLayout()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout2.addStretch()
+        button_layout2.addWidget(close_btn)
+
+        layout.addLayout(button_layout2)
+        self.setLayout(layout)
+
+    def load_goals(self):
+        """Load savings goals into the table"""
+        goals = self.parent().get_savings_goals(active_only=False)
+
+        self.goals_table.setRowCount(len(goals))
+
+        total_target = 0
+        total_current = 0
+        active_goals = 0
+        completed_goals = 0
+
+        for row, goal in enumerate(goals):
+            progress_pct = (goal['current_amount'] / goal['target_amount'] * 100) if goal['target_amount'] > 0 else 0
+
+            # Status
+            if goal['is_completed']:
+                status = "✅ Completed"
+                status_color = QColor(76, 175, 80)  # Green
+                completed_goals += 1
+            else:
+                status = "🔄 Active"
+                status_color = QColor(33, 150, 243)  # Blue
+                active_goals += 1
+
+            # Priority color
+            priority_colors = {
+                'high': QColor(244, 67, 54),    # Red
+                'medium': QColor(255, 152, 0),  # Orange
+                'low': QColor(76, 175, 80)      # Green
+            }
+            priority_color = priority_colors.get(goal['priority'], QColor(158, 158, 158))
+
+            self.goals_table.setItem(row, 0, QTableWidgetItem(goal['name']))
+            self.goals_table.setItem(row, 1, QTableWidgetItem(f"${goal['target_amount']:.2f}"))
+            self.goals_table.setItem(row, 2, QTableWidgetItem(f"${goal['current_amount']:.2f}"))
+            self.goals_table.setItem(row, 3, QTableWidgetItem(f"{progress_pct:.1f}%"))
+
+            priority_item = QTableWidgetItem(goal['priority'].title())
+            priority_item.setBackground(priority_color)
+            priority_item.setForeground(QColor(255, 255, 255))
+            self.goals_table.setItem(row, 4, priority_item)
+
+            self.goals_table.setItem(row, 5, QTableWidgetItem(goal['target_date'] or 'No target'))
+
+            status_item = QTableWidgetItem(status)
+            status_item.setBackground(status_color)
+            status_item.setForeground(QColor(255, 255, 255))
+            self.goals_table.setItem(row, 6, status_item)
+
+            total_target += goal['target_amount']
+            total_current += goal['current_amount']
+
+        self.goals_table.resizeColumnsToContents()
+
+        # Update summary
+        self.goals_summary_label.setText(
+            f"Active: {active_goals} | Completed: {completed_goals} | "
+            f"Total Target: ${total_target:.2f} | Total Saved: ${total_current:.2f}"
+        )
+
+    def on_goal_selected(self):
+        """Handle goal selection to show details"""
+        selected_rows = set()
+        for item in self.goals_table.selectedItems():
+            selected_rows.add(item.row())
+
+        if len(selected_rows) == 1:
+            row = list(selected_rows)[0]
+            goal_name = self.goals_table.item(row, 0).text()
+
+            # Get full goal data
+            goals = self.parent().get_savings_goals(active_only=False)
+            goal_data = next((g for g in goals if g['name'] == goal_name), None)
+
+            if goal_data:
+                progress = self.parent().get_goal_progress(goal_data['id'])
+                if progress:
+                    details = f"""<b>{progress['name']}</b> ({progress['category']})
+<b>Description:</b> {progress.get('description', 'No description')}
+
+<b>Progress:</b> ${progress['current_amount']:.2f} / ${progress['target_amount']:.2f} ({progress.get('progress_percentage', 0):.1f}%)
+
+<b>Priority:</b> {progress['priority'].title()}
+<b>Target Date:</b> {progress.get('target_date', 'No target date set')}
+
+<b>Status:</b> {'✅ Completed' if progress['is_completed'] else '🔄 In Progress'}"""
+
+                    if 'days_remaining' in progress:
+                        details += f"\n<b>Days Remaining:</b> {progress['days_remaining']}"
+                        if 'required_daily' in progress:
+                            details += f"\n<b>Required Daily Savings:</b> ${progress['required_daily']:.2f}"
+
+                    self.goal_details_text.setPlainText(details)
+                else:
+                    self.goal_details_text.setPlainText("Error loading goal details")
+            else:
+                self.goal_details_text.setPlainText("Goal not found")
+        else:
+            self.goal_details_text.setPlainText("Select a single goal to view details")
+
+    def add_goal(self):
+        """Add a new savings goal"""
+        dialog = SavingsGoalDialog(self.parent())
+        if dialog.exec():
+            self.load_goals()
+
+    def edit_selected_goal(self):
+        """Edit the selected savings goal"""
+        selected_rows = set()
+        for item in self.goals_table.selectedItems():
+            selected_rows.add(item.row())
+
+        if len(selected_rows) != 1:
+            QMessageBox.warning(self, "Selection Error", "Please select exactly one goal to edit.")
+            return
+
+        row = list(selected_rows)[0]
+        goal_name = self.goals_table.item(row, 0).text()
+
+        # Get full goal data
+        goals = self.parent().get_savings_goals(active_only=False)
+        goal_data = next((g for g in goals if g['name'] == goal_name), None)
+
+        if goal_data:
+            dialog = SavingsGoalDialog(self.parent(), goal_data)
+            if dialog.exec():
+                self.load_goals()
+
+    def add_money_to_goal(self):
+        """Add money to the selected savings goal"""
+        selected_rows = set()
+        for item in self.goals_table.selectedItems():
+            selected_rows.add(item.row())
+
+        if len(selected_rows) != 1:
+            QMessageBox.warning(self, "Selection Error", "Please select exactly one goal to add money to.")
+            return
+
+        row = list(selected_rows)[0]
+        goal_name = self.goals_table.item(row, 0).text()
+
+        # Get amount to add
+        amount, ok = QInputDialog.getDouble(self, "Add Money to Goal",
+                                          f"Enter amount to add to '{goal_name}':",
+                                          0, 0, 10000, 2)
+
+        if ok and amount > 0:
+            try:
+                # Find goal ID
+                goals = self.parent().get_savings_goals(active_only=False)
+                goal_data = next((g for g in goals if g['name'] == goal_name), None)
+
+                if goal_data:
+                    self.parent().add_to_savings_goal(goal_data['id'], amount)
+                    QMessageBox.information(self, "Success", f"Added ${amount:.2f} to '{goal_name}'!")
+                    self.load_goals()
+                else:
+                    QMessageBox.warning(self, "Error", "Goal not found.")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to add money to goal: {e}")
+
+    def mark_goal_complete(self):
+        """Mark the selected goal as completed"""
+        selected_rows = set()
+        for item in self.goals_table.selectedItems():
+            selected_rows.add(item.row())
+
+        if len(selected_rows) != 1:
+            QMessageBox.warning(self, "Selection Error", "Please select exactly one goal to mark complete.")
+            return
+
+        row = list(selected_rows)[0]
+        goal_name = self.goals_table.item(row, 0).text()
+
+        reply = QMessageBox.question(self, "Mark Goal Complete",
+                                   f"Are you sure you want to mark '{goal_name}' as completed?",
+                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+
+        if reply == QMessageBox.StandardButton.Yes:
+            try:
+                # Find goal ID and update
+                goals = self.parent().get_savings_goals(active_only=False)
+                goal_data = next((g for g in goals if g['name'] == goal_name), None)
+
+                if goal_data:
+                    goal_data_copy = goal_data.copy()
+                    goal_data_copy['is_completed'] = 1
+                    goal_data_copy['completed_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    self.parent().update_savings_goal(goal_data['id'], goal_data_copy)
+                    QMessageBox.information(self, "Success", f"Goal '{goal_name}' marked as completed!")
+                    self.load_goals()
+                else:
+                    QMessageBox.warning(self, "Error", "Goal not found.")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to mark goal complete: {e}")
+
+    def delete_selected_goal(self):
+        """Delete the selected savings goal"""
+        selected_rows = set()
+        for item in self.goals_table.selectedItems():
+            selected_rows.add(item.row())
+
+        if len(selected_rows) != 1:
+            QMessageBox.warning(self, "Selection Error", "Please select exactly one goal to delete.")
+            return
+
+        row = list(selected_rows)[0]
+        goal_name = self.goals_table.item(row, 0).text()
+
+        reply = QMessageBox.question(self, "Confirm Delete",
+                                   f"Are you sure you want to delete the goal '{goal_name}'?\n\n"
+                                   "This action cannot be undone.",
+                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+
+        if reply == QMessageBox.StandardButton.Yes:
+            try:
+                # Find goal ID and delete
+                goals = self.parent().get_savings_goals(active_only=False)
+                goal_data = next((g for g in goals if g['name'] == goal_name), None)
+
+                if goal_data:
+                    conn = connect('family_manager.db')
+                    cursor = conn.cursor()
+                    cursor.execute("DELETE FROM savings_goals WHERE id = ?", (goal_data['id'],))
+                    conn.commit()
+                    conn.close()
+
+                    QMessageBox.information(self, "Success", f"Goal '{goal_name}' deleted successfully!")
+                    self.load_goals()
+                else:
+                    QMessageBox.warning(self, "Error", "Goal not found.")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to delete goal: {e}")
+
+
+class FinancialHealthDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Financial Health Assessment")
+        self.setModal(True)
+        self.resize(800, 700)
+        self.setup_ui()
+        self.perform_assessment()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title
+        title = QLabel("🏥 Financial Health Assessment")
+        title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2E86C1; margin-bottom: 10px;")
+        layout.addWidget(title)
+
+        # Overall score display
+        score_layout = QHBoxLayout()
+
+        self.score_display = QLabel("Calculating...")
+        self.score_display.setStyleSheet("""
+            font-size: 48px;
+            font-weight: bold;
+            color: #4CAF50;
+            padding: 20px;
+            border: 3px solid #4CAF50;
+            border-radius: 10px;
+            text-align: center;
+        """)
+        self.score_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        score_layout.addWidget(self.score_display)
+
+        score_layout.addStretch()
+
+        self.health_status = QLabel("Assessment in progress...")
+        self.health_status.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        score_layout.addWidget(self.health_status)
+
+        layout.addLayout(score_layout)
+
+        # Assessment breakdown
+        assessment_group = QGroupBox("Assessment Breakdown")
+        assessment_layout = QVBoxLayout(assessment_group)
+
+        # Create progress bars for different health factors
+        self.liquidity_bar = self.create_health_factor_bar("💧 Liquidity", "Emergency fund coverage")
+        assessment_layout.addLayout(self.liquidity_bar)
+
+        self.savings_rate_bar = self.create_health_factor_bar("💰 Savings Rate", "Percentage of income saved")
+        assessment_layout.addLayout(self.savings_rate_bar)
+
+        self.debt_ratio_bar = self.create_health_factor_bar("📊 Debt-to-Income Ratio", "Debt relative to income")
+        assessment_layout.addLayout(self.debt_ratio_bar)
+
+        self.budget_adherence_bar = self.create_health_factor_bar("📋 Budget Adherence", "Staying within budget limits")
+        assessment_layout.addLayout(self.budget_adherence_bar)
+
+        self.expense_stability_bar = self.create_health_factor_bar("📈 Expense Stability", "Consistency of spending")
+        assessment_layout.addLayout(self.expense_stability_bar)
+
+        layout.addWidget(assessment_group)
+
+        # Recommendations
+        recommendations_group = QGroupBox("💡 Personalized Recommendations")
+        recommendations_layout = QVBoxLayout(recommendations_group)
+
+        self.recommendations_text = QTextEdit()
+        self.recommendations_text.setReadOnly(True)
+        self.recommendations_text.setStyleSheet("""
+            QTextEdit {
+                border: 1px solid #ddd;
+                border-radius: 5px;
+                background-color: #f8f9fa;
+                padding: 10px;
+            }
+        """)
+        recommendations_layout.addWidget(self.recommendations_text)
+
+        layout.addWidget(recommendations_group)
+
+        # Action plan
+        action_group = QGroupBox("🎯 30-Day Action Plan")
+        action_layout = QVBoxLayout(action_group)
+
+        self.action_plan_text = QTextEdit()
+        self.action_plan_text.setReadOnly(True)
+        self.action_plan_text.setStyleSheet("""
+            QTextEdit {
+                border: 1px solid #ddd;
+                border-radius: 5px;
+                background-color: #fff3cd;
+                padding: 10px;
+            }
+        """)
+        action_layout.addWidget(self.action_plan_text)
+
+        layout.addWidget(action_group)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+
+        reassess_btn = QPushButton("🔄 Reassess")
+        reassess_btn.clicked.connect(self.perform_assessment)
+        reassess_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #2196F3; color: white; }")
+        button_layout.addWidget(reassess_btn)
+
+        export_btn = QPushButton("📄 Export Report")
+        export_btn.clicked.connect(self.export_health_report)
+        export_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #4CAF50; color: white; }")
+        button_layout.addWidget(export_btn)
+
+        button_layout.addStretch()
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def create_health_factor_bar(self, title, description):
+        """Create a health factor display with progress bar"""
+        layout = QVBoxLayout()
+
+        # Title and description
+        title_layout = QHBoxLayout()
+        title_label = QLabel(title)
+        title_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        title_layout.addWidget(title_label)
+
+        title_layout.addStretch()
+
+        self.score_labels = {}  # Will store score labels for each factor
+
+        layout.addLayout(title_layout)
+
+        desc_label = QLabel(description)
+        desc_label.setStyleSheet("color: #666; font-size: 11px; margin-bottom: 5px;")
+        layout.addWidget(desc_label)
+
+        # Progress bar
+        progress_bar = QProgressBar()
+        progress_bar.setRange(0, 100)
+        progress_bar.setValue(0)
+        progress_bar.setTextVisible(True)
+        progress_bar.setFormat("0/100")
+        progress_bar.setStyleSheet("""
+            QProgressBar {
+                border: 2px solid #ddd;
+                border-radius: 5px;
+                text-align: center;
+            }
+            QProgressBar::chunk {
+                background-color: #4CAF50;
+                border-radius: 3px;
+            }
+        """)
+        layout.addWidget(progress_bar)
+
+        # Store references for updating
+        factor_name = title.split()[1].lower()  # Extract factor name from emoji + text
+        self.health_factors = getattr(self, 'health_factors', {})
+        self.health_factors[factor_name] = {
+            'bar': progress_bar,
+            'score': 0
+        }
+
+        return layout
+
+    def perform_assessment(self):
+        """Perform comprehensive financial health assessment"""
+        try:
+            # Gather financial data
+            assessment_data = self.gather_financial_data()
+
+            # Calculate individual factor scores
+            factor_scores = self.calculate_factor_scores(assessment_data)
+
+            # Calculate overall health score
+            overall_score = self.calculate_overall_health_score(factor_scores)
+
+            # Update UI with results
+            self.update_assessment_display(overall_score, factor_scores)
+
+            # Generate recommendations and action plan
+            self.generate_recommendations(overall_score, factor_scores, assessment_data)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Assessment Error", f"Failed to perform health assessment: {e}")
+            self.score_display.setText("Error")
+            self.health_status.setText("Assessment failed")
+
+    def gather_financial_data(self):
+        """Gather all relevant financial data for assessment"""
+        analytics = get_analytics_service()
+
+        # Current month
+        current_month = datetime.now().strftime('%Y-%m')
+
+        # Get recent financial data
+        data = {
+            'inventory_value': 0,
+            'monthly_income': 0,  # Placeholder - would need income tracking
+            'monthly_expenses': 0,
+            'total_bills': 0,
+            'unpaid_bills': 0,
+            'active_budgets': 0,
+            'budget_overruns': 0,
+            'savings_goals': 0,
+            'completed_goals': 0,
+            'expense_volatility': 0,
+            'months_of_data': 0
+        }
+
+        # Inventory value
+        data['inventory_value'] = analytics.inventory_value()
+
+        # Monthly expenses
+        data['monthly_expenses'], _ = analytics.month_total(current_month)
+
+        # Bills data
+        bills = analytics.bills_summary()
+        data['total_bills'] = bills['total']
+        data['unpaid_bills'] = bills['unpaid']
+
+        # Budget data
+        budgets = self.parent().get_budget_performance()
+        data['active_budgets'] = len([b for b in budgets if not b.get('status') == 'over'])
+        data['budget_overruns'] = len([b for b in budgets if b.get('status') == 'over'])
+
+        # Savings goals
+        goals = self.parent().get_savings_goals(active_only=False)
+        data['savings_goals'] = len(goals)
+        data['completed_goals'] = len([g for g in goals if g['is_completed']])
+
+        # Expense volatility (coefficient of variation over last 6 months)
+        six_months_ago = (datetime.now() - timedelta(days=180)).strftime('%Y-%m-%d')
+        monthly_expenses = analytics.monthly_totals(six_months_ago)
+        data['months_of_data'] = len(monthly_expenses)
+
+        if len(monthly_expenses) > 1:
+            amounts = [row[1] for row in monthly_expenses]
+            mean_expense = sum(amounts) / len(amounts)
+            variance = sum((x - mean_expense) ** 2 for x in amounts) / len(amounts)
+            std_dev = variance ** 0.5
+            data['expense_volatility'] = (std_dev / mean_expense * 100) if mean_expense > 0 else 0
+
+        return data
+
+    def calculate_factor_scores(self, data):
+        """Calculate scores for individual health factors"""
+        scores = {}
+
+        # Liquidity (Emergency fund: aim for 3-6 months of expenses)
+        emergency_months = data['inventory_value'] / data['monthly_expenses'] if data['monthly_expenses'] > 0 else 0
+        if emergency_months >= 6:
+            scores['liquidity'] = 100
+        elif emergency_months >= 3:
+            scores['liquidity'] = 80
+        elif emergency_months >= 1:
+            scores['liquidity'] = 50
+        else:
+            scores['liquidity'] = max(0, emergency_months * 25)
+
+        # Savings rate (aim for 20%+ of income - using expenses as proxy for income)
+        # This is simplified since we don't have income tracking
+        estimated_income = data['monthly_expenses'] * 1.2  # Rough estimate
+        savings_rate = (data['inventory_value'] * 0.1 / 12) / estimated_income if estimated_income > 0 else 0
+        savings_rate = min(100, savings_rate * 100)  # Cap at 100%
+        scores['savings_rate'] = savings_rate
+
+        # Debt-to-income ratio (bills as debt proxy)
+        debt_ratio = (data['total_bills'] / estimated_income) if estimated_income > 0 else 0
+        if debt_ratio <= 0.2:
+            scores['debt_ratio'] = 100
+        elif debt_ratio <= 0.36:
+            scores['debt_ratio'] = 70
+        elif debt_ratio <= 0.43:
+            scores['debt_ratio'] = 40
+        else:
+            scores['debt_ratio'] = max(0, 100 - (debt_ratio - 0.43) * 100)
+
+        # Budget adherence
+        if data['active_budgets'] > 0:
+            adherence_rate = (data['active_budgets'] - data['budget_overruns']) / data['active_budgets']
+            scores['budget_adherence'] = adherence_rate * 100
+        else:
+            scores['budget_adherence'] = 50  # Neutral if no budgets
+
+        # Expense stability (lower volatility = higher score)
+        stability_score = max(0, 100 - data['expense_volatility'])
+        scores['expense_stability'] = stability_score
+
+        return scores
+
+    def calculate_overall_health_score(self, factor_scores):
+        """Calculate weighted overall health score"""
+        weights = {
+            'liquidity': 0.25,      # 25% - Emergency preparedness
+            'savings_rate': 0.20,   # 20% - Saving habits
+            'debt_ratio': 0.25,     # 25% - Debt management
+            'budget_adherence': 0.15, # 15% - Budget discipline
+            'expense_stability': 0.15 # 15% - Spending consistency
+        }
+
+        overall_score = 0
+        for factor, score in factor_scores.items():
+            overall_score += score * weights.get(factor, 0)
+
+        return round(overall_score)
+
+    def update_assessment_display(self, overall_score, factor_scores):
+        """Update the UI with assessment results"""
+        # Overall score
+        self.score_display.setText(str(overall_score))
+
+        # Color code based on score
+        if overall_score >= 80:
+            color = "#4CAF50"  # Green
+            status = "Excellent Financial Health"
+        elif overall_score >= 60:
+            color = "#FF9800"  # Orange
+            status = "Good Financial Health"
+        elif overall_score >= 40:
+            color = "#FF5722"  # Deep Orange
+            status = "Fair Financial Health"
+        else:
+            color = "#f44336"  # Red
+            status = "Needs Improvement"
+
+        self.score_display.setStyleSheet(f"""
+            font-size: 48px;
+            font-weight: bold;
+            color: {color};
+            padding: 20px;
+            border: 3px solid {color};
+            border-radius: 10px;
+            text-align: center;
+        """)
+
+        self.health_status.setText(status)
+        self.health_status.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {color}; padding: 10px;")
+
+        # Update factor bars
+        for factor_name, data in self.health_factors.items():
+            if factor_name in factor_scores:
+                score = factor_scores[factor_name]
+                data['bar'].setValue(int(score))
+                data['bar'].setFormat(f"{int(score)}/100")
+
+                # Color code bars
+                if score >= 80:
+                    bar_color = "#4CAF50"
+                elif score >= 60:
+                    bar_color = "#FF9800"
+                elif score >= 40:
+                    bar_color = "#FF5722"
+                else:
+                    bar_color = "#f44336"
+
+                data['bar'].setStyleSheet(f"""
+                    QProgressBar {{
+                        border: 2px solid #ddd;
+                        border-radius: 5px;
+                        text-align: center;
+                    }}
+                    QProgressBar::chunk {{
+                        background-color: {bar_color};
+                        border-radius: 3px;
+                    }}
+                """)
+
+    def generate_recommendations(self, overall_score, factor_scores, data):
+        """Generate personalized recommendations and action plan"""
+        recommendations = []
+        action_plan = []
+
+        # Liquidity recommendations
+        if factor_scores['liquidity'] < 60:
+            emergency_months = data['inventory_value'] / data['monthly_expenses'] if data['monthly_expenses'] > 0 else 0
+            recommendations.append(f"• Build emergency fund: Currently covers {emergency_months:.1f} months. Aim for 3-6 months of expenses.")
+            action_plan.append("• Week 1-2: Calculate target emergency fund amount (3-6 months of expenses)")
+            action_plan.append("• Week 3-4: Set up automatic transfers to savings account")
+
+        # Savings recommendations
+        if factor_scores['savings_rate'] < 50:
+            recommendations.append("• Increase savings rate: Aim to save 20% of income. Consider automating savings transfers.")
+            action_plan.append("• Set up automatic savings transfers on payday")
+
+        # Debt recommendations
+        if factor_scores['debt_ratio'] > 70:
+            recommendations.append("• Reduce debt-to-income ratio: Focus on paying down high-interest debt first.")
+            action_plan.append("• Create debt payoff plan prioritizing high-interest accounts")
+
+        # Budget recommendations
+        if factor_scores['budget_adherence'] < 70:
+            recommendations.append("• Improve budget adherence: Review spending patterns and adjust budget categories.")
+            action_plan.append("• Track expenses for one week and identify overspending categories")
+
+        # Stability recommendations
+        if factor_scores['expense_stability'] < 60:
+            recommendations.append("• Stabilize expenses: Reduce spending volatility by planning purchases in advance.")
+            action_plan.append("• Create weekly meal plan to reduce food spending variability")
+
+        # Overall recommendations based on score
+        if overall_score >= 80:
+            recommendations.insert(0, "• Excellent work! Maintain current financial habits and consider advanced goals.")
+        elif overall_score >= 60:
+            recommendations.insert(0, "• Good progress! Focus on the areas identified above for improvement.")
+        else:
+            recommendations.insert(0, "• Significant improvements needed. Start with building an emergency fund and creating a budget.")
+
+        # Set the text
+        self.recommendations_text.setPlainText("\n".join(recommendations) if recommendations else "No specific recommendations at this time.")
+        self.action_plan_text.setPlainText("\n".join(action_plan) if action_plan else "No immediate actions required. Maintain current financial habits.")
+
+    def export_health_report(self):
+        """Export financial health report"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Financial Health Report", "", "Text Files (*.txt);;PDF Files (*.pdf)")
+
+        if file_path:
+            try:
+                with open(file_path, 'w') as f:
+                    f.write("Financial Health Assessment Report\n")
+                    f.write("=" * 50 + "\n\n")
+                    f.write(f"Assessment Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+                    f.write("OVERALL SCORE\n")
+                    f.write("-" * 15 + "\n")
+                    f.write(f"Financial Health Score: {self.score_display.text()}/100\n")
+                    f.write(f"Status: {self.health_status.text()}\n\n")
+
+                    f.write("FACTOR BREAKDOWN\n")
+                    f.write("-" * 20 + "\n")
+                    for factor_name, data in self.health_factors.items():
+                        f.write(f"{factor_name.title()}: {data['bar'].value()}/100\n")
+                    f.write("\n")
+
+                    f.write("RECOMMENDATIONS\n")
+                    f.write("-" * 20 + "\n")
+                    f.write(self.recommendations_text.toPlainText() + "\n\n")
+
+                    f.write("30-DAY ACTION PLAN\n")
+                    f.write("-" * 20 + "\n")
+                    f.write(self.action_plan_text.toPlainText() + "\n")
+
+                QMessageBox.information(self, "Export Complete", f"Health assessment report exported to {file_path}")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Export Error", f"Failed to export report: {e}")
+
+
+class AIInsightsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("🤖 AI Financial Insights")
+        self.setModal(True)
+        self.resize(1000, 700)
+        self.setup_ui()
+        self.setup_loader()
+        self.load_ai_insights()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Header with refresh
+        header_layout = QHBoxLayout()
+        title = QLabel("🤖 AI-Powered Financial Insights")
+        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #2E86C1;")
+        header_layout.addWidget(title)
+
+        header_layout.addStretch()
+
+        refresh_btn = QPushButton("🔄 Analyze")
+        refresh_btn.clicked.connect(self.load_ai_insights)
+        refresh_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #4CAF50; color: white; }")
+        header_layout.addWidget(refresh_btn)
+
+        layout.addLayout(header_layout)
+
+        # Main content tabs
+        self.insights_tabs = QTabWidget()
+
+        # Predictions tab
+        self.setup_predictions_tab()
+        self.insights_tabs.addTab(self.predictions_tab, "🔮 Predictions")
+
+        # Insights tab
+        self.setup_insights_tab()
+        self.insights_tabs.addTab(self.insights_tab, "💡 Insights")
+
+        # Recommendations tab
+        self.setup_recommendations_tab()
+        self.insights_tabs.addTab(self.recommendations_tab, "🎯 Recommendations")
+
+        # Anomalies tab
+        self.setup_anomalies_tab()
+        self.insights_tabs.addTab(self.anomalies_tab, "⚠️ Anomalies")
+
+        layout.addWidget(self.insights_tabs)
+
+        # Status bar
+        self.status_label = QLabel("AI analysis complete")
+        self.status_label.setStyleSheet("color: #666; margin-top: 10px;")
+        layout.addWidget(self.status_label)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+
+        export_btn = QPushButton("📄 Export Insights")
+        export_btn.clicked.connect(self.export_insights)
+        export_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #2196F3; color: white; }")
+        button_layout.addWidget(export_btn)
+
+        button_layout.addStretch()
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def setup_predictions_tab(self):
+        """Setup predictions tab"""
+        self.predictions_tab = QWidget()
+        layout = QVBoxLayout()
+
+        # Forecast summary
+        forecast_group = QGroupBox("Spending Forecast (Next 3 Months)")
+        forecast_layout = QVBoxLayout(forecast_group)
+
+        self.forecast_table = QTableWidget()
+        self.forecast_table.setColumnCount(3)
+        self.forecast_table.setHorizontalHeaderLabels(["Month", "Predicted Spending", "Confidence"])
+        self.forecast_table.setAlternatingRowColors(True)
+        forecast_layout.addWidget(self.forecast_table)
+
+        layout.addWidget(forecast_group)
+
+        # Category trends
+        trends_group = QGroupBox("Category Spending Trends")
+        trends_layout = QVBoxLayout(trends_group)
+
+        self.trends_table = QTableWidget()
+        self.trends_table.setColumnCount(4)
+        self.trends_table.setHorizontalHeaderLabels(["Category", "Avg Monthly", "Trend", "Growth Rate"])
+        self.trends_table.setAlternatingRowColors(True)
+        trends_layout.addWidget(self.trends_table)
+
+        layout.addWidget(trends_group)
+
+        self.predictions_tab.setLayout(layout)
+
+    def setup_insights_tab(self):
+        """Setup modern insights tab with clean card-based design"""
+        self.insights_tab = QWidget()
+        main_layout = QVBoxLayout(self.insights_tab)
+        main_layout.setSpacing(20)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        # Header
+        header_layout = QHBoxLayout()
+        title_label = QLabel("🧠 Financial Insights")
+        title_label.setStyleSheet(f"""
+            font-size: {AppTheme.FONT_SIZES['xl']};
+            font-weight: bold;
+            color: {AppTheme.TEXT_PRIMARY};
+        """)
+        header_layout.addWidget(title_label)
+        header_layout.addStretch()
+        main_layout.addLayout(header_layout)
+
+        # Spending Personality Card
+        personality_card = ModernCard(
+            title="🧠 Your Spending Personality",
+            content=self.create_personality_content()
+        )
+        main_layout.addWidget(personality_card)
+
+        # Health Indicators Grid
+        health_layout = QHBoxLayout()
+        health_layout.setSpacing(15)
+
+        self.budget_health_card = self.create_health_indicator_card("Budget Health", "Analyzing...", "#2196F3", "🎯")
+        self.savings_health_card = self.create_health_indicator_card("Savings Habits", "Analyzing...", "#4CAF50", "💰")
+        self.spending_stability_card = self.create_health_indicator_card("Spending Stability", "Analyzing...", "#FF9800", "📈")
+
+        health_layout.addWidget(self.budget_health_card)
+        health_layout.addWidget(self.savings_health_card)
+        health_layout.addWidget(self.spending_stability_card)
+
+        main_layout.addLayout(health_layout)
+
+        # Key Insights Card
+        insights_card = ModernCard(
+            title="💡 Key Insights",
+            content=self.create_insights_content()
+        )
+        main_layout.addWidget(insights_card)
+
+        # Refresh button
+        refresh_layout = QHBoxLayout()
+        refresh_layout.addStretch()
+        refresh_btn = ModernButton("🔄 Refresh Insights", variant="primary")
+        refresh_btn.clicked.connect(lambda: self.load_ai_insights())
+        refresh_layout.addWidget(refresh_btn)
+        main_layout.addLayout(refresh_layout)
+
+    def setup_recommendations_tab(self):
+        """Setup modern recommendations tab with clean card design"""
+        self.recommendations_tab = QWidget()
+        main_layout = QVBoxLayout(self.recommendations_tab)
+        main_layout.setSpacing(20)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        # Header
+        header_layout = QHBoxLayout()
+        title_label = QLabel("🎯 Smart Recommendations")
+        title_label.setStyleSheet(f"""
+            font-size: {AppTheme.FONT_SIZES['xl']};
+            font-weight: bold;
+            color: {AppTheme.TEXT_PRIMARY};
+        """)
+        header_layout.addWidget(title_label)
+        header_layout.addStretch()
+        main_layout.addLayout(header_layout)
+
+        # AI Recommendations Card
+        ai_card = ModernCard(
+            title="🤖 AI-Powered Recommendations",
+            content=self.create_recommendations_content()
+        )
+        main_layout.addWidget(ai_card)
+
+        # Goals Suggestions Card
+        goals_card = ModernCard(
+            title="💰 Suggested Savings Goals",
+            content=self.create_goals_suggestions_content()
+        )
+        main_layout.addWidget(goals_card)
+
+        # Action buttons
+        action_layout = QHBoxLayout()
+        action_layout.addStretch()
+
+        implement_btn = ModernButton("✅ Implement Selected", variant="success", size="md")
+        implement_btn.clicked.connect(self.implement_recommendation)
+
+        refresh_btn = ModernButton("🔄 Refresh", variant="primary", size="md")
+        refresh_btn.clicked.connect(lambda: self.load_ai_insights())
+
+        action_layout.addWidget(implement_btn)
+        action_layout.addWidget(refresh_btn)
+
+        main_layout.addLayout(action_layout)
+
+    def setup_anomalies_tab(self):
+        """Setup modern anomalies detection tab"""
+        self.anomalies_tab = QWidget()
+        main_layout = QVBoxLayout(self.anomalies_tab)
+        main_layout.setSpacing(20)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        # Header
+        header_layout = QHBoxLayout()
+        title_label = QLabel("🚨 Spending Anomalies")
+        title_label.setStyleSheet(f"""
+            font-size: {AppTheme.FONT_SIZES['xl']};
+            font-weight: bold;
+            color: {AppTheme.TEXT_PRIMARY};
+        """)
+        header_layout.addWidget(title_label)
+        header_layout.addStretch()
+        main_layout.addLayout(header_layout)
+
+        # Explanation Card
+        explanation_card = ModernCard(
+            title="🤖 AI Anomaly Detection",
+            content=self.create_anomaly_explanation()
+        )
+        main_layout.addWidget(explanation_card)
+
+        # Anomalies Table Card
+        table_card = ModernCard(
+            title="⚠️ Detected Anomalies",
+            content=self.create_anomalies_table()
+        )
+        main_layout.addWidget(table_card)
+
+        # Summary Card
+        summary_card = ModernCard(
+            title="📊 Anomaly Summary",
+            content=self.create_anomaly_summary()
+        )
+        main_layout.addWidget(summary_card)
+
+        # Action buttons
+        action_layout = QHBoxLayout()
+        action_layout.addStretch()
+
+        investigate_btn = ModernButton("🔍 Investigate Selected", variant="warning", size="md")
+        investigate_btn.clicked.connect(self.investigate_anomaly)
+
+        export_btn = ModernButton("📤 Export Report", variant="info", size="md")
+        export_btn.clicked.connect(self.export_anomalies)
+
+        action_layout.addWidget(investigate_btn)
+        action_layout.addWidget(export_btn)
+
+        main_layout.addLayout(action_layout)
+
+    def create_indicator_card(self, title, value, color):
+        """Create a health indicator card"""
+        card = QGroupBox(title)
+        card.setStyleSheet(f"""
+            QGroupBox {{
+                border: 2px solid {color};
+                border-radius: 8px;
+                margin-top: 1ex;
+                padding-top: 5px;
+                background-color: #f9f9f9;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: 8px;
+                padding: 0 3px 0 3px;
+                color: {color};
+                font-size: 12px;
+            }}
+        """)
+
+        card_layout = QVBoxLayout()
+        card_layout.setContentsMargins(5, 5, 5, 5)
+
+        value_label = QLabel(value)
+        value_label.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {color}; text-align: center;")
+        value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card_layout.addWidget(value_label)
+
+        card.setLayout(card_layout)
+        card.setMaximumHeight(60)
+
+        return card
+
+    def setup_loader(self):
+        """Register the analyses that run in the background, one per tab"""
+        parent = self.parent()
+
+        self.loader = DialogLoader(self)
+        self.loader.add('predictions', parent.generate_predictive_analytics, self.update_predictions_tab,
+                        [self.forecast_table, self.trends_table])
+        self.loader.add('insights', parent.generate_personalized_insights, self.update_insights_tab,
+                        [self.personality_label, self.timing_insights_list])
+        # Recommendations combine the two analyses above, so they wait for both
+        self.loader.add('recommendations', apply=self.update_recommendations_tab,
+                        placeholders=[self.recommendations_list, self.goals_suggestions_list],
+                        requires=('predictions', 'insights'))
+        self.loader.add('anomalies', parent.detect_spending_anomalies, self.update_anomalies_tab,
+                        [self.anomalies_table, self.anomaly_summary_label])
+        self.loader.section_loaded.connect(self.on_analysis_progress)
+        self.loader.all_loaded.connect(self.on_analysis_complete)
+
+    def load_ai_insights(self):
+        """Start all AI insights and analysis; each tab fills in as it finishes"""
+        self.status_label.setText("🤖 AI analysis in progress...")
+        self.loader.start()
+
+    def on_analysis_progress(self, key):
+        if self.loader.is_loading:
+            done = len(self.loader.results) + len(self.loader.errors)
+            self.status_label.setText(f"🤖 AI analysis in progress... ({done}/4)")
+
+    def on_analysis_complete(self, ok):
+        if ok:
+            self.status_label.setText("✅ AI analysis complete")
+        else:
+            failed = ", ".join(self.loader.errors)
+            self.status_label.setText(f"⚠️ AI analysis finished; unavailable: {failed}")
+
+    def update_predictions_tab(self, predictions):
+        """Update the predictions tab with forecast data"""
+        # Update forecast table
+        forecast_data = predictions.get('monthly_forecast', [])
+        self.forecast_table.setRowCount(len(forecast_data))
+
+        for i, forecast in enumerate(forecast_data):
+            confidence_pct = int(forecast['confidence'] * 100)
+
+            self.forecast_table.setItem(i, 0, QTableWidgetItem(forecast['month']))
+            self.forecast_table.setItem(i, 1, QTableWidgetItem(f"${forecast['predicted_amount']:.2f}"))
+            self.forecast_table.setItem(i, 2, QTableWidgetItem(f"{confidence_pct}%"))
+
+        self.forecast_table.resizeColumnsToContents()
+
+        # Update trends table
+        trends_data = predictions.get('category_trends', {})
+        self.trends_table.setRowCount(len(trends_data))
+
+        for i, (category, trend_data) in enumerate(trends_data.items()):
+            growth_rate = trend_data['growth_rate']
+            trend_indicator = "📈" if growth_rate > 0 else "📉"
+
+            self.trends_table.setItem(i, 0, QTableWidgetItem(category))
+            self.trends_table.setItem(i, 1, QTableWidgetItem(f"${trend_data['average_monthly']:.2f}"))
+            self.trends_table.setItem(i, 2, QTableWidgetItem(f"{trend_indicator} ${trend_data['trend']:.2f}/month"))
+            self.trends_table.setItem(i, 3, QTableWidgetItem(f"{growth_rate:.1f}%"))
+
+        self.trends_table.resizeColumnsToContents()
+
+    def update_insights_tab(self, insights):
+        """Update the insights tab"""
+        # Update spending personality
+        personality = insights.get('spending_personality', 'Unable to determine spending personality')
+        self.personality_label.setText(f"You are a: {personality}")
+
+        personality_descriptions = {
+            "Frugal focused spender": "You spend conservatively and focus on essential categories. This approach helps maintain financial stability but consider occasional discretionary spending for life balance.",
+            "Moderate balanced spender": "You have a well-rounded approach to spending across multiple categories. This balanced approach typically leads to good financial health.",
+            "Generous diverse spender": "You enjoy spending across many categories and are generous with your money. Consider setting specific budgets to maintain financial goals.",
+            "Conservative spender with minimal transaction data": "Limited spending data available. Continue tracking expenses to receive more personalized insights."
+        }
+
+        description = personality_descriptions.get(personality, "Continue tracking your expenses to receive more detailed personality insights.")
+        self.personality_description.setText(description)
+
+        # Update health indicators
+        budget_health = insights.get('budget_effectiveness', 'Analyzing...')
+        savings_habits = insights.get('savings_habits', 'Analyzing...')
+        spending_stability = "High spending volatility detected"  # Placeholder
+
+        self.budget_health_card.layout().itemAt(0).widget().setText(budget_health)
+        self.savings_health_card.layout().itemAt(0).widget().setText(savings_habits)
+        self.spending_stability_card.layout().itemAt(0).widget().setText(spending_stability)
+
+        # Update timing insights
+        timing_insights = insights.get('timing_insights', [])
+        self.timing_insights_list.clear()
+
+        if timing_insights:
+            for insight in timing_insights:
+                self.timing_insights_list.addItem(insight)
+        else:
+            self.timing_insights_list.addItem("Continue tracking expenses to receive timing insights")
+
+    def update_recommendations_tab(self, predictions, insights):
+        """Update the recommendations tab"""
+        # Update AI recommendations
+        recommendations = predictions.get('recommendations', [])
+        self.recommendations_list.clear()
+
+        if recommendations:
+            for rec in recommendations:
+                priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(rec['priority'], "🔵")
+                item_text = f"{priority_emoji} {rec['title']}\n{rec['message']}\n💡 {rec['action']}"
+
+                list_item = QListWidgetItem(item_text)
+                list_item.setToolTip(f"Priority: {rec['priority'].title()}\nType: {rec['type']}")
+                self.recommendations_list.addItem(list_item)
+        else:
+            self.recommendations_list.addItem("🎉 Your finances are in good shape! No major recommendations at this time.")
+
+        # Update goal suggestions
+        goal_suggestions = insights.get('financial_goals', [])
+        self.goals_suggestions_list.clear()
+
+        if goal_suggestions:
+            for goal in goal_suggestions:
+                priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(goal['priority'], "🔵")
+                item_text = f"{priority_emoji} {goal['title']}\n{goal['description']}"
+
+                list_item = QListWidgetItem(item_text)
+                list_item.setToolTip(f"Priority: {goal['priority'].title()}\nType: {goal['type']}")
+                self.goals_suggestions_list.addItem(list_item)
+        else:
+            self.goals_suggestions_list.addItem("💰 Consider setting savings goals to improve your financial future!")
+
+    def update_anomalies_tab(self, anomalies):
+        """Update the anomalies tab"""
+        self.anomalies_table.setRowCount(len(anomalies))
+
+        for i, anomaly in enumerate(anomalies):
+            deviation_pct = anomaly['deviation']
+            anomaly_type = anomaly['type']
+
+            # Color code based on anomaly type
+            if anomaly_type == 'high_amount':
+                bg_color = QColor(255, 235, 235)  # Light red
+                fg_color = QColor(220, 53, 69)   # Red text
+            else:
+                bg_color = QColor(255, 243, 235)  # Light orange
+                fg_color = QColor(255, 193, 7)    # Orange text
+
+            self.anomalies_table.setItem(i, 0, QTableWidgetItem(anomaly['date']))
+            self.anomalies_table.setItem(i, 1, QTableWidgetItem(f"${anomaly['amount']:.2f}"))
+            self.anomalies_table.setItem(i, 2, QTableWidgetItem(anomaly['category'] or 'Uncategorized'))
+            self.anomalies_table.setItem(i, 3, QTableWidgetItem(anomaly['description'] or ''))
+
+            deviation_item = QTableWidgetItem(f"{deviation_pct:.1f}%")
+            deviation_item.setBackground(bg_color)
+            deviation_item.setForeground(fg_color)
+            self.anomalies_table.setItem(i, 4, deviation_item)
+
+        self.anomalies_table.resizeColumnsToContents()
+
+        # Update summary
+        if anomalies:
+            total_anomalies = len(anomalies)
+            high_amount_anomalies = len([a for a in anomalies if a['type'] == 'high_amount'])
+
+            summary = f"Found {total_anomalies} spending anomalies in recent transactions. "
+            summary += f"{high_amount_anomalies} unusually high amounts detected. "
+            summary += "Review these transactions to ensure they align with your budget."
+
+            self.anomaly_summary_label.setText(summary)
+            self.anomaly_summary_label.setStyleSheet("padding: 10px; background-color: #fff3cd; border: 1px solid #ffeaa7; border-radius: 5px;")
+        else:
+            self.anomaly_summary_label.setText("✅ No spending anomalies detected in recent transactions. Your spending patterns are consistent with historical data.")
+            self.anomaly_summary_label.setStyleSheet("padding: 10px; background-color: #d4edda; border: 1px solid #c3e6cb; border-radius: 5px;")
+
+    def export_insights(self):
+        """Export AI insights to file"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export AI Insights", "", "Text Files (*.txt);;JSON Files (*.json)")
+
+        if file_path:
+            try:
+                # Gather all insights data
+                # Reuse what the tabs already loaded
+                results = self.loader.results
+                insights_data = {
+                    'predictions': results.get('predictions') or self.parent().generate_predictive_analytics(),
+                    'personal_insights': results.get('insights') or self.parent().generate_personalized_insights(),
+                    'anomalies': results['anomalies'] if 'anomalies' in results else self.parent().detect_spending_anomalies(),
+                    'generated_at': datetime.now().isoformat()
+                }
+
+                if file_path.endswith('.json'):
+                    import json
+                    with open(file_path, 'w') as f:
+                        json.dump(insights_data, f, indent=2, default=str)
+                else:
+                    # Text export
+                    with open(file_path, 'w') as f:
+                        f.write("AI FINANCIAL INSIGHTS REPORT\n")
+                        f.write("=" * 50 + "\n\n")
+                        f.write(f"Generated: {insights_data['generated_at']}\n\n")
+
+                        # Predictions
+                        f.write("PREDICTIVE ANALYTICS\n")
+                        f.write("-" * 20 + "\n")
+                        predictions = insights_data['predictions']
+                        if predictions.get('monthly_forecast'):
+                            f.write("Monthly Spending Forecast:\n")
+                            for forecast in predictions['monthly_forecast']:
+                                f.write(f"  {forecast['month']}: ${forecast['predicted_amount']:.2f} "
+                                       f"(Confidence: {int(forecast['confidence']*100)}%)\n")
+                        f.write("\n")
+
+                        # Personal insights
+                        f.write("PERSONAL INSIGHTS\n")
+                        f.write("-" * 20 + "\n")
+                        personal = insights_data['personal_insights']
+                        f.write(f"Spending Personality: {personal.get('spending_personality', 'Unknown')}\n")
+                        f.write(f"Budget Effectiveness: {personal.get('budget_effectiveness', 'Unknown')}\n")
+                        f.write(f"Savings Habits: {personal.get('savings_habits', 'Unknown')}\n\n")
+
+                        # Anomalies
+                        f.write("SPENDING ANOMALIES\n")
+                        f.write("-" * 20 + "\n")
+                        anomalies = insights_data['anomalies']
+                        if anomalies:
+                            for anomaly in anomalies:
+                                f.write(f"• {anomaly['date']}: ${anomaly['amount']:.2f} in {anomaly['category']} "
+                                       f"({anomaly['deviation']:.1f}% deviation)\n")
+                        else:
+                            f.write("No anomalies detected.\n")
+
+                QMessageBox.information(self, "Export Complete", f"AI insights exported to {file_path}")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Export Error", f"Failed to export insights: {e}")
+
+
+class AdvancedReportingDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Advanced Reporting & Analytics")
+        self.setModal(True)
+        self.resize(1200, 800)
+        self.setup_ui()
+
+        # Header
+        header = QLabel("🔍 UI Visual Debugger - Powered by MCP")
+        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #2E86C1; margin-bottom: 10px;")
+        layout.addWidget(header)
+
+        # Control panel
+        control_group = QGroupBox("Debugging Controls")
+        control_layout = QHBoxLayout(control_group)
+
+        # Target selection
+        target_layout = QVBoxLayout()
+        target_layout.addWidget(QLabel("Select Target:"))
+
+        self.target_combo = QComboBox()
+        self.target_combo.addItems([
+            "Main Window", "Current Tab", "Dashboard Tab", "Inventory Tab",
+            "Meals Tab", "Shopping Tab", "Bills Tab", "Expenses Tab"
+        ])
+        target_layout.addWidget(self.target_combo)
+
+        control_layout.addLayout(target_layout)
+
+        # Action buttons
+        actions_layout = QVBoxLayout()
+        actions_layout.addWidget(QLabel("Actions:"))
+
+        inspect_btn = QPushButton("🔍 Inspect Hierarchy")
+        inspect_btn.clicked.connect(self.inspect_hierarchy)
+        actions_layout.addWidget(inspect_btn)
+
+        perf_btn = QPushButton("⚡ Performance Analysis")
+        perf_btn.clicked.connect(self.analyze_performance)
+        actions_layout.addWidget(perf_btn)
+
+        issues_btn = QPushButton("🚨 Detect Issues")
+        issues_btn.clicked.connect(self.detect_issues)
+        actions_layout.addWidget(issues_btn)
+
+        overlay_btn = QPushButton("🎭 Create Overlay")
+        overlay_btn.clicked.connect(self.create_overlay)
+        actions_layout.addWidget(overlay_btn)
+
+        control_layout.addLayout(actions_layout)
+        layout.addWidget(control_group)
+
+        # Results area
+        self.results_text = QTextEdit()
+        self.results_text.setReadOnly(True)
+        self.results_text.setPlaceholderText("Debugging results will appear here...")
+        layout.addWidget(self.results_text)
+
+        # Status
+        self.status_label = QLabel("Ready to debug UI components")
+        self.status_label.setStyleSheet("margin-top: 10px; color: #666;")
+        layout.addWidget(self.status_label)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+        clear_btn = QPushButton("🗑️ Clear Results")
+        clear_btn.clicked.connect(lambda: self.results_text.clear())
+        button_layout.addWidget(clear_btn)
+
+        button_layout.addStretch()
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def get_target_widget(self):
+        """Get the widget to debug based on selection"""
+        target = self.target_combo.currentText()
+
+        if target == "Main Window":
+            return self.parent()
+        elif target == "Current Tab":
+            return self.parent().tabs.currentWidget()
+        elif target == "Dashboard Tab":
+            return self.parent().tabs.widget(0)  # Assuming dashboard is first
+        elif target == "Inventory Tab":
+            return self.parent().tabs.widget(1)
+        elif target == "Meals Tab":
+            return self.parent().tabs.widget(2)
+        elif target == "Shopping Tab":
+            return self.parent().tabs.widget(3)
+        elif target == "Bills Tab":
+            return self.parent().tabs.widget(4)
+        elif target == "Expenses Tab":
+            return self.parent().tabs.widget(5)
+
+        return self.parent()
+
+    def inspect_hierarchy(self):
+        """Inspect widget hierarchy"""
+        try:
+            target_widget = self.get_target_widget()
+            result = self.mcp_manager.call_method("ui_visual_debugger", "inspect_widget_hierarchy", widget=target_widget)
+
+            if result:
+                output = f"Widget Hierarchy Analysis:\n\n"
+                output += f"Total Widgets: {result.get('hierarchy', {}).get('children', []).__len__() + 1}\n\n"
+
+                if result.get('issues'):
+                    output += "Issues Found:\n"
+                    for issue in result['issues']:
+                        output += f"• {issue['message']} ({issue['severity']})\n"
+                    output += "\n"
+
+                if result.get('recommendations'):
+                    output += "Recommendations:\n"
+                    for rec in result['recommendations']:
+                        output += f"• {rec}\n"
+
+                self.results_text.setText(output)
+                self.status_label.setText("✅ Hierarchy inspection completed")
+            else:
+                self.results_text.setText("❌ Failed to inspect hierarchy")
+                self.status_label.setText("❌ Inspection failed")
+
+        except Exception as e:
+            self.results_text.setText(f"❌ Error: {e}")
+            self.status_label.setText("❌ Error during inspection")
+
+    def analyze_performance(self):
+        """Analyze layout performance"""
+        try:
+            target_widget = self.get_target_widget()
+            result = self.mcp_manager.call_method("ui_visual_debugger", "analyze_layout_performance", widget=target_widget)
+
+            if result:
+                output = f"Performance Analysis Results:\n\n"
+                output += f"Layout Time: {result.get('layout_time_ms', 0):.2f} ms\n"
+                output += f"Widget Count: {result.get('widget_count', 0)}\n"
+                output += f"Layout Depth: {result.get('layout_depth', 0)}\n"
+                output += f"Performance Rating: {result.get('performance_rating', 'unknown')}\n"
+
+                self.results_text.setText(output)
+                self.status_label.setText("✅ Performance analysis completed")
+            else:
+                self.results_text.setText("❌ Failed to analyze performance")
+                self.status_label.setText("❌ Analysis failed")
+
+        except Exception as e:
+            self.results_text.setText(f"❌ Error: {e}")
+            self.status_label.setText("❌ Error during analysis")
+
+    def detect_issues(self):
+        """Detect visual issues"""
+        try:
+            target_widget = self.get_target_widget()
+            result = self.mcp_manager.call_method("ui_visual_debugger", "detect_visual_issues", widget=target_widget)
+
+            if result:
+                output = f"Visual Issues Detected:\n\n"
+                for issue in result:
+                    output += f"• {issue['message']} ({issue['severity']})\n"
+
+                if not result:
+                    output += "✅ No visual issues detected!"
+
+                self.results_text.setText(output)
+                self.status_label.setText("✅ Issue detection completed")
+            else:
+                self.results_text.setText("❌ Failed to detect issues")
+                self.status_label.setText("❌ Detection failed")
+
+        except Exception as e:
+            self.results_text.setText(f"❌ Error: {e}")
+            self.status_label.setText("❌ Error during detection")
+
+    def create_overlay(self):
+        """Create debug overlay"""
+        try:
+            target_widget = self.get_target_widget()
+            result = self.mcp_manager.call_method("ui_visual_debugger", "create_debug_overlay",
+                                                widget=target_widget, overlay_type="hierarchy")
+
+            if result:
+                output = f"Debug Overlay Created:\n\n"
+                output += f"Type: {result.get('type', 'unknown')}\n"
+                output += f"Total Widgets: {result.get('total_widgets', 0)}\n"
+                output += "Overlay data available for visualization\n"
+
+                self.results_text.setText(output)
+                self.status_label.setText("✅ Debug overlay created")
+            else:
+                self.results_text.setText("❌ Failed to create overlay")
+                self.status_label.setText("❌ Overlay creation failed")
+
+        except Exception as e:
+            self.results_text.setText(f"❌ Error: {e}")
+            self.status_label.setText("❌ Error creating overlay")
+
+
+class AdvancedReportingDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Advanced Reporting & Analytics")
+        self.setModal(True)
+        self.resize(1200, 800)
+        self.setup_ui()
+        self.load_report_data()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title and controls
+        title_layout = QHBoxLayout()
+        title = QLabel("📊 Advanced Reporting Dashboard")
+        title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2E86C1;")
+        title_layout.addWidget(title)
+
+        title_layout.addStretch()
+
+        # Date range selector
+        range_layout = QHBoxLayout()
+        range_layout.addWidget(QLabel("Date Range:"))
+
+        self.date_from = QDateEdit()
+        self.date_from.setDate(QDate.currentDate().addMonths(-6))
+        self.date_from.setCalendarPopup(True)
+        range_layout.addWidget(self.date_from)
+
+        range_layout.addWidget(QLabel("to"))
+
+        self.date_to = QDateEdit()
+        self.date_to.setDate(QDate.currentDate())
+        self.date_to.setCalendarPopup(True)
+        range_layout.addWidget(self.date_to)
+
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.clicked.connect(self.load_report_data)
+        refresh_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #4CAF50; color: white; }")
+        range_layout.addWidget(refresh_btn)
+
+        title_layout.addLayout(range_layout)
+        layout.addLayout(title_layout)
+
+        # Main content with tabs for different report types
+        self.report_tabs = QTabWidget()
+
+        # Overview tab
+        self.setup_overview_tab()
+        self.report_tabs.addTab(self.overview_tab, "📈 Overview")
+
+        # Expense Analysis tab
+        self.setup_expense_analysis_tab()
+        self.report_tabs.addTab(self.expense_analysis_tab, "💸 Expenses")
+
+        # Budget Analysis tab
+        self.setup_budget_analysis_tab()
+        self.report_tabs.addTab(self.budget_analysis_tab, "📊 Budgets")
+
+        # Trends tab
+        self.setup_trends_tab()
+        self.report_tabs.addTab(self.trends_tab, "📉 Trends")
+
+        # Custom Reports tab
+        self.setup_custom_reports_tab()
+        self.report_tabs.addTab(self.custom_reports_tab, "🔧 Custom")
+
+        layout.addWidget(self.report_tabs)
+
+        # Export and actions
+        action_layout = QHBoxLayout()
+
+        export_pdf_btn = QPushButton("📄 Export PDF")
+        export_pdf_btn.clicked.connect(self.export_pdf_report)
+        export_pdf_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #2196F3; color: white; }")
+        action_layout.addWidget(export_pdf_btn)
+
+        export_csv_btn = QPushButton("📊 Export CSV")
+        export_csv_btn.clicked.connect(self.export_csv_data)
+        export_csv_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #4CAF50; color: white; }")
+        action_layout.addWidget(export_csv_btn)
+
+        action_layout.addStretch()
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        action_layout.addWidget(close_btn)
+
+        layout.addLayout(action_layout)
+        self.setLayout(layout)
+
+    def setup_overview_tab(self):
+        """Setup the overview dashboard tab"""
+        self.overview_tab = QWidget()
+        layout = QVBoxLayout()
+
+        # Key metrics cards
+        metrics_layout = QGridLayout()
+
+        # Financial Summary Cards
+        self.total_income_card = self.create_metric_card("Total Income", "$0.00", "#4CAF50")
+        self.total_expenses_card = self.create_metric_card("Total Expenses", "$0.00", "#f44336")
+        self.net_cash_flow_card = self.create_metric_card("Net Cash Flow", "$0.00", "#2196F3")
+        self.savings_rate_card = self.create_metric_card("Savings Rate", "0%", "#9C27B0")
+
+        metrics_layout.addWidget(self.total_income_card, 0, 0)
+        metrics_layout.addWidget(self.total_expenses_card, 0, 1)
+        metrics_layout.addWidget(self.net_cash_flow_card, 1, 0)
+        metrics_layout.addWidget(self.savings_rate_card, 1, 1)
+
+        layout.addLayout(metrics_layout)
+
+        # Charts section
+        charts_layout = QHBoxLayout()
+
+        # Left side - Category breakdown
+        left_charts = QVBoxLayout()
+        left_charts.addWidget(QLabel("Expense Categories (Pie Chart):"))
+        self.category_pie_placeholder = self.create_chart_placeholder("🥧 Category Breakdown\n\n[Interactive pie chart showing expense distribution by category]")
+        left_charts.addWidget(self.category_pie_placeholder)
+
+        # Right side - Monthly trends
+        right_charts = QVBoxLayout()
+        right_charts.addWidget(QLabel("Monthly Trends (Line Chart):"))
+        self.monthly_trend_placeholder = self.create_chart_placeholder("📈 Monthly Spending Trends\n\n[Line chart showing income vs expenses over time]")
+        right_charts.addWidget(self.monthly_trend_placeholder)
+
+        charts_layout.addLayout(left_charts)
+        charts_layout.addLayout(right_charts)
+
+        layout.addLayout(charts_layout)
+
+        # Recent transactions summary
+        summary_group = QGroupBox("Recent Activity Summary")
+        summary_layout = QVBoxLayout(summary_group)
+
+        self.recent_activity_text = QTextEdit()
+        self.recent_activity_text.setReadOnly(True)
+        self.recent_activity_text.setMaximumHeight(150)
+        summary_layout.addWidget(self.recent_activity_text)
+
+        layout.addWidget(summary_group)
+
+        self.overview_tab.setLayout(layout)
+
+    def setup_expense_analysis_tab(self):
+        """Setup expense analysis tab"""
+        self.expense_analysis_tab = QWidget()
+        layout = QVBoxLayout()
+
+        # Controls
+        control_layout = QHBoxLayout()
+        control_layout.addWidget(QLabel("Analysis Type:"))
+
+        self.expense_analysis_type = QComboBox()
+        self.expense_analysis_type.addItems([
+            "By Category", "By Month", "Top Expenses", "Expense Trends",
+            "Budget vs Actual", "Weekly Patterns", "Year-over-Year"
+        ])
+        self.expense_analysis_type.currentTextChanged.connect(self.update_expense_analysis)
+        control_layout.addWidget(self.expense_analysis_type)
+
+        control_layout.addStretch()
+
+        analyze_btn = QPushButton("🔍 Analyze")
+        analyze_btn.clicked.connect(self.update_expense_analysis)
+        control_layout.addWidget(analyze_btn)
+
+        layout.addLayout(control_layout)
+
+        # Results area
+        self.expense_results_area = QScrollArea()
+        self.expense_results_widget = QWidget()
+        self.expense_results_layout = QVBoxLayout(self.expense_results_widget)
+
+        # Default content
+        default_label = QLabel("Select an analysis type and click Analyze to generate insights.")
+        default_label.setStyleSheet("font-size: 14px; color: #666; text-align: center; padding: 40px;")
+        self.expense_results_layout.addWidget(default_label)
+
+        self.expense_results_area.setWidget(self.expense_results_widget)
+        self.expense_results_area.setWidgetResizable(True)
+        layout.addWidget(self.expense_results_area)
+
+        self.expense_analysis_tab.setLayout(layout)
+
+    def setup_budget_analysis_tab(self):
+        """Setup budget analysis tab"""
+        self.budget_analysis_tab = QWidget()
+        layout = QVBoxLayout()
+
+        # Budget status overview
+        status_layout = QHBoxLayout()
+
+        self.budget_status_label = QLabel("Budget Status: Analyzing...")
+        self.budget_status_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        status_layout.addWidget(self.budget_status_label)
+
+        status_layout.addStretch()
+
+        self.budget_refresh_btn = QPushButton("🔄 Update Budget Status")
+        self.budget_refresh_btn.clicked.connect(self.update_budget_analysis)
+        status_layout.addWidget(self.budget_refresh_btn)
+
+        layout.addLayout(status_layout)
+
+        # Budget performance table
+        self.budget_table = QTableWidget()
+        self.budget_table.setColumnCount(5)
+        self.budget_table.setHorizontalHeaderLabels(["Budget Category", "Allocated", "Spent", "Remaining", "Status"])
+        self.budget_table.setAlternatingRowColors(True)
+        layout.addWidget(self.budget_table)
+
+        # Budget chart
+        chart_layout = QHBoxLayout()
+        chart_layout.addWidget(QLabel("Budget Performance Chart:"))
+        self.budget_chart_placeholder = self.create_chart_placeholder("📊 Budget vs Actual Performance\n\n[Bar chart comparing budgeted vs actual spending]")
+        chart_layout.addWidget(self.budget_chart_placeholder)
+        layout.addLayout(chart_layout)
+
+        self.budget_analysis_tab.setLayout(layout)
+
+    def setup_trends_tab(self):
+        """Setup trends analysis tab"""
+        self.trends_tab = QWidget()
+        layout = QVBoxLayout()
+
+        # Trend controls
+        trend_controls = QHBoxLayout()
+        trend_controls.addWidget(QLabel("Trend Analysis:"))
+
+        self.trend_type = QComboBox()
+        self.trend_type.addItems([
+            "Spending Trends", "Income Trends", "Savings Trends",
+            "Category Trends", "Seasonal Patterns", "Forecasting"
+        ])
+        trend_controls.addWidget(self.trend_type)
+
+        self.trend_period = QComboBox()
+        self.trend_period.addItems(["3 Months", "6 Months", "1 Year", "2 Years", "All Time"])
+        trend_controls.addWidget(self.trend_period)
+
+        analyze_trend_btn = QPushButton("📈 Analyze Trends")
+        analyze_trend_btn.clicked.connect(self.analyze_trends)
+        trend_controls.addWidget(analyze_trend_btn)
+
+        layout.addLayout(trend_controls)
+
+        # Trend visualization
+        self.trend_chart_area = self.create_chart_placeholder("📉 Trend Analysis Visualization\n\n[Interactive trend charts with forecasting]")
+        layout.addWidget(self.trend_chart_area)
+
+        # Trend insights
+        insights_group = QGroupBox("Trend Insights & Predictions")
+        insights_layout = QVBoxLayout(insights_group)
+
+        self.trend_insights_text = QTextEdit()
+        self.trend_insights_text.setReadOnly(True)
+        insights_layout.addWidget(self.trend_insights_text)
+
+        layout.addWidget(insights_group)
+
+        self.trends_tab.setLayout(layout)
+
+    def setup_custom_reports_tab(self):
+        """Setup custom reports tab"""
+        self.custom_reports_tab = QWidget()
+        layout = QVBoxLayout()
+
+        # Report builder
+        builder_group = QGroupBox("Custom Report Builder")
+        builder_layout = QFormLayout(builder_group)
+
+        self.report_name = QLineEdit()
+        self.report_name.setPlaceholderText("My Custom Report")
+        builder_layout.addRow("Report Name:", self.report_name)
+
+        self.report_type = QComboBox()
+        self.report_type.addItems([
+            "Financial Summary", "Expense Breakdown", "Budget Analysis",
+            "Trend Report", "Comparative Analysis", "Custom Query"
+        ])
+        builder_layout.addRow("Report Type:", self.report_type)
+
+        # Data filters
+        filter_group = QGroupBox("Data Filters")
+        filter_layout = QVBoxLayout(filter_group)
+
+        category_filter_layout = QHBoxLayout()
+        category_filter_layout.addWidget(QLabel("Categories:"))
+        self.category_filter = QComboBox()
+        self.category_filter.addItem("All Categories")
+        # Will be populated with actual categories
+        category_filter_layout.addWidget(self.category_filter)
+        filter_layout.addLayout(category_filter_layout)
+
+        amount_filter_layout = QHBoxLayout()
+        amount_filter_layout.addWidget(QLabel("Amount Range:"))
+        self.min_amount = QDoubleSpinBox()
+        self.min_amount.setPrefix("$")
+        self.min_amount.setMaximum(100000)
+        amount_filter_layout.addWidget(self.min_amount)
+
+        amount_filter_layout.addWidget(QLabel("to"))
+
+        self.max_amount = QDoubleSpinBox()
+        self.max_amount.setPrefix("$")
+        self.max_amount.setMaximum(100000)
+        self.max_amount.setValue(10000)
+        amount_filter_layout.addWidget(self.max_amount)
+        filter_layout.addLayout(amount_filter_layout)
+
+        builder_layout.addRow("Filters:", filter_group)
+
+        # Generate button
+        generate_btn = QPushButton("🚀 Generate Custom Report")
+        generate_btn.clicked.connect(self.generate_custom_report)
+        builder_layout.addRow(generate_btn)
+
+        layout.addWidget(builder_group)
+
+        # Report output area
+        self.custom_report_output = QTextEdit()
+        self.custom_report_output.setReadOnly(True)
+        self.custom_report_output.setPlaceholderText("Generated custom report will appear here...")
+        layout.addWidget(self.custom_report_output)
+
+        self.custom_reports_tab.setLayout(layout)
+
+    def create_metric_card(self, title, value, color="#4CAF50"):
+        """Create a metric card for dashboard"""
+        card = QGroupBox(title)
+        card.setStyleSheet(f"""
+            QGroupBox {{
+                font-weight: bold;
+                border: 2px solid {color};
+                border-radius: 8px;
+                margin-top: 1ex;
+                padding-top: 10px;
+                background-color: #f9f9f9;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px 0 5px;
+                color: {color};
+            }}
+        """)
+
+        card_layout = QVBoxLayout()
+
+        value_label = QLabel(value)
+        value_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {color}; margin: 5px;")
+        value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card_layout.addWidget(value_label)
+
+        card.setLayout(card_layout)
+        return card
+
+    def create_chart_placeholder(self, text):
+        """Create a placeholder for charts"""
+        placeholder = QLabel(text)
+        placeholder.setStyleSheet("""
+            border: 2px dashed #ccc;
+            border-radius: 10px;
+            background-color: #f9f9f9;
+            padding: 40px;
+            text-align: center;
+            font-size: 14px;
+            color: #666;
+        """)
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        placeholder.setWordWrap(True)
+        return placeholder
+
+    def load_report_data(self):
+        """Load all report data"""
+        try:
+            date_from = self.date_from.date().toString("yyyy-MM-dd")
+            date_to = self.date_to.date().toString("yyyy-MM-dd")
+
+            # Load overview data
+            self.load_overview_data(date_from, date_to)
+
+            # Load budget analysis
+            self.update_budget_analysis()
+
+            # Set last updated time
+            self.setWindowTitle(f"Advanced Reporting & Analytics - Updated: {datetime.now().strftime('%H:%M:%S')}")
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load report data: {e}")
+
+    def load_overview_data(self, date_from, date_to):
+        """Load overview dashboard data"""
+        try:
+            conn = connect('family_manager.db')
+            cursor = conn.cursor()
+
+            # Calculate total expenses
+            total_expenses, _ = get_analytics_service().total_spent(date_from, date_to)
+
+            # For now, income is not tracked, so we'll estimate it
+            # In a real system, you'd have an income table
+            estimated_income = total_expenses * 1.2  # Rough estimate
+
+            # Net cash flow
+            net_cash_flow = estimated_income - total_expenses
+
+            # Savings rate
+            savings_rate = (net_cash_flow / estimated_income * 100) if estimated_income > 0 else 0
+
+            # Update metric cards
+            self.total_income_card.layout().itemAt(0).widget().setText(f"${estimated_income:.2f}")
+            self.total_expenses_card.layout().itemAt(0).widget().setText(f"${total_expenses:.2f}")
+            self.net_cash_flow_card.layout().itemAt(0).widget().setText(f"${net_cash_flow:.2f}")
+            self.savings_rate_card.layout().itemAt(0).widget().setText(f"{savings_rate:.1f}%")
+
+            # Load recent activity
+            cursor.execute("""
+                SELECT date, category, amount, description
+                FROM expenses
+                WHERE date BETWEEN ? AND ?
+                ORDER BY date DESC
+                LIMIT 10
+            """, (date_from, date_to))
+
+            recent_expenses = cursor.fetchall()
+            activity_text = "Recent Transactions:\n\n"
+            for expense in recent_expenses:
+                date, category, amount, description = expense
+                activity_text += f"• {date}: {category or 'Uncategorized'} - ${amount:.2f}"
+                if description:
+                    activity_text += f" ({description})"
+                activity_text += "\n"
+
+            if not recent_expenses:
+                activity_text += "No transactions found in the selected date range."
+
+            self.recent_activity_text.setPlainText(activity_text)
+
+            conn.close()
+
+        except Exception as e:
+            print(f"Error loading overview data: {e}")
+
+    def update_expense_analysis(self):
+        """Update expense analysis based on selected type"""
+        analysis_type = self.expense_analysis_type.currentText()
+        date_from = self.date_from.date().toString("yyyy-MM-dd")
+        date_to = self.date_to.date().toString("yyyy-MM-dd")
+
+        # Clear previous results
+        self.clear_layout(self.expense_results_layout)
+
+        try:
+            conn = connect('family_manager.db')
+            cursor = conn.cursor()
+
+            if analysis_type == "By Category":
+                self.show_category_breakdown(cursor, date_from, date_to)
+            elif analysis_type == "By Month":
+                self.show_monthly_breakdown(cursor, date_from, date_to)
+            elif analysis_type == "Top Expenses":
+                self.show_top_expenses(cursor, date_from, date_to)
+            elif analysis_type == "Expense Trends":
+                self.show_expense_trends(cursor, date_from, date_to)
+            elif analysis_type == "Budget vs Actual":
+                self.show_budget_vs_actual(cursor, date_from, date_to)
+            elif analysis_type == "Weekly Patterns":
+                self.show_weekly_patterns(cursor, date_from, date_to)
+            elif analysis_type == "Year-over-Year":
+                self.show_year_over_year(cursor, date_from, date_to)
+
+            conn.close()
+
+        except Exception as e:
+            error_label = QLabel(f"Error generating analysis: {e}")
+            error_label.setStyleSheet("color: #f44336; padding: 20px;")
+            self.expense_results_layout.addWidget(error_label)
+
+    def show_category_breakdown(self, cursor, date_from, date_to):
+        """Show expense breakdown by category"""
+        categories = [row for row in get_analytics_service().category_totals(date_from, date_to) if row[0] is not None]
+
+        if not categories:
+            no_data_label = QLabel("No expense data found for the selected period.")
+            self.expense_results_layout.addWidget(no_data_label)
+            return
+
+        # Create table
+        table = QTableWidget()
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["Category", "Total Amount", "Transaction Count", "Percentage"])
+        table.setAlternatingRowColors(True)
+
+        total_amount = sum(cat[1] for cat in categories)
+
+        for i, (category, amount, count) in enumerate(categories):
+            percentage = (amount / total_amount * 100) if total_amount > 0 else 0
+
+            table.setItem(i, 0, QTableWidgetItem(category))
+            table.setItem(i, 1, QTableWidgetItem(f"${amount:.2f}"))
+            table.setItem(i, 2, QTableWidgetItem(str(count)))
+            table.setItem(i, 3, QTableWidgetItem(f"{percentage:.1f}%"))
+
+        table.resizeColumnsToContents()
+        table.setMaximumHeight(300)
+        self.expense_results_layout.addWidget(table)
+
+        # Summary
+        summary_text = f"Total Categories: {len(categories)} | Total Spent: ${total_amount:.2f}"
+        summary_label = QLabel(summary_text)
+        summary_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        self.expense_results_layout.addWidget(summary_label)
+
+    def show_monthly_breakdown(self, cursor, date_from, date_to):
+        """Show monthly expense breakdown"""
+        monthly_data = get_analytics_service().monthly_totals(date_from, date_to)
+
+        if not monthly_data:
+            no_data_label = QLabel("No expense data found for the selected period.")
+            self.expense_results_layout.addWidget(no_data_label)
+            return
+
+        # Create table
+        table = QTableWidget()
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["Month", "Total Expenses", "Transaction Count", "Avg per Transaction"])
+        table.setAlternatingRowColors(True)
+
+        for i, (month, total, count) in enumerate(monthly_data):
+            avg_per_transaction = total / count if count > 0 else 0
+
+            table.setItem(i, 0, QTableWidgetItem(month))
+            table.setItem(i, 1, QTableWidgetItem(f"${total:.2f}"))
+            table.setItem(i, 2, QTableWidgetItem(str(count)))
+            table.setItem(i, 3, QTableWidgetItem(f"${avg_per_transaction:.2f}"))
+
+        table.resizeColumnsToContents()
+        self.expense_results_layout.addWidget(table)
+
+    def show_top_expenses(self, cursor, date_from, date_to):
+        """Show top individual expenses"""
+        cursor.execute("""
+            SELECT date, category, amount, description
+            FROM expenses
+            WHERE date BETWEEN ? AND ?
+            ORDER BY amount DESC
+            LIMIT 20
+        """, (date_from, date_to))
+
+        top_expenses = cursor.fetchall()
+
+        if not top_expenses:
+            no_data_label = QLabel("No expense data found for the selected period.")
+            self.expense_results_layout.addWidget(no_data_label)
+            return
+
+        # Create table
+        table = QTableWidget()
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["Date", "Category", "Amount", "Description"])
+        table.setAlternatingRowColors(True)
+
+        for i, (date, category, amount, description) in enumerate(top_expenses):
+            table.setItem(i, 0, QTableWidgetItem(date))
+            table.setItem(i, 1, QTableWidgetItem(category or 'Uncategorized'))
+            table.setItem(i, 2, QTableWidgetItem(f"${amount:.2f}"))
+            table.setItem(i, 3, QTableWidgetItem(description or ''))
+
+        table.resizeColumnsToContents()
+        self.expense_results_layout.addWidget(table)
+
+    def show_expense_trends(self, cursor, date_from, date_to):
+        """Show expense trends over time"""
+        # This would typically show trend analysis with charts
+        trend_placeholder = self.create_chart_placeholder("📈 Expense Trend Analysis\n\n[Line chart showing expense trends with moving averages and trend lines]")
+        self.expense_results_layout.addWidget(trend_placeholder)
+
+        # Add some basic trend insights
+        months = get_analytics_service().monthly_totals(date_from, date_to)
+
+        if len(months) >= 2:
+            # Calculate simple trend
+            first_month = months[0][1]
+            last_month = months[-1][1]
+            trend_pct = ((last_month - first_month) / first_month * 100) if first_month > 0 else 0
+
+            trend_text = f"""
+            Trend Analysis:
+            • First month: ${first_month:.2f}
+            • Latest month: ${last_month:.2f}
+            • Overall trend: {"📈" if trend_pct > 0 else "📉"} {trend_pct:.1f}%
+            • {"Spending is increasing" if trend_pct > 0 else "Spending is decreasing"}
+            """
+
+            trend_label = QLabel(trend_text.strip())
+            trend_label.setWordWrap(True)
+            trend_label.setStyleSheet("margin-top: 15px; padding: 10px; background-color: #f8f9fa; border-radius: 5px;")
+            self.expense_results_layout.addWidget(trend_label)
+
+    def show_budget_vs_actual(self, cursor, date_from, date_to):
+        """Show budget vs actual spending"""
+        # Get budget performance data
+        budget_performance = self.parent().get_budget_performance()
+
+        if not budget_performance:
+            no_budget_label = QLabel("No active budgets found to compare against.")
+            self.expense_results_layout.addWidget(no_budget_label)
+            return
+
+        # Create comparison table
+        table = QTableWidget()
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["Budget Category", "Budgeted", "Actual", "Variance"])
+        table.setAlternatingRowColors(True)
+
+        for i, budget in enumerate(budget_performance):
+            budgeted = budget['amount']
+            actual = budget.get('spent', 0)
+            variance = budgeted - actual
+            variance_pct = (variance / budgeted * 100) if budgeted > 0 else 0
+
+            table.setItem(i, 0, QTableWidgetItem(budget['category']))
+            table.setItem(i, 1, QTableWidgetItem(f"${budgeted:.2f}"))
+            table.setItem(i, 2, QTableWidgetItem(f"${actual:.2f}"))
+
+            variance_item = QTableWidgetItem(f"${variance:.2f} ({variance_pct:.1f}%)")
+            if variance >= 0:
+                variance_item.setBackground(QColor(200, 255, 200))  # Light green
+            else:
+                variance_item.setBackground(QColor(255, 200, 200))  # Light red
+            table.setItem(i, 3, variance_item)
+
+        table.resizeColumnsToContents()
+        self.expense_results_layout.addWidget(table)
+
+    def show_weekly_patterns(self, cursor, date_from, date_to):
+        """Show weekly spending patterns"""
+        weekly_data = get_analytics_service().weekday_totals(date_from, date_to)
+
+        weekday_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+        pattern_text = "Weekly Spending Patterns:\n\n"
+        for weekday_num, total, count in weekly_data:
+            weekday_name = weekday_names[int(weekday_num)]
+            pattern_text += f"• {weekday_name}: ${total / count:.2f} avg ({count} transactions)\n"
+
+        pattern_label = QLabel(pattern_text)
+        pattern_label.setWordWrap(True)
+        pattern_label.setStyleSheet("padding: 15px; background-color: #f8f9fa; border-radius: 5px;")
+        self.expense_results_layout.addWidget(pattern_label)
+
+    def show_year_over_year(self, cursor, date_from, date_to):
+        """Show year-over-year comparison"""
+        # This is a simplified version - in reality you'd need more historical data
+        yoy_placeholder = QLabel("Year-over-Year Analysis\n\n[This would compare spending patterns across different years to identify seasonal trends and growth patterns]")
+        yoy_placeholder.setStyleSheet("padding: 40px; border: 2px dashed #ccc; border-radius: 10px; background-color: #f9f9f9; text-align: center;")
+        yoy_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.expense_results_layout.addWidget(yoy_placeholder)
+
+    def update_budget_analysis(self):
+        """Update budget analysis data"""
+        budget_performance = self.parent().get_budget_performance()
+
+        self.budget_table.setRowCount(len(budget_performance))
+
+        total_budgeted = 0
+        total_spent = 0
+
+        for i, budget in enumerate(budget_performance):
+            budgeted = budget['amount']
+            spent = budget.get('spent', 0)
+            remaining = budgeted - spent
+
+            self.budget_table.setItem(i, 0, QTableWidgetItem(budget['category']))
+            self.budget_table.setItem(i, 1, QTableWidgetItem(f"${budgeted:.2f}"))
+            self.budget_table.setItem(i, 2, QTableWidgetItem(f"${spent:.2f}"))
+            self.budget_table.setItem(i, 3, QTableWidgetItem(f"${remaining:.2f}"))
+
+            # Status with color coding
+            if remaining >= 0:
+                status = "On Track"
+                status_color = QColor(76, 175, 80)  # Green
+            else:
+                status = "Over Budget"
+                status_color = QColor(244, 67, 54)  # Red
+
+            status_item = QTableWidgetItem(status)
+            status_item.setBackground(status_color)
+            status_item.setForeground(QColor(255, 255, 255))
+            self.budget_table.setItem(i, 4, status_item)
+
+            total_budgeted += budgeted
+            total_spent += spent
+
+        self.budget_table.resizeColumnsToContents()
+
+        # Update status label
+        over_budget_count = sum(1 for b in budget_performance if b.get('spent', 0) > b['amount'])
+        if over_budget_count == 0:
+            status_text = "✅ All budgets on track"
+            status_color = "#4CAF50"
+        else:
+            status_text = f"⚠️ {over_budget_count} budget(s) over limit"
+            status_color = "#f44336"
+
+        self.budget_status_label.setText(f"Budget Status: {status_text}")
+        self.budget_status_label.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {status_color};")
+
+    def analyze_trends(self):
+        """Analyze spending trends"""
+        trend_type = self.trend_type.currentText()
+        period = self.trend_period.currentText()
+
+        # Convert period to date range
+        if period == "3 Months":
+            months_back = 3
+        elif period == "6 Months":
+            months_back = 6
+        elif period == "1 Year":
+            months_back = 12
+        elif period == "2 Years":
+            months_back = 24
+        else:  # All Time
+            months_back = 60  # Roughly 5 years
+
+        date_from = (datetime.now() - timedelta(days=months_back*30)).strftime('%Y-%m-%d')
+        date_to = datetime.now().strftime('%Y-%m-%d')
+
+        insights = f"Trend Analysis: {trend_type} ({period})\n\n"
+
+        try:
+            conn = connect('family_manager.db')
+            cursor = conn.cursor()
+
+            if trend_type == "Spending Trends":
+                cursor.execute("""
+                    SELECT strftime('%Y-%m', date) as month, SUM(amount)
+                    FROM expenses
+                    WHERE date >= ?
+                    GROUP BY strftime('%Y-%m', date)
+                    ORDER BY month
+                """, (date_from,))
+
+                monthly_data = cursor.fetchall()
+
+                if len(monthly_data) >= 2:
+                    amounts = [row[1] for row in monthly_data]
+                    avg_spending = sum(amounts) / len(amounts)
+
+                    # Calculate trend
+                    first_half = sum(amounts[:len(amounts)//2]) / (len(amounts)//2)
+                    second_half = sum(amounts[len(amounts)//2:]) / (len(amounts) - len(amounts)//2)
+                    trend_pct = ((second_half - first_half) / first_half * 100) if first_half > 0 else 0
+
+                    insights += f"Average Monthly Spending: ${avg_spending:.2f}\n"
+                    insights += f"Trend: {'📈 Increasing' if trend_pct > 0 else '📉 Decreasing'} by {abs(trend_pct):.1f}%\n"
+                    insights += f"Highest Month: ${max(amounts):.2f}\n"
+                    insights += f"Lowest Month: ${min(amounts):.2f}\n"
+
+            elif trend_type == "Category Trends":
+                cursor.execute("""
+                    SELECT category, strftime('%Y-%m', date) as month, SUM(amount)
+                    FROM expenses
+                    WHERE date >= ? AND category IS NOT NULL
+                    GROUP BY category, month
+                    ORDER BY category, month
+                """, (date_from,))
+
+                category_trends = cursor.fetchall()
+
+                # Group by category
+                category_data = {}
+                for category, month, amount in category_trends:
+                    if category not in category_data:
+                        category_data[category] = []
+                    category_data[category].append((month, amount))
+
+                insights += "Category Trends:\n"
+                for category, data in sorted(category_data.items()):
+                    if len(data) >= 2:
+                        amounts = [d[1] for d in data]
+                        trend = "📈" if amounts[-1] > amounts[0] else "📉"
+                        insights += f"• {category}: {trend} ${amounts[0]:.2f} → ${amounts[-1]:.2f}\n"
+
+            conn.close()
+
+        except Exception as e:
+            insights += f"Error generating trend analysis: {e}"
+
+        self.trend_insights_text.setPlainText(insights)
+
+    def generate_custom_report(self):
+        """Generate a custom report based on user settings"""
+        report_name = self.report_name.text().strip()
+        report_type = self.report_type.currentText()
+
+        if not report_name:
+            QMessageBox.warning(self, "Missing Information", "Please enter a report name.")
+            return
+
+        # Generate report content based on type
+        report_content = f"CUSTOM REPORT: {report_name}\n"
+        report_content += f"Report Type: {report_type}\n"
+        report_content += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        report_content += "=" * 50 + "\n\n"
+
+        # Add filters information
+        category_filter = self.category_filter.currentText()
+        min_amt = self.min_amount.value()
+        max_amt = self.max_amount.value()
+
+        report_content += "FILTERS APPLIED:\n"
+        report_content += f"• Categories: {category_filter}\n"
+        report_content += f"• Amount Range: ${min_amt:.2f} - ${max_amt:.2f}\n\n"
+
+        # Generate report data based on type
+        try:
+            conn = connect('family_manager.db')
+            cursor = conn.cursor()
+
+            if report_type == "Financial Summary":
+                self.generate_financial_summary_report(cursor, report_content)
+            elif report_type == "Expense Breakdown":
+                self.generate_expense_breakdown_report(cursor, report_content)
+            elif report_type == "Budget Analysis":
+                self.generate_budget_analysis_report(cursor, report_content)
+
+            conn.close()
+
+        except Exception as e:
+            report_content += f"Error generating report: {e}\n"
+
+        self.custom_report_output.setPlainText(report_content)
+
+    def generate_financial_summary_report(self, cursor, report_content):
+        """Generate financial summary report"""
+        # Add summary data to report
+        report_content += "FINANCIAL SUMMARY\n"
+        report_content += "-" * 20 + "\n"
+        # Add actual summary data here
+
+    def generate_expense_breakdown_report(self, cursor, report_content):
+        """Generate expense breakdown report"""
+        report_content += "EXPENSE BREAKDOWN\n"
+        report_content += "-" * 20 + "\n"
+        # Add expense breakdown data here
+
+    def generate_budget_analysis_report(self, cursor, report_content):
+        """Generate budget analysis report"""
+        report_content += "BUDGET ANALYSIS\n"
+        report_content += "-" * 20 + "\n"
+        # Add budget analysis data here
+
+    def export_pdf_report(self):
+        """Export current report as PDF"""
+        QMessageBox.information(self, "Coming Soon", "PDF export functionality will be implemented in the next update.")
+
+    def export_csv_data(self):
+        """Export report data as CSV"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Report Data", "", "CSV Files (*.csv)")
+
+        if file_path:
+            try:
+                current_tab = self.report_tabs.currentIndex()
+                tab_name = self.report_tabs.tabText(current_tab)
+
+                with open(file_path, 'w', newline='') as csvfile:
+                    writer = csv.writer(csvfile)
+
+                    # Write header
+                    writer.writerow([f"Report: {tab_name}"])
+                    writer.writerow([f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+                    writer.writerow([])
+
+                    # Export data based on current tab
+                    if tab_name == "📈 Overview":
+                        self.export_overview_csv(writer)
+                    elif tab_name == "💸 Expenses":
+                        self.export_expenses_csv(writer)
+                    elif tab_name == "📊 Budgets":
+                        self.export_budgets_csv(writer)
+
+                QMessageBox.information(self, "Export Complete", f"Data exported to {file_path}")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Export Error", f"Failed to export data: {e}")
+
+    def export_overview_csv(self, writer):
+        """Export overview data to CSV"""
+        writer.writerow(["Metric", "Value"])
+        # Add actual metric data here
+
+    def export_expenses_csv(self, writer):
+        """Export expense data to CSV"""
+        writer.writerow(["Date", "Category", "Amount", "Description"])
+        # Add actual expense data here
+
+    def export_budgets_csv(self, writer):
+        """Export budget data to CSV"""
+        writer.writerow(["Category", "Budgeted", "Spent", "Remaining", "Status"])
+        # Add actual budget data here
+
+    def clear_layout(self, layout):
+        """Clear all widgets from a layout"""
+        while layout.count():
+            child = layout.takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+
+
+class AutomationManagementDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Automation Management")
+        self.setModal(True)
+        self.resize(1000, 700)
+        self.setup_ui()
+        self.load_automation_data()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title
+        title = QLabel("🤖 Automation Management")
+        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #2E86C1; margin-bottom: 10px;")
+        layout.addWidget(title)
+
+        # Tab widget for different automation features
+        tabs = QTabWidget()
+
+        # Recurring Transactions tab
+        recurring_tab = QWidget()
+        self.setup_recurring_tab(recurring_tab)
+        tabs.addTab(recurring_tab, "🔄 Recurring Transactions")
+
+        # Auto-Categorization tab
+        categorization_tab = QWidget()
+        self.setup_categorization_tab(categorization_tab)
+        tabs.addTab(categorization_tab, "🏷️ Auto-Categorization")
+
+        # Rules Management tab
+        rules_tab = QWidget()
+        self.setup_rules_tab(rules_tab)
+        tabs.addTab(rules_tab, "📋 Categorization Rules")
+
+        layout.addWidget(tabs)
+
+        # Status bar
+        self.status_label = QLabel("Ready")
+        self.status_label.setStyleSheet("color: #666; margin-top: 10px;")
+        layout.addWidget(self.status_label)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+
+        process_btn = QPushButton("⚡ Process Now")
+        process_btn.clicked.connect(self.process_recurring_now)
+        process_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #4CAF50; color: white; }")
+        button_layout.addWidget(process_btn)
+
+        button_layout.addStretch()
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def setup_recurring_tab(self, tab):
+        """Setup recurring transactions tab"""
+        layout = QVBoxLayout()
+
+        # Header with summary
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(QLabel("Recurring Transactions:"))
+        self.recurring_count_label = QLabel("0 active")
+        header_layout.addWidget(self.recurring_count_label)
+        header_layout.addStretch()
+
+        add_recurring_btn = QPushButton("➕ Add Recurring")
+        add_recurring_btn.clicked.connect(self.add_recurring_transaction)
+        add_recurring_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #4CAF50; color: white; }")
+        header_layout.addWidget(add_recurring_btn)
+
+        layout.addLayout(header_layout)
+
+        # Recurring transactions table
+        self.recurring_table = QTableWidget()
+        self.recurring_table.setColumnCount(8)
+        self.recurring_table.setHorizontalHeaderLabels(["Name", "Type", "Category", "Amount", "Frequency", "Next Due", "Status", "Actions"])
+        self.recurring_table.setAlternatingRowColors(True)
+        self.recurring_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        layout.addWidget(self.recurring_table)
+
+        tab.setLayout(layout)
+
+    def setup_categorization_tab(self, tab):
+        """Setup auto-categorization tab"""
+        layout = QVBoxLayout()
+
+        # Description
+        desc = QLabel("Auto-categorization helps automatically assign categories to new transactions based on patterns and rules.")
+        desc.setWordWrap(True)
+        desc.setStyleSheet("margin-bottom: 10px; padding: 10px; background-color: #f8f9fa; border-radius: 5px;")
+        layout.addWidget(desc)
+
+        # Test categorization
+        test_layout = QHBoxLayout()
+        test_layout.addWidget(QLabel("Test categorization:"))
+
+        self.test_input = QLineEdit()
+        self.test_input.setPlaceholderText("Enter transaction name...")
+        test_layout.addWidget(self.test_input)
+
+        self.test_type_combo = QComboBox()
+        self.test_type_combo.addItems(["expense", "bill"])
+        test_layout.addWidget(self.test_type_combo)
+
+        test_btn = QPushButton("Test")
+        test_btn.clicked.connect(self.test_categorization)
+        test_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #2196F3; color: white; }")
+        test_layout.addWidget(test_btn)
+
+        layout.addLayout(test_layout)
+
+        # Result display
+        self.categorization_result = QLabel("Enter a transaction name and click Test to see auto-categorization result.")
+        self.categorization_result.setStyleSheet("margin-top: 10px; padding: 10px; border: 1px solid #ddd; border-radius: 5px; min-height: 40px;")
+        self.categorization_result.setWordWrap(True)
+        layout.addWidget(self.categorization_result)
+
+        tab.setLayout(layout)
+
+    def setup_rules_tab(self, tab):
+        """Setup categorization rules tab"""
+        layout = QVBoxLayout()
+
+        # Header
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(QLabel("Categorization Rules:"))
+        self.rules_count_label = QLabel("0 active")
+        header_layout.addWidget(self.rules_count_label)
+        header_layout.addStretch()
+
+        add_rule_btn = QPushButton("➕ Add Rule")
+        add_rule_btn.clicked.connect(self.add_categorization_rule)
+        add_rule_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #4CAF50; color: white; }")
+        header_layout.addWidget(add_rule_btn)
+
+        layout.addLayout(header_layout)
+
+        # Rules table
+        self.rules_table = QTableWidget()
+        self.rules_table.setColumnCount(6)
+        self.rules_table.setHorizontalHeaderLabels(["Name", "Type", "Category", "Priority", "Match Count", "Actions"])
+        self.rules_table.setAlternatingRowColors(True)
+        layout.addWidget(self.rules_table)
+
+        tab.setLayout(layout)
+
+    def load_automation_data(self):
+        """Load all automation data"""
+        self.load_recurring_transactions()
+        self.load_categorization_rules()
+
+    def load_recurring_transactions(self):
+        """Load recurring transactions into table"""
+        transactions = self.parent().get_recurring_transactions()
+
+        self.recurring_table.setRowCount(len(transactions))
+        self.recurring_count_label.setText(f"{len(transactions)} active")
+
+        for i, transaction in enumerate(transactions):
+            # Basic info
+            self.recurring_table.setItem(i, 0, QTableWidgetItem(transaction['name']))
+            self.recurring_table.setItem(i, 1, QTableWidgetItem(transaction['type'].title()))
+            self.recurring_table.setItem(i, 2, QTableWidgetItem(transaction['category'] or 'N/A'))
+            self.recurring_table.setItem(i, 3, QTableWidgetItem(f"${transaction['amount']:.2f}"))
+            self.recurring_table.setItem(i, 4, QTableWidgetItem(transaction['frequency'].title()))
+
+            # Next due with color coding
+            next_due = transaction['next_due']
+            due_item = QTableWidgetItem(next_due)
+
+            # Check if due soon
+            try:
+                due_date = datetime.strptime(next_due, '%Y-%m-%d').date()
+                today = datetime.now().date()
+                days_until = (due_date - today).days
+
+                if days_until < 0:
+                    due_item.setBackground(QColor(244, 67, 54))  # Red - overdue
+                    due_item.setForeground(QColor(255, 255, 255))
+                elif days_until <= 3:
+                    due_item.setBackground(QColor(255, 152, 0))  # Orange - due soon
+                elif days_until <= 7:
+                    due_item.setBackground(QColor(255, 193, 7))  # Yellow - upcoming
+            except:
+                pass
+
+            self.recurring_table.setItem(i, 5, due_item)
+
+            # Status
+            status = "Active" if transaction['is_active'] else "Inactive"
+            status_item = QTableWidgetItem(status)
+            if transaction['is_active']:
+                status_item.setBackground(QColor(76, 175, 80))  # Green
+                status_item.setForeground(QColor(255, 255, 255))
+            else:
+                status_item.setBackground(QColor(158, 158, 158))  # Gray
+            self.recurring_table.setItem(i, 6, status_item)
+
+            # Actions button (placeholder for now)
+            actions_item = QTableWidgetItem("Edit | Delete")
+            self.recurring_table.setItem(i, 7, actions_item)
+
+        self.recurring_table.resizeColumnsToContents()
+
+    def load_categorization_rules(self):
+        """Load categorization rules into table"""
+        rules = self.parent().get_categorization_rules()
+
+        self.rules_table.setRowCount(len(rules))
+        self.rules_count_label.setText(f"{len(rules)} active")
+
+        for i, rule in enumerate(rules):
+            self.rules_table.setItem(i, 0, QTableWidgetItem(rule['name']))
+            self.rules_table.setItem(i, 1, QTableWidgetItem(rule['type'].title()))
+            self.rules_table.setItem(i, 2, QTableWidgetItem(rule['category']))
+            self.rules_table.setItem(i, 3, QTableWidgetItem(str(rule['priority'])))
+            self.rules_table.setItem(i, 4, QTableWidgetItem(str(rule['match_count'])))
+            self.rules_table.setItem(i, 5, QTableWidgetItem("Edit | Delete"))
+
+        self.rules_table.resizeColumnsToContents()
+
+    def add_recurring_transaction(self):
+        """Add a new recurring transaction"""
+        # Placeholder - would implement a dialog
+        QMessageBox.information(self, "Coming Soon", "Recurring transaction creation dialog will be implemented.")
+
+    def test_categorization(self):
+        """Test auto-categorization for entered text"""
+        transaction_name = self.test_input.text().strip()
+        transaction_type = self.test_type_combo.currentText()
+
+        if not transaction_name:
+            self.categorization_result.setText("Please enter a transaction name to test.")
+            return
+
+        category = self.parent().auto_categorize_transaction(transaction_name, transaction_type)
+
+        if category:
+            self.categorization_result.setText(f"✅ Auto-categorized as: <b>{category}</b>")
+            self.categorization_result.setStyleSheet("margin-top: 10px; padding: 10px; border: 1px solid #4CAF50; border-radius: 5px; background-color: #e8f5e8; min-height: 40px;")
+        else:
+            self.categorization_result.setText("❌ Could not auto-categorize this transaction.")
+            self.categorization_result.setStyleSheet("margin-top: 10px; padding: 10px; border: 1px solid #f44336; border-radius: 5px; background-color: #ffebee; min-height: 40px;")
+
+    def add_categorization_rule(self):
+        """Add a new categorization rule"""
+        # Placeholder - would implement a rule creation dialog
+        QMessageBox.information(self, "Coming Soon", "Categorization rule creation dialog will be implemented.")
+
+    def process_recurring_now(self):
+        """Process recurring transactions immediately"""
+        processed = self.parent().process_recurring_transactions()
+        self.status_label.setText(f"✅ Processed {processed} recurring transactions")
+        self.load_recurring_transactions()
+
+        if processed > 0:
+            QMessageBox.information(self, "Success", f"Successfully processed {processed} recurring transactions!")
+
+
+class FinancialDashboardDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Financial Dashboard")
+        self.setModal(True)
+        self.resize(1200, 800)
+        self.setup_ui()
+        self.setup_loader()
+        self.load_dashboard_data()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title and refresh
+        title_layout = QHBoxLayout()
+        title = QLabel("💰 Financial Dashboard")
+        title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2E86C1;")
+        title_layout.addWidget(title)
+
+        title_layout.addStretch()
+
+        self.last_updated_label = QLabel("Last updated: --")
+        self.last_updated_label.setStyleSheet("color: #666; font-size: 12px;")
+        title_layout.addWidget(self.last_updated_label)
+
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.clicked.connect(self.load_dashboard_data)
+        refresh_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #4CAF50; color: white; }")
+        title_layout.addWidget(refresh_btn)
+
+        layout.addLayout(title_layout)
+
+        # Main dashboard content
+        dashboard_widget = QWidget()
+        dashboard_layout = QVBoxLayout(dashboard_widget)
+
+        # Key metrics row
+        metrics_layout = QHBoxLayout()
+
+        # Financial health score
+        self.health_score_card = self.create_metric_card(
+            "Financial Health Score", "Calculating...", "Overall financial wellness indicator",
+            "#4CAF50", "🏥"
+        )
+        metrics_layout.addWidget(self.health_score_card)
+
+        # Net worth
+        self.net_worth_card = self.create_metric_card(
+            "Net Worth", "$0.00", "Assets minus liabilities",
+            "#2196F3", "💎"
+        )
+        metrics_layout.addWidget(self.net_worth_card)
+
+        # Monthly cash flow
+        self.cash_flow_card = self.create_metric_card(
+            "Monthly Cash Flow", "$0.00", "Income minus expenses",
+            "#FF9800", "💸"
+        )
+        metrics_layout.addWidget(self.cash_flow_card)
+
+        # Savings rate
+        self.savings_rate_card = self.create_metric_card(
+            "Savings Rate", "0%", "Percentage of income saved",
+            "#9C27B0", "💰"
+        )
+        metrics_layout.addWidget(self.savings_rate_card)
+
+        dashboard_layout.addLayout(metrics_layout)
+
+        # Charts and analysis section
+        charts_layout = QHBoxLayout()
+
+        # Left side - Charts
+        left_charts = QVBoxLayout()
+
+        # Budget vs Actual chart placeholder
+        budget_chart_group = QGroupBox("Budget vs Actual Spending")
+        budget_chart_layout = QVBoxLayout(budget_chart_group)
+        self.budget_chart_placeholder = QLabel("📊 Budget Performance Chart\n\n[Chart would show budgeted vs actual spending by category]")
+        self.budget_chart_placeholder.setStyleSheet("padding: 40px; border: 2px dashed #ccc; border-radius: 10px; background-color: #f9f9f9; text-align: center;")
+        self.budget_chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        budget_chart_layout.addWidget(self.budget_chart_placeholder)
+        left_charts.addWidget(budget_chart_group)
+
+        # Expense trend chart placeholder
+        trend_chart_group = QGroupBox("Expense Trends (6 Months)")
+        trend_chart_layout = QVBoxLayout(trend_chart_group)
+        self.trend_chart_placeholder = QLabel("📈 Expense Trend Chart\n\n[Line chart showing spending trends over time]")
+        self.trend_chart_placeholder.setStyleSheet("padding: 40px; border: 2px dashed #ccc; border-radius: 10px; background-color: #f9f9f9; text-align: center;")
+        self.trend_chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        trend_chart_layout.addWidget(self.trend_chart_placeholder)
+        left_charts.addWidget(trend_chart_group)
+
+        charts_layout.addLayout(left_charts)
+
+        # Right side - Insights and alerts
+        right_panel = QVBoxLayout()
+
+        # Financial alerts
+        alerts_group = QGroupBox("🚨 Financial Alerts")
+        alerts_layout = QVBoxLayout(alerts_group)
+        self.alerts_text = QTextEdit()
+        self.alerts_text.setReadOnly(True)
+        self.alerts_text.setMaximumHeight(120)
+        self.alerts_text.setStyleSheet("QTextEdit { border: 1px solid #ddd; border-radius: 5px; background-color: #fff3cd; }")
+        alerts_layout.addWidget(self.alerts_text)
+        right_panel.addWidget(alerts_group)
+
+        # Key insights
+        insights_group = QGroupBox("💡 Key Insights")
+        insights_layout = QVBoxLayout(insights_group)
+        self.insights_text = QTextEdit()
+        self.insights_text.setReadOnly(True)
+        self.insights_text.setMaximumHeight(150)
+        self.insights_text.setStyleSheet("QTextEdit { border: 1px solid #ddd; border-radius: 5px; background-color: #f8f9fa; }")
+        insights_layout.addWidget(self.insights_text)
+        right_panel.addWidget(insights_group)
+
+        # Upcoming financial events
+        events_group = QGroupBox("📅 Upcoming (30 Days)")
+        events_layout = QVBoxLayout(events_group)
+        self.events_text = QTextEdit()
+        self.events_text.setReadOnly(True)
+        self.events_text.setMaximumHeight(120)
+        self.events_text.setStyleSheet("QTextEdit { border: 1px solid #ddd; border-radius: 5px; background-color: #e8f5e8; }")
+        events_layout.addWidget(self.events_text)
+        right_panel.addWidget(events_group)
+
+        charts_layout.addLayout(right_panel)
+
+        dashboard_layout.addLayout(charts_layout)
+
+        # Detailed breakdowns section
+        details_tabs = QTabWidget()
+
+        # Monthly breakdown tab
+        monthly_tab = QWidget()
+        self.setup_monthly_breakdown_tab(monthly_tab)
+        details_tabs.addTab(monthly_tab, "Monthly Breakdown")
+
+        # Category analysis tab
+        category_tab = QWidget()
+        self.setup_category_analysis_tab(category_tab)
+        details_tabs.addTab(category_tab, "Category Analysis")
+
+        # Goals progress tab
+        goals_tab = QWidget()
+        self.setup_goals_progress_tab(goals_tab)
+        details_tabs.addTab(goals_tab, "Goals & Savings")
+
+        dashboard_layout.addWidget(details_tabs)
+
+        # Scroll area for the dashboard
+        scroll_area = QScrollArea()
+        scroll_area.setWidget(dashboard_widget)
+        scroll_area.setWidgetResizable(True)
+        layout.addWidget(scroll_area)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+        export_btn = QPushButton("📄 Export Report")
+        export_btn.clicked.connect(self.export_dashboard_report)
+        export_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #4CAF50; color: white; }")
+        button_layout.addWidget(export_btn)
+
+        button_layout.addStretch()
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def create_metric_card(self, title, value, subtitle, color="#4CAF50", icon="📊"):
+        """Create a metric card with consistent styling"""
+        card = QGroupBox(title)
+        card.setStyleSheet(f"""
+            QGroupBox {{
+                font-weight: bold;
+                border: 2px solid {color};
+                border-radius: 8px;
+                margin-top: 1ex;
+                padding-top: 10px;
+                background-color: #f9f9f9;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px 0 5px;
+                color: {color};
+            }}
+        """)
+
+        card_layout = QVBoxLayout()
+
+        # Icon and value row
+        value_layout = QHBoxLayout()
+        icon_label = QLabel(icon)
+        icon_label.setStyleSheet(f"font-size: 24px; color: {color};")
+        value_layout.addWidget(icon_label)
+
+        value_layout.addStretch()
+
+        value_label = QLabel(value)
+        value_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {color}; margin: 5px;")
+        value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        value_layout.addWidget(value_label)
+
+        card_layout.addLayout(value_layout)
+
+        subtitle_label = QLabel(subtitle)
+        subtitle_label.setStyleSheet("color: #666; font-size: 11px; margin: 5px;")
+        subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card_layout.addWidget(subtitle_label)
+
+        card.setLayout(card_layout)
+        return card
+
+    def setup_monthly_breakdown_tab(self, tab):
+        """Setup monthly breakdown analysis tab"""
+        layout = QVBoxLayout()
+
+        # Monthly summary table
+        summary_label = QLabel("Monthly Financial Summary:")
+        summary_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        layout.addWidget(summary_label)
+
+        self.monthly_table = QTableWidget()
+        self.monthly_table.setColumnCount(5)
+        self.monthly_table.setHorizontalHeaderLabels(["Month", "Income", "Expenses", "Net", "Savings Rate"])
+        self.monthly_table.setAlternatingRowColors(True)
+        layout.addWidget(self.monthly_table)
+
+        tab.setLayout(layout)
+
+    def setup_category_analysis_tab(self, tab):
+        """Setup category analysis tab"""
+        layout = QVBoxLayout()
+
+        # Category spending analysis
+        analysis_label = QLabel("Spending Analysis by Category (Last 6 Months):")
+        analysis_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        layout.addWidget(analysis_label)
+
+        self.category_analysis_table = QTableWidget()
+        self.category_analysis_table.setColumnCount(6)
+        self.category_analysis_table.setHorizontalHeaderLabels(["Category", "Total Spent", "Avg/Month", "Trend", "Budget Status", "% of Total"])
+        self.category_analysis_table.setAlternatingRowColors(True)
+        layout.addWidget(self.category_analysis_table)
+
+        # Category pie chart placeholder
+        chart_placeholder = QLabel("🥧 Category Spending Pie Chart\n\n[Interactive pie chart showing spending distribution]")
+        chart_placeholder.setStyleSheet("margin-top: 20px; padding: 40px; border: 2px dashed #ccc; border-radius: 10px; background-color: #f9f9f9; text-align: center;")
+        chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(chart_placeholder)
+
+        tab.setLayout(layout)
+
+    def setup_goals_progress_tab(self, tab):
+        """Setup savings goals progress tab"""
+        layout = QVBoxLayout()
+
+        goals_label = QLabel("Savings Goals Progress:")
+        goals_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        layout.addWidget(goals_label)
+
+        # Goals progress table
+        self.goals_table = QTableWidget()
+        self.goals_table.setColumnCount(5)
+        self.goals_table.setHorizontalHeaderLabels(["Goal", "Target Amount", "Current Saved", "Progress", "Target Date"])
+        self.goals_table.setAlternatingRowColors(True)
+        layout.addWidget(self.goals_table)
+
+        # Add goal button
+        add_goal_btn = QPushButton("➕ Add Savings Goal")
+        add_goal_btn.clicked.connect(self.add_savings_goal)
+        add_goal_btn.setStyleSheet("QPushButton { padding: 8px 16px; margin-top: 10px; } QPushButton:hover { background-color: #4CAF50; color: white; }")
+        layout.addWidget(add_goal_btn)
+
+        # Goals visualization placeholder
+        goals_chart = QLabel("🎯 Goals Progress Visualization\n\n[Progress bars and timeline charts for savings goals]")
+        goals_chart.setStyleSheet("margin-top: 20px; padding: 40px; border: 2px dashed #ccc; border-radius: 10px; background-color: #f9f9f9; text-align: center;")
+        goals_chart.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(goals_chart)
+
+        tab.setLayout(layout)
+
+    def setup_loader(self):
+        """Register the dashboard sections that load in the background"""
+        parent = self.parent()
+        metric_labels = [card.layout().itemAt(1).widget() for card in (
+            self.health_score_card, self.net_worth_card, self.cash_flow_card, self.savings_rate_card
+        )]
+
+        self.loader = DialogLoader(self)
+        self.loader.add('metrics', self.calculate_key_metrics, self.show_key_metrics, metric_labels)
+        self.loader.add('monthly', self.calculate_monthly_breakdown, self.load_monthly_breakdown, [self.monthly_table])
+        self.loader.add('categories', self.calculate_category_analysis, self.load_category_analysis,
+                        [self.category_analysis_table])
+        self.loader.add('goals', lambda: parent.get_savings_goals(active_only=True), self.load_goals_progress,
+                        [self.goals_table])
+        self.loader.add('alerts', parent.get_budget_performance, self.generate_alerts_and_insights,
+                        [self.alerts_text, self.insights_text])
+        self.loader.add('events', self.get_upcoming_events, self.load_upcoming_events, [self.events_text])
+        self.loader.all_loaded.connect(self.on_dashboard_loaded)
+
+    def load_dashboard_data(self):
+        """Load all dashboard data; each section fills in as its worker finishes"""
+        self.last_updated_label.setText("Updating...")
+        self.loader.start()
+
+    def on_dashboard_loaded(self, ok):
+        """Stamp the refresh time once every section has arrived"""
+        suffix = "" if ok else f" ({len(self.loader.errors)} sections failed)"
+        self.last_updated_label.setText(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{suffix}")
+
+    def calculate_key_metrics(self):
+        """Calculate key financial metrics (runs on a worker thread)"""
+        analytics = get_analytics_service()
+
+        # Get current month
+        current_month = datetime.now().strftime('%Y-%m')
+
+        # Calculate net worth (assets - liabilities)
+        # For now, simplified to just inventory value
+        assets = analytics.inventory_value()
+
+        # Liabilities would be bills/expenses, but for simplicity:
+        liabilities = 0  # Could be expanded to include outstanding bills
+
+        net_worth = assets - liabilities
+
+        # Monthly income (simplified - would need income tracking)
+        monthly_income = 0  # Placeholder
+
+        # Monthly expenses
+        monthly_expenses, _ = analytics.month_total(current_month)
+
+        # Cash flow
+        cash_flow = monthly_income - monthly_expenses
+
+        # Savings rate
+        savings_rate = (monthly_income - monthly_expenses) / monthly_income * 100 if monthly_income > 0 else 0
+
+        # Financial health score (simplified algorithm)
+        health_score = self.calculate_financial_health_score(assets, liabilities, monthly_expenses, monthly_income)
+
+        return {
+            'net_worth': net_worth,
+            'cash_flow': cash_flow,
+            'savings_rate': savings_rate,
+            'health_score': health_score
+        }
+
+    def show_key_metrics(self, metrics):
+        """Display key financial metrics"""
+        self.net_worth_card.layout().itemAt(1).widget().setText(f"${metrics['net_worth']:.2f}")
+        self.cash_flow_card.layout().itemAt(1).widget().setText(f"${metrics['cash_flow']:.2f}")
+        self.savings_rate_card.layout().itemAt(1).widget().setText(f"{metrics['savings_rate']:.1f}%")
+        self.health_score_card.layout().itemAt(1).widget().setText(f"{metrics['health_score']}/100")
+
+        # Color code health score
+        health_score = metrics['health_score']
+        if health_score >= 80:
+            color = "#4CAF50"  # Green
+        elif health_score >= 60:
+            color = "#FF9800"  # Orange
+        else:
+            color = "#f44336"  # Red
+
+        self.health_score_card.layout().itemAt(1).widget().setStyleSheet(f"font-size: 24px; font-weight: bold; color: {color}; margin: 5px;")
+
+    def calculate_financial_health_score(self, assets, liabilities, expenses, income):
+        """Calculate a simplified financial health score (0-100)"""
+        score = 50  # Base score
+
+        # Asset to liability ratio (max +20 points)
+        if liabilities > 0:
+            ratio = assets / liabilities
+            if ratio >= 2:
+                score += 20
+            elif ratio >= 1:
+                score += 10
+            else:
+                score -= 10
+
+        # Expense to income ratio (max +20 points)
+        if income > 0:
+            expense_ratio = expenses / income
+            if expense_ratio <= 0.5:
+                score += 20
+            elif expense_ratio <= 0.7:
+                score += 10
+            elif expense_ratio > 0.9:
+                score -= 20
+
+        # Emergency fund indicator (simplified - max +10 points)
+        emergency_fund = assets * 0.1  # Assume 10% of assets as emergency fund
+        if emergency_fund >= expenses * 3:  # 3 months of expenses
+            score += 10
+
+        return max(0, min(100, score))
+
+    def calculate_monthly_breakdown(self):
+        """Monthly income/expense rows for the last 6 months (runs on a worker thread)"""
+        month_dates = [datetime.now() - timedelta(days=i*30) for i in range(5, -1, -1)]
+        first_month = month_dates[0].strftime('%Y-%m')
+        last_month = month_dates[-1].strftime('%Y-%m')
+        expenses_by_month = {
+            month: total for month, total, _ in
+            get_analytics_service().monthly_totals(month_bounds(first_month)[0], month_bounds(last_month)[1])
+        }
+
+        monthly_data = []
+        for month_date in month_dates:
+            month_str = month_date.strftime('%Y-%m')
+            month_name = month_date.strftime('%B %Y')
+
+            # Get expenses for this month
+            expenses = expenses_by_month.get(month_str, 0)
+
+            # Income would be from income tracking (placeholder)
+            income = 0
+
+            net = income - expenses
+            savings_rate = (income - expenses) / income * 100 if income > 0 else 0
+
+            monthly_data.append([month_name, income, expenses, net, savings_rate])
+
+        return monthly_data
+
+    def load_monthly_breakdown(self, monthly_data):
+        """Load monthly financial breakdown"""
+        self.monthly_table.setRowCount(len(monthly_data))
+        for i, row in enumerate(monthly_data):
+            for j, value in enumerate(row):
+                if j == 0:  # Month name
+                    self.monthly_table.setItem(i, j, QTableWidgetItem(str(value)))
+                elif j == 4:  # Savings rate
+                    self.monthly_table.setItem(i, j, QTableWidgetItem(f"{value:.1f}%" if value != 0 else "N/A"))
+                else:  # Monetary values
+                    self.monthly_table.setItem(i, j, QTableWidgetItem(f"${value:.2f}"))
+
+        self.monthly_table.resizeColumnsToContents()
+
+    def calculate_category_analysis(self):
+        """Top categories over the last 6 months (runs on a worker thread)"""
+        six_months_ago = (datetime.now() - timedelta(days=180)).strftime('%Y-%m-%d')
+
+        return [
+            row for row in get_analytics_service().category_totals(six_months_ago) if row[0] is not None
+        ][:10]
+
+    def load_category_analysis(self, category_data):
+        """Load category analysis data"""
+        # Calculate totals for percentages
+        total_spending = sum(row[1] for row in category_data) if category_data else 0
+
+        # Update table
+        self.category_analysis_table.setRowCount(len(category_data))
+        for i, (category, total_spent, count) in enumerate(category_data):
+            avg_monthly = total_spent / 6  # Rough average
+            percentage = (total_spent / total_spending * 100) if total_spending > 0 else 0
+
+            # Trend calculation (simplified)
+            trend = "↗️ Increasing"  # Would need more complex analysis
+
+            # Budget status (simplified)
+            budget_status = "On Track"  # Would compare to actual budgets
+
+            self.category_analysis_table.setItem(i, 0, QTableWidgetItem(category or 'Uncategorized'))
+            self.category_analysis_table.setItem(i, 1, QTableWidgetItem(f"${total_spent:.2f}"))
+            self.category_analysis_table.setItem(i, 2, QTableWidgetItem(f"${avg_monthly:.2f}"))
+            self.category_analysis_table.setItem(i, 3, QTableWidgetItem(trend))
+            self.category_analysis_table.setItem(i, 4, QTableWidgetItem(budget_status))
+            self.category_analysis_table.setItem(i, 5, QTableWidgetItem(f"{percentage:.1f}%"))
+
+        self.category_analysis_table.resizeColumnsToContents()
+
+    def load_goals_progress(self, goals):
+        """Load savings goals progress"""
+        if not goals:
+            # Show message if no goals exist
+            self.goals_table.setRowCount(1)
+            no_goals_item = QTableWidgetItem("No active savings goals. Click 'Add Savings Goal' to create one.")
+            no_goals_item.setForeground(QColor(128, 128, 128))
+            self.goals_table.setItem(0, 0, no_goals_item)
+            # Span across all columns
+            self.goals_table.setSpan(0, 0, 1, 5)
+            return
+
+        self.goals_table.setRowCount(len(goals))
+
+        for i, goal in enumerate(goals):
+            progress_pct = (goal['current_amount'] / goal['target_amount'] * 100) if goal['target_amount'] > 0 else 0
+
+            self.goals_table.setItem(i, 0, QTableWidgetItem(goal['name']))
+            self.goals_table.setItem(i, 1, QTableWidgetItem(f"${goal['target_amount']:.2f}"))
+            self.goals_table.setItem(i, 2, QTableWidgetItem(f"${goal['current_amount']:.2f}"))
+            self.goals_table.setItem(i, 3, QTableWidgetItem(f"{progress_pct:.1f}%"))
+
+            # Color-code progress
+            progress_item = self.goals_table.item(i, 3)
+            if progress_pct >= 100:
+                progress_item.setBackground(QColor(76, 175, 80))  # Green
+                progress_item.setForeground(QColor(255, 255, 255))
+            elif progress_pct >= 75:
+                progress_item.setBackground(QColor(255, 193, 7))  # Yellow
+            elif progress_pct >= 50:
+                progress_item.setBackground(QColor(255, 152, 0))  # Orange
+            else:
+                progress_item.setBackground(QColor(244, 67, 54))  # Red
+                progress_item.setForeground(QColor(255, 255, 255))
+
+            self.goals_table.setItem(i, 4, QTableWidgetItem(goal['target_date'] or 'No target date'))
+
+        self.goals_table.resizeColumnsToContents()
+
+    def generate_alerts_and_insights(self, budget_alerts):
+        """Generate financial alerts and insights"""
+        alerts = []
+        insights = []
+
+        # Budget alerts
+        for budget in budget_alerts:
+            if budget.get('status') == 'over':
+                alerts.append(f"⚠️ Over budget in {budget['category']}: ${budget['spent']:.2f} spent vs ${budget['amount']:.2f} budgeted")
+
+        # Expense insights
+        if not alerts:
+            alerts.append("✅ All budgets are on track!")
+
+        insights.append("💡 Consider setting up automatic savings transfers")
+        insights.append("💡 Review subscriptions and recurring expenses quarterly")
+        insights.append("💡 Build an emergency fund covering 3-6 months of expenses")
+
+        self.alerts_text.setPlainText("\n".join(alerts))
+        self.insights_text.setPlainText("\n".join(insights))
+
+    def get_upcoming_events(self):
+        """Unpaid bills due in the next 30 days (runs on a worker thread)"""
+        conn = connect('family_manager.db')
+        cursor = conn.cursor()
+
+        # Get upcoming bills due in next 30 days
+        thirty_days = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+
+        cursor.execute("""
+            SELECT name, amount, due_date, recurring
+            FROM bills
+            WHERE paid = 0 AND due_date <= ?
+            ORDER BY due_date
+            LIMIT 5
+        """, (thirty_days,))
+
+        upcoming_bills = cursor.fetchall()
+        conn.close()
+        return upcoming_bills
+
+    def load_upcoming_events(self, upcoming_bills):
+        """Load upcoming financial events"""
+        events = []
+        for bill in upcoming_bills:
+            name, amount, due_date, recurring = bill
+            days_until = (datetime.strptime(due_date, '%Y-%m-%d').date() - datetime.now().date()).days
+            status = "Due today" if days_until == 0 else f"Due in {days_until} days"
+            events.append(f"📄 {name}: ${amount:.2f} ({status})")
+
+        if not events:
+            events.append("No upcoming bills in the next 30 days")
+
+        self.events_text.setPlainText("\n".join(events))
+
+    def add_savings_goal(self):
+        """Add a new savings goal"""
+        dialog = SavingsGoalDialog(self.parent())
+        if dialog.exec():
+            self.loader.start(['goals'])
+
+    def export_dashboard_report(self):
+        """Export dashboard report to file"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Financial Report", "", "Text Files (*.txt);;PDF Files (*.pdf)")
+
+        if file_path:
+            try:
+                with open(file_path, 'w') as f:
+                    f.write("Financial Dashboard Report\n")
+                    f.write("=" * 40 + "\n\n")
+                    f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+                    # Key metrics
+                    f.write("KEY METRICS\n")
+                    f.write("-" * 15 + "\n")
+                    f.write(f"Financial Health Score: {self.health_score_card.layout().itemAt(1).widget().text()}\n")
+                    f.write(f"Net Worth: {self.net_worth_card.layout().itemAt(1).widget().text()}\n")
+                    f.write(f"Monthly Cash Flow: {self.cash_flow_card.layout().itemAt(1).widget().text()}\n")
+                    f.write(f"Savings Rate: {self.savings_rate_card.layout().itemAt(1).widget().text()}\n\n")
+
+                    # Alerts and insights
+                    f.write("ALERTS & INSIGHTS\n")
+                    f.write("-" * 20 + "\n")
+                    f.write("Alerts:\n")
+                    f.write(self.alerts_text.toPlainText() + "\n\n")
+                    f.write("Insights:\n")
+                    f.write(self.insights_text.toPlainText() + "\n")
+
+                QMessageBox.information(self, "Export Complete", f"Financial report exported to {file_path}")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Export Error", f"Failed to export report: {e}")
+
+
+class ExpenseAnalysisDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Expense Analysis & Forecasting")
+        self.setModal(True)
+        self.resize(1000, 700)
+        self.setup_ui()
+        self.load_expense_data()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title and controls
+        title_layout = QHBoxLayout()
+        title = QLabel("📊 Expense Analysis Dashboard")
+        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title_layout.addWidget(title)
+
+        title_layout.addStretch()
+
+        # Time period selector
+        period_layout = QHBoxLayout()
+        period_layout.addWidget(QLabel("Analysis Period:"))
+        self.period_combo = QComboBox()
+        self.period_combo.addItems(["Last 3 Months", "Last 6 Months", "Last 12 Months", "All Time"])
+        self.period_combo.setCurrentText("Last 6 Months")
+        self.period_combo.currentTextChanged.connect(self.load_expense_data)
+        period_layout.addWidget(self.period_combo)
+
+        title_layout.addLayout(period_layout)
+        layout.addLayout(title_layout)
+
+        # Summary cards
+        self.setup_summary_cards(layout)
+
+        # Main content tabs
+        tabs = QTabWidget()
+
+        # Trends tab
+        trends_tab = QWidget()
+        self.setup_trends_tab(trends_tab)
+        tabs.addTab(trends_tab, "📈 Trends")
+
+        # Forecasting tab
+        forecast_tab = QWidget()
+        self.setup_forecasting_tab(forecast_tab)
+        tabs.addTab(forecast_tab, "🔮 Forecasting")
+
+        # Category Analysis tab
+        category_tab = QWidget()
+        self.setup_category_analysis_tab(category_tab)
+        tabs.addTab(category_tab, "📂 Categories")
+
+        # Insights tab
+        insights_tab = QWidget()
+        self.setup_insights_tab(insights_tab)
+        tabs.addTab(insights_tab, "💡 Insights")
+
+        layout.addWidget(tabs)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+        export_btn = QPushButton("Export Report")
+        export_btn.clicked.connect(self.export_analysis_report)
+        export_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #4CAF50; color: white; }")
+        button_layout.addWidget(export_btn)
+
+        button_layout.addStretch()
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def setup_summary_cards(self, layout):
+        """Setup summary cards showing key metrics"""
+        cards_layout = QHBoxLayout()
+
+        self.total_expenses_card = self.create_metric_card("Total Expenses", "$0.00", "Total spent in period")
+        self.avg_monthly_card = self.create_metric_card("Avg Monthly", "$0.00", "Average monthly spending")
+        self.largest_category_card = self.create_metric_card("Top Category", "None", "Highest spending category")
+        self.trend_indicator_card = self.create_metric_card("Trend", "↗️ +0%", "Spending trend vs previous period")
+
+        cards_layout.addWidget(self.total_expenses_card)
+        cards_layout.addWidget(self.avg_monthly_card)
+        cards_layout.addWidget(self.largest_category_card)
+        cards_layout.addWidget(self.trend_indicator_card)
+
+        layout.addLayout(cards_layout)
+
+    def create_metric_card(self, title, value, subtitle):
+        """Create a metric card widget"""
+        card = QGroupBox(title)
+        card.setStyleSheet("""
+            QGroupBox {
+                font-weight: bold;
+                border: 2px solid #ddd;
+                border-radius: 8px;
+                margin-top: 1ex;
+                padding-top: 10px;
+                background-color: #f9f9f9;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px 0 5px;
+                color: #333;
+            }
+        """)
+
+        card_layout = QVBoxLayout()
+
+        value_label = QLabel(value)
+        value_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #2E86C1; margin: 5px;")
+        value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card_layout.addWidget(value_label)
+
+        subtitle_label = QLabel(subtitle)
+        subtitle_label.setStyleSheet("color: #666; font-size: 10px; margin: 5px;")
+        subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card_layout.addWidget(subtitle_label)
+
+        card.setLayout(card_layout)
+        return card
+
+    def setup_trends_tab(self, tab):
+        """Setup the trends analysis tab"""
+        layout = QVBoxLayout()
+
+        # Monthly trends table
+        trends_label = QLabel("Monthly Spending Trends:")
+        trends_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        layout.addWidget(trends_label)
+
+        self.trends_table = QTableWidget()
+        self.trends_table.setColumnCount(4)
+        self.trends_table.setHorizontalHeaderLabels(["Month", "Total Expenses", "Transaction Count", "Avg per Transaction"])
+        self.trends_table.setAlternatingRowColors(True)
+        layout.addWidget(self.trends_table)
+
+        tab.setLayout(layout)
+
+    def setup_forecasting_tab(self, tab):
+        """Setup the forecasting tab"""
+        layout = QVBoxLayout()
+
+        forecast_label = QLabel("Spending Forecast (Next 3 Months):")
+        forecast_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        layout.addWidget(forecast_label)
+
+        self.forecast_table = QTableWidget()
+        self.forecast_table.setColumnCount(4)
+        self.forecast_table.setHorizontalHeaderLabels(["Month", "Projected Spending", "Confidence", "Based On"])
+        self.forecast_table.setAlternatingRowColors(True)
+        layout.addWidget(self.forecast_table)
+
+        # Forecast explanation
+        explanation = QLabel(
+            "<b>How Forecasting Works:</b><br>"
+            "• Uses historical spending patterns<br>"
+            "• Applies seasonal adjustments<br>"
+            "• Considers recent trends and changes<br>"
+            "• Provides confidence levels based on data consistency"
+        )
+        explanation.setStyleSheet("margin-top: 15px; padding: 10px; border: 1px solid #ddd; border-radius: 5px; background-color: #f9f9f9;")
+        explanation.setWordWrap(True)
+        layout.addWidget(explanation)
+
+        tab.setLayout(layout)
+
+    def setup_category_analysis_tab(self, tab):
+        """Setup the category analysis tab"""
+        layout = QVBoxLayout()
+
+        category_label = QLabel("Spending by Category:")
+        category_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        layout.addWidget(category_label)
+
+        self.category_table = QTableWidget()
+        self.category_table.setColumnCount(5)
+        self.category_table.setHorizontalHeaderLabels(["Category", "Total Spent", "Percentage", "Transactions", "Avg per Transaction"])
+        self.category_table.setAlternatingRowColors(True)
+        layout.addWidget(self.category_table)
+
+        # Category breakdown chart placeholder
+        chart_placeholder = QLabel("📊 Category Breakdown Chart\n(Chart visualization would be implemented here)")
+        chart_placeholder.setStyleSheet("margin-top: 20px; padding: 40px; border: 2px dashed #ccc; border-radius: 10px; background-color: #f9f9f9; text-align: center;")
+        chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(chart_placeholder)
+
+        tab.setLayout(layout)
+
+    def setup_insights_tab(self, tab):
+        """Setup the insights tab"""
+        layout = QVBoxLayout()
+
+        insights_label = QLabel("💡 Key Insights & Recommendations:")
+        insights_label.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
+        layout.addWidget(insights_label)
+
+        # Insights text area
+        self.insights_text = QTextEdit()
+        self.insights_text.setReadOnly(True)
+        self.insights_text.setStyleSheet("QTextEdit { border: 1px solid #ccc; border-radius: 5px; padding: 10px; }")
+        layout.addWidget(self.insights_text)
+
+        # Recommendations
+        recs_label = QLabel("📋 Recommendations:")
+        recs_label.setStyleSheet("font-weight: bold; margin-top: 15px; margin-bottom: 5px;")
+        layout.addWidget(recs_label)
+
+        self.recommendations_text = QTextEdit()
+        self.recommendations_text.setReadOnly(True)
+        self.recommendations_text.setStyleSheet("QTextEdit { border: 1px solid #ccc; border-radius: 5px; padding: 10px; background-color: #fff3cd; }")
+        layout.addWidget(self.recommendations_text)
+
+        tab.setLayout(layout)
+
+    def load_expense_data(self):
+        """Load expense data and perform analysis"""
+        try:
+            # Get date range based on selected period
+            end_date = datetime.now()
+            period = self.period_combo.currentText()
+
+            if period == "Last 3 Months":
+                start_date = end_date - timedelta(days=90)
+            elif period == "Last 6 Months":
+                start_date = end_date - timedelta(days=180)
+            elif period == "Last 12 Months":
+                start_date = end_date - timedelta(days=365)
+            else:  # All Time
+                start_date = datetime(2000, 1, 1)
+            # Whole months only, so the first month of the range is not partial
+            start_date = start_date.replace(day=1)
+
+            start_str = start_date.strftime('%Y-%m-%d')
+            end_str = end_date.strftime('%Y-%m-%d')
+
+            # (month, category, total, count) rows from the expense rollups
+            expenses = get_analytics_service().month_category_totals(start_str, end_str)
+
+            # Perform analysis
+            self.analyze_expense_data(expenses, start_date, end_date)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load expense data: {e}")
+
+    def analyze_expense_data(self, expenses, start_date, end_date):
+        """Analyze expense data and update UI"""
+        if not expenses:
+            self.update_empty_state()
+            return
+
+        # Calculate summary metrics
+        total_expenses = sum(expense[2] for expense in expenses)
+        transaction_count = sum(expense[3] for expense in expenses)
+        months_diff = max(1, (end_date - start_date).days / 30)
+        avg_monthly = total_expenses / months_diff
+
+        # Category analysis
+        category_totals = {}
+        category_counts = {}
+        for expense in expenses:
+            category = expense[1] or 'Uncategorized'
+            amount = expense[2]
+
+            category_totals[category] = category_totals.get(category, 0) + amount
+            category_counts[category] = category_counts.get(category, 0) + expense[3]
+
+        # Find largest category
+        largest_category = max(category_totals.items(), key=lambda x: x[1]) if category_totals else ("None", 0)
+
+        # Monthly matrix shared by the trend and the forecast, ending at the
+        # last complete month (quiet months up to it count as zero)
+        last_complete_month = (end_date.replace(day=1) - timedelta(days=1)).strftime('%Y-%m')
+        series = ExpenseSeries.from_rows(expenses, through=last_complete_month)
+        trend_percentage = self.calculate_trend(series)
+
+        # Update summary cards
+        self.total_expenses_card.layout().itemAt(0).widget().setText(f"${total_expenses:.2f}")
+        self.avg_monthly_card.layout().itemAt(0).widget().setText(f"${avg_monthly:.2f}")
+        self.largest_category_card.layout().itemAt(0).widget().setText(largest_category[0])
+
+        trend_text = f"↗️ +{trend_percentage:.1f}%" if trend_percentage > 0 else f"↘️ {trend_percentage:.1f}%"
+        trend_color = "#4CAF50" if trend_percentage <= 0 else "#f44336"
+        self.trend_indicator_card.layout().itemAt(0).widget().setText(trend_text)
+        self.trend_indicator_card.layout().itemAt(0).widget().setStyleSheet(f"font-size: 20px; font-weight: bold; color: {trend_color}; margin: 5px;")
+
+        # Update detailed tabs
+        self.update_trends_table(expenses)
+        self.update_forecasting_table(series)
+        self.update_category_table(category_totals, category_counts, total_expenses)
+        self.generate_insights(expenses, total_expenses, transaction_count, largest_category, trend_percentage)
+
+    def calculate_trend(self, series):
+        """Calculate spending trend percentage (last month vs the one before)"""
+        return month_over_month_change(series)
+
+    def update_trends_table(self, expenses):
+        """Update the trends table with monthly data"""
+        # Group by month
+        monthly_data = {}
+        for expense in expenses:
+            month = expense[0][:7]  # YYYY-MM
+            if month not in monthly_data:
+                monthly_data[month] = {'total': 0, 'count': 0}
+            monthly_data[month]['total'] += expense[2]
+            monthly_data[month]['count'] += expense[3]
+
+        # Sort months
+        sorted_months = sorted(monthly_data.keys())
+
+        self.trends_table.setRowCount(len(sorted_months))
+
+        for i, month in enumerate(sorted_months):
+            data = monthly_data[month]
+            avg_per_transaction = data['total'] / data['count'] if data['count'] > 0 else 0
+
+            self.trends_table.setItem(i, 0, QTableWidgetItem(month))
+            self.trends_table.setItem(i, 1, QTableWidgetItem(f"${data['total']:.2f}"))
+            self.trends_table.setItem(i, 2, QTableWidgetItem(str(data['count'])))
+            self.trends_table.setItem(i, 3, QTableWidgetItem(f"${avg_per_transaction:.2f}"))
+
+        self.trends_table.resizeColumnsToContents()
+
+    def update_forecasting_table(self, series):
+        """Update the forecasting table with projections"""
+        if series.n_months == 0:
+            self.forecast_table.setRowCount(0)
+            return
+
+        # The current month is the first projected one; show the three after it
+        forecast = skip_months(forecast_all(series, horizon=4)['total'], 1)
+        confidences = interval_confidence(forecast)
+        basis = "Trend + seasonality" if forecast.seasonal else "Linear trend"
+
+        self.forecast_table.setRowCount(len(forecast.months))
+
+        for i, month in enumerate(forecast.months):
+            if confidences[i] >= 0.8:
+                confidence = "High"
+            elif confidences[i] >= 0.5:
+                confidence = "Medium"
+            else:
+                confidence = "Low"
+
+            self.forecast_table.setItem(i, 0, QTableWidgetItem(month))
+            self.forecast_table.setItem(i, 1, QTableWidgetItem(f"${forecast.predicted[i]:.2f}"))
+            self.forecast_table.setItem(i, 2, QTableWidgetItem(confidence))
+            self.forecast_table.setItem(i, 3, QTableWidgetItem(
+                f"{basis} (95%: ${forecast.lower[i]:.2f}-${forecast.upper[i]:.2f})"
+            ))
+
+        self.forecast_table.resizeColumnsToContents()
+
+    def update_category_table(self, category_totals, category_counts, total_expenses):
+        """Update the category analysis table"""
+        sorted_categories = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)
+
+        self.category_table.setRowCount(len(sorted_categories))
+
+        for i, (category, total) in enumerate(sorted_categories):
+            percentage = (total / total_expenses * 100) if total_expenses > 0 else 0
+            count = category_counts.get(category, 0)
+            avg_per_transaction = total / count if count > 0 else 0
+
+            self.category_table.setItem(i, 0, QTableWidgetItem(category))
+            self.category_table.setItem(i, 1, QTableWidgetItem(f"${total:.2f}"))
+            self.category_table.setItem(i, 2, QTableWidgetItem(f"{percentage:.1f}%"))
+            self.category_table.setItem(i, 3, QTableWidgetItem(str(count)))
+            self.category_table.setItem(i, 4, QTableWidgetItem(f"${avg_per_transaction:.2f}"))
+
+        self.category_table.resizeColumnsToContents()
+
+    def generate_insights(self, expenses, total_expenses, transaction_count, largest_category, trend_percentage):
+        """Generate insights and recommendations"""
+        insights = []
+        recommendations = []
+
+        # Basic insights
+        if expenses:
+            avg_transaction = total_expenses / max(1, transaction_count)
+            insights.append(f"• Average transaction amount: ${avg_transaction:.2f}")
+            insights.append(f"• Largest spending category: {largest_category[0]} (${largest_category[1]:.2f})")
+
+            if trend_percentage > 10:
+                insights.append(f"• ⚠️ Spending is trending upward (+{trend_percentage:.1f}% vs previous period)")
+                recommendations.append("• Consider reviewing recent purchases and identifying areas to cut back")
+            elif trend_percentage < -10:
+                insights.append(f"• ✅ Spending is trending downward ({trend_percentage:.1f}% vs previous period)")
+                recommendations.append("• Great job managing expenses! Consider setting aside savings from reduced spending")
+
+            # Category concentration
+            category_totals = {}
+            for expense in expenses:
+                category = expense[1] or 'Uncategorized'
+                category_totals[category] = category_totals.get(category, 0) + expense[2]
+
+            top_category_percentage = (largest_category[1] / total_expenses * 100) if total_expenses > 0 else 0
+            if top_category_percentage > 50:
+                insights.append(f"• ⚠️ High concentration in {largest_category[0]} ({top_category_percentage:.1f}% of total spending)")
+                recommendations.append(f"• Consider diversifying spending away from {largest_category[0]} category")
+
+            # Transaction frequency
+            monthly_transaction_count = transaction_count / max(1, len(set(expense[0][:7] for expense in expenses)))
+            insights.append(f"• Average monthly transactions: {monthly_transaction_count:.1f}")
+
+            if monthly_transaction_count > 50:
+                recommendations.append("• High transaction frequency - consider consolidating purchases")
+
+        # Set the text
+        self.insights_text.setPlainText("\n".join(insights) if insights else "No expense data available for insights.")
+        self.recommendations_text.setPlainText("\n".join(recommendations) if recommendations else "No specific recommendations at this time.")
+
+    def update_empty_state(self):
+        """Update UI for empty state"""
+        self.total_expenses_card.layout().itemAt(0).widget().setText("$0.00")
+        self.avg_monthly_card.layout().itemAt(0).widget().setText("$0.00")
+        self.largest_category_card.layout().itemAt(0).widget().setText("None")
+        self.trend_indicator_card.layout().itemAt(0).widget().setText("No data")
+
+        self.trends_table.setRowCount(0)
+        self.forecast_table.setRowCount(0)
+        self.category_table.setRowCount(0)
+
+        self.insights_text.setPlainText("No expense data available for the selected period.")
+        self.recommendations_text.setPlainText("Add some expenses to see analysis and recommendations.")
+
+    def export_analysis_report(self):
+        """Export analysis report to file"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Analysis Report", "", "Text Files (*.txt);;CSV Files (*.csv)")
+
+        if file_path:
+            try:
+                with open(file_path, 'w') as f:
+                    f.write("Expense Analysis Report\n")
+                    f.write("=" * 50 + "\n\n")
+
+                    # Summary
+                    f.write("SUMMARY\n")
+                    f.write("-" * 20 + "\n")
+                    f.write(f"Analysis Period: {self.period_combo.currentText()}\n")
+                    f.write(f"Total Expenses: {self.total_expenses_card.layout().itemAt(0).widget().text()}\n")
+                    f.write(f"Average Monthly: {self.avg_monthly_card.layout().itemAt(0).widget().text()}\n")
+                    f.write(f"Top Category: {self.largest_category_card.layout().itemAt(0).widget().text()}\n")
+                    f.write(f"Trend: {self.trend_indicator_card.layout().itemAt(0).widget().text()}\n\n")
+
+                    # Insights
+                    f.write("KEY INSIGHTS\n")
+                    f.write("-" * 20 + "\n")
+                    f.write(self.insights_text.toPlainText() + "\n\n")
+
+                    # Recommendations
+                    f.write("RECOMMENDATIONS\n")
+                    f.write("-" * 20 + "\n")
+                    f.write(self.recommendations_text.toPlainText() + "\n")
+
+                QMessageBox.information(self, "Export Complete", f"Analysis report exported to {file_path}")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Export Error", f"Failed to export report: {e}")
+
+
+class BudgetManagementDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Budget Management")
+        self.setModal(True)
+        self.resize(900, 600)
+        self.setup_ui()
+        self.load_budgets()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title and summary
+        title_layout = QHBoxLayout()
+        title = QLabel("💰 Budget Management")
+        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title_layout.addWidget(title)
+
+        title_layout.addStretch()
+        self.summary_label = QLabel("Loading...")
+        title_layout.addWidget(self.summary_label)
+
+        layout.addLayout(title_layout)
+
+        # Budget list and controls
+        content_layout = QHBoxLayout()
+
+        # Left side - Budget list
+        left_layout = QVBoxLayout()
+
+        list_label = QLabel("Active Budgets:")
+        list_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        left_layout.addWidget(list_label)
+
+        self.budget_table = QTableWidget()
+        self.budget_table.setColumnCount(6)
+        self.budget_table.setHorizontalHeaderLabels(["Name", "Category", "Amount", "Period", "Status", "Spent"])
+        self.budget_table.setAlternatingRowColors(True)
+        self.budget_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.budget_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        left_layout.addWidget(self.budget_table)
+
+        # Budget controls
+        control_layout = QHBoxLayout()
+
+        add_btn = QPushButton("➕ Add Budget")
+        add_btn.clicked.connect(self.add_budget)
+        add_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #4CAF50; color: white; }")
+        control_layout.addWidget(add_btn)
+
+        edit_btn = QPushButton("✏️ Edit Selected")
+        edit_btn.clicked.connect(self.edit_selected_budget)
+        edit_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #2196F3; color: white; }")
+        control_layout.addWidget(edit_btn)
+
+        delete_btn = QPushButton("🗑️ Delete Selected")
+        delete_btn.clicked.connect(self.delete_selected_budget)
+        delete_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #f44336; color: white; }")
+        control_layout.addWidget(delete_btn)
+
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.clicked.connect(self.load_budgets)
+        refresh_btn.setStyleSheet("QPushButton { padding: 6px 12px; } QPushButton:hover { background-color: #FF9800; color: white; }")
+        control_layout.addWidget(refresh_btn)
+
+        left_layout.addLayout(control_layout)
+
+        content_layout.addLayout(left_layout)
+
+        # Right side - Performance details
+        right_layout = QVBoxLayout()
+
+        perf_label = QLabel("Budget Performance (This Month):")
+        perf_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        right_layout.addWidget(perf_label)
+
+        self.performance_table = QTableWidget()
+        self.performance_table.setColumnCount(4)
+        self.performance_table.setHorizontalHeaderLabels(["Budget", "Allocated", "Spent", "Remaining"])
+        self.performance_table.setAlternatingRowColors(True)
+        self.performance_table.setMaximumWidth(300)
+        right_layout.addWidget(self.performance_table)
+
+        # Performance summary
+        self.perf_summary = QLabel("Select a budget to view details")
+        self.perf_summary.setStyleSheet("margin-top: 10px; padding: 10px; border: 1px solid #ddd; border-radius: 5px;")
+        self.perf_summary.setWordWrap(True)
+        right_layout.addWidget(self.perf_summary)
+
+        content_layout.addLayout(right_layout)
+
+        layout.addLayout(content_layout)
+
+        # Connect table selection
+        self.budget_table.itemSelectionChanged.connect(self.on_budget_selected)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def load_budgets(self):
+        """Load budgets into the table"""
+        budgets = self.get_budget_performance()
+
+        self.budget_table.setRowCount(len(budgets))
+
+        total_budgeted = 0
+        total_spent = 0
+
+        for row, budget in enumerate(budgets):
+            self.budget_table.setItem(row, 0, QTableWidgetItem(budget['name']))
+            self.budget_table.setItem(row, 1, QTableWidgetItem(budget['category']))
+            self.budget_table.setItem(row, 2, QTableWidgetItem(f"${budget['amount']:.2f}"))
+            self.budget_table.setItem(row, 3, QTableWidgetItem(budget['period'].title()))
+
+            # Status with color coding
+            spent = budget.get('spent', 0)
+            status = budget.get('status', 'unknown')
+            status_item = QTableWidgetItem(status.replace('_', ' ').title())
+
+            if status == 'under':
+                status_item.setBackground(QColor(200, 255, 200))  # Light green
+            elif status == 'over':
+                status_item.setBackground(QColor(255, 200, 200))  # Light red
+            else:
+                status_item.setBackground(QColor(255, 255, 200))  # Light yellow
+
+            self.budget_table.setItem(row, 4, status_item)
+            self.budget_table.setItem(row, 5, QTableWidgetItem(f"${spent:.2f}"))
+
+            total_budgeted += budget['amount']
+            total_spent += spent
+
+        self.budget_table.resizeColumnsToContents()
+
+        # Update summary
+        remaining = total_budgeted - total_spent
+        self.summary_label.setText(f"Total: ${total_budgeted:.2f} budgeted, ${total_spent:.2f} spent, ${remaining:.2f} remaining")
+
+    def on_budget_selected(self):
+        """Handle budget selection to show performance details"""
+        selected_rows = set()
+        for item in self.budget_table.selectedItems():
+            selected_rows.add(item.row())
+
+        if len(selected_rows) == 1:
+            row = list(selected_rows)[0]
+            budget_name = self.budget_table.item(row, 0).text()
+            category = self.budget_table.item(row, 1).text()
+            amount = float(self.budget_table.item(row, 2).text().replace('$', ''))
+            spent = float(self.budget_table.item(row, 5).text().replace('$', ''))
+
+            remaining = amount - spent
+            percent_used = (spent / amount * 100) if amount > 0 else 0
+
+            self.perf_summary.setText(f"""<b>{budget_name}</b> ({category})<br>
+            <b>Budget:</b> ${amount:.2f}<br>
+            <b>Spent:</b> ${spent:.2f}<br>
+            <b>Remaining:</b> ${remaining:.2f}<br>
+            <b>Percent Used:</b> {percent_used:.1f}%""")
+
+            # Color code based on spending
+            if percent_used > 100:
+                self.perf_summary.setStyleSheet("margin-top: 10px; padding: 10px; border: 1px solid #ddd; border-radius: 5px; background-color: #ffebee;")
+            elif percent_used > 80:
+                self.perf_summary.setStyleSheet("margin-top: 10px; padding: 10px; border: 1px solid #ddd; border-radius: 5px; background-color: #fff3e0;")
+            else:
+                self.perf_summary.setStyleSheet("margin-top: 10px; padding: 10px; border: 1px solid #ddd; border-radius: 5px; background-color: #e8f5e8;")
+        else:
+            self.perf_summary.setText("Select a single budget to view details")
+
+    def add_budget(self):
+        """Add a new budget"""
+        dialog = BudgetDialog(self.parent())
+        if dialog.exec():
+            self.load_budgets()
+
+    def edit_selected_budget(self):
+        """Edit the selected budget"""
+        selected_rows = set()
+        for item in self.budget_table.selectedItems():
+            selected_rows.add(item.row())
+
+        if len(selected_rows) != 1:
+            QMessageBox.warning(self, "Selection Error", "Please select exactly one budget to edit.")
+            return
+
+        row = list(selected_rows)[0]
+        budget_name = self.budget_table.item(row, 0).text()
+
+        # Get full budget data
+        budgets = self.parent().get_budgets()
+        budget_data = next((b for b in budgets if b['name'] == budget_name), None)
+
+        if budget_data:
+            dialog = BudgetDialog(self.parent(), budget_data)
+            if dialog.exec():
+                self.load_budgets()
+
+    def delete_selected_budget(self):
+        """Delete the selected budget"""
+        selected_rows = set()
+        for item in self.budget_table.selectedItems():
+            selected_rows.add(item.row())
+
+        if len(selected_rows) != 1:
+            QMessageBox.warning(self, "Selection Error", "Please select exactly one budget to delete.")
+            return
+
+        row = list(selected_rows)[0]
+        budget_name = self.budget_table.item(row, 0).text()
+
+        reply = QMessageBox.question(self, "Confirm Delete",
+                                   f"Are you sure you want to delete the budget '{budget_name}'?\n\n"
+                                   "This action cannot be undone.",
+                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+
+        if reply == QMessageBox.StandardButton.Yes:
+            try:
+                # Find budget ID
+                budgets = self.parent().get_budgets()
+                budget_data = next((b for b in budgets if b['name'] == budget_name), None)
+
+                if budget_data:
+                    self.parent().delete_budget(budget_data['id'])
+                    QMessageBox.information(self, "Success", f"Budget '{budget_name}' deleted successfully!")
+                    self.load_budgets()
+                else:
+                    QMessageBox.warning(self, "Error", "Budget not found.")
+
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to delete budget: {e}")
+
+
+class BudgetDialog(QDialog):
+    def __init__(self, parent=None, budget_data=None):
+        super().__init__(parent)
+        self.budget_data = budget_data
+        self.setWindowTitle("Manage Budget" if budget_data else "Add Budget")
+        self.setModal(True)
+        self.resize(500, 400)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title
+        title = QLabel("💰 Budget Management")
+        title.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        layout.addWidget(title)
+
+        # Form layout
+        form_layout = QFormLayout()
+
+        # Budget name
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("e.g., Groceries Budget, Utilities Budget")
+        if self.budget_data:
+            self.name_input.setText(self.budget_data.get('name', ''))
+        form_layout.addRow("Budget Name:", self.name_input)
+
+        # Category
+        self.category_combo = QComboBox()
+        categories = [
+            "Food & Dining", "Groceries", "Transportation", "Utilities",
+            "Rent/Mortgage", "Insurance", "Healthcare", "Entertainment",
+            "Shopping", "Education", "Savings", "Miscellaneous"
+        ]
+        self.category_combo.addItems(categories)
+        if self.budget_data:
+            self.category_combo.setCurrentText(self.budget_data.get('category', ''))
+        form_layout.addRow("Category:", self.category_combo)
+
+        # Amount
+        self.amount_input = QDoubleSpinBox()
+        self.amount_input.setMinimum(0)
+        self.amount_input.setMaximum(100000)
+        self.amount_input.setPrefix("$")
+        if self.budget_data:
+            self.amount_input.setValue(self.budget_data.get('amount', 0))
+        form_layout.addRow("Budget Amount:", self.amount_input)
+
+        # Period
+        self.period_combo = QComboBox()
+        self.period_combo.addItems(["Weekly", "Monthly", "Yearly"])
+        if self.budget_data:
+            period = self.budget_data.get('period', 'monthly').title()
+            self.period_combo.setCurrentText(period)
+        else:
+            self.period_combo.setCurrentText("Monthly")
+        form_layout.addRow("Period:", self.period_combo)
+
+        # Start date
+        self.start_date_input = QDateEdit()
+        self.start_date_input.setCalendarPopup(True)
+        self.start_date_input.setDate(QDate.currentDate())
+        if self.budget_data and self.budget_data.get('start_date'):
+            self.start_date_input.setDate(QDate.fromString(self.budget_data['start_date'], "yyyy-MM-dd"))
+        form_layout.addRow("Start Date:", self.start_date_input)
+
+        # End date (optional)
+        self.end_date_input = QDateEdit()
+        self.end_date_input.setCalendarPopup(True)
+        self.end_date_input.setDate(QDate.currentDate().addMonths(12))
+        self.end_date_input.setSpecialValueText("No End Date")
+        if self.budget_data and self.budget_data.get('end_date'):
+            self.end_date_input.setDate(QDate.fromString(self.budget_data['end_date'], "yyyy-MM-dd"))
+        else:
+            self.end_date_input.setDate(QDate(2000, 1, 1))  # Special value for no end date
+        form_layout.addRow("End Date (Optional):", self.end_date_input)
+
+        # Notes
+        self.notes_input = QTextEdit()
+        self.notes_input.setMaximumHeight(60)
+        self.notes_input.setPlaceholderText("Optional notes about this budget...")
+        if self.budget_data:
+            self.notes_input.setPlainText(self.budget_data.get('notes', ''))
+        form_layout.addRow("Notes:", self.notes_input)
+
+        layout.addLayout(form_layout)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+        save_btn = QPushButton("Save Budget")
+        save_btn.clicked.connect(self.save_budget)
+        save_btn.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #4CAF50; color: white; }")
+        button_layout.addWidget(save_btn)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def save_budget(self):
+        """Save the budget to database"""
+        name = self.name_input.text().strip()
+        if not name:
+            QMessageBox.warning(self, "Validation Error", "Budget name is required.")
+            return
+
+        if self.amount_input.value() <= 0:
+            QMessageBox.warning(self, "Validation Error", "Budget amount must be greater than zero.")
+            return
+
+        # Prepare data
+        budget_data = {
+            'name': name,
+            'category': self.category_combo.currentText(),
+            'amount': self.amount_input.value(),
+            'period': self.period_combo.currentText().lower(),
+            'start_date': self.start_date_input.date().toString("yyyy-MM-dd"),
+            'end_date': None if self.end_date_input.date().year() == 2000 else self.end_date_input.date().toString("yyyy-MM-dd"),
+            'notes': self.notes_input.toPlainText().strip()
+        }
+
+        try:
+            if self.budget_data:
+                # Update existing budget
+                self.parent().update_budget(self.budget_data['id'], budget_data)
+            else:
+                # Create new budget
+                self.parent().create_budget(budget_data)
+
+            QMessageBox.information(self, "Success", "Budget saved successfully!")
+            self.accept()
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save budget: {e}")
+
+
+class CostAnalyticsDialog(QDialog):
+    def __init__(self, analytics, parent=None):
+        super().__init__(parent)
+        self.analytics = analytics
+        self.setWindowTitle("Cost Analytics & Savings")
+        self.setModal(True)
+        self.resize(700, 500)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        # Title
+        title = QLabel("💰 Cost Analytics Dashboard")
+        title.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        layout.addWidget(title)
+
+        # Summary cards
+        summary_layout = QHBoxLayout()
+
+        # Total value card
+        total_card = self.create_summary_card("Total Inventory Value",
+                                            f"${self.analytics['total_value']:.2f}",
+                                            "Total cost of all tracked items")
+        summary_layout.addWidget(total_card)
+
+        # Average cost card
+        avg_card = self.create_summary_card("Average Item Cost",
+                                          f"${self.analytics['avg_cost']:.2f}",
+                                          "Average price per item")
+        summary_layout.addWidget(avg_card)
+
+        layout.addLayout(summary_layout)
+
+        # Tab widget for different analytics
+        tabs = QTabWidget()
+
+        # Expensive items tab
+        expensive_tab = QWidget()
+        expensive_layout = QVBoxLayout()
+
+        expensive_label = QLabel("Most Expensive Items:")
+        expensive_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        expensive_layout.addWidget(expensive_label)
+
+        expensive_table = QTableWidget()
+        expensive_table.setColumnCount(3)
+        expensive_table.setHorizontalHeaderLabels(["Item", "Price", "Category"])
+        expensive_table.setRowCount(len(self.analytics['expensive_items']))
+
+        for i, (name, price, category) in enumerate(self.analytics['expensive_items']):
+            expensive_table.setItem(i, 0, QTableWidgetItem(name))
+            expensive_table.setItem(i, 1, QTableWidgetItem(f"${price:.2f}"))
+            expensive_table.setItem(i, 2, QTableWidgetItem(category or 'N/A'))
+
+        expensive_table.resizeColumnsToContents()
+        expensive_layout.addWidget(expensive_table)
+        expensive_tab.setLayout(expensive_layout)
+        tabs.addTab(expensive_tab, "Top Expenses")
+
+        # Category breakdown tab
+        category_tab = QWidget()
+        category_layout = QVBoxLayout()
+
+        category_label = QLabel("Spending by Category:")
+        category_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        category_layout.addWidget(category_label)
+
+        category_table = QTableWidget()
+        category_table.setColumnCount(3)
+        category_table.setHorizontalHeaderLabels(["Category", "Total Cost", "Item Count"])
+        category_table.setRowCount(len(self.analytics['category_spending']))
+
+        for i, (category, total_cost, count) in enumerate(self.analytics['category_spending']):
+            category_table.setItem(i, 0, QTableWidgetItem(category or 'Uncategorized'))
+            category_table.setItem(i, 1, QTableWidgetItem(f"${total_cost:.2f}"))
+            category_table.setItem(i, 2, QTableWidgetItem(str(count)))
+
+        category_table.resizeColumnsToContents()
+        category_layout.addWidget(category_table)
+        category_tab.setLayout(category_layout)
+        tabs.addTab(category_tab, "By Category")
+
+        # Monthly trends tab
+        monthly_tab = QWidget()
+        monthly_layout = QVBoxLayout()
+
+        monthly_label = QLabel("Monthly Spending Trends:")
+        monthly_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        monthly_layout.addWidget(monthly_label)
+
+        monthly_table = QTableWidget()
+        monthly_table.setColumnCount(3)
+        monthly_table.setHorizontalHeaderLabels(["Month", "Total Spent", "Items Purchased"])
+        monthly_table.setRowCount(len(self.analytics['monthly_spending']))
+
+        for i, (month, total_spent, count) in enumerate(self.analytics['monthly_spending']):
+            monthly_table.setItem(i, 0, QTableWidgetItem(month))
+            monthly_table.setItem(i, 1, QTableWidgetItem(f"${total_spent:.2f}"))
+            monthly_table.setItem(i, 2, QTableWidgetItem(str(count)))
+
+        monthly_table.resizeColumnsToContents()
+        monthly_layout.addWidget(monthly_table)
+        monthly_tab.setLayout(monthly_layout)
+        tabs.addTab(monthly_tab, "Monthly Trends")
+
+        layout.addWidget(tabs)
+
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def create_summary_card(self, title, value, subtitle):
+        """Create a summary card widget"""
+        card = QGroupBox(title)
+        card.setStyleSheet("""
+            QGroupBox {
+                font-weight: bold;
+                border: 2px solid #ddd;
+                border-radius: 5px;
+                margin-top: 1ex;
+                padding-top: 10px;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px 0 5px;
+            }
+        """)
+
+        card_layout = QVBoxLayout()
+
+        value_label = QLabel(value)
+        value_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #2E86C1;")
+        value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card_layout.addWidget(value_label)
+
+        subtitle_label = QLabel(subtitle)
+        subtitle_label.setStyleSheet("color: #666; font-size: 10px;")
+        subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card_layout.addWidget(subtitle_label)
+
+        card.setLayout(card_layout)
+        return card
@@ -0,0 +1,194 @@
+"""
+Analytics Service for Family Household Manager
+One shared, memoized source of the spending aggregates the finance dialogs
+display. Results are computed once per database snapshot and reused by every
+dialog until something commits a change.
+"""
+
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from .expense_rollups import (
+        ensure_expense_rollups, total_spent, category_totals, monthly_totals,
+        month_category_totals, weekday_totals, month_bounds, spending_anomalies
+    )
+    from .instrumentation import connect
+except ImportError:
+    from expense_rollups import (
+        ensure_expense_rollups, total_spent, category_totals, monthly_totals,
+        month_category_totals, weekday_totals, month_bounds, spending_anomalies
+    )
+    from instrumentation import connect
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsService:
+    """
+    Memoized, parameterized analytics queries
+
+    Holds one read connection so that PRAGMA data_version identifies the
+    database snapshot: it changes whenever another connection commits, which
+    is how every writer in the app works. Cached results are keyed by query
+    and parameters and dropped as soon as the snapshot moves on.
+    """
+
+    def __init__(self, db_path: str = 'family_manager.db'):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._snapshot: Optional[int] = None
+        self._results: Dict[Tuple, object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = connect(self.db_path, check_same_thread=False)
+            try:
+                ensure_expense_rollups(self._conn.cursor())
+                self._conn.commit()
+            except sqlite3.OperationalError as e:
+                logger.error(f"Failed to prepare expense rollups: {e}")
+        return self._conn
+
+    def snapshot(self) -> int:
+        """Current database snapshot id"""
+        with self._lock:
+            return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def _cached(self, name: str, compute: Callable[[sqlite3.Cursor], object], *params):
+        """Return a memoized result for (name, params), computing it on a miss"""
+        with self._lock:
+            snapshot = self.snapshot()
+            if snapshot != self._snapshot:
+                self._results.clear()
+                self._snapshot = snapshot
+            key = (name,) + params
+            if key in self._results:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._results[key] = compute(self._connection().cursor())
+            return self._results[key]
+
+    def invalidate(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._results.clear()
+            self._snapshot = None
+
+    def cache_info(self) -> Dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._results), 'snapshot': self._snapshot}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self.invalidate()
+
+    # Spending aggregates (see expense_rollups for the row shapes)
+
+    def total_spent(self, date_from, date_to=None) -> Tuple[float, int]:
+        return self._cached('total_spent', lambda c: total_spent(c, date_from, date_to), date_from, date_to)
+
+    def month_total(self, month: str) -> Tuple[float, int]:
+        """Total and transaction count for a 'YYYY-MM' month"""
+        return self.total_spent(*month_bounds(month))
+
+    def monthly_totals(self, date_from, date_to=None) -> List[Tuple[str, float, int]]:
+        return list(self._cached('monthly_totals', lambda c: monthly_totals(c, date_from, date_to),
+                                 date_from, date_to))
+
+    def category_totals(self, date_from, date_to=None) -> List[Tuple[Optional[str], float, int]]:
+        return list(self._cached('category_totals', lambda c: category_totals(c, date_from, date_to),
+                                 date_from, date_to))
+
+    def month_category_totals(self, date_from, date_to=None) -> List[Tuple[str, Optional[str], float, int]]:
+        return list(self._cached('month_category_totals', lambda c: month_category_totals(c, date_from, date_to),
+                                 date_from, date_to))
+
+    def weekday_totals(self, date_from, date_to) -> List[Tuple[int, float, int]]:
+        return list(self._cached('weekday_totals', lambda c: weekday_totals(c, date_from, date_to),
+                                 date_from, date_to))
+
+    def spending_anomalies(self, date_from, history_from) -> List[Dict]:
+        """Expenses since date_from that are unusually large compared with history_from onwards"""
+        return list(self._cached('spending_anomalies', lambda c: spending_anomalies(c, date_from, history_from),
+                                 date_from, history_from))
+
+    # Other finance figures
+
+    def inventory_value(self) -> float:
+        """Total cost of inventory on hand"""
+        def compute(cursor):
+            cursor.execute("SELECT SUM(total_cost) FROM inventory WHERE total_cost > 0")
+            return cursor.fetchone()[0] or 0
+        return self._cached('inventory_value', compute)
+
+    def bills_summary(self) -> Dict:
+        """Total, count and unpaid amount of all bills"""
+        def compute(cursor):
+            cursor.execute("SELECT SUM(amount), COUNT(*), SUM(CASE WHEN paid = 0 THEN amount END) FROM bills")
+            total, count, unpaid = cursor.fetchone()
+            return {'total': total or 0, 'count': count, 'unpaid': unpaid or 0}
+        return dict(self._cached('bills_summary', compute))
+
+    def budget_performance(self, month: Optional[str] = None) -> List[Dict]:
+        """
+        Active budgets with what was spent in their category this month
+
+        Args:
+            month: 'YYYY-MM' (defaults to the current month)
+
+        Returns:
+            list: Budget dicts with spent, remaining and percentage
+        """
+        month = month or datetime.now().strftime('%Y-%m')
+
+        def compute(cursor):
+            spent_by_category = {
+                category or 'Uncategorized': total
+                for category, total, _ in category_totals(cursor, *month_bounds(month))
+            }
+            cursor.execute("""
+                SELECT name, category, amount, period, start_date, end_date
+                FROM budgets
+                WHERE is_active = 1
+                ORDER BY category, name
+            """)
+            budgets = []
+            for name, category, amount, period, start_date, end_date in cursor.fetchall():
+                spent = spent_by_category.get(category, 0)
+                budgets.append({
+                    'name': name,
+                    'category': category,
+                    'amount': amount,
+                    'period': period,
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    'spent': spent,
+                    'remaining': amount - spent,
+                    'percentage': (spent / amount * 100) if amount > 0 else 0
+                })
+            return budgets
+
+        return [dict(budget) for budget in self._cached('budget_performance', compute, month)]
+
+
+_services: Dict[str, AnalyticsService] = {}
+_services_lock = threading.Lock()
+
+
+def get_analytics_service(db_path: str = 'family_manager.db') -> AnalyticsService:
+    """Shared AnalyticsService for a database, so every dialog reuses the same results"""
+    with _services_lock:
+        if db_path not in _services:
+            _services[db_path] = AnalyticsService(db_path)
+        return _services[db_path]
@@ -1,17 +1,50 @@
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory, stream_with_context
 import sqlite3
 import argparse
 import logging
 
+try:
+    from .meal_ingredients import ensure_meal_ingredients_table, insert_meal, ingredient_usage
+    from .units import ensure_unit_schema
+    from .notification_manager import NotificationManager
+    from .notification_stream import NotificationBroker, stream_notifications
+    from .instrumentation import connect, get_registry
+except ImportError:
+    from meal_ingredients import ensure_meal_ingredients_table, insert_meal, ingredient_usage
+    from units import ensure_unit_schema
+    from notification_manager import NotificationManager
+    from notification_stream import NotificationBroker, stream_notifications
+    from instrumentation import connect, get_registry
+
 logging.basicConfig(filename='api.log', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 app = Flask(__name__, static_folder='static')
 
 def get_db():
-    conn = sqlite3.connect('family_manager.db')  # Same directory
+    conn = connect('family_manager.db')  # Same directory, queries timed for /api/metrics
     conn.row_factory = sqlite3.Row
     return conn
 
+
+_notification_manager = None
+notification_broker = NotificationBroker()
+
+def get_notification_manager():
+    """Shared NotificationManager so its settings cache survives between requests"""
+    global _notification_manager
+    if _notification_manager is None:
+        _notification_manager = NotificationManager('family_manager.db', broker=notification_broker)
+    return _notification_manager
+
+
+def init_meal_ingredients():
+    """Create and backfill the meal_ingredients index and base-unit columns"""
+    conn = get_db()
+    ensure_unit_schema(conn.cursor())
+    ensure_meal_ingredients_table(conn.cursor())
+    conn.commit()
+    conn.close()
+
 @app.route('/api/inventory', methods=['GET'])
 def get_inventory():
     conn = get_db()
@@ -40,8 +73,10 @@ def get_meals():
 def add_meal():
     data = request.json
     conn = get_db()
-    conn.execute('INSERT INTO meals (date, meal_type, name, ingredients, recipe, time) VALUES (?, ?, ?, ?, ?, ?)',
-                 (data['date'], data['meal_type'], data['name'], data['ingredients'], data['recipe'], data.get('time', '')))
+    insert_meal(conn.cursor(), {
+        'date': data['date'], 'meal_type': data['meal_type'], 'name': data['name'],
+        'ingredients': data['ingredients'], 'recipe': data['recipe'], 'time': data.get('time', '')
+    })
     conn.commit()
     conn.close()
     return jsonify({'status': 'ok'})
@@ -57,8 +92,8 @@ def get_shopping():
 def add_shopping():
     data = request.json
     conn = get_db()
-    conn.execute('INSERT INTO shopping_list (item, qty, price, aisle) VALUES (?, ?, ?, ?)',
-                 (data['item'], data['qty'], data['price'], data.get('aisle', '')))
+    conn.execute('INSERT INTO shopping_list (item, qty, unit, price, aisle) VALUES (?, ?, ?, ?, ?)',
+                 (data['item'], data['qty'], data.get('unit', 'each'), data['price'], data.get('aisle', '')))
     conn.commit()
     conn.close()
     return jsonify({'status': 'ok'})
@@ -138,15 +173,8 @@ def get_suggestions():
     cursor = conn.cursor()
     from datetime import datetime, timedelta
     week_ago = (datetime.now() - timedelta(days=7)).date().isoformat()
-    cursor.execute("SELECT ingredients FROM meals WHERE date >= ?", (week_ago,))
-    recent_ings = []
-    for (ing_str,) in cursor.fetchall():
-        if ing_str:
-            recent_ings.extend([i.strip() for i in ing_str.split(',') if i.strip()])
-    ing_counts = {}
-    for ing in recent_ings:
-        ing_counts[ing] = ing_counts.get(ing, 0) + 1
-    suggestions = [{'item': ing, 'reason': f'Used {count} times recently', 'qty': 1} for ing, count in ing_counts.items() if count > 1]
+    suggestions = [{'item': ing, 'reason': f'Used {count} times recently', 'qty': 1}
+                   for ing, _, count, _ in ingredient_usage(cursor, week_ago) if count > 1]
     # Low stock
     cursor.execute("SELECT name FROM inventory WHERE qty < 1")
     low_stock = [{'item': row[0], 'reason': 'Low stock', 'qty': 1} for row in cursor.fetchall()]
@@ -154,6 +182,54 @@ def get_suggestions():
     conn.close()
     return jsonify(all_sug[:10])
 
+@app.route('/api/notifications', methods=['GET'])
+def get_notifications():
+    # Page with ?before_created_at=...&before_id=... taken from the last item of the previous page
+    before = None
+    if request.args.get('before_id'):
+        before = (request.args.get('before_created_at', ''), request.args.get('before_id', type=int))
+    notifications = get_notification_manager().get_notifications(
+        request.args.get('recipient_id', 1, type=int),
+        unread_only=request.args.get('unread_only') == 'true',
+        notification_type=request.args.get('type'),
+        limit=min(request.args.get('limit', 50, type=int), 200),
+        before=before,
+    )
+    return jsonify(notifications)
+
+@app.route('/api/notifications/unread-count', methods=['GET'])
+def get_unread_notification_count():
+    # Polled every few seconds by the mobile app; a primary-key read on the counter table
+    recipient_id = request.args.get('recipient_id', 1, type=int)
+    return jsonify({'unread_count': get_notification_manager().get_unread_count(recipient_id)})
+
+@app.route('/api/notifications/stream', methods=['GET'])
+def notification_stream():
+    # Server-sent events: new notifications and unread-count changes for one member.
+    # Browsers and the mobile client resend Last-Event-ID on reconnect to catch up.
+    recipient_id = request.args.get('recipient_id', 1, type=int)
+    last_event_id = request.headers.get('Last-Event-ID', request.args.get('last_event_id'))
+    last_event_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    events = stream_notifications(get_notification_manager(), notification_broker, recipient_id, last_event_id)
+    return Response(stream_with_context(events), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/notifications/<int:id>', methods=['PUT'])
+def update_notification(id):
+    get_notification_manager().mark_as_read(id)
+    return jsonify({'status': 'ok'})
+
+@app.route('/api/notifications/<int:id>', methods=['DELETE'])
+def delete_notification(id):
+    get_notification_manager().delete_notification(id)
+    return jsonify({'status': 'ok'})
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """p50/p95/p99 latency per operation; ?category=db|ai|ui|mcp limits the output"""
+    registry = get_registry()
+    return jsonify({'since': registry.started, 'metrics': registry.snapshot(request.args.get('category'))})
+
 @app.route('/manifest.json')
 def manifest():
     return send_from_directory('static', 'manifest.json')
@@ -506,8 +582,17 @@ def index():
     </html>
     '''
 
+# Initialize the ingredient index when module is imported
+try:
+    init_meal_ingredients()
+except Exception as e:
+    logging.error(f"Failed to initialize meal_ingredients: {e}")
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Family Manager Web Server')
     parser.add_argument('--port', type=int, default=8000, help='Port to run the server on')
     args = parser.parse_args()
-    app.run(host='127.0.0.1', port=args.port, debug=False)
\ No newline at end of file
+    # Reminders fire from an in-memory schedule and are pushed to open streams
+    get_notification_manager().start_reminder_scheduler()
+    # Threaded so open notification streams do not block other requests
+    app.run(host='127.0.0.1', port=args.port, debug=False, threaded=True)
\ No newline at end of file
@@ -4,7 +4,7 @@ Authentication and Security Module for Family Household Manager
 Provides:
 - User registration and authentication
 - JWT token management
-- Password hashing with bcrypt
+- Password hashing with scrypt/PBKDF2 (bcrypt optional)
 - Family/household management with roles
 - Session management
 - API route protection decorators
@@ -15,17 +15,24 @@ import hashlib
 import secrets
 import jwt
 import json
+import atexit
 import logging
 from datetime import datetime, timedelta
 from functools import wraps
 from flask import request, jsonify, g
 import os
 
+try:
+    from .session_cache import SessionCache, ActivityRecorder
+    from .password_kdf import PasswordHasher
+except ImportError:
+    from session_cache import SessionCache, ActivityRecorder
+    from password_kdf import PasswordHasher
+
 # Configuration
 SECRET_KEY = os.environ.get('JWT_SECRET_KEY', secrets.token_hex(32))
 TOKEN_EXPIRY_HOURS = 24
 REFRESH_TOKEN_EXPIRY_DAYS = 30
-PASSWORD_SALT_LENGTH = 32
 MIN_PASSWORD_LENGTH = 8
 
 # User roles
@@ -43,6 +50,17 @@ def get_auth_db():
     return conn
 
 
+def hash_token(token):
+    """SHA-256 hex digest stored in user_sessions for a token"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+# Sessions validated recently, so authenticated requests skip user_sessions
+session_cache = SessionCache()
+# Batches last_activity writes off the request path
+activity_recorder = ActivityRecorder(get_auth_db)
+
+
 def init_auth_tables():
     """Initialize authentication database tables"""
     conn = get_auth_db()
@@ -169,24 +187,28 @@ def init_auth_tables():
     logging.info("Authentication tables initialized successfully")
 
 
-def hash_password(password, salt=None):
-    """Hash password with salt using SHA-256"""
-    if salt is None:
-        salt = secrets.token_hex(PASSWORD_SALT_LENGTH)
-    
-    # Multiple iterations for added security
-    password_bytes = (password + salt).encode('utf-8')
-    for _ in range(10000):
-        password_bytes = hashlib.sha256(password_bytes).digest()
+# Configured KDF (see password_kdf.py); hashing runs on its thread pool
+password_hasher = PasswordHasher()
+
+
+def hash_password(password):
+    """
+    Hash password with the configured KDF
     
-    password_hash = hashlib.sha256(password_bytes).hexdigest()
-    return password_hash, salt
+    The salt and cost parameters are encoded in the hash itself, so the
+    returned salt (for the users.salt column) is empty.
+    """
+    return password_hasher.hash(password), ''
 
 
 def verify_password(password, password_hash, salt):
-    """Verify password against stored hash"""
-    computed_hash, _ = hash_password(password, salt)
-    return secrets.compare_digest(computed_hash, password_hash)
+    """Verify password against stored hash (any supported scheme, including legacy SHA-256)"""
+    return password_hasher.verify(password, password_hash, salt)
+
+
+def password_needs_rehash(password_hash):
+    """True if a stored hash predates the configured KDF or its cost parameters"""
+    return password_hasher.needs_rehash(password_hash)
 
 
 def generate_token(user_id, token_type='access'):
@@ -340,13 +362,20 @@ class AuthService:
                 conn.close()
                 return None, "Invalid credentials"
             
+            # Upgrade hashes made with an older scheme or cheaper parameters
+            rehashed = password_needs_rehash(user['password_hash'])
+            if rehashed:
+                new_hash, new_salt = hash_password(password)
+                cursor.execute('UPDATE users SET password_hash = ?, salt = ? WHERE id = ?',
+                              (new_hash, new_salt, user['id']))
+            
             # Generate tokens
             access_token, access_expiry = generate_token(user['id'], 'access')
             refresh_token, refresh_expiry = generate_token(user['id'], 'refresh')
             
             # Store session
-            token_hash = hashlib.sha256(access_token.encode()).hexdigest()
-            refresh_token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
+            token_hash = hash_token(access_token)
+            refresh_token_hash = hash_token(refresh_token)
             
             cursor.execute('''
                 INSERT INTO user_sessions (user_id, token_hash, refresh_token_hash, device_info, ip_address, expires_at)
@@ -360,6 +389,8 @@ class AuthService:
             conn.close()
             
             # Log successful login
+            if rehashed:
+                log_security_event('password_rehashed', user['id'], {'kdf': password_hasher.kdf.name})
             log_security_event('login_success', user['id'], {'device': device_info}, ip_address)
             
             return {
@@ -387,7 +418,8 @@ class AuthService:
             conn = get_auth_db()
             cursor = conn.cursor()
             
-            token_hash = hashlib.sha256(token.encode()).hexdigest()
+            token_hash = hash_token(token)
+            session_cache.invalidate(token_hash)
             
             # Get user_id before deactivating session
             cursor.execute('SELECT user_id FROM user_sessions WHERE token_hash = ?', (token_hash,))
@@ -421,9 +453,9 @@ class AuthService:
             cursor = conn.cursor()
             
             # Verify refresh token is still valid in database
-            refresh_token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
+            refresh_token_hash = hash_token(refresh_token)
             cursor.execute('''
-                SELECT user_id FROM user_sessions 
+                SELECT id, user_id, token_hash FROM user_sessions 
                 WHERE refresh_token_hash = ? AND is_active = 1
             ''', (refresh_token_hash,))
             
@@ -436,7 +468,7 @@ class AuthService:
             access_token, access_expiry = generate_token(payload['user_id'], 'access')
             
             # Update session with new token hash
-            new_token_hash = hashlib.sha256(access_token.encode()).hexdigest()
+            new_token_hash = hash_token(access_token)
             cursor.execute('''
                 UPDATE user_sessions 
                 SET token_hash = ?, expires_at = ?, last_activity = ?
@@ -446,6 +478,10 @@ class AuthService:
             conn.commit()
             conn.close()
             
+            # The old access token is dead; last_activity went out with the row above
+            session_cache.invalidate(session['token_hash'])
+            activity_recorder.discard(session['id'])
+            
             return {
                 'access_token': access_token,
                 'expires_at': access_expiry.isoformat()
@@ -554,6 +590,7 @@ class AuthService:
             
             conn.commit()
             conn.close()
+            session_cache.invalidate_user(user_id)
             
             log_security_event('password_changed', user_id)
             
@@ -845,6 +882,7 @@ class FamilyService:
             
             conn.commit()
             conn.close()
+            session_cache.invalidate_user(user_id)
             
             log_security_event('member_removed', removed_by_user_id, 
                              {'removed_user': user_id, 'family_id': family_id})
@@ -902,21 +940,26 @@ def require_auth(f):
         if error:
             return jsonify({'error': error}), 401
         
-        # Verify session is still active
-        conn = get_auth_db()
-        cursor = conn.cursor()
-        
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-        cursor.execute('''
-            SELECT user_id FROM user_sessions 
-            WHERE token_hash = ? AND is_active = 1 AND expires_at > ?
-        ''', (token_hash, datetime.utcnow().isoformat()))
+        # Verify session is still active, from the cache when it was checked recently
+        token_hash = hash_token(token)
+        session = session_cache.get(token_hash)
         
-        session = cursor.fetchone()
-        conn.close()
+        if session is None:
+            conn = get_auth_db()
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, user_id, expires_at FROM user_sessions 
+                WHERE token_hash = ? AND is_active = 1 AND expires_at > ?
+            ''', (token_hash, datetime.utcnow().isoformat()))
+            
+            row = cursor.fetchone()
+            conn.close()
+            
+            if not row:
+                return jsonify({'error': 'Session expired or invalid'}), 401
+            session = session_cache.put(token_hash, row['id'], row['user_id'], row['expires_at'])
         
-        if not session:
-            return jsonify({'error': 'Session expired or invalid'}), 401
+        activity_recorder.touch(session.session_id)
         
         # Store user info in flask g object
         g.user_id = payload['user_id']
@@ -964,3 +1007,6 @@ try:
     init_auth_tables()
 except Exception as e:
     logging.error(f"Failed to initialize auth tables: {e}")
+
+activity_recorder.start()
+atexit.register(activity_recorder.stop)
@@ -0,0 +1,290 @@
+"""
+Background Dialog Loading for Family Household Manager
+Computes each section of a dialog's data on a worker thread and applies the
+results on the Qt main thread as they finish, so dialogs open immediately
+with placeholders instead of blocking until every tab is built.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from PyQt6.QtWidgets import QDialog, QLabel, QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem, QTextEdit
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtGui import QColor
+
+try:
+    from .theme import AppTheme
+except ImportError:
+    from theme import AppTheme
+
+logger = logging.getLogger(__name__)
+
+LOADING_TEXT = "Loading..."
+SKELETON_ROWS = 3
+SKELETON_CELL = "━━━━━━"
+
+
+class LoadCancelled(Exception):
+    """Raised inside a compute function once its load has been cancelled"""
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared between a dialog and its workers"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self):
+        """Abort the current computation if the load was cancelled"""
+        if self._event.is_set():
+            raise LoadCancelled()
+
+
+class SectionWorker(QThread):
+    """Runs one section's compute function off the main thread"""
+    loaded = pyqtSignal(str, int, object)   # key, generation, result
+    failed = pyqtSignal(str, int, str)      # key, generation, error
+
+    def __init__(self, key: str, generation: int, compute: Callable[[], object], token: CancelToken):
+        super().__init__()
+        self.key = key
+        self.generation = generation
+        self.compute = compute
+        self.token = token
+
+    def run(self):
+        try:
+            self.token.check()
+            result = self.compute()
+            self.token.check()
+        except LoadCancelled:
+            return
+        except Exception as e:
+            logger.exception(f"Background load of '{self.key}' failed")
+            if not self.token.cancelled:
+                self.failed.emit(self.key, self.generation, str(e))
+            return
+        self.loaded.emit(self.key, self.generation, result)
+
+
+# Workers are kept alive here until their thread exits, even after the dialog
+# that started them has closed; a QThread must not be destroyed while running.
+_active_workers = set()
+_active_workers_lock = threading.Lock()
+
+
+def _release_worker(worker: SectionWorker):
+    with _active_workers_lock:
+        _active_workers.discard(worker)
+    worker.deleteLater()
+
+
+def wait_for_workers(timeout_ms: int = 2000):
+    """Cancel in-flight workers and give them a chance to exit (call on application quit)"""
+    with _active_workers_lock:
+        workers = list(_active_workers)
+    for worker in workers:
+        worker.token.cancel()
+        worker.wait(timeout_ms)
+
+
+def show_skeleton(widget):
+    """Put a loading placeholder into a table, list, text box or label"""
+    placeholder = QColor(AppTheme.TEXT_SECONDARY)
+    if isinstance(widget, QTableWidget):
+        widget.clearSpans()
+        widget.setRowCount(SKELETON_ROWS)
+        for row in range(SKELETON_ROWS):
+            for column in range(widget.columnCount()):
+                item = QTableWidgetItem(LOADING_TEXT if row == 0 and column == 0 else SKELETON_CELL)
+                item.setForeground(placeholder)
+                widget.setItem(row, column, item)
+    elif isinstance(widget, QListWidget):
+        widget.clear()
+        item = QListWidgetItem(LOADING_TEXT)
+        item.setForeground(placeholder)
+        widget.addItem(item)
+    elif isinstance(widget, QLabel):
+        widget.setText(LOADING_TEXT)
+    elif isinstance(widget, QTextEdit):
+        widget.setPlainText(LOADING_TEXT)
+
+
+def show_load_error(widget, message: str):
+    """Replace a placeholder with an error message"""
+    text = f"Failed to load: {message}"
+    if isinstance(widget, QTableWidget):
+        widget.clearSpans()
+        widget.setRowCount(1)
+        item = QTableWidgetItem(text)
+        item.setForeground(QColor(244, 67, 54))
+        widget.setItem(0, 0, item)
+        if widget.columnCount() > 1:
+            widget.setSpan(0, 0, 1, widget.columnCount())
+    elif isinstance(widget, QListWidget):
+        widget.clear()
+        widget.addItem(text)
+    elif isinstance(widget, QLabel):
+        widget.setText(text)
+    elif isinstance(widget, QTextEdit):
+        widget.setPlainText(text)
+
+
+class _Section:
+    def __init__(self, key, compute, apply, placeholders, requires):
+        self.key = key
+        self.compute = compute
+        self.apply = apply
+        self.placeholders = list(placeholders)
+        self.requires = tuple(requires)
+        self.generation = 0
+        self.token = CancelToken()
+
+
+class DialogLoader(QObject):
+    """
+    Streams a dialog's sections in from worker threads
+
+    Each section pairs a compute function, which runs off-thread and must not
+    touch widgets, with an apply function that receives its result on the
+    main thread. Sections with `requires` and no compute function are applied
+    once the sections they depend on have loaded. Loading is cancelled when
+    the dialog closes; late results are dropped.
+    """
+    section_loaded = pyqtSignal(str)
+    section_failed = pyqtSignal(str, str)
+    all_loaded = pyqtSignal(bool)   # True when every section succeeded
+
+    def __init__(self, dialog: QObject):
+        super().__init__(dialog)
+        self._sections: Dict[str, _Section] = {}
+        self._pending = set()
+        self.results: Dict[str, object] = {}
+        self.errors: Dict[str, str] = {}
+        if isinstance(dialog, QDialog):
+            dialog.finished.connect(self.cancel)
+
+    def add(self, key: str, compute: Optional[Callable[[], object]] = None,
+            apply: Optional[Callable[..., None]] = None, placeholders: Iterable = (),
+            requires: Sequence[str] = ()):
+        """
+        Register a section
+
+        Args:
+            key: Section name
+            compute: Runs on a worker thread and returns the section's data
+            apply: Called on the main thread with the result (or with the
+                   results of `requires`, in order, for derived sections)
+            placeholders: Widgets to show a skeleton in while loading
+            requires: Sections whose results a derived section is built from
+        """
+        self._sections[key] = _Section(key, compute, apply, placeholders, requires)
+
+    @property
+    def is_loading(self) -> bool:
+        return bool(self._pending)
+
+    def start(self, keys: Optional[Iterable[str]] = None):
+        """
+        (Re)load the given sections, or all of them
+
+        Sections derived from a reloaded section are reloaded too; anything
+        still in flight for these sections is cancelled.
+        """
+        keys = set(keys) if keys is not None else set(self._sections)
+        keys |= {s.key for s in self._sections.values() if keys.intersection(s.requires)}
+
+        for key in self._ordered(keys):
+            section = self._sections[key]
+            section.token.cancel()
+            section.token = CancelToken()
+            section.generation += 1
+            self.results.pop(key, None)
+            self.errors.pop(key, None)
+            self._pending.add(key)
+            for widget in section.placeholders:
+                show_skeleton(widget)
+            if section.compute is not None:
+                self._launch(section)
+
+        self._apply_derived()
+        self._check_done()
+
+    def cancel(self, *args):
+        """Stop every in-flight section; their results will be ignored"""
+        for section in self._sections.values():
+            section.token.cancel()
+        self._pending.clear()
+
+    def _ordered(self, keys) -> List[str]:
+        return [key for key in self._sections if key in keys]
+
+    def _launch(self, section: _Section):
+        worker = SectionWorker(section.key, section.generation, section.compute, section.token)
+        worker.loaded.connect(self._on_loaded)
+        worker.failed.connect(self._on_failed)
+        worker.finished.connect(lambda w=worker: _release_worker(w))
+        with _active_workers_lock:
+            _active_workers.add(worker)
+        worker.start()
+
+    def _is_current(self, key: str, generation: int) -> bool:
+        section = self._sections.get(key)
+        return (section is not None and section.generation == generation
+                and not section.token.cancelled and key in self._pending)
+
+    def _on_loaded(self, key: str, generation: int, result):
+        if not self._is_current(key, generation):
+            return
+        self._finish(key, (result,))
+        self._apply_derived()
+        self._check_done()
+
+    def _on_failed(self, key: str, generation: int, error: str):
+        if not self._is_current(key, generation):
+            return
+        self._fail(key, error)
+        self._apply_derived()
+        self._check_done()
+
+    def _finish(self, key: str, values: tuple):
+        section = self._sections[key]
+        try:
+            if section.apply is not None:
+                section.apply(*values)
+        except Exception as e:
+            logger.exception(f"Applying '{key}' failed")
+            self._fail(key, str(e))
+            return
+        self._pending.discard(key)
+        self.results[key] = values[0] if len(values) == 1 else values
+        self.section_loaded.emit(key)
+
+    def _fail(self, key: str, error: str):
+        self._pending.discard(key)
+        self.errors[key] = error
+        for widget in self._sections[key].placeholders:
+            show_load_error(widget, error)
+        self.section_failed.emit(key, error)
+
+    def _apply_derived(self):
+        for section in self._sections.values():
+            if section.compute is not None or section.key not in self._pending:
+                continue
+            failed = [r for r in section.requires if r in self.errors]
+            if failed:
+                self._fail(section.key, f"{', '.join(failed)} unavailable")
+            elif all(r in self.results for r in section.requires):
+                self._finish(section.key, tuple(self.results[r] for r in section.requires))
+
+    def _check_done(self):
+        if not self._pending:
+            self.all_loaded.emit(not self.errors)
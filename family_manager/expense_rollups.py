@@ -0,0 +1,320 @@
+"""
+Expense Rollups for Family Household Manager
+Day, week and month totals per category, kept current by SQLite triggers on
+expenses so the reporting dialogs read a handful of pre-aggregated rows
+instead of re-grouping the whole expense history.
+"""
+
+import sqlite3
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# period -> SQLite expression for the start of the period containing {d}
+# (weeks start on Monday)
+PERIOD_STARTS = {
+    'day': "date({d})",
+    'week': "date({d}, '-6 days', 'weekday 1')",
+    'month': "date({d}, 'start of month')",
+}
+
+# Rollup rows store uncategorized expenses under this key
+UNCATEGORIZED = ''
+
+
+def _rollup_keys(row: str) -> List[Tuple[str, str, str]]:
+    """(period, period_start, category) SQL expressions for NEW or OLD"""
+    # Unparseable dates are kept under their raw value rather than failing the write
+    category = f"COALESCE({row}.category, '')"
+    return [(f"'{period}'", f"COALESCE({expr.format(d=row + '.date')}, {row}.date)", category)
+            for period, expr in PERIOD_STARTS.items()]
+
+
+def _apply_sql(row: str, sign: str) -> str:
+    values = ', '.join(f"({p}, {s}, {c}, {sign}{row}.amount, {sign}1)" for p, s, c in _rollup_keys(row))
+    return f'''
+        INSERT INTO expense_rollups (period, period_start, category, total, count)
+        VALUES {values}
+        ON CONFLICT (period, period_start, category) DO UPDATE SET
+            total = total + excluded.total,
+            count = count + excluded.count;
+    '''
+
+
+def _prune_sql(row: str) -> str:
+    keys = ', '.join(f"({p}, {s}, {c})" for p, s, c in _rollup_keys(row))
+    return f'''
+        DELETE FROM expense_rollups
+        WHERE (period, period_start, category) IN (VALUES {keys}) AND count <= 0;
+    '''
+
+
+def ensure_expense_rollups(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the expense_rollups table and the triggers that maintain it
+
+    Rollups are built from the existing expenses the first time this runs;
+    afterwards every insert, update and delete on expenses adjusts the
+    affected day, week and month rows, whichever code path writes them.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'expenses'")
+    if not cursor.fetchone():
+        return
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'expense_rollups'")
+    exists = cursor.fetchone() is not None
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS expense_rollups (
+            period TEXT NOT NULL,
+            period_start TEXT NOT NULL,
+            category TEXT NOT NULL,
+            total REAL NOT NULL DEFAULT 0,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (period, period_start, category)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_expense_rollups_insert
+        AFTER INSERT ON expenses
+        BEGIN {_apply_sql('NEW', '')} END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_expense_rollups_delete
+        AFTER DELETE ON expenses
+        BEGIN {_apply_sql('OLD', '-')} {_prune_sql('OLD')} END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_expense_rollups_update
+        AFTER UPDATE OF date, amount, category ON expenses
+        BEGIN {_apply_sql('OLD', '-')} {_apply_sql('NEW', '')} {_prune_sql('OLD')} END
+    ''')
+
+    if not exists:
+        rebuild_expense_rollups(cursor)
+
+
+def rebuild_expense_rollups(cursor: sqlite3.Cursor) -> int:
+    """
+    Recompute every rollup row from the expenses table
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    cursor.execute("DELETE FROM expense_rollups")
+    written = 0
+    for period, expr in PERIOD_STARTS.items():
+        start = f"COALESCE({expr.format(d='date')}, date)"
+        cursor.execute(f'''
+            INSERT INTO expense_rollups (period, period_start, category, total, count)
+            SELECT ?, {start}, COALESCE(category, ''), SUM(amount), COUNT(*)
+            FROM expenses
+            GROUP BY {start}, COALESCE(category, '')
+        ''', (period,))
+        written += cursor.rowcount
+    logger.info(f"Rebuilt {written} expense rollup rows")
+    return written
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value[:10], '%Y-%m-%d').date()
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(day: date) -> date:
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _covering_rows(cursor: sqlite3.Cursor, date_from, date_to=None) -> List[Tuple[str, str, float, int]]:
+    """
+    Rollup rows that exactly cover [date_from, date_to] (no upper bound when date_to is None)
+
+    Whole months come from month rows; the partial months at either end come
+    from day rows, so a multi-year range reads about one row per month and
+    category.
+
+    Returns:
+        list: (period_start, category, total, count)
+    """
+    first = _as_date(date_from)
+    last = _as_date(date_to) if date_to is not None else date.max - timedelta(days=1)
+    if first > last:
+        return []
+    full_from = first if first.day == 1 else _next_month(first)
+    full_to = _month_start(last + timedelta(days=1))  # exclusive
+
+    parts, params = [], []
+    if full_from < full_to:
+        parts.append("period = 'month' AND period_start >= ? AND period_start < ?")
+        params += [full_from.isoformat(), full_to.isoformat()]
+        day_ranges = [(first, full_from - timedelta(days=1)), (full_to, last)]
+    else:
+        day_ranges = [(first, last)]
+    for start, end in day_ranges:
+        if start <= end:
+            parts.append("period = 'day' AND period_start BETWEEN ? AND ?")
+            params += [start.isoformat(), end.isoformat()]
+
+    cursor.execute(
+        ' UNION ALL '.join(
+            f"SELECT period_start, category, total, count FROM expense_rollups WHERE {part}" for part in parts
+        ),
+        params
+    )
+    return cursor.fetchall()
+
+
+def month_bounds(month: str) -> Tuple[str, str]:
+    """First and last day of a 'YYYY-MM' month"""
+    first = datetime.strptime(month[:7], '%Y-%m').date()
+    return first.isoformat(), (_next_month(first) - timedelta(days=1)).isoformat()
+
+
+def _category_name(category: str) -> Optional[str]:
+    return category if category != UNCATEGORIZED else None
+
+
+def total_spent(cursor: sqlite3.Cursor, date_from, date_to=None) -> Tuple[float, int]:
+    """Total amount and transaction count in [date_from, date_to]"""
+    rows = _covering_rows(cursor, date_from, date_to)
+    return sum(row[2] for row in rows), sum(row[3] for row in rows)
+
+
+def category_totals(cursor: sqlite3.Cursor, date_from, date_to=None) -> List[Tuple[Optional[str], float, int]]:
+    """
+    Spending per category in [date_from, date_to]
+
+    Returns:
+        list: (category or None, total, count), largest total first
+    """
+    totals: Dict[str, List] = defaultdict(lambda: [0.0, 0])
+    for _, category, total, count in _covering_rows(cursor, date_from, date_to):
+        totals[category][0] += total
+        totals[category][1] += count
+    rows = [(_category_name(c), t, n) for c, (t, n) in totals.items() if n > 0]
+    return sorted(rows, key=lambda row: row[1], reverse=True)
+
+
+def month_category_totals(cursor: sqlite3.Cursor, date_from, date_to=None) -> List[Tuple[str, Optional[str], float, int]]:
+    """
+    Spending per month and category in [date_from, date_to]
+
+    Returns:
+        list: ('YYYY-MM', category or None, total, count) ordered by month
+    """
+    totals: Dict[Tuple[str, str], List] = defaultdict(lambda: [0.0, 0])
+    for start, category, total, count in _covering_rows(cursor, date_from, date_to):
+        totals[(start[:7], category)][0] += total
+        totals[(start[:7], category)][1] += count
+    return [(month, _category_name(category), t, n)
+            for (month, category), (t, n) in sorted(totals.items()) if n > 0]
+
+
+def monthly_totals(cursor: sqlite3.Cursor, date_from, date_to=None) -> List[Tuple[str, float, int]]:
+    """
+    Spending per month in [date_from, date_to]
+
+    Returns:
+        list: ('YYYY-MM', total, count) ordered by month
+    """
+    totals: Dict[str, List] = defaultdict(lambda: [0.0, 0])
+    for month, _, total, count in month_category_totals(cursor, date_from, date_to):
+        totals[month][0] += total
+        totals[month][1] += count
+    return [(month, t, n) for month, (t, n) in sorted(totals.items())]
+
+
+def weekly_totals(cursor: sqlite3.Cursor, date_from, date_to) -> List[Tuple[str, float, int]]:
+    """
+    Spending per week (starting Monday) for the weeks overlapping [date_from, date_to]
+
+    Returns:
+        list: (Monday 'YYYY-MM-DD', total, count) ordered by week
+    """
+    first = _as_date(date_from)
+    first -= timedelta(days=first.weekday())
+    cursor.execute('''
+        SELECT period_start, SUM(total), SUM(count)
+        FROM expense_rollups
+        WHERE period = 'week' AND period_start BETWEEN ? AND ?
+        GROUP BY period_start
+        HAVING SUM(count) > 0
+        ORDER BY period_start
+    ''', (first.isoformat(), _as_date(date_to).isoformat()))
+    return cursor.fetchall()
+
+
+def weekday_totals(cursor: sqlite3.Cursor, date_from, date_to) -> List[Tuple[int, float, int]]:
+    """
+    Spending per day of the week in [date_from, date_to]
+
+    Returns:
+        list: (weekday 0=Sunday..6=Saturday, total, count) for weekdays with spending
+    """
+    cursor.execute('''
+        SELECT CAST(strftime('%w', period_start) AS INTEGER) AS weekday, SUM(total), SUM(count)
+        FROM expense_rollups
+        WHERE period = 'day' AND period_start BETWEEN ? AND ?
+        GROUP BY weekday
+        HAVING SUM(count) > 0
+        ORDER BY weekday
+    ''', (_as_date(date_from).isoformat(), _as_date(date_to).isoformat()))
+    return cursor.fetchall()
+
+
+def spending_anomalies(cursor: sqlite3.Cursor, date_from, history_from, threshold: float = 2.0,
+                       limit: int = 20) -> List[Dict]:
+    """
+    Expenses on or after date_from that are unusually large for their category
+
+    Each expense is compared with the average expense in its category from
+    history_from up to the day before date_from, read from the rollups.
+    Expenses in a category with no history are compared with the average
+    expense overall instead.
+
+    Args:
+        threshold: How many times the average an expense must reach to be flagged
+        limit: Maximum number of anomalies returned
+
+    Returns:
+        list: {'date', 'amount', 'category', 'description', 'deviation' (% above the average),
+               'type' ('high_amount' or 'new_category')}, largest deviation first
+    """
+    first = _as_date(date_from)
+    history_to = first - timedelta(days=1)
+    overall_total, overall_count = total_spent(cursor, history_from, history_to)
+    if not overall_count:
+        return []
+    overall = overall_total / overall_count
+    averages = {category: total / count for category, total, count in category_totals(cursor, history_from, history_to)}
+
+    cursor.execute('''
+        SELECT date, amount, category, description
+        FROM expenses
+        WHERE date >= ? AND amount > 0
+        ORDER BY date
+    ''', (first.isoformat(),))
+    anomalies = []
+    for day, amount, category, description in cursor.fetchall():
+        average = averages.get(category or None)
+        baseline = average if average is not None else overall
+        if baseline > 0 and amount >= threshold * baseline:
+            anomalies.append({
+                'date': day,
+                'amount': amount,
+                'category': category,
+                'description': description,
+                'deviation': (amount - baseline) / baseline * 100,
+                'type': 'high_amount' if average is not None else 'new_category'
+            })
+    anomalies.sort(key=lambda anomaly: anomaly['deviation'], reverse=True)
+    return anomalies[:limit]
@@ -0,0 +1,250 @@
+"""
+Expense Forecasting for Family Household Manager
+Loads monthly spending into a category x month NumPy matrix once, then fits
+least-squares trends, seasonal indices and prediction intervals for the total
+and every category in a single vectorized pass.
+"""
+
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+UNCATEGORIZED = 'Uncategorized'
+SEASON_LENGTH = 12
+# Two-sided normal quantiles for the supported confidence levels
+Z_SCORES = {0.8: 1.2816, 0.9: 1.6449, 0.95: 1.96, 0.99: 2.5758}
+
+
+class ExpenseSeries:
+    """Monthly totals per category over a contiguous run of months"""
+
+    def __init__(self, start: np.datetime64, categories: List[str], totals: np.ndarray, counts: np.ndarray):
+        self.start = start
+        self.categories = categories
+        self.totals = totals    # shape (categories, months)
+        self.counts = counts
+
+    @property
+    def n_months(self) -> int:
+        return self.totals.shape[1]
+
+    @property
+    def months(self) -> List[str]:
+        return [str(m) for m in self.start + np.arange(self.n_months)]
+
+    @property
+    def monthly_total(self) -> np.ndarray:
+        return self.totals.sum(axis=0)
+
+    @classmethod
+    def _from_arrays(cls, months: np.ndarray, categories: Sequence[Optional[str]], amounts: np.ndarray,
+                     counts: np.ndarray) -> 'ExpenseSeries':
+        if len(months) == 0:
+            return cls(np.datetime64('today', 'M'), [], np.zeros((0, 0)), np.zeros((0, 0), dtype=int))
+        start = months.min()
+        month_index = (months - start).astype(int)
+        n_months = int(month_index.max()) + 1
+        names, category_index = np.unique(
+            np.array([c or UNCATEGORIZED for c in categories], dtype=object).astype(str), return_inverse=True
+        )
+        flat = category_index * n_months + month_index
+        size = len(names) * n_months
+        totals = np.bincount(flat, weights=amounts, minlength=size).reshape(len(names), n_months)
+        count_matrix = np.bincount(flat, weights=counts, minlength=size).reshape(len(names), n_months)
+        return cls(start, names.tolist(), totals, count_matrix.astype(int))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, Optional[str], float, int]],
+                  through: Optional[str] = None) -> 'ExpenseSeries':
+        """
+        Build from (month 'YYYY-MM', category, total, count) rows
+
+        Args:
+            rows: Output of AnalyticsService.month_category_totals / expense_rollups
+            through: Last month ('YYYY-MM') of the series, e.g. the last complete
+                     one; later rows are dropped and quiet months up to it are zero
+
+        Returns:
+            ExpenseSeries: Months between the first and last row, gaps filled with zero
+        """
+        rows = list(rows)
+        if through is not None:
+            rows = [row for row in rows if row[0][:7] <= through[:7]]
+        series = cls._from_arrays(
+            np.array([row[0][:7] for row in rows], dtype='datetime64[M]'),
+            [row[1] for row in rows],
+            np.array([row[2] for row in rows], dtype=float),
+            np.array([row[3] for row in rows], dtype=float),
+        )
+        if through is not None and series.n_months:
+            missing = int(np.datetime64(through[:7], 'M') - series.start) + 1 - series.n_months
+            if missing > 0:
+                series.totals = np.pad(series.totals, ((0, 0), (0, missing)))
+                series.counts = np.pad(series.counts, ((0, 0), (0, missing)))
+        return series
+
+    @classmethod
+    def from_expenses(cls, dates: Sequence[str], amounts: Sequence[float],
+                      categories: Sequence[Optional[str]]) -> 'ExpenseSeries':
+        """Build from raw expense columns ('YYYY-MM-DD' dates)"""
+        return cls._from_arrays(
+            np.array([d[:10] for d in dates], dtype='datetime64[D]').astype('datetime64[M]'),
+            categories,
+            np.asarray(amounts, dtype=float),
+            np.ones(len(amounts)),
+        )
+
+
+class Forecast(NamedTuple):
+    """Projection for one series"""
+    months: List[str]
+    predicted: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    slope: float            # change per month
+    average: float          # mean monthly spend over the history
+    growth_rate: float      # slope as % of the average
+    seasonal: bool
+
+
+def linear_trend(y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Least-squares line through each row of y against month index
+
+    Returns:
+        tuple: (slopes, intercepts), one per row
+    """
+    n = y.shape[1]
+    x = np.arange(n, dtype=float)
+    x_centered = x - x.mean()
+    sxx = float((x_centered ** 2).sum()) or 1.0
+    y_mean = y.mean(axis=1)
+    slopes = (y - y_mean[:, None]) @ x_centered / sxx
+    return slopes, y_mean - slopes * x.mean()
+
+
+def seasonal_indices(y: np.ndarray, slopes: np.ndarray, intercepts: np.ndarray,
+                     period: int = SEASON_LENGTH) -> Optional[np.ndarray]:
+    """
+    Additive seasonal component of each row after removing its trend
+
+    Needs at least two full seasons; returns None otherwise.
+
+    Returns:
+        np.ndarray: shape (rows, period), each row centred on zero
+    """
+    n = y.shape[1]
+    if n < 2 * period:
+        return None
+    detrended = y - (intercepts[:, None] + slopes[:, None] * np.arange(n))
+    # Average the detrended values that fall on each position of the season
+    position = np.arange(n) % period
+    sums = np.zeros((y.shape[0], period))
+    np.add.at(sums.T, position, detrended.T)
+    indices = sums / np.bincount(position, minlength=period)
+    return indices - indices.mean(axis=1, keepdims=True)
+
+
+def forecast_matrix(y: np.ndarray, horizon: int = 3, confidence: float = 0.95,
+                    period: int = SEASON_LENGTH) -> Dict[str, np.ndarray]:
+    """
+    Project every row of y `horizon` months ahead
+
+    Trend plus (when there is enough history) seasonality, with OLS prediction
+    intervals from the residual spread.
+
+    Returns:
+        dict: predicted/lower/upper of shape (rows, horizon), slopes, averages
+              and whether seasonality was applied
+    """
+    rows, n = y.shape
+    slopes, intercepts = linear_trend(y)
+    seasonal = seasonal_indices(y, slopes, intercepts, period)
+
+    x = np.arange(n)
+    fitted = intercepts[:, None] + slopes[:, None] * x
+    future = np.arange(n, n + horizon)
+    predicted = intercepts[:, None] + slopes[:, None] * future
+    if seasonal is not None:
+        fitted = fitted + seasonal[:, x % period]
+        predicted = predicted + seasonal[:, future % period]
+
+    # Residual standard error; fewer than 3 points leaves no degrees of freedom
+    dof = max(n - 2 - (period - 1 if seasonal is not None else 0), 1)
+    sigma = np.sqrt(((y - fitted) ** 2).sum(axis=1) / dof) if n > 2 else y.std(axis=1)
+    x_mean = x.mean() if n else 0.0
+    sxx = float(((x - x_mean) ** 2).sum()) or 1.0
+    spread = np.sqrt(1 + 1 / max(n, 1) + (future - x_mean) ** 2 / sxx)
+    half_width = Z_SCORES.get(confidence, 1.96) * sigma[:, None] * spread[None, :]
+
+    # Spending cannot go negative, but the interval is centred on the unclipped fit
+    return {
+        'predicted': np.maximum(predicted, 0),
+        'lower': np.maximum(predicted - half_width, 0),
+        'upper': np.maximum(predicted + half_width, 0),
+        'slopes': slopes,
+        'averages': y.mean(axis=1) if n else np.zeros(rows),
+        'seasonal': seasonal is not None,
+    }
+
+
+def _future_months(series: ExpenseSeries, horizon: int) -> List[str]:
+    return [str(m) for m in series.start + series.n_months + np.arange(horizon)]
+
+
+def forecast_all(series: ExpenseSeries, horizon: int = 3, confidence: float = 0.95) -> Dict:
+    """
+    Forecast the monthly total and every category at once
+
+    Args:
+        series: Monthly spending
+        horizon: Months to project past the last month in the series
+        confidence: Prediction interval level (0.8, 0.9, 0.95 or 0.99)
+
+    Returns:
+        dict: {'total': Forecast, 'categories': {name: Forecast}}
+    """
+    if series.n_months == 0:
+        empty = Forecast([], np.zeros(0), np.zeros(0), np.zeros(0), 0.0, 0.0, 0.0, False)
+        return {'total': empty, 'categories': {}}
+
+    # Row 0 is the total, the rest are categories
+    matrix = np.vstack([series.monthly_total, series.totals])
+    result = forecast_matrix(matrix, horizon, confidence)
+    months = _future_months(series, horizon)
+
+    def row(i):
+        average = float(result['averages'][i])
+        slope = float(result['slopes'][i])
+        return Forecast(months, result['predicted'][i], result['lower'][i], result['upper'][i], slope, average,
+                        slope / average * 100 if average > 0 else 0.0, result['seasonal'])
+
+    return {
+        'total': row(0),
+        'categories': {name: row(i + 1) for i, name in enumerate(series.categories)},
+    }
+
+
+def skip_months(forecast: Forecast, count: int) -> Forecast:
+    """The forecast without its first `count` projected months"""
+    return forecast._replace(months=forecast.months[count:], predicted=forecast.predicted[count:],
+                             lower=forecast.lower[count:], upper=forecast.upper[count:])
+
+
+def month_over_month_change(series: ExpenseSeries) -> float:
+    """Percentage change of total spending between the last two months"""
+    totals = series.monthly_total
+    if len(totals) < 2 or totals[-2] <= 0:
+        return 0.0
+    return float((totals[-1] - totals[-2]) / totals[-2] * 100)
+
+
+def interval_confidence(forecast: Forecast) -> np.ndarray:
+    """Rough 0-1 confidence per month: 1 minus the interval's relative half-width"""
+    half_width = (forecast.upper - forecast.lower) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative = np.where(forecast.predicted > 0, half_width / forecast.predicted, 1.0)
+    return np.clip(1 - relative, 0, 1)
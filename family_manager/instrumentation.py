@@ -0,0 +1,322 @@
+"""
+Instrumentation for Family Household Manager
+Latency histograms per operation, spans (context manager and decorator) that
+feed them, and a SQLite connection whose statements are timed, so the app and
+the API can report p50/p95/p99 for database queries, AI calls and UI work.
+Statements over a threshold can also be written to an opt-in slow-query log.
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import logging
+import sqlite3
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Categories shown in the Performance view and /api/metrics
+DB, AI, UI, MCP = 'db', 'ai', 'ui', 'mcp'
+
+# Spans slower than this are also logged, so outliers show up in the log
+SLOW_SPAN_SECONDS = 1.0
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram
+
+    Bucket boundaries grow by 2^(1/8) from one microsecond, so percentiles
+    are accurate to about 9% while memory stays bounded however many samples
+    are added.
+    """
+    BUCKETS_PER_DOUBLING = 8
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, seconds: float) -> int:
+        microseconds = seconds * 1e6
+        if microseconds <= 1:
+            return 0
+        return int(math.log2(microseconds) * self.BUCKETS_PER_DOUBLING) + 1
+
+    def _upper_bound(self, bucket: int) -> float:
+        return 2 ** (bucket / self.BUCKETS_PER_DOUBLING) / 1e6
+
+    def add(self, seconds: float):
+        seconds = max(seconds, 0.0)
+        bucket = self._bucket(seconds)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """Latency in seconds below which p% of samples fall (0 when empty)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(max(self._upper_bound(bucket), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Count plus mean, p50, p95, p99 and max in milliseconds"""
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50) * 1000, 3),
+            'p95_ms': round(self.percentile(95) * 1000, 3),
+            'p99_ms': round(self.percentile(99) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe histograms keyed by (category, operation)"""
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def record(self, category: str, name: str, seconds: float):
+        with self._lock:
+            histogram = self._histograms.setdefault(category, {}).get(name)
+            if histogram is None:
+                histogram = self._histograms[category][name] = LatencyHistogram()
+            histogram.add(seconds)
+
+    def histogram(self, category: str, name: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get(category, {}).get(name)
+
+    def snapshot(self, category: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Summaries of every operation
+
+        Args:
+            category: Only include this category
+
+        Returns:
+            dict: {category: {operation: summary}}, operations slowest p95 first
+        """
+        with self._lock:
+            snapshot = {}
+            for cat, histograms in self._histograms.items():
+                if category is not None and cat != category:
+                    continue
+                summaries = {name: histogram.summary() for name, histogram in histograms.items()}
+                snapshot[cat] = dict(sorted(summaries.items(), key=lambda item: item[1]['p95_ms'], reverse=True))
+            return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.started = time.time()
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Process-wide registry the app, API and timed connections report to"""
+    return _registry
+
+
+@contextmanager
+def span(name: str, category: str = 'app', registry: Optional[MetricsRegistry] = None):
+    """Time the enclosed block as one sample of `name` (recorded even if it raises)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        (registry or _registry).record(category, name, elapsed)
+        if elapsed >= SLOW_SPAN_SECONDS:
+            logger.info(f"Slow {category} span {name}: {elapsed * 1000:.0f} ms")
+
+
+def timed(name: Optional[str] = None, category: str = 'app'):
+    """Decorator recording each call as a span named after the function (or `name`)"""
+    def decorator(func: Callable):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# First keyword of the statement and the table it works on
+_STATEMENT_TABLE = re.compile(r'\b(?:FROM|INTO|UPDATE|TABLE|EXISTS)\s+["`\[]?(\w+)', re.IGNORECASE)
+
+
+def statement_name(sql: str) -> str:
+    """Group statements by verb and table, e.g. 'SELECT expenses' or 'PRAGMA'"""
+    words = sql.split(None, 1)
+    if not words:
+        return 'EMPTY'
+    verb = words[0].upper()
+    if verb == 'WITH':
+        verb = 'SELECT'
+    table = _STATEMENT_TABLE.search(sql)
+    return f"{verb} {table.group(1)}" if table else verb
+
+
+class SlowQueryLog:
+    """
+    Statements slower than a threshold, with their parameters and call site
+
+    Entries are kept in memory (most recent `max_entries`) and, when a path is
+    given, appended to it as JSON lines that query_audit.py can replay.
+    """
+
+    def __init__(self, threshold_ms: float = 100.0, path: Optional[str] = None, max_entries: int = 500):
+        self.threshold = threshold_ms / 1000
+        self.path = path
+        self.entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, parameters, seconds: float):
+        entry = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'ms': round(seconds * 1000, 1),
+            'sql': ' '.join(sql.split()),
+            'params': _loggable_parameters(parameters),
+            'site': _call_site(),
+        }
+        logger.warning(f"Slow query ({entry['ms']:.0f} ms) at {entry['site']}: {entry['sql'][:200]}")
+        with self._lock:
+            self.entries.append(entry)
+            if self.path:
+                try:
+                    with open(self.path, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(entry) + '\n')
+                except OSError as e:
+                    logger.error(f"Failed to write slow query log {self.path}: {e}")
+
+
+def _loggable_parameters(parameters):
+    """JSON-safe copy of statement parameters (executemany batches are summarised)"""
+    if isinstance(parameters, str):
+        return parameters
+    if isinstance(parameters, dict):
+        return {key: _loggable_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_loggable_value(value) for value in parameters]
+    return f"<{type(parameters).__name__}>"
+
+
+def _loggable_value(value):
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, bytes):
+        return f"<{len(value)} bytes>"
+    text = str(value)
+    return text if len(text) <= 200 else text[:200] + '...'
+
+
+def _call_site() -> str:
+    """'file.py:123 in function' for the first frame outside this module"""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return 'unknown'
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+_slow_query_log: Optional[SlowQueryLog] = None
+
+
+def enable_slow_query_log(threshold_ms: float = 100.0, path: Optional[str] = 'slow_queries.jsonl') -> SlowQueryLog:
+    """
+    Start logging statements on timed connections that take at least threshold_ms
+
+    Also enabled at import by setting SLOW_QUERY_MS (and optionally
+    SLOW_QUERY_LOG for the file path) in the environment.
+    """
+    global _slow_query_log
+    _slow_query_log = SlowQueryLog(threshold_ms, path)
+    logger.info(f"Slow query log enabled at {threshold_ms:.0f} ms" + (f" -> {path}" if path else ""))
+    return _slow_query_log
+
+
+def disable_slow_query_log():
+    global _slow_query_log
+    _slow_query_log = None
+
+
+def slow_queries() -> List[dict]:
+    """Recent slow-query entries (empty when the log is disabled)"""
+    return list(_slow_query_log.entries) if _slow_query_log is not None else []
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor that records each statement's execution time under DB"""
+
+    def _timed(self, sql, parameters, run):
+        start = time.perf_counter()
+        try:
+            return run()
+        finally:
+            elapsed = time.perf_counter() - start
+            _registry.record(DB, statement_name(sql), elapsed)
+            slow_log = _slow_query_log
+            if slow_log is not None and elapsed >= slow_log.threshold:
+                slow_log.record(sql, parameters, elapsed)
+
+    def execute(self, sql, parameters=()):
+        return self._timed(sql, parameters, lambda: super(TimedCursor, self).execute(sql, parameters))
+
+    def executemany(self, sql, seq_of_parameters):
+        seq_of_parameters = list(seq_of_parameters)
+        return self._timed(sql, f"<{len(seq_of_parameters)} parameter sets>",
+                           lambda: super(TimedCursor, self).executemany(sql, seq_of_parameters))
+
+    def executescript(self, sql_script):
+        return self._timed(sql_script, (), lambda: super(TimedCursor, self).executescript(sql_script))
+
+
+class TimedConnection(sqlite3.Connection):
+    """Connection whose cursors and shortcut execute methods are timed"""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """sqlite3.connect() returning a connection whose queries are timed"""
+    return sqlite3.connect(db_path, factory=TimedConnection, **kwargs)
+
+
+if os.environ.get('SLOW_QUERY_MS'):
+    enable_slow_query_log(float(os.environ['SLOW_QUERY_MS']), os.environ.get('SLOW_QUERY_LOG', 'slow_queries.jsonl'))
@@ -0,0 +1,66 @@
+"""
+Lazy Module Imports for Family Household Manager
+Stand-ins for feature modules that are imported the first time one of their
+attributes is used, so features a session never opens cost nothing at startup.
+"""
+
+import importlib
+import logging
+import threading
+import time
+from types import ModuleType
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """
+    Proxy for a sibling module of family_manager, imported on first attribute access
+
+    Resolved relative to `package` when the app runs as a package and as a
+    top-level module otherwise, mirroring the try/except imports used
+    throughout the app.
+    """
+
+    def __init__(self, name: str, package: Optional[str] = None):
+        self._name = name
+        self._package = package
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """Import the module (once) and return it"""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    start = time.perf_counter()
+                    if self._package:
+                        try:
+                            module = importlib.import_module(f'.{self._name}', self._package)
+                        except ModuleNotFoundError as e:
+                            # Only retry as a top-level module when the package or the module itself
+                            # is missing; a dependency it fails to import is a real error
+                            if e.name not in (self._package, f'{self._package}.{self._name}'):
+                                raise
+                            module = importlib.import_module(self._name)
+                    else:
+                        module = importlib.import_module(self._name)
+                    logger.info(f"Loaded {self._name} in {(time.perf_counter() - start) * 1000:.1f} ms")
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        # Our own state is always set in __init__; reaching here for it (e.g.
+        # during copy) must not trigger an import
+        if attr.startswith('__') or attr in ('_name', '_package', '_module', '_lock'):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self.is_loaded else 'not loaded'
+        return f"<LazyModule {self._name} ({state})>"
@@ -0,0 +1,140 @@
+"""
+Lazy Tabs for Family Household Manager
+A QTabWidget whose pages are built the first time they are shown (or the
+first time code touches one of their widgets) instead of at startup.
+"""
+
+import functools
+import logging
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from PyQt6.QtWidgets import QTabWidget, QVBoxLayout, QWidget
+from PyQt6.QtCore import pyqtSignal
+
+try:
+    from .instrumentation import UI, get_registry, span
+except ImportError:
+    from instrumentation import UI, get_registry, span
+
+logger = logging.getLogger(__name__)
+
+PENDING, BUILDING, BUILT = 'pending', 'building', 'built'
+
+
+class _LazyTab:
+    def __init__(self, key, title, builder, provides, placeholder):
+        self.key = key
+        self.title = title
+        self.builder = builder
+        self.provides = frozenset(provides)
+        self.placeholder = placeholder
+        self.state = PENDING
+
+
+class LazyTabWidget(QTabWidget):
+    """
+    Tab widget with on-demand page construction
+
+    Each tab starts as an empty placeholder page. Its builder runs when the
+    tab is first activated, or when build_for_attribute() is asked for one of
+    the widget attributes the builder creates; the builder hands its page to
+    fill_tab().
+    """
+    tab_built = pyqtSignal(str, float)  # key, seconds taken
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tabs: Dict[str, _LazyTab] = {}
+        self.currentChanged.connect(self._on_current_changed)
+
+    def add_lazy_tab(self, key: str, title: str, builder: Callable[[], None], provides: Iterable[str] = ()) -> int:
+        """
+        Register a tab without building it
+
+        Args:
+            key: Tab name used by ensure_built / fill_tab
+            title: Tab label
+            builder: Builds the page and passes it to fill_tab(key, page)
+            provides: Attributes of the owner the builder creates
+
+        Returns:
+            int: Index of the tab
+        """
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._tabs[key] = _LazyTab(key, title, builder, provides, placeholder)
+        # Adding the first tab makes it current, which builds it right away
+        return self.addTab(placeholder, title)
+
+    def fill_tab(self, key: str, page: QWidget):
+        """Install a built page in its tab"""
+        self._tabs[key].placeholder.layout().addWidget(page)
+
+    def is_pending(self, key: str) -> bool:
+        tab = self._tabs.get(key)
+        return tab is not None and tab.state == PENDING
+
+    def pending_tabs(self):
+        return [key for key, tab in self._tabs.items() if tab.state == PENDING]
+
+    def ensure_built(self, key: str) -> bool:
+        """
+        Build a tab if it has not been built yet
+
+        Returns:
+            bool: True if the tab was built by this call
+        """
+        tab = self._tabs[key]
+        if tab.state != PENDING:
+            return False
+        tab.state = BUILDING
+        start = time.perf_counter()
+        try:
+            tab.builder()
+        except Exception:
+            tab.state = PENDING
+            logger.exception(f"Building the {tab.title} tab failed")
+            raise
+        tab.state = BUILT
+        elapsed = time.perf_counter() - start
+        get_registry().record(UI, f"build {key} tab", elapsed)
+        logger.info(f"Built {tab.title} tab in {elapsed * 1000:.1f} ms")
+        self.tab_built.emit(key, elapsed)
+        return True
+
+    def build_for_attribute(self, name: str) -> bool:
+        """Build the pending tab that creates attribute `name`, if any"""
+        for tab in self._tabs.values():
+            if tab.state == PENDING and name in tab.provides:
+                return self.ensure_built(tab.key)
+        return False
+
+    def _key_at(self, index: int) -> Optional[str]:
+        page = self.widget(index)
+        return next((key for key, tab in self._tabs.items() if tab.placeholder is page), None)
+
+    def _on_current_changed(self, index: int):
+        key = self._key_at(index)
+        if key is not None:
+            self.ensure_built(key)
+
+
+def refreshes_tab(key: str):
+    """
+    Skip a refresh of a tab that has not been built yet, and time the rest
+
+    The tab loads current data when it is built, so refreshing it beforehand
+    would only force it to be built early.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tabs = self.__dict__.get('tabs')
+            if isinstance(tabs, LazyTabWidget) and tabs.is_pending(key):
+                return None
+            with span(method.__name__, UI):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,335 @@
+"""
+Meal Ingredients Index for Family Household Manager
+Normalizes meals.ingredients into structured (name_key, qty, unit) rows
+"""
+
+import re
+import json
+import sqlite3
+import logging
+from typing import List, Dict, Optional, Tuple, Iterable
+
+try:
+    from .units import to_base, convert
+except ImportError:
+    from units import to_base, convert
+
+logger = logging.getLogger(__name__)
+
+
+# Units recognised when an ingredient is written as "2 cups flour"
+KNOWN_UNITS = {
+    'each', 'pc', 'pcs', 'piece', 'pieces', 'count', 'dozen',
+    'g', 'gram', 'grams', 'kg', 'kilogram', 'kilograms',
+    'oz', 'ounce', 'ounces', 'lb', 'lbs', 'pound', 'pounds',
+    'ml', 'l', 'liter', 'liters', 'litre', 'litres',
+    'tsp', 'teaspoon', 'teaspoons', 'tbsp', 'tablespoon', 'tablespoons',
+    'cup', 'cups', 'pint', 'pints', 'quart', 'quarts', 'gal', 'gallon', 'gallons',
+    'can', 'cans', 'clove', 'cloves', 'slice', 'slices', 'loaf', 'bunch', 'head',
+}
+
+_PAREN_QTY = re.compile(r'^(.+?)\s*\(\s*([\d./]+)\s*([a-zA-Z]*)\s*\)$')
+_LEADING_QTY = re.compile(r'^(\d+\s+\d+/\d+|\d+(?:\.\d+)?(?:\s*/\s*\d+)?)\s*([a-zA-Z]+)?\.?\s+(?:of\s+)?(.+)$')
+
+
+def normalize_name(name: str) -> str:
+    """Build the lookup key used to group ingredients across meals"""
+    return ' '.join(str(name).lower().split())
+
+
+def _parse_number(text: str) -> Optional[float]:
+    """Parse '2', '1.5', '1/2' or '1 1/2' into a float"""
+    text = text.strip()
+    try:
+        if ' ' in text:
+            whole, frac = text.split(None, 1)
+            return float(whole) + _parse_number(frac)
+        if '/' in text:
+            num, den = text.split('/', 1)
+            return float(num) / float(den)
+        return float(text)
+    except (ValueError, TypeError, ZeroDivisionError):
+        return None
+
+
+def parse_ingredient_text(text: str) -> Tuple[str, float, str]:
+    """
+    Parse a single free-text ingredient into (name, qty, unit)
+
+    Handles "chicken breast (4 oz)", "2 cups flour", "1/2 lb butter" and
+    plain names, which default to a quantity of 1 'each'.
+    """
+    text = str(text).strip().strip('-•*').strip()
+
+    match = _PAREN_QTY.match(text)
+    if match:
+        qty = _parse_number(match.group(2))
+        if qty is not None:
+            return match.group(1).strip(), qty, (match.group(3) or 'each').lower()
+
+    match = _LEADING_QTY.match(text)
+    if match:
+        qty = _parse_number(match.group(1))
+        unit = (match.group(2) or '').lower()
+        name = match.group(3).strip()
+        if qty is not None:
+            if unit and unit not in KNOWN_UNITS:
+                # "2 large eggs" - the word belongs to the name, not the unit
+                name = f"{match.group(2)} {name}"
+                unit = ''
+            return name, qty, unit or 'each'
+
+    return text, 1.0, 'each'
+
+
+def _parse_structured(item: Dict) -> Optional[Tuple[str, float, str]]:
+    """Parse a JSON ingredient object such as {"name": ..., "quantity": ..., "unit": ...}"""
+    name = item.get('name') or item.get('item') or item.get('ingredient')
+    if not name:
+        return None
+    qty = item.get('qty', item.get('quantity', item.get('amount')))
+    if qty is None:
+        return parse_ingredient_text(name)
+    parsed_qty = _parse_number(str(qty))
+    unit = str(item.get('unit') or 'each').lower()
+    return str(name).strip(), parsed_qty if parsed_qty is not None else 1.0, unit
+
+
+def parse_ingredients(raw) -> List[Dict]:
+    """
+    Parse a meals.ingredients value (JSON array or comma-separated string)
+
+    Args:
+        raw: The stored ingredients value, or an already decoded list
+
+    Returns:
+        list: Dictionaries with name, name_key, qty and unit keys
+    """
+    if not raw:
+        return []
+
+    items: Iterable = []
+    if isinstance(raw, (list, tuple)):
+        items = raw
+    else:
+        raw = str(raw).strip()
+        if raw.startswith('[') or raw.startswith('{'):
+            try:
+                decoded = json.loads(raw)
+                items = decoded if isinstance(decoded, list) else [decoded]
+            except (json.JSONDecodeError, TypeError):
+                items = raw.split(',')
+        else:
+            items = re.split(r'[,\n]', raw)
+
+    parsed = []
+    for item in items:
+        if isinstance(item, dict):
+            result = _parse_structured(item)
+        elif item is not None and str(item).strip():
+            result = parse_ingredient_text(item)
+        else:
+            result = None
+
+        if not result or not result[0]:
+            continue
+
+        name, qty, unit = result
+        parsed.append({
+            'name': name,
+            'name_key': normalize_name(name),
+            'qty': qty,
+            'unit': unit
+        })
+
+    return parsed
+
+
+def ensure_meal_ingredients_table(cursor: sqlite3.Cursor, backfill: bool = True) -> int:
+    """
+    Create the meal_ingredients table, its indexes and maintenance triggers
+
+    The triggers clear rows whenever a meal is deleted or its ingredients
+    column changes; write paths repopulate them with sync_meal_ingredients().
+    Meals that have ingredients but no index rows (legacy data, or a write
+    path that skipped the sync) are backfilled here.
+
+    Returns:
+        int: Number of meals backfilled
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS meal_ingredients (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            meal_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            name_key TEXT NOT NULL,
+            qty REAL DEFAULT 1,
+            unit TEXT DEFAULT 'each',
+            base_qty REAL,
+            base_unit TEXT,
+            FOREIGN KEY (meal_id) REFERENCES meals (id) ON DELETE CASCADE
+        )
+    ''')
+    cursor.execute("PRAGMA table_info(meal_ingredients)")
+    columns = {row[1] for row in cursor.fetchall()}
+    if 'base_qty' not in columns:
+        cursor.execute("ALTER TABLE meal_ingredients ADD COLUMN base_qty REAL")
+        cursor.execute("ALTER TABLE meal_ingredients ADD COLUMN base_unit TEXT")
+        # Re-index so every row carries a canonical quantity
+        cursor.execute("DELETE FROM meal_ingredients")
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_meal_ingredients_meal ON meal_ingredients(meal_id)")
+    cursor.execute("DROP INDEX IF EXISTS idx_meal_ingredients_key")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_meal_ingredients_base ON meal_ingredients(name_key, base_unit)")
+
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meals'")
+    if not cursor.fetchone():
+        return 0
+
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_meals_delete_ingredients
+        AFTER DELETE ON meals
+        BEGIN
+            DELETE FROM meal_ingredients WHERE meal_id = OLD.id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_meals_update_ingredients
+        AFTER UPDATE OF ingredients ON meals
+        BEGIN
+            DELETE FROM meal_ingredients WHERE meal_id = OLD.id;
+        END
+    ''')
+
+    return backfill_meal_ingredients(cursor) if backfill else 0
+
+
+def backfill_meal_ingredients(cursor: sqlite3.Cursor) -> int:
+    """Populate meal_ingredients for meals that have not been indexed yet"""
+    cursor.execute('''
+        SELECT m.id, m.ingredients FROM meals m
+        WHERE m.ingredients IS NOT NULL AND m.ingredients != ''
+        AND NOT EXISTS (SELECT 1 FROM meal_ingredients mi WHERE mi.meal_id = m.id)
+    ''')
+    pending = cursor.fetchall()
+
+    rows = []
+    for meal_id, raw in pending:
+        rows.extend(_rows_for_meal(meal_id, raw))
+
+    if rows:
+        cursor.executemany(_INSERT_SQL, rows)
+        logger.info(f"Backfilled {len(rows)} ingredient rows for {len(pending)} meals")
+
+    return len(pending)
+
+
+_INSERT_SQL = '''
+    INSERT INTO meal_ingredients (meal_id, name, name_key, qty, unit, base_qty, base_unit)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _rows_for_meal(meal_id: int, raw) -> List[Tuple]:
+    rows = []
+    for ing in parse_ingredients(raw):
+        base_qty, base_unit = to_base(ing['qty'], ing['unit'])
+        rows.append((meal_id, ing['name'], ing['name_key'], ing['qty'], ing['unit'], base_qty, base_unit))
+    return rows
+
+
+def sync_meal_ingredients(cursor: sqlite3.Cursor, meal_id: int, raw) -> int:
+    """
+    Replace the indexed ingredients for a single meal
+
+    Call this after every INSERT/UPDATE on meals, using the same cursor so
+    the index is written in the same transaction as the meal.
+
+    Returns:
+        int: Number of ingredient rows written
+    """
+    cursor.execute("DELETE FROM meal_ingredients WHERE meal_id = ?", (meal_id,))
+    rows = _rows_for_meal(meal_id, raw)
+    if rows:
+        cursor.executemany(_INSERT_SQL, rows)
+    return len(rows)
+
+
+def insert_meal(cursor: sqlite3.Cursor, columns: Dict) -> int:
+    """
+    Insert a meal row and index its ingredients in one step
+
+    Args:
+        cursor: Cursor on an open connection (caller commits)
+        columns: Column name to value mapping for the meals table
+
+    Returns:
+        int: ID of the new meal
+    """
+    names = list(columns.keys())
+    cursor.execute(
+        f"INSERT INTO meals ({', '.join(names)}) VALUES ({', '.join('?' for _ in names)})",
+        [columns[name] for name in names]
+    )
+    meal_id = cursor.lastrowid
+    sync_meal_ingredients(cursor, meal_id, columns.get('ingredients'))
+    return meal_id
+
+
+def ingredient_usage(cursor: sqlite3.Cursor, start_date: str, end_date: Optional[str] = None) -> List[Tuple]:
+    """
+    Count how often each ingredient appears in meals within a date range
+
+    Returns:
+        list: (name, name_key, meal_count, inventory_qty) tuples, most used first.
+              inventory_qty is None when the ingredient is not in inventory.
+    """
+    params = [start_date]
+    date_filter = "m.date >= ?"
+    if end_date:
+        date_filter += " AND m.date <= ?"
+        params.append(end_date)
+
+    cursor.execute(f'''
+        SELECT MIN(mi.name), mi.name_key, COUNT(*) AS uses,
+               (SELECT SUM(i.qty) FROM inventory i WHERE LOWER(i.name) = mi.name_key) AS on_hand
+        FROM meal_ingredients mi
+        JOIN meals m ON m.id = mi.meal_id
+        WHERE {date_filter}
+        GROUP BY mi.name_key
+        ORDER BY uses DESC, mi.name_key
+    ''', params)
+    return cursor.fetchall()
+
+
+def aggregate_ingredients(cursor: sqlite3.Cursor, start_date: str,
+                          end_date: str) -> Dict[Tuple[str, str], Tuple[float, str]]:
+    """
+    Sum required ingredient quantities for meals between two dates (inclusive)
+
+    Quantities are summed in their canonical base unit, so "1 lb" and
+    "8 oz" of the same ingredient add up exactly; the total is reported in
+    the alphabetically first unit the ingredient was written with (MIN(unit)),
+    so the same meals always produce the same unit.
+
+    Returns:
+        dict: {(name, base_unit): (total_qty, unit)} - one entry per ingredient and dimension
+    """
+    cursor.execute('''
+        SELECT MIN(mi.name), MIN(mi.unit), mi.base_unit, SUM(mi.base_qty)
+        FROM meal_ingredients mi
+        JOIN meals m ON m.id = mi.meal_id
+        WHERE m.date BETWEEN ? AND ?
+        GROUP BY mi.name_key, mi.base_unit
+        ORDER BY mi.name_key
+    ''', (start_date, end_date))
+
+    required = {}
+    for name, unit, base_unit, base_total in cursor.fetchall():
+        unit = unit or 'each'
+        try:
+            total = convert(base_total or 0, base_unit, unit)
+        except ValueError:
+            total, unit = base_total or 0, base_unit
+        required[(name, base_unit)] = (round(total, 4), unit)
+    return required
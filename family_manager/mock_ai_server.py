@@ -0,0 +1,336 @@
+"""
+AI Provider Stand-in Server for Family Household Manager
+Replays recorded provider responses (or minimal built-in ones) with a
+configurable latency, error rate and 429 rate limiting, so retries, caching
+and concurrency can be measured offline and deterministically. Runs either
+as a local HTTP server the app is redirected to with AI_PROVIDER_BASE_URL,
+or in-process as a transport (ReplayTransport) for tests and benchmarks.
+
+Usage:
+    python mock_ai_server.py [--port 8765] [--recordings recordings.json] [--latency-ms 300]
+                             [--jitter-ms 100] [--error-rate 0.05] [--rate-limit 5] [--seed 0]
+    AI_PROVIDER_BASE_URL=http://127.0.0.1:8765 python main.py
+"""
+
+import sys
+import json
+import math
+import time
+import random
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+try:
+    from .provider_transport import ProviderTransport
+except ImportError:
+    from provider_transport import ProviderTransport
+
+logger = logging.getLogger(__name__)
+
+
+class FaultProfile(NamedTuple):
+    """How the stand-in misbehaves"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0          # latency varies uniformly by up to this much either way
+    error_rate: float = 0.0         # fraction of requests answered with error_status
+    error_status: int = 503
+    rate_limit: Optional[float] = None  # sustained requests per second per provider
+    burst: Optional[int] = None     # requests allowed at once (defaults to the rate, at least 1)
+    seed: int = 0
+
+
+class MockReply(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: object
+    delay: float  # seconds to wait before replying
+
+
+def _completion(text: str) -> Dict:
+    """OpenAI-style chat completion, the shape HuggingFace, AIMLAPI, Scitely and OpenCode Zen return"""
+    return {
+        'id': 'mock-completion', 'object': 'chat.completion', 'model': 'mock',
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+    }
+
+
+def default_response(provider: str, path: str) -> Optional[Dict]:
+    """Minimal valid response for a provider endpoint, or None if the endpoint is unknown"""
+    if ':generateContent' in path:
+        return {
+            'candidates': [{'content': {'role': 'model', 'parts': [{'text': '{}'}]}, 'finishReason': 'STOP',
+                            'index': 0}],
+            'usageMetadata': {'promptTokenCount': 0, 'candidatesTokenCount': 0, 'totalTokenCount': 0},
+        }
+    if path.endswith('/chat/completions') or path.endswith('/responses'):
+        return _completion('{}')
+    if provider == 'spoonacular':
+        if path.endswith('/findByIngredients'):
+            return []
+        if path.endswith('/information'):
+            return {'id': 0, 'title': 'Mock recipe', 'readyInMinutes': 0, 'servings': 1,
+                    'extendedIngredients': [], 'analyzedInstructions': []}
+        return {}
+    return None
+
+
+def load_recordings(path: str) -> Dict[str, List[Dict]]:
+    """
+    Read a recordings file
+
+    The file maps 'provider/path' (or just 'provider', for every endpoint of
+    that provider) to a list of {'status': ..., 'body': ...} responses, which
+    are replayed in turn. provider_transport's AI_PROVIDER_RECORD writes it.
+    """
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ReplayEngine:
+    """
+    Decides each stand-in reply: recorded or default body, status and delay
+
+    Rate-limited requests are answered at once with 429 and a Retry-After
+    header; every other reply waits the configured latency first.
+
+    Args:
+        recordings: {'provider/path' or 'provider': [{'status', 'body'}, ...]}
+        profile: Latency, errors and rate limiting to apply
+        clock: Monotonic clock in seconds (replaceable in tests)
+    """
+
+    def __init__(self, recordings: Optional[Dict[str, List[Dict]]] = None, profile: FaultProfile = FaultProfile(),
+                 clock: Callable[[], float] = time.monotonic):
+        self.recordings = recordings or {}
+        self.profile = profile
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget replay positions, rate-limit state and statistics, and reseed"""
+        with self._lock:
+            self._rng = random.Random(self.profile.seed)
+            self._positions: Dict[str, int] = {}
+            self._buckets: Dict[str, List[float]] = {}  # provider -> [tokens, last refill]
+            self._stats: Dict[str, Dict[str, int]] = {}
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """{provider: {'requests', 'ok', 'errors', 'rate_limited'}}"""
+        with self._lock:
+            return {provider: dict(counts) for provider, counts in self._stats.items()}
+
+    def _take_token(self, provider: str) -> float:
+        """0 if the request may proceed, otherwise seconds until it could"""
+        rate = self.profile.rate_limit
+        if not rate:
+            return 0.0
+        capacity = self.profile.burst or max(1, int(rate))
+        now = self.clock()
+        bucket = self._buckets.setdefault(provider, [capacity, now])
+        bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / rate
+
+    def _recorded(self, provider: str, path: str) -> Optional[Dict]:
+        for key in (f"{provider}{path}", provider):
+            responses = self.recordings.get(key)
+            if responses:
+                position = self._positions.get(key, 0)
+                self._positions[key] = position + 1
+                return responses[position % len(responses)]
+        return None
+
+    def respond(self, provider: str, path: str) -> MockReply:
+        """Reply to one request for `path` on `provider`"""
+        profile = self.profile
+        with self._lock:
+            counts = self._stats.setdefault(provider, {'requests': 0, 'ok': 0, 'errors': 0, 'rate_limited': 0})
+            counts['requests'] += 1
+
+            wait = self._take_token(provider)
+            if wait:
+                counts['rate_limited'] += 1
+                return MockReply(429, {'Retry-After': str(math.ceil(wait))},
+                                 {'error': {'message': 'Rate limit exceeded', 'type': 'rate_limit'}}, 0.0)
+
+            delay = max(0.0, profile.latency_ms + self._rng.uniform(-1, 1) * profile.jitter_ms) / 1000
+            if profile.error_rate and self._rng.random() < profile.error_rate:
+                counts['errors'] += 1
+                return MockReply(profile.error_status, {},
+                                 {'error': {'message': 'Injected failure', 'type': 'server_error'}}, delay)
+
+            recorded = self._recorded(provider, path)
+            if recorded is not None:
+                status, body = recorded.get('status', 200), recorded.get('body')
+            else:
+                body = default_response(provider, path)
+                status = 200 if body is not None else 404
+                if body is None:
+                    body = {'error': {'message': f"No recording for {provider}{path}", 'type': 'not_found'}}
+            counts['ok' if status < 400 else 'errors'] += 1
+            return MockReply(status, {}, body, delay)
+
+
+class ReplayResponse:
+    """The parts of requests.Response the providers use"""
+
+    def __init__(self, status_code: int, body, headers: Optional[Dict[str, str]] = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = body if isinstance(body, str) else json.dumps(body)
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class ReplayTransport(ProviderTransport):
+    """
+    In-process transport answering from a ReplayEngine, no sockets involved
+
+    Use with provider_transport.set_transport(). SDK-based providers (Gemini,
+    OpenAI, Spoonacular) bypass transports; point them at MockProviderServer.
+
+    Args:
+        engine: Engine that decides the replies
+        sleep: Called with each reply's delay (replaceable in tests)
+    """
+
+    def __init__(self, engine: ReplayEngine, sleep: Callable[[float], None] = time.sleep):
+        super().__init__()
+        self.engine = engine
+        self.sleep = sleep
+
+    def _send(self, provider, url, headers, body, timeout):
+        reply = self.engine.respond(provider, urlsplit(url).path)
+        if reply.delay > timeout:
+            self.sleep(timeout)
+            raise TimeoutError(f"{provider} did not answer within {timeout} s")
+        self.sleep(reply.delay)
+        return ReplayResponse(reply.status, reply.body, reply.headers)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: 'ThreadingHTTPServer'
+
+    def _reply(self, status: int, body, headers: Optional[Dict[str, str]] = None):
+        data = (body if isinstance(body, str) else json.dumps(body)).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self):
+        engine: ReplayEngine = self.server.engine
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        path = urlsplit(self.path).path
+        if path == '/_mock/stats':
+            return self._reply(200, engine.stats())
+        if path == '/_mock/reset':
+            engine.reset()
+            return self._reply(200, {'status': 'ok'})
+
+        provider, _, rest = path.lstrip('/').partition('/')
+        reply = engine.respond(provider, '/' + rest)
+        if reply.delay:
+            time.sleep(reply.delay)
+        self._reply(reply.status, reply.body, reply.headers)
+
+    do_GET = _handle
+    do_POST = _handle
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class MockProviderServer:
+    """
+    Stand-in for every provider on one local port
+
+    Requests to /<provider>/<path> are answered by the engine;
+    GET /_mock/stats returns the engine's counters and POST /_mock/reset
+    clears them.
+    """
+
+    def __init__(self, engine: Optional[ReplayEngine] = None, host: str = '127.0.0.1', port: int = 0):
+        self.engine = engine or ReplayEngine()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.engine = self.engine
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockProviderServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='mock-ai-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve on the calling thread until interrupted"""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve recorded AI provider responses with injected faults")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--recordings', help="JSON recordings file (see load_recordings)")
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--rate-limit', type=float, help="Requests per second per provider before 429s")
+    parser.add_argument('--burst', type=int, help="Requests allowed at once under the rate limit")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    profile = FaultProfile(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status, args.rate_limit,
+                           args.burst, args.seed)
+    engine = ReplayEngine(load_recordings(args.recordings) if args.recordings else None, profile)
+    server = MockProviderServer(engine, args.host, args.port)
+    print(f"Serving AI provider stand-in on {server.url} (AI_PROVIDER_BASE_URL={server.url})")
+    server.serve_forever()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,10 +5,18 @@ Handles notification creation, retrieval, preferences, and reminder scheduling
 
 import sqlite3
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
+try:
+    from .instrumentation import connect
+    from .reminder_scheduler import ReminderScheduler
+except ImportError:
+    from instrumentation import connect
+    from reminder_scheduler import ReminderScheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,19 +40,184 @@ class NotificationPriority(Enum):
     URGENT = "urgent"
 
 
+# Notification type -> notification_settings column that enables it
+TYPE_TO_SETTING = {
+    NotificationType.REMINDER.value: 'reminder_enabled',
+    NotificationType.ALERT.value: 'alert_enabled',
+    NotificationType.TASK_ASSIGNED.value: 'task_assigned_enabled',
+    NotificationType.CHORE_DUE.value: 'chore_due_enabled',
+    NotificationType.EVENT_UPCOMING.value: 'event_upcoming_enabled',
+    NotificationType.BILL_DUE.value: 'bill_due_enabled',
+    NotificationType.INVENTORY_LOW.value: 'inventory_low_enabled',
+    NotificationType.RECURRING_EVENT.value: 'recurring_event_enabled'
+}
+
+_INSERT_NOTIFICATION = '''
+    INSERT INTO notifications
+    (notification_type, recipient_id, title, message, priority, source_entity_type,
+     source_entity_id, action_url, scheduled_for, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+# Feed and unread-count queries filter on recipient and read state and page
+# newest first; the trailing columns let the filters run inside the index.
+# notification_unread_counts keeps a per-user unread total, maintained by
+# triggers so set-based inserts from NotificationTriggers are counted too.
+# next_expiry is the earliest expires_at among counted rows (possibly stale
+# early after a read, never late).
+_NOTIFICATION_SCHEMA = [
+    '''
+    CREATE INDEX IF NOT EXISTS idx_notifications_feed
+    ON notifications(recipient_id, created_at, id, is_read, expires_at)
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_notifications_unread_insert
+    AFTER INSERT ON notifications WHEN NEW.is_read = 0
+    BEGIN
+        INSERT OR IGNORE INTO notification_unread_counts (recipient_id) VALUES (NEW.recipient_id);
+        UPDATE notification_unread_counts
+        SET unread_count = unread_count + 1,
+            next_expiry = CASE WHEN next_expiry IS NULL OR NEW.expires_at < next_expiry
+                               THEN COALESCE(NEW.expires_at, next_expiry) ELSE next_expiry END
+        WHERE recipient_id = NEW.recipient_id;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_notifications_unread_update
+    AFTER UPDATE OF is_read, recipient_id ON notifications
+    WHEN OLD.is_read = 0 OR NEW.is_read = 0
+    BEGIN
+        UPDATE notification_unread_counts SET unread_count = unread_count - 1
+        WHERE recipient_id = OLD.recipient_id AND OLD.is_read = 0;
+        INSERT OR IGNORE INTO notification_unread_counts (recipient_id)
+        SELECT NEW.recipient_id WHERE NEW.is_read = 0;
+        UPDATE notification_unread_counts
+        SET unread_count = unread_count + 1,
+            next_expiry = CASE WHEN next_expiry IS NULL OR NEW.expires_at < next_expiry
+                               THEN COALESCE(NEW.expires_at, next_expiry) ELSE next_expiry END
+        WHERE recipient_id = NEW.recipient_id AND NEW.is_read = 0;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_notifications_unread_delete
+    AFTER DELETE ON notifications WHEN OLD.is_read = 0
+    BEGIN
+        UPDATE notification_unread_counts SET unread_count = unread_count - 1
+        WHERE recipient_id = OLD.recipient_id;
+    END
+    ''',
+]
+
+
+def ensure_notification_schema(cursor):
+    """
+    Create the feed index and the trigger-maintained unread counters
+
+    The counter table is backfilled from existing notifications the first
+    time it is created. Run inside a write transaction so no insert slips in
+    between the backfill and the triggers.
+
+    Args:
+        cursor: Cursor on a database that already has a notifications table
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'notification_unread_counts'")
+    exists = cursor.fetchone() is not None
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS notification_unread_counts (
+            recipient_id INTEGER PRIMARY KEY,
+            unread_count INTEGER NOT NULL DEFAULT 0,
+            next_expiry TEXT
+        )
+    ''')
+    if not exists:
+        cursor.execute('''
+            INSERT INTO notification_unread_counts (recipient_id, unread_count, next_expiry)
+            SELECT recipient_id, COUNT(*), MIN(expires_at) FROM notifications
+            WHERE is_read = 0 GROUP BY recipient_id
+        ''')
+    for statement in _NOTIFICATION_SCHEMA:
+        cursor.execute(statement)
+
+
 class NotificationManager:
     """Manage notifications, settings, and reminder scheduling"""
 
-    def __init__(self, db_path: str = 'family_manager.db'):
+    def __init__(self, db_path: str = 'family_manager.db', broker=None):
         self.db_path = db_path
+        # Optional NotificationBroker that streaming clients subscribe to
+        self.broker = broker
+        # Set by start_reminder_scheduler; create/dismiss keep it in sync
+        self.reminder_scheduler: Optional[ReminderScheduler] = None
+        # user_id -> full notification_settings row (None when the user has no row)
+        self._settings_cache: Dict[int, Optional[Dict]] = {}
+        self._settings_lock = threading.Lock()
+        # Bumped on every invalidation so an in-flight load cannot store stale rows
+        self._settings_generation = 0
+        self._ensure_schema()
         self._initialize_user_settings()
 
     def _get_connection(self):
         """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _ensure_schema(self):
+        """Create the feed index and unread counters if they are missing"""
+        try:
+            conn = self._get_connection()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                ensure_notification_schema(conn.cursor())
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to prepare notification schema: {e}")
+
+    def _publish_created(self, notification_ids: List[int]):
+        """Push new notifications and fresh unread counts to listening clients"""
+        if self.broker is None or not notification_ids:
+            return
+        try:
+            conn = self._get_connection()
+            try:
+                placeholders = ','.join('?' for _ in notification_ids)
+                rows = conn.execute(f"SELECT * FROM notifications WHERE id IN ({placeholders}) ORDER BY id",
+                                    notification_ids).fetchall()
+            finally:
+                conn.close()
+
+            recipients = []
+            for row in rows:
+                if self.broker.has_subscribers(row['recipient_id']):
+                    self.broker.publish(row['recipient_id'], {'type': 'notification', 'notification': dict(row)})
+                    if row['recipient_id'] not in recipients:
+                        recipients.append(row['recipient_id'])
+            for recipient_id in recipients:
+                self._publish_unread_count(recipient_id)
+        except Exception as e:
+            logger.error(f"Failed to publish notifications: {e}")
+
+    def _publish_unread_count(self, recipient_id: Optional[int]):
+        """Push a user's current unread count if anyone is listening"""
+        if self.broker is None or recipient_id is None or not self.broker.has_subscribers(recipient_id):
+            return
+        self.broker.publish(recipient_id, {'type': 'unread_count',
+                                           'unread_count': self.get_unread_count(recipient_id)})
+
+    def _recipient_of(self, notification_id: int) -> Optional[int]:
+        """Recipient of a notification, looked up only when streaming is enabled"""
+        if self.broker is None:
+            return None
+        conn = self._get_connection()
+        try:
+            row = conn.execute("SELECT recipient_id FROM notifications WHERE id = ?", (notification_id,)).fetchone()
+            return row['recipient_id'] if row else None
+        finally:
+            conn.close()
+
     def _initialize_user_settings(self):
         """Initialize default notification settings for all users"""
         try:
@@ -73,9 +246,78 @@ class NotificationManager:
 
             conn.commit()
             conn.close()
+            self.invalidate_settings_cache()
         except Exception as e:
             logger.error(f"Failed to initialize user settings: {e}")
 
+    def invalidate_settings_cache(self, user_id: Optional[int] = None):
+        """
+        Drop cached settings so the next lookup reads notification_settings
+
+        Args:
+            user_id: Only forget this user's settings (default: everyone)
+        """
+        with self._settings_lock:
+            self._settings_generation += 1
+            if user_id is None:
+                self._settings_cache.clear()
+            else:
+                self._settings_cache.pop(user_id, None)
+
+    def _load_settings(self, user_ids: List[int]):
+        """Read settings rows for users missing from the cache in one query"""
+        with self._settings_lock:
+            missing = [uid for uid in set(user_ids) if uid not in self._settings_cache]
+            generation = self._settings_generation
+        if not missing:
+            return
+
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            placeholders = ','.join('?' for _ in missing)
+            cursor.execute(f"SELECT * FROM notification_settings WHERE user_id IN ({placeholders})", missing)
+            rows = {row['user_id']: dict(row) for row in cursor.fetchall()}
+        finally:
+            conn.close()
+
+        with self._settings_lock:
+            if generation == self._settings_generation:
+                for uid in missing:
+                    self._settings_cache[uid] = rows.get(uid)
+
+    def _cached_settings(self, user_id: int) -> Optional[Dict]:
+        """Return the cached settings row for a user, loading it on a miss"""
+        with self._settings_lock:
+            if user_id in self._settings_cache:
+                return self._settings_cache[user_id]
+        self._load_settings([user_id])
+        with self._settings_lock:
+            if user_id in self._settings_cache:
+                return self._settings_cache[user_id]
+        # Settings changed while loading; read them uncached this time
+        conn = self._get_connection()
+        try:
+            row = conn.execute("SELECT * FROM notification_settings WHERE user_id = ?", (user_id,)).fetchone()
+            return dict(row) if row else None
+        finally:
+            conn.close()
+
+    def _notification_row(self, recipient_id: int, notification_type: str, title: str,
+                          message: str, priority: str = "normal", source_entity_type: Optional[str] = None,
+                          source_entity_id: Optional[int] = None, action_url: Optional[str] = None,
+                          scheduled_for: Optional[str] = None, expires_in_hours: int = 72) -> Tuple:
+        """Build the INSERT parameters for one notification"""
+        # Set default scheduled time to now if not specified
+        if scheduled_for is None:
+            scheduled_for = datetime.now().isoformat()
+
+        # Calculate expiration time
+        expires_at = (datetime.fromisoformat(scheduled_for) + timedelta(hours=expires_in_hours)).isoformat()
+
+        return (notification_type, recipient_id, title, message, priority, source_entity_type,
+                source_entity_id, action_url, scheduled_for, expires_at)
+
     def create_notification(self, recipient_id: int, notification_type: str, title: str,
                           message: str, priority: str = "normal", source_entity_type: Optional[str] = None,
                           source_entity_id: Optional[int] = None, action_url: Optional[str] = None,
@@ -99,51 +341,85 @@ class NotificationManager:
             int: ID of created notification, or None if failed
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             # Check user preferences
-            if not self._should_notify_user(cursor, recipient_id, notification_type):
+            if not self._should_notify_user(recipient_id, notification_type):
                 logger.debug(f"Notification suppressed for user {recipient_id} (disabled in preferences)")
-                conn.close()
                 return None
 
-            # Set default scheduled time to now if not specified
-            if scheduled_for is None:
-                scheduled_for = datetime.now().isoformat()
+            row = self._notification_row(recipient_id, notification_type, title, message, priority,
+                                         source_entity_type, source_entity_id, action_url,
+                                         scheduled_for, expires_in_hours)
 
-            # Calculate expiration time
-            expires_at = (datetime.fromisoformat(scheduled_for) + timedelta(hours=expires_in_hours)).isoformat()
-
-            cursor.execute('''
-                INSERT INTO notifications
-                (notification_type, recipient_id, title, message, priority, source_entity_type,
-                 source_entity_id, action_url, scheduled_for, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (notification_type, recipient_id, title, message, priority, source_entity_type,
-                  source_entity_id, action_url, scheduled_for, expires_at))
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(_INSERT_NOTIFICATION, row)
 
             notification_id = cursor.lastrowid
             conn.commit()
             conn.close()
 
             logger.info(f"Created notification {notification_id} for user {recipient_id}: {title}")
+            self._publish_created([notification_id])
             return notification_id
 
         except Exception as e:
             logger.error(f"Failed to create notification: {e}")
             return None
 
+    def create_notifications(self, notifications: List[Dict]) -> List[Optional[int]]:
+        """
+        Create many notifications in a single transaction
+
+        Args:
+            notifications: Dictionaries of create_notification keyword arguments
+
+        Returns:
+            list: Notification ID for each input, or None where the recipient's
+                  preferences suppressed it. Empty if the batch failed.
+        """
+        if not notifications:
+            return []
+
+        try:
+            self._load_settings([n['recipient_id'] for n in notifications])
+
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                ids = []
+                for notification in notifications:
+                    if not self._should_notify_user(notification['recipient_id'],
+                                                    notification['notification_type']):
+                        ids.append(None)
+                        continue
+                    cursor.execute(_INSERT_NOTIFICATION, self._notification_row(**notification))
+                    ids.append(cursor.lastrowid)
+                conn.commit()
+            finally:
+                conn.close()
+
+            created = sum(1 for notification_id in ids if notification_id is not None)
+            logger.info(f"Created {created} of {len(notifications)} notifications in one batch")
+            self._publish_created([notification_id for notification_id in ids if notification_id is not None])
+            return ids
+
+        except Exception as e:
+            logger.error(f"Failed to create notification batch: {e}")
+            return []
+
     def get_notifications(self, recipient_id: int, unread_only: bool = False,
-                         notification_type: Optional[str] = None, limit: int = 50) -> List[Dict]:
+                         notification_type: Optional[str] = None, limit: int = 50,
+                         before: Optional[Tuple[str, int]] = None) -> List[Dict]:
         """
-        Retrieve notifications for a user
+        Retrieve notifications for a user, newest first
 
         Args:
             recipient_id: ID of family member
             unread_only: Only retrieve unread notifications
             notification_type: Filter by notification type
             limit: Maximum number of notifications to retrieve
+            before: (created_at, id) of the last notification on the previous
+                    page; only older notifications are returned
 
         Returns:
             list: List of notification dictionaries
@@ -165,7 +441,12 @@ class NotificationManager:
             # Only show non-expired notifications
             query += " AND (expires_at IS NULL OR expires_at > datetime('now'))"
 
-            query += " ORDER BY created_at DESC LIMIT ?"
+            # Keyset pagination: seek past the previous page instead of OFFSET
+            if before:
+                query += " AND (created_at < ? OR (created_at = ? AND id < ?))"
+                params.extend([before[0], before[0], before[1]])
+
+            query += " ORDER BY created_at DESC, id DESC LIMIT ?"
             params.append(limit)
 
             cursor.execute(query, params)
@@ -178,21 +459,79 @@ class NotificationManager:
             logger.error(f"Failed to retrieve notifications: {e}")
             return []
 
-    def get_unread_count(self, recipient_id: int) -> int:
-        """Get count of unread notifications for a user"""
+    def get_notifications_since(self, recipient_id: int, after_id: int, limit: int = 100) -> List[Dict]:
+        """
+        Retrieve a user's non-expired notifications newer than a given id, oldest first
+
+        Args:
+            recipient_id: ID of family member
+            after_id: Highest notification id the caller already has
+            limit: Maximum number of notifications to retrieve
+
+        Returns:
+            list: List of notification dictionaries
+        """
         try:
             conn = self._get_connection()
-            cursor = conn.cursor()
+            try:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT * FROM notifications
+                    WHERE recipient_id = ? AND id > ?
+                    AND (expires_at IS NULL OR expires_at > datetime('now'))
+                    ORDER BY id LIMIT ?
+                ''', (recipient_id, after_id, limit))
+                return [dict(row) for row in cursor.fetchall()]
+            finally:
+                conn.close()
 
-            cursor.execute('''
-                SELECT COUNT(*) FROM notifications
-                WHERE recipient_id = ? AND is_read = 0
-                AND (expires_at IS NULL OR expires_at > datetime('now'))
-            ''', (recipient_id,))
+        except Exception as e:
+            logger.error(f"Failed to retrieve new notifications: {e}")
+            return []
 
-            count = cursor.fetchone()[0]
-            conn.close()
-            return count
+    def get_latest_notification_id(self, recipient_id: int) -> int:
+        """Highest notification id for a user (0 if none)"""
+        try:
+            conn = self._get_connection()
+            try:
+                row = conn.execute("SELECT MAX(id) FROM notifications WHERE recipient_id = ?",
+                                   (recipient_id,)).fetchone()
+                return row[0] or 0
+            finally:
+                conn.close()
+
+        except Exception as e:
+            logger.error(f"Failed to get latest notification id: {e}")
+            return 0
+
+    def get_unread_count(self, recipient_id: int) -> int:
+        """Get count of unread notifications for a user from the counter table"""
+        try:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT unread_count, next_expiry <= datetime('now') AS stale
+                    FROM notification_unread_counts WHERE recipient_id = ?
+                ''', (recipient_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return 0
+                unread = row['unread_count']
+
+                if row['stale']:
+                    # Something this user has not read may have expired; leave
+                    # it for cleanup_expired_notifications and just not count it
+                    cursor.execute('''
+                        SELECT COUNT(*) FROM notifications
+                        WHERE recipient_id = ? AND is_read = 0
+                        AND expires_at IS NOT NULL AND expires_at <= datetime('now')
+                    ''', (recipient_id,))
+                    unread -= cursor.fetchone()[0]
+            finally:
+                conn.close()
+
+            return unread
 
         except Exception as e:
             logger.error(f"Failed to get unread count: {e}")
@@ -201,6 +540,7 @@ class NotificationManager:
     def mark_as_read(self, notification_id: int) -> bool:
         """Mark a notification as read"""
         try:
+            recipient_id = self._recipient_of(notification_id)
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -214,6 +554,7 @@ class NotificationManager:
             conn.close()
 
             logger.info(f"Marked notification {notification_id} as read")
+            self._publish_unread_count(recipient_id)
             return True
 
         except Exception as e:
@@ -231,11 +572,15 @@ class NotificationManager:
                 SET is_read = 1, read_at = datetime('now')
                 WHERE recipient_id = ? AND is_read = 0
             ''', (recipient_id,))
+            # Nothing unread is left to expire
+            cursor.execute("UPDATE notification_unread_counts SET next_expiry = NULL WHERE recipient_id = ?",
+                           (recipient_id,))
 
             conn.commit()
             conn.close()
 
             logger.info(f"Marked all notifications as read for user {recipient_id}")
+            self._publish_unread_count(recipient_id)
             return True
 
         except Exception as e:
@@ -245,6 +590,7 @@ class NotificationManager:
     def delete_notification(self, notification_id: int) -> bool:
         """Delete a notification"""
         try:
+            recipient_id = self._recipient_of(notification_id)
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -254,6 +600,7 @@ class NotificationManager:
             conn.close()
 
             logger.info(f"Deleted notification {notification_id}")
+            self._publish_unread_count(recipient_id)
             return True
 
         except Exception as e:
@@ -263,13 +610,7 @@ class NotificationManager:
     def get_settings(self, user_id: int) -> Optional[Dict]:
         """Get notification settings for a user"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT * FROM notification_settings WHERE user_id = ?", (user_id,))
-            settings = cursor.fetchone()
-            conn.close()
-
+            settings = self._cached_settings(user_id)
             return dict(settings) if settings else None
 
         except Exception as e:
@@ -318,6 +659,7 @@ class NotificationManager:
 
             conn.commit()
             conn.close()
+            self.invalidate_settings_cache(user_id)
 
             logger.info(f"Updated notification settings for user {user_id}")
             return True
@@ -370,12 +712,55 @@ class NotificationManager:
             conn.close()
 
             logger.info(f"Created reminder {reminder_id} for user {recipient_id}: {event_title}")
+            if self.reminder_scheduler is not None:
+                self.reminder_scheduler.schedule(reminder_id, reminder_time)
             return reminder_id
 
         except Exception as e:
             logger.error(f"Failed to create reminder: {e}")
             return None
 
+    def get_pending_reminders(self) -> List[Dict]:
+        """Get every reminder that has not been sent or dismissed, due or not"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                SELECT id, reminder_time FROM notification_reminders
+                WHERE is_sent = 0 AND is_dismissed = 0
+                ORDER BY reminder_time ASC
+            ''')
+
+            reminders = [dict(row) for row in cursor.fetchall()]
+            conn.close()
+
+            return reminders
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve pending reminders: {e}")
+            return []
+
+    def start_reminder_scheduler(self) -> ReminderScheduler:
+        """
+        Fire reminders from an in-memory schedule instead of polling get_due_reminders
+
+        Reminders that fell due while nothing was running are sent straight away.
+
+        Returns:
+            ReminderScheduler: The running scheduler
+        """
+        if self.reminder_scheduler is None:
+            self.reminder_scheduler = ReminderScheduler(self)
+            self.reminder_scheduler.start()
+        return self.reminder_scheduler
+
+    def stop_reminder_scheduler(self):
+        """Stop the reminder scheduler if it is running"""
+        if self.reminder_scheduler is not None:
+            self.reminder_scheduler.stop()
+            self.reminder_scheduler = None
+
     def get_due_reminders(self) -> List[Dict]:
         """Get all reminders that should be sent now"""
         try:
@@ -414,14 +799,21 @@ class NotificationManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
+            # Claim the reminder first so a second scheduler or a retry cannot send it twice
+            cursor.execute('''
+                UPDATE notification_reminders
+                SET is_sent = 1, sent_at = datetime('now')
+                WHERE id = ? AND is_sent = 0 AND is_dismissed = 0
+            ''', (reminder_id,))
+            conn.commit()
+            if cursor.rowcount == 0:
+                conn.close()
+                return False
+
             # Get reminder details
             cursor.execute("SELECT * FROM notification_reminders WHERE id = ?", (reminder_id,))
             reminder = cursor.fetchone()
 
-            if not reminder:
-                conn.close()
-                return False
-
             # Create notification from reminder
             reminder_dict = dict(reminder)
             notification_title = f"Reminder: {reminder_dict['event_title']}"
@@ -437,14 +829,6 @@ class NotificationManager:
                 source_entity_id=reminder_dict['event_id']
             )
 
-            # Mark reminder as sent
-            cursor.execute('''
-                UPDATE notification_reminders
-                SET is_sent = 1, sent_at = datetime('now')
-                WHERE id = ?
-            ''', (reminder_id,))
-
-            conn.commit()
             conn.close()
 
             logger.info(f"Sent reminder {reminder_id} (notification {notification_id})")
@@ -470,6 +854,8 @@ class NotificationManager:
             conn.close()
 
             logger.info(f"Dismissed reminder {reminder_id}")
+            if self.reminder_scheduler is not None:
+                self.reminder_scheduler.cancel(reminder_id)
             return True
 
         except Exception as e:
@@ -493,6 +879,15 @@ class NotificationManager:
             ''')
 
             deleted_count = cursor.rowcount
+            if deleted_count > 0:
+                # Move each affected counter's next_expiry past the deleted rows
+                cursor.execute('''
+                    UPDATE notification_unread_counts
+                    SET next_expiry = (SELECT MIN(n.expires_at) FROM notifications n
+                                       WHERE n.recipient_id = notification_unread_counts.recipient_id
+                                       AND n.is_read = 0)
+                    WHERE next_expiry < datetime('now')
+                ''')
             conn.commit()
             conn.close()
 
@@ -505,30 +900,15 @@ class NotificationManager:
             logger.error(f"Failed to cleanup expired notifications: {e}")
             return 0
 
-    def _should_notify_user(self, cursor: sqlite3.Cursor, user_id: int, notification_type: str) -> bool:
+    def _should_notify_user(self, user_id: int, notification_type: str) -> bool:
         """Check if user should receive this type of notification"""
         try:
-            # Map notification type to setting field
-            type_to_setting = {
-                NotificationType.REMINDER.value: 'reminder_enabled',
-                NotificationType.ALERT.value: 'alert_enabled',
-                NotificationType.TASK_ASSIGNED.value: 'task_assigned_enabled',
-                NotificationType.CHORE_DUE.value: 'chore_due_enabled',
-                NotificationType.EVENT_UPCOMING.value: 'event_upcoming_enabled',
-                NotificationType.BILL_DUE.value: 'bill_due_enabled',
-                NotificationType.INVENTORY_LOW.value: 'inventory_low_enabled',
-                NotificationType.RECURRING_EVENT.value: 'recurring_event_enabled'
-            }
-
-            setting_field = type_to_setting.get(notification_type, 'alert_enabled')
-
-            cursor.execute(f"SELECT {setting_field} FROM notification_settings WHERE user_id = ?", (user_id,))
-            result = cursor.fetchone()
-
-            if result is None:
+            settings = self._cached_settings(user_id)
+            if settings is None:
                 return True  # Default to enabling if no settings found
 
-            return bool(result[0])
+            setting_field = TYPE_TO_SETTING.get(notification_type, 'alert_enabled')
+            return bool(settings.get(setting_field, 1))
 
         except Exception as e:
             logger.error(f"Failed to check notification preference: {e}")
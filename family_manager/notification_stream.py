@@ -0,0 +1,137 @@
+"""
+Push delivery for notifications
+In-process broker that NotificationManager publishes to, and a server-sent
+events generator that mobile clients hold open instead of polling.
+"""
+
+import json
+import queue
+import logging
+import threading
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds between keep-alives; also how often the stream looks for
+# notifications created by another process (desktop app, trigger sweep)
+HEARTBEAT_SECONDS = 15.0
+
+# Events buffered per connection before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class NotificationBroker:
+    """Fan out notification events to the connections of each recipient"""
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, List[queue.Queue]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, recipient_id: int) -> queue.Queue:
+        """Register a connection for a recipient and return its event queue"""
+        events = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(recipient_id, []).append(events)
+        return events
+
+    def unsubscribe(self, recipient_id: int, events: queue.Queue):
+        """Forget a connection's queue"""
+        with self._lock:
+            queues = self._subscribers.get(recipient_id, [])
+            if events in queues:
+                queues.remove(events)
+            if not queues:
+                self._subscribers.pop(recipient_id, None)
+
+    def has_subscribers(self, recipient_id: int) -> bool:
+        """True if at least one connection is listening for this recipient"""
+        with self._lock:
+            return bool(self._subscribers.get(recipient_id))
+
+    def publish(self, recipient_id: int, event: Dict):
+        """
+        Queue an event for every connection of a recipient
+
+        Slow connections lose their oldest events rather than blocking the
+        publisher; the client catches up from Last-Event-ID on reconnect.
+        """
+        with self._lock:
+            queues = list(self._subscribers.get(recipient_id, []))
+        for events in queues:
+            while True:
+                try:
+                    events.put_nowait(event)
+                    break
+                except queue.Full:
+                    try:
+                        events.get_nowait()
+                    except queue.Empty:
+                        pass
+
+
+def format_sse(event: Dict) -> str:
+    """Encode an event as a server-sent events frame; notifications carry their id"""
+    lines = []
+    if event.get('type') == 'notification':
+        lines.append(f"id: {event['notification']['id']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event, default=str)}")
+    return '\n'.join(lines) + '\n\n'
+
+
+def stream_notifications(manager, broker: NotificationBroker, recipient_id: int,
+                         last_event_id: Optional[int] = None,
+                         heartbeat: float = HEARTBEAT_SECONDS) -> Iterator[str]:
+    """
+    Yield server-sent events for one recipient until the client disconnects
+
+    Sends the current unread count on connect (plus anything newer than
+    last_event_id), then every event the broker publishes. Between events a
+    keep-alive goes out each heartbeat, after a primary-key read of the
+    unread counter to pick up notifications inserted by other processes.
+
+    Args:
+        manager: NotificationManager for the database being streamed
+        broker: Broker the manager publishes to
+        recipient_id: Family member to stream for
+        last_event_id: Highest notification id the client already has
+        heartbeat: Seconds to wait for an event before a keep-alive
+
+    Yields:
+        str: SSE frames
+    """
+    events = broker.subscribe(recipient_id)
+    try:
+        last_id = last_event_id if last_event_id is not None else manager.get_latest_notification_id(recipient_id)
+        for notification in manager.get_notifications_since(recipient_id, last_id):
+            last_id = notification['id']
+            yield format_sse({'type': 'notification', 'notification': notification})
+
+        unread = manager.get_unread_count(recipient_id)
+        yield format_sse({'type': 'unread_count', 'unread_count': unread})
+
+        while True:
+            try:
+                event = events.get(timeout=heartbeat)
+            except queue.Empty:
+                current = manager.get_unread_count(recipient_id)
+                if current == unread:
+                    yield ': keep-alive\n\n'
+                    continue
+                # Changed outside this process; replay what we have not sent
+                for notification in manager.get_notifications_since(recipient_id, last_id):
+                    last_id = notification['id']
+                    yield format_sse({'type': 'notification', 'notification': notification})
+                event = {'type': 'unread_count', 'unread_count': current}
+
+            if event['type'] == 'notification':
+                if event['notification']['id'] <= last_id:
+                    continue
+                last_id = event['notification']['id']
+            elif event['type'] == 'unread_count':
+                unread = event['unread_count']
+            yield format_sse(event)
+    finally:
+        broker.unsubscribe(recipient_id, events)
+        logger.debug(f"Notification stream closed for user {recipient_id}")
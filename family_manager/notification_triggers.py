@@ -5,469 +5,367 @@ Generates notifications based on system events and scheduled items
 
 import sqlite3
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional
 
+try:
+    from .instrumentation import connect
+    from .notification_manager import ensure_notification_schema
+    from .recurring_events_manager import RecurringEventManager
+except ImportError:
+    from instrumentation import connect
+    from notification_manager import ensure_notification_schema
+    from recurring_events_manager import RecurringEventManager
+
 logger = logging.getLogger(__name__)
 
 
+# Every trigger inserts through this column list; its SELECT must produce
+# the columns in the same order, ending with the two timestamp parameters.
+_INSERT_NOTIFICATIONS = """
+    INSERT INTO notifications
+    (notification_type, recipient_id, title, message, priority,
+     source_entity_type, source_entity_id, scheduled_for, expires_at)
+"""
+
+# Admin members, or member 1 when the household has no admin
+_ADMIN_RECIPIENTS = """
+    recipients(id) AS (
+        SELECT id FROM family_members WHERE role = 'admin'
+        UNION ALL
+        SELECT 1 WHERE NOT EXISTS (SELECT 1 FROM family_members WHERE role = 'admin')
+    )
+"""
+
+
 class NotificationTriggers:
-    """Automatically generate notifications based on system events"""
+    """
+    Automatically generate notifications based on system events
+
+    Nothing is created unless a NotificationManager is passed, as with the
+    per-row triggers the set-based statements replaced.
+    """
 
-    def __init__(self, db_path: str = 'family_manager.db', notification_manager=None):
+    def __init__(self, db_path: str = 'family_manager.db', notification_manager=None,
+                 expires_in_hours: int = 72):
         self.db_path = db_path
         self.notification_manager = notification_manager
+        self.expires_in_hours = expires_in_hours
+        self.recurring_events = RecurringEventManager(db_path)
+        self._ensure_indexes()
 
     def _get_connection(self):
         """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _ensure_indexes(self):
+        """Index the duplicate-notification checks and set up the unread counters"""
+        try:
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_notifications_source
+                ON notifications(source_entity_type, source_entity_id, created_at)
+            """)
+            # Unread counters must exist before the first set-based insert
+            ensure_notification_schema(conn.cursor())
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Skipped notification trigger indexes: {e}")
+
+    def _params(self, **extra) -> Dict:
+        """Shared named parameters: warning window, today and notification timestamps"""
+        now = datetime.now()
+        params = {
+            'warning_start': (now + timedelta(hours=23)).isoformat()[:10],
+            'warning_end': (now + timedelta(hours=25)).isoformat()[:10],
+            'today': now.date().isoformat(),
+            'scheduled_for': now.isoformat(),
+            'expires_at': (now + timedelta(hours=self.expires_in_hours)).isoformat(),
+        }
+        params.update(extra)
+        return params
+
+    def _insert(self, label: str, sql: str, params: Dict, occurrences: Optional[List] = None) -> int:
+        """Run one set-based INSERT ... SELECT and return the number of notifications created
+
+        occurrences, if given, are (recurring_event_id, event_date, event_time)
+        rows loaded into temp.upcoming_occurrences for the statement to join.
+        The new notifications are published through the manager's broker.
+        """
+        if self.notification_manager is None:
+            return 0
+
+        conn = self._get_connection()
+        try:
+            # Hold the write lock from here so every id above last_id is ours
+            conn.execute("BEGIN IMMEDIATE")
+            if occurrences is not None:
+                conn.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS upcoming_occurrences
+                    (recurring_event_id INTEGER, event_date TEXT, event_time TEXT)
+                """)
+                conn.executemany("INSERT INTO temp.upcoming_occurrences VALUES (?, ?, ?)", occurrences)
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM notifications").fetchone()[0]
+            conn.execute(sql, params)
+            # cursor.rowcount is -1 for statements that start with a WITH clause
+            created = conn.execute("SELECT changes()").fetchone()[0]
+            new_ids = []
+            if created and getattr(self.notification_manager, 'broker', None) is not None:
+                new_ids = [row[0] for row in conn.execute(
+                    "SELECT id FROM notifications WHERE id > ? ORDER BY id", (last_id,))]
+            conn.commit()
+        finally:
+            conn.close()
+
+        if created:
+            logger.info(f"Created {created} {label} notifications")
+            self.notification_manager._publish_created(new_ids)
+        return created
+
     def check_all_triggers(self):
         """Check all notification triggers and create notifications as needed"""
         logger.info("Running notification trigger check...")
-        
+
         try:
             self.check_upcoming_chores()
             self.check_upcoming_tasks()
             self.check_upcoming_bills()
             self.check_upcoming_recurring_events()
             self.check_low_inventory()
-            
+
             logger.info("Notification trigger check complete")
             return True
         except Exception as e:
             logger.error(f"Failed to run notification triggers: {e}")
             return False
 
-    def check_upcoming_chores(self):
+    def check_upcoming_chores(self) -> int:
         """Create notifications for chores due within advance warning period"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Get chores due in the next 24-48 hours (not already notified)
-            now = datetime.now()
-            warning_start = (now + timedelta(hours=23)).isoformat()
-            warning_end = (now + timedelta(hours=25)).isoformat()
-
-            cursor.execute('''
-                SELECT c.*, fm.name as assignee_name 
+            return self._insert('chore due', _INSERT_NOTIFICATIONS + """
+                SELECT 'chore_due', c.assignee_id,
+                       'Chore Due: ' || c.name,
+                       'Your chore ''' || c.name || ''' is due on ' || c.due_date
+                           || COALESCE(' at ' || c.due_time, ''),
+                       'normal', 'chore', c.id, :scheduled_for, :expires_at
                 FROM chores c
-                LEFT JOIN family_members fm ON c.assignee_id = fm.id
-                WHERE c.status = 'pending' 
-                AND c.due_date BETWEEN ? AND ?
+                JOIN notification_settings ns
+                    ON ns.user_id = c.assignee_id AND ns.chore_due_enabled = 1
+                WHERE c.status = 'pending'
+                AND c.due_date BETWEEN :warning_start AND :warning_end
                 AND NOT EXISTS (
-                    SELECT 1 FROM notifications 
-                    WHERE source_entity_type = 'chore' 
-                    AND source_entity_id = c.id
-                    AND created_at > datetime('now', '-24 hours')
+                    SELECT 1 FROM notifications n
+                    WHERE n.source_entity_type = 'chore'
+                    AND n.source_entity_id = c.id
+                    AND n.created_at > datetime('now', '-24 hours')
                 )
-            ''', (warning_start[:10], warning_end[:10]))
-
-            chores = cursor.fetchall()
-
-            for chore in chores:
-                # Check user notification preferences
-                cursor.execute('''
-                    SELECT chore_due_enabled, advance_warning_hours 
-                    FROM notification_settings 
-                    WHERE user_id = ?
-                ''', (chore['assignee_id'],))
-                
-                settings = cursor.fetchone()
-                if not settings or not settings['chore_due_enabled']:
-                    continue
-
-                # Create notification
-                if self.notification_manager:
-                    title = f"Chore Due: {chore['name']}"
-                    message = f"Your chore '{chore['name']}' is due on {chore['due_date']} at {chore['due_time']}"
-                    
-                    self.notification_manager.create_notification(
-                        recipient_id=chore['assignee_id'],
-                        notification_type='chore_due',
-                        title=title,
-                        message=message,
-                        priority='normal',
-                        source_entity_type='chore',
-                        source_entity_id=chore['id']
-                    )
-                    
-                    logger.info(f"Created chore due notification for chore {chore['id']}")
-
-            conn.close()
+            """, self._params())
         except Exception as e:
             logger.error(f"Failed to check upcoming chores: {e}")
+            return 0
 
-    def check_upcoming_tasks(self):
+    def check_upcoming_tasks(self) -> int:
         """Create notifications for tasks due within advance warning period"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Get tasks due in the next 24-48 hours
-            now = datetime.now()
-            warning_start = (now + timedelta(hours=23)).isoformat()
-            warning_end = (now + timedelta(hours=25)).isoformat()
-
-            cursor.execute('''
-                SELECT t.*, p.name as project_name
+            return self._insert('task due', _INSERT_NOTIFICATIONS + """
+                SELECT 'task_assigned', t.assigned_to_id,
+                       'Task Due: ' || t.title,
+                       'Your task ''' || t.title || '''' || COALESCE(' (Project: ' || p.name || ')', '')
+                           || ' is due on ' || t.due_date,
+                       CASE WHEN t.priority >= 4 THEN 'high' ELSE 'normal' END,
+                       'task', t.id, :scheduled_for, :expires_at
                 FROM tasks t
                 LEFT JOIN projects p ON t.project_id = p.id
+                JOIN notification_settings ns
+                    ON ns.user_id = t.assigned_to_id AND ns.task_assigned_enabled = 1
                 WHERE t.status IN ('pending', 'in_progress')
-                AND t.due_date BETWEEN ? AND ?
+                AND t.due_date BETWEEN :warning_start AND :warning_end
                 AND t.assigned_to_id IS NOT NULL
                 AND NOT EXISTS (
-                    SELECT 1 FROM notifications 
-                    WHERE source_entity_type = 'task' 
-                    AND source_entity_id = t.id
-                    AND created_at > datetime('now', '-24 hours')
+                    SELECT 1 FROM notifications n
+                    WHERE n.source_entity_type = 'task'
+                    AND n.source_entity_id = t.id
+                    AND n.created_at > datetime('now', '-24 hours')
                 )
-            ''', (warning_start[:10], warning_end[:10]))
-
-            tasks = cursor.fetchall()
-
-            for task in tasks:
-                # Check user notification preferences
-                cursor.execute('''
-                    SELECT task_assigned_enabled 
-                    FROM notification_settings 
-                    WHERE user_id = ?
-                ''', (task['assigned_to_id'],))
-                
-                settings = cursor.fetchone()
-                if not settings or not settings['task_assigned_enabled']:
-                    continue
-
-                # Create notification
-                if self.notification_manager:
-                    project_info = f" (Project: {task['project_name']})" if task['project_name'] else ""
-                    title = f"Task Due: {task['title']}"
-                    message = f"Your task '{task['title']}'{project_info} is due on {task['due_date']}"
-                    
-                    priority = 'high' if task['priority'] >= 4 else 'normal'
-                    
-                    self.notification_manager.create_notification(
-                        recipient_id=task['assigned_to_id'],
-                        notification_type='task_assigned',
-                        title=title,
-                        message=message,
-                        priority=priority,
-                        source_entity_type='task',
-                        source_entity_id=task['id']
-                    )
-                    
-                    logger.info(f"Created task due notification for task {task['id']}")
-
-            conn.close()
+            """, self._params())
         except Exception as e:
             logger.error(f"Failed to check upcoming tasks: {e}")
+            return 0
 
-    def check_upcoming_bills(self):
+    def check_upcoming_bills(self) -> int:
         """Create notifications for bills due within advance warning period"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Get unpaid bills due in the next 24-48 hours
-            now = datetime.now()
-            warning_start = (now + timedelta(hours=23)).isoformat()
-            warning_end = (now + timedelta(hours=25)).isoformat()
-
-            cursor.execute('''
-                SELECT * FROM bills
-                WHERE paid = 0
-                AND due_date BETWEEN ? AND ?
+            return self._insert('bill due', 'WITH ' + _ADMIN_RECIPIENTS + _INSERT_NOTIFICATIONS + """
+                SELECT 'bill_due', r.id,
+                       'Bill Due: ' || b.name,
+                       'Bill ''' || b.name || ''' for $' || printf('%.2f', b.amount)
+                           || ' is due on ' || b.due_date,
+                       CASE WHEN b.amount > 500 THEN 'high' ELSE 'normal' END,
+                       'bill', b.id, :scheduled_for, :expires_at
+                FROM bills b
+                CROSS JOIN recipients r
+                JOIN notification_settings ns
+                    ON ns.user_id = r.id AND ns.bill_due_enabled = 1
+                WHERE b.paid = 0
+                AND b.due_date BETWEEN :warning_start AND :warning_end
                 AND NOT EXISTS (
-                    SELECT 1 FROM notifications 
-                    WHERE source_entity_type = 'bill' 
-                    AND source_entity_id = id
-                    AND created_at > datetime('now', '-24 hours')
+                    SELECT 1 FROM notifications n
+                    WHERE n.source_entity_type = 'bill'
+                    AND n.source_entity_id = b.id
+                    AND n.created_at > datetime('now', '-24 hours')
                 )
-            ''', (warning_start[:10], warning_end[:10]))
-
-            bills = cursor.fetchall()
-
-            # Get all family members to notify (or default admin)
-            cursor.execute('SELECT id FROM family_members WHERE role = "admin"')
-            admin_members = cursor.fetchall()
-            recipient_ids = [member['id'] for member in admin_members] if admin_members else [1]
-
-            for bill in bills:
-                for recipient_id in recipient_ids:
-                    # Check user notification preferences
-                    cursor.execute('''
-                        SELECT bill_due_enabled 
-                        FROM notification_settings 
-                        WHERE user_id = ?
-                    ''', (recipient_id,))
-                    
-                    settings = cursor.fetchone()
-                    if not settings or not settings['bill_due_enabled']:
-                        continue
-
-                    # Create notification
-                    if self.notification_manager:
-                        title = f"Bill Due: {bill['name']}"
-                        message = f"Bill '{bill['name']}' for ${bill['amount']:.2f} is due on {bill['due_date']}"
-                        
-                        priority = 'high' if bill['amount'] > 500 else 'normal'
-                        
-                        self.notification_manager.create_notification(
-                            recipient_id=recipient_id,
-                            notification_type='bill_due',
-                            title=title,
-                            message=message,
-                            priority=priority,
-                            source_entity_type='bill',
-                            source_entity_id=bill['id']
-                        )
-                        
-                        logger.info(f"Created bill due notification for bill {bill['id']}")
-
-            conn.close()
+            """, self._params())
         except Exception as e:
             logger.error(f"Failed to check upcoming bills: {e}")
+            return 0
 
-    def check_upcoming_recurring_events(self):
-        """Create notifications for recurring event instances within advance warning period"""
+    def check_upcoming_recurring_events(self) -> int:
+        """Create notifications for recurring event occurrences within advance warning period"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Get upcoming recurring event instances in the next 24-48 hours
-            now = datetime.now()
-            warning_start = (now + timedelta(hours=23)).isoformat()
-            warning_end = (now + timedelta(hours=25)).isoformat()
-
-            cursor.execute('''
-                SELECT rei.*, re.title, re.created_by
-                FROM recurring_event_instances rei
-                JOIN recurring_events re ON rei.recurring_event_id = re.id
-                WHERE re.is_active = 1
-                AND rei.is_completed = 0
-                AND rei.event_date BETWEEN ? AND ?
-                AND NOT EXISTS (
-                    SELECT 1 FROM notifications 
-                    WHERE source_entity_type = 'recurring_event_instance' 
-                    AND source_entity_id = rei.id
-                    AND created_at > datetime('now', '-24 hours')
+            params = self._params()
+            # Occurrences are expanded on demand; only exceptions are stored.
+            # The earliest open occurrence per event is announced.
+            window_start = date.fromisoformat(params['warning_start'])
+            window_end = date.fromisoformat(params['warning_end']) + timedelta(days=1)
+            upcoming = {}
+            for occurrence in self.recurring_events.get_all_occurrences(window_start, window_end):
+                if not occurrence['is_completed']:
+                    upcoming.setdefault(occurrence['recurring_event_id'], (
+                        occurrence['recurring_event_id'], occurrence['event_date'], occurrence['event_time']))
+            if not upcoming:
+                return 0
+
+            return self._insert('recurring event', _INSERT_NOTIFICATIONS + """
+                SELECT 'recurring_event', re.created_by,
+                       'Upcoming Event: ' || re.title,
+                       'Recurring event ''' || re.title || ''' is scheduled for ' || uo.event_date
+                           || COALESCE(' at ' || uo.event_time, ''),
+                       'normal', 'recurring_event', re.id, :scheduled_for, :expires_at
+                FROM temp.upcoming_occurrences uo
+                JOIN recurring_events re ON uo.recurring_event_id = re.id
+                JOIN notification_settings ns
+                    ON ns.user_id = re.created_by AND ns.recurring_event_enabled = 1
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM notifications n
+                    WHERE n.source_entity_type = 'recurring_event'
+                    AND n.source_entity_id = re.id
+                    AND n.created_at > datetime('now', '-24 hours')
                 )
-            ''', (warning_start[:10], warning_end[:10]))
-
-            instances = cursor.fetchall()
-
-            for instance in instances:
-                # Check user notification preferences
-                cursor.execute('''
-                    SELECT recurring_event_enabled 
-                    FROM notification_settings 
-                    WHERE user_id = ?
-                ''', (instance['created_by'],))
-                
-                settings = cursor.fetchone()
-                if not settings or not settings['recurring_event_enabled']:
-                    continue
-
-                # Create notification
-                if self.notification_manager:
-                    title = f"Upcoming Event: {instance['title']}"
-                    message = f"Recurring event '{instance['title']}' is scheduled for {instance['event_date']} at {instance['event_time']}"
-                    
-                    self.notification_manager.create_notification(
-                        recipient_id=instance['created_by'],
-                        notification_type='recurring_event',
-                        title=title,
-                        message=message,
-                        priority='normal',
-                        source_entity_type='recurring_event_instance',
-                        source_entity_id=instance['id']
-                    )
-                    
-                    logger.info(f"Created recurring event notification for instance {instance['id']}")
-
-            conn.close()
+            """, params, occurrences=list(upcoming.values()))
         except Exception as e:
             logger.error(f"Failed to check upcoming recurring events: {e}")
+            return 0
 
-    def check_low_inventory(self):
-        """Create notifications for low inventory items"""
+    def check_low_inventory(self) -> int:
+        """Create one summary notification per recipient for low inventory items"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Get inventory items with low quantity (less than 2 units)
-            cursor.execute('''
-                SELECT * FROM inventory
-                WHERE qty <= 2
-                AND qty > 0
-                AND NOT EXISTS (
-                    SELECT 1 FROM notifications 
-                    WHERE source_entity_type = 'inventory' 
-                    AND source_entity_id = id
-                    AND created_at > datetime('now', '-48 hours')
+            return self._insert('low inventory', 'WITH ' + _ADMIN_RECIPIENTS + """,
+                low_items AS (
+                    SELECT i.id, i.name FROM inventory i
+                    WHERE i.qty <= 2
+                    AND i.qty > 0
+                    AND NOT EXISTS (
+                        SELECT 1 FROM notifications n
+                        WHERE n.source_entity_type = 'inventory'
+                        AND n.source_entity_id = i.id
+                        AND n.created_at > datetime('now', '-48 hours')
+                    )
+                ),
+                summary AS (
+                    SELECT COUNT(*) AS total, MIN(id) AS first_id,
+                           (SELECT group_concat(name, ', ')
+                            FROM (SELECT name FROM low_items ORDER BY id LIMIT 5)) AS names
+                    FROM low_items
                 )
-            ''')
-
-            low_items = cursor.fetchall()
-
-            if low_items:
-                # Get all admin members to notify
-                cursor.execute('SELECT id FROM family_members WHERE role = "admin"')
-                admin_members = cursor.fetchall()
-                recipient_ids = [member['id'] for member in admin_members] if admin_members else [1]
-
-                for recipient_id in recipient_ids:
-                    # Check user notification preferences
-                    cursor.execute('''
-                        SELECT inventory_low_enabled 
-                        FROM notification_settings 
-                        WHERE user_id = ?
-                    ''', (recipient_id,))
-                    
-                    settings = cursor.fetchone()
-                    if not settings or not settings['inventory_low_enabled']:
-                        continue
-
-                    # Create a summary notification for all low items
-                    if self.notification_manager:
-                        item_names = [item['name'] for item in low_items[:5]]
-                        more_text = f" and {len(low_items) - 5} more" if len(low_items) > 5 else ""
-                        
-                        title = f"Low Inventory Alert: {len(low_items)} Item(s)"
-                        message = f"The following items are running low: {', '.join(item_names)}{more_text}"
-                        
-                        self.notification_manager.create_notification(
-                            recipient_id=recipient_id,
-                            notification_type='inventory_low',
-                            title=title,
-                            message=message,
-                            priority='normal',
-                            source_entity_type='inventory',
-                            source_entity_id=low_items[0]['id']  # Reference first low item
-                        )
-                        
-                        logger.info(f"Created low inventory notification for {len(low_items)} items")
-
-            conn.close()
+            """ + _INSERT_NOTIFICATIONS + """
+                SELECT 'inventory_low', r.id,
+                       'Low Inventory Alert: ' || s.total || ' Item(s)',
+                       'The following items are running low: ' || s.names
+                           || CASE WHEN s.total > 5 THEN ' and ' || (s.total - 5) || ' more' ELSE '' END,
+                       'normal', 'inventory', s.first_id, :scheduled_for, :expires_at
+                FROM summary s
+                CROSS JOIN recipients r
+                JOIN notification_settings ns
+                    ON ns.user_id = r.id AND ns.inventory_low_enabled = 1
+                WHERE s.total > 0
+            """, self._params())
         except Exception as e:
             logger.error(f"Failed to check low inventory: {e}")
+            return 0
 
-    def check_overdue_items(self):
+    def check_overdue_items(self) -> int:
         """Create alert notifications for overdue chores, tasks, and bills"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            today = datetime.now().date().isoformat()
-
-            # Overdue chores
-            cursor.execute('''
-                SELECT c.*, fm.name as assignee_name 
+            params = self._params()
+
+            # Alerts honour alert_enabled, defaulting to on when a user has no settings row
+            created = self._insert('overdue chore', _INSERT_NOTIFICATIONS + """
+                SELECT 'alert', c.assignee_id,
+                       '⚠️ Overdue Chore: ' || c.name,
+                       'Your chore ''' || c.name || ''' was due on ' || c.due_date,
+                       'high', 'chore', c.id, :scheduled_for, :expires_at
                 FROM chores c
-                LEFT JOIN family_members fm ON c.assignee_id = fm.id
-                WHERE c.status = 'pending' 
-                AND c.due_date < ?
+                LEFT JOIN notification_settings ns ON ns.user_id = c.assignee_id
+                WHERE c.status = 'pending'
+                AND c.due_date < :today
+                AND c.assignee_id IS NOT NULL
+                AND COALESCE(ns.alert_enabled, 1) = 1
                 AND NOT EXISTS (
-                    SELECT 1 FROM notifications 
-                    WHERE source_entity_type = 'chore' 
-                    AND source_entity_id = c.id
-                    AND notification_type = 'alert'
-                    AND created_at > datetime('now', '-24 hours')
+                    SELECT 1 FROM notifications n
+                    WHERE n.source_entity_type = 'chore'
+                    AND n.source_entity_id = c.id
+                    AND n.notification_type = 'alert'
+                    AND n.created_at > datetime('now', '-24 hours')
                 )
-            ''', (today,))
-
-            overdue_chores = cursor.fetchall()
-
-            for chore in overdue_chores:
-                if self.notification_manager:
-                    title = f"⚠️ Overdue Chore: {chore['name']}"
-                    message = f"Your chore '{chore['name']}' was due on {chore['due_date']}"
-                    
-                    self.notification_manager.create_notification(
-                        recipient_id=chore['assignee_id'],
-                        notification_type='alert',
-                        title=title,
-                        message=message,
-                        priority='high',
-                        source_entity_type='chore',
-                        source_entity_id=chore['id']
-                    )
+            """, params)
 
-            # Overdue tasks
-            cursor.execute('''
-                SELECT t.*, p.name as project_name
+            created += self._insert('overdue task', _INSERT_NOTIFICATIONS + """
+                SELECT 'alert', t.assigned_to_id,
+                       '⚠️ Overdue Task: ' || t.title,
+                       'Your task ''' || t.title || ''' was due on ' || t.due_date,
+                       'high', 'task', t.id, :scheduled_for, :expires_at
                 FROM tasks t
-                LEFT JOIN projects p ON t.project_id = p.id
+                LEFT JOIN notification_settings ns ON ns.user_id = t.assigned_to_id
                 WHERE t.status IN ('pending', 'in_progress')
-                AND t.due_date < ?
+                AND t.due_date < :today
                 AND t.assigned_to_id IS NOT NULL
+                AND COALESCE(ns.alert_enabled, 1) = 1
                 AND NOT EXISTS (
-                    SELECT 1 FROM notifications 
-                    WHERE source_entity_type = 'task' 
-                    AND source_entity_id = t.id
-                    AND notification_type = 'alert'
-                    AND created_at > datetime('now', '-24 hours')
+                    SELECT 1 FROM notifications n
+                    WHERE n.source_entity_type = 'task'
+                    AND n.source_entity_id = t.id
+                    AND n.notification_type = 'alert'
+                    AND n.created_at > datetime('now', '-24 hours')
                 )
-            ''', (today,))
-
-            overdue_tasks = cursor.fetchall()
-
-            for task in overdue_tasks:
-                if self.notification_manager:
-                    title = f"⚠️ Overdue Task: {task['title']}"
-                    message = f"Your task '{task['title']}' was due on {task['due_date']}"
-                    
-                    self.notification_manager.create_notification(
-                        recipient_id=task['assigned_to_id'],
-                        notification_type='alert',
-                        title=title,
-                        message=message,
-                        priority='high',
-                        source_entity_type='task',
-                        source_entity_id=task['id']
-                    )
-
-            # Overdue bills
-            cursor.execute('''
-                SELECT * FROM bills
-                WHERE paid = 0
-                AND due_date < ?
+            """, params)
+
+            created += self._insert('overdue bill', 'WITH ' + _ADMIN_RECIPIENTS + _INSERT_NOTIFICATIONS + """
+                SELECT 'alert', r.id,
+                       '⚠️ Overdue Bill: ' || b.name,
+                       'Bill ''' || b.name || ''' for $' || printf('%.2f', b.amount)
+                           || ' was due on ' || b.due_date,
+                       'urgent', 'bill', b.id, :scheduled_for, :expires_at
+                FROM bills b
+                CROSS JOIN recipients r
+                LEFT JOIN notification_settings ns ON ns.user_id = r.id
+                WHERE b.paid = 0
+                AND b.due_date < :today
+                AND COALESCE(ns.alert_enabled, 1) = 1
                 AND NOT EXISTS (
-                    SELECT 1 FROM notifications 
-                    WHERE source_entity_type = 'bill' 
-                    AND source_entity_id = id
-                    AND notification_type = 'alert'
-                    AND created_at > datetime('now', '-24 hours')
+                    SELECT 1 FROM notifications n
+                    WHERE n.source_entity_type = 'bill'
+                    AND n.source_entity_id = b.id
+                    AND n.notification_type = 'alert'
+                    AND n.created_at > datetime('now', '-24 hours')
                 )
-            ''', (today,))
+            """, params)
 
-            overdue_bills = cursor.fetchall()
-
-            # Get admin members
-            cursor.execute('SELECT id FROM family_members WHERE role = "admin"')
-            admin_members = cursor.fetchall()
-            recipient_ids = [member['id'] for member in admin_members] if admin_members else [1]
-
-            for bill in overdue_bills:
-                for recipient_id in recipient_ids:
-                    if self.notification_manager:
-                        title = f"⚠️ Overdue Bill: {bill['name']}"
-                        message = f"Bill '{bill['name']}' for ${bill['amount']:.2f} was due on {bill['due_date']}"
-                        
-                        self.notification_manager.create_notification(
-                            recipient_id=recipient_id,
-                            notification_type='alert',
-                            title=title,
-                            message=message,
-                            priority='urgent',
-                            source_entity_type='bill',
-                            source_entity_id=bill['id']
-                        )
-
-            conn.close()
             logger.info("Checked for overdue items")
+            return created
         except Exception as e:
             logger.error(f"Failed to check overdue items: {e}")
+            return 0
@@ -0,0 +1,187 @@
+"""
+OCR Result Cache for Family Household Manager
+Content-addressed SQLite cache of OCR output keyed by image hash, engine
+and prompt version, with a size cap and least-recently-used eviction
+"""
+
+import json
+import sqlite3
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OCRResultCache:
+    """Stores OCR results so re-importing the same image skips the engine"""
+
+    def __init__(self, db_path: str = 'family_manager.db', max_entries: int = 500,
+                 max_bytes: int = 20 * 1024 * 1024):
+        """
+        Args:
+            db_path: SQLite database holding the ocr_cache table
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total size of cached result payloads
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._initialize_table()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection"""
+        return sqlite3.connect(self.db_path)
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a connection that is committed (or rolled back) and closed on exit"""
+        conn = self._get_connection()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _initialize_table(self):
+        try:
+            with self._transaction() as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS ocr_cache (
+                        image_hash TEXT NOT NULL,
+                        engine TEXT NOT NULL,
+                        prompt_version TEXT NOT NULL,
+                        result TEXT NOT NULL,
+                        size_bytes INTEGER NOT NULL,
+                        created_at TEXT NOT NULL,
+                        last_accessed TEXT NOT NULL,
+                        hit_count INTEGER DEFAULT 0,
+                        PRIMARY KEY (image_hash, engine, prompt_version)
+                    )
+                ''')
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_cache_lru ON ocr_cache(last_accessed)")
+        except sqlite3.Error as e:
+            logger.error(f"Error creating OCR cache table: {e}")
+
+    def get(self, image_hash: str, engine: str, prompt_version: str) -> Optional[Dict]:
+        """
+        Look up a cached result and mark it as recently used
+
+        Returns:
+            dict: The cached result, or None on a miss
+        """
+        try:
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT result FROM ocr_cache
+                    WHERE image_hash = ? AND engine = ? AND prompt_version = ?
+                ''', (image_hash, engine, prompt_version))
+                row = cursor.fetchone()
+                if not row:
+                    self.misses += 1
+                    return None
+
+                cursor.execute('''
+                    UPDATE ocr_cache SET last_accessed = ?, hit_count = hit_count + 1
+                    WHERE image_hash = ? AND engine = ? AND prompt_version = ?
+                ''', (datetime.now().isoformat(), image_hash, engine, prompt_version))
+                self.hits += 1
+                return json.loads(row[0])
+
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.error(f"Error reading OCR cache: {e}")
+            self.misses += 1
+            return None
+
+    def put(self, image_hash: str, engine: str, prompt_version: str, result: Dict) -> bool:
+        """
+        Store a result, evicting least recently used entries over the cap
+
+        Returns:
+            bool: True if stored
+        """
+        payload = json.dumps(result)
+        size = len(payload.encode('utf-8'))
+        if size > self.max_bytes:
+            return False
+
+        now = datetime.now().isoformat()
+        try:
+            with self._transaction() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO ocr_cache
+                    (image_hash, engine, prompt_version, result, size_bytes, created_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (image_hash, engine, prompt_version, payload, size, now, now))
+                self._evict(conn)
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error writing OCR cache: {e}")
+            return False
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Drop least recently used entries until both caps are met"""
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM ocr_cache")
+        count, total_bytes = cursor.fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return 0
+
+        cursor.execute('''
+            SELECT rowid, size_bytes FROM ocr_cache ORDER BY last_accessed ASC
+        ''')
+        doomed = []
+        for rowid, size in cursor.fetchall():
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            doomed.append((rowid,))
+            count -= 1
+            total_bytes -= size
+
+        cursor.executemany("DELETE FROM ocr_cache WHERE rowid = ?", doomed)
+        if doomed:
+            logger.info(f"Evicted {len(doomed)} OCR cache entries")
+        return len(doomed)
+
+    def clear(self) -> int:
+        """Remove every cached result"""
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute("DELETE FROM ocr_cache")
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error clearing OCR cache: {e}")
+            return 0
+
+    def get_stats(self) -> Dict:
+        """Get statistics about the OCR cache"""
+        stats = {
+            'total_cached': 0,
+            'total_bytes': 0,
+            'total_hits': 0,
+            'by_engine': {},
+            'session_hits': self.hits,
+            'session_misses': self.misses,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes
+        }
+        try:
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT engine, COUNT(*), COALESCE(SUM(size_bytes), 0), COALESCE(SUM(hit_count), 0)
+                    FROM ocr_cache GROUP BY engine
+                ''')
+                for engine, count, size, hits in cursor.fetchall():
+                    stats['by_engine'][engine] = count
+                    stats['total_cached'] += count
+                    stats['total_bytes'] += size
+                    stats['total_hits'] += hits
+        except sqlite3.Error as e:
+            logger.error(f"Error getting OCR cache stats: {e}")
+        return stats
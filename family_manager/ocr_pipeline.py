@@ -0,0 +1,423 @@
+"""
+Batch OCR Pipeline for Family Household Manager
+Extracts inventory items from many receipt images at once, deduplicating
+identical images and running OCR through a bounded worker pool
+"""
+
+import os
+import re
+import json
+import asyncio
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from .meal_ingredients import parse_ingredient_text
+    from .ocr_cache import OCRResultCache
+    from .ocr_preprocess import PREPROCESS_VERSION, prepare_for_ai, preprocess_image
+    from .provider_transport import gemini_client
+except ImportError:
+    from meal_ingredients import parse_ingredient_text
+    from ocr_cache import OCRResultCache
+    from ocr_preprocess import PREPROCESS_VERSION, prepare_for_ai, preprocess_image
+    from provider_transport import gemini_client
+
+logger = logging.getLogger(__name__)
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+GEMINI_MODEL = "models/gemini-2.5-flash"
+
+OCR_PROMPT = """
+    Analyze this image and extract grocery items or inventory items.
+    Return a JSON object with the following structure:
+
+    {
+      "success": true,
+      "items": [
+        {
+          "name": "item name (required)",
+          "quantity": "number or string (optional)",
+          "unit": "kg/g/l/ml/each/pack/loaf/can/bottle/box (optional)",
+          "category": "inferred category like dairy/meat/produce/bakery (optional)",
+          "price": "price if visible (optional)"
+        }
+      ],
+      "source": "receipt or product_label or other",
+      "confidence": "high/medium/low"
+    }
+
+    Rules:
+    - Extract all visible food items, groceries, or inventory items
+    - Infer reasonable categories based on item types
+    - Extract quantities and units when visible
+    - Only include items that are clearly identifiable
+    - Set confidence based on text clarity and item identification
+    - If no items found, return {"success": false, "error": "No items detected"}
+"""
+
+# Cache key components: bump when engine output for the same image would change
+PROMPT_VERSION = hashlib.sha256(
+    f"{GEMINI_MODEL}\n{PREPROCESS_VERSION}\n{OCR_PROMPT}".encode('utf-8')
+).hexdigest()[:12]
+TESSERACT_VERSION = f"text-v1/{PREPROCESS_VERSION}"
+
+_MIME_TYPES = {'.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.bmp': 'image/bmp'}
+_TRAILING_PRICE = re.compile(r'\s*\$?\s*(\d+\.\d{2})\s*[A-Z]?\s*$')
+_SKIP_LINES = re.compile(r'\b(sub\s*total|total|tax|change|cash|visa|mastercard|debit|credit|balance)\b', re.I)
+
+
+def collect_image_paths(paths: List[str]) -> List[str]:
+    """
+    Expand dropped files and folders into a sorted list of image files
+
+    Folders are walked recursively; non-image files are ignored.
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                for name in files:
+                    if name.lower().endswith(IMAGE_EXTENSIONS):
+                        found.append(os.path.join(root, name))
+        elif os.path.isfile(path) and path.lower().endswith(IMAGE_EXTENSIONS):
+            found.append(path)
+    return sorted(set(found))
+
+
+def hash_image_file(path: str, chunk_size: int = 1 << 16) -> str:
+    """Return the SHA-256 hex digest of an image file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dedupe_images(paths: List[str]) -> Tuple[Dict[str, str], List[Tuple[str, str]]]:
+    """
+    Group images by content hash
+
+    Returns:
+        tuple: ({hash: first path}, [(duplicate path, path it duplicates)])
+    """
+    unique: Dict[str, str] = {}
+    duplicates = []
+    for path in paths:
+        try:
+            digest = hash_image_file(path)
+        except OSError as e:
+            logger.error(f"Could not read image {path}: {e}")
+            continue
+        if digest in unique:
+            duplicates.append((path, unique[digest]))
+        else:
+            unique[digest] = path
+    return unique, duplicates
+
+
+def parse_ai_response(text: str) -> Dict:
+    """Decode a JSON reply from the AI model, stripping markdown code fences"""
+    text = (text or '').strip()
+    if text.startswith("```json"):
+        text = text[7:]
+    if text.startswith("```"):
+        text = text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    text = text.strip()
+
+    try:
+        result = json.loads(text)
+    except json.JSONDecodeError as e:
+        return {"success": False, "error": f"JSON parsing failed: {e}", "raw_text": text}
+
+    if not isinstance(result, dict):
+        return {"success": False, "error": "Invalid response format"}
+    return result
+
+
+def text_to_items(text: str) -> List[Dict]:
+    """
+    Turn raw Tesseract output into item dictionaries for the review dialog
+
+    Each receipt line becomes one item; a trailing price is split off and
+    totals/payment lines are skipped.
+    """
+    items = []
+    for line in (text or '').splitlines():
+        line = line.strip()
+        if not re.search(r'[A-Za-z]{2,}', line) or _SKIP_LINES.search(line):
+            continue
+
+        price = ''
+        match = _TRAILING_PRICE.search(line)
+        if match:
+            price = match.group(1)
+            line = line[:match.start()].strip()
+            if not line:
+                continue
+
+        name, qty, unit = parse_ingredient_text(line)
+        items.append({
+            'name': name,
+            'quantity': f"{qty:g}",
+            'unit': unit,
+            'category': 'OCR Import',
+            'price': price
+        })
+    return items
+
+
+def tesseract_extract(path: str) -> str:
+    """
+    Run Tesseract on a single preprocessed image
+
+    Module-level so it can be shipped to a worker process.
+    """
+    import pytesseract
+
+    return pytesseract.image_to_string(preprocess_image(path))
+
+
+def _image_part(path: str):
+    from google.genai import types
+
+    try:
+        data, mime_type = prepare_for_ai(path)
+    except Exception as e:
+        # Send the original file rather than failing the request
+        logger.warning(f"Preprocessing failed for {path}, sending original image: {e}")
+        with open(path, 'rb') as f:
+            data = f.read()
+        mime_type = _MIME_TYPES.get(os.path.splitext(path)[1].lower(), 'image/jpeg')
+    return types.Part.from_bytes(data=data, mime_type=mime_type)
+
+
+def gemini_extract(path: str, api_key: str) -> Dict:
+    """Extract structured items from one image with Gemini (blocking)"""
+    try:
+        client = gemini_client(api_key)
+        response = client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=[OCR_PROMPT, _image_part(path)]
+        )
+        return parse_ai_response(response.text)
+    except Exception as e:
+        return {"success": False, "error": f"Gemini API error: {e}"}
+
+
+async def gemini_extract_async(client, path: str, semaphore: asyncio.Semaphore) -> Dict:
+    """Extract structured items from one image using the async Gemini client"""
+    async with semaphore:
+        try:
+            response = await client.aio.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=[OCR_PROMPT, _image_part(path)]
+            )
+            return parse_ai_response(response.text)
+        except Exception as e:
+            return {"success": False, "error": f"Gemini API error: {e}"}
+
+
+def cached_tesseract_text(path: str, cache: Optional[OCRResultCache] = None) -> str:
+    """Run Tesseract on one image, reusing a cached result for identical bytes"""
+    if cache is None:
+        return tesseract_extract(path)
+    digest = hash_image_file(path)
+    cached = cache.get(digest, 'tesseract', TESSERACT_VERSION)
+    if cached is not None:
+        return cached['text']
+    text = tesseract_extract(path)
+    cache.put(digest, 'tesseract', TESSERACT_VERSION, {'text': text})
+    return text
+
+
+def cached_gemini_extract(path: str, api_key: str, cache: Optional[OCRResultCache] = None) -> Dict:
+    """Extract items from one image with Gemini, reusing a cached result for identical bytes"""
+    if cache is None:
+        return gemini_extract(path, api_key)
+    digest = hash_image_file(path)
+    cached = cache.get(digest, 'gemini', PROMPT_VERSION)
+    if cached is not None:
+        return cached
+    result = gemini_extract(path, api_key)
+    if result.get('success'):
+        cache.put(digest, 'gemini', PROMPT_VERSION, result)
+    return result
+
+
+def gemini_api_key(config_path: str = 'ai_meal_config.json') -> Optional[str]:
+    """Gemini key from GEMINI_API_KEY, else gemini_key in the AI config file (None when neither is set)"""
+    key = os.environ.get('GEMINI_API_KEY')
+    if key:
+        return key
+    try:
+        with open(config_path, encoding='utf-8') as f:
+            return json.load(f).get('gemini_key') or None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class BatchOCRPipeline:
+    """
+    Run a batch of receipt images through OCR and merge the results
+
+    Identical images are processed once. Tesseract jobs run in a process
+    pool; AI jobs run concurrently on one event loop, capped by a
+    semaphore. Images the AI cannot read fall back to Tesseract using the
+    path already in hand.
+    """
+
+    def __init__(self, engine: str = 'tesseract', api_key: Optional[str] = None,
+                 max_workers: Optional[int] = None, ai_concurrency: int = 4,
+                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                 cache: Optional[OCRResultCache] = None):
+        """
+        Args:
+            engine: 'gemini' or 'tesseract'
+            api_key: Gemini API key (required for the gemini engine)
+            max_workers: Tesseract process count (defaults to CPU count, max 4)
+            ai_concurrency: Maximum in-flight AI requests
+            progress_callback: Called with (done, total) after each image
+            cache: Result cache consulted before, and filled after, each engine call
+        """
+        self.engine = engine
+        self.api_key = api_key
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.ai_concurrency = max(1, ai_concurrency)
+        self.progress_callback = progress_callback
+        self.cache = cache
+        self._done = 0
+        self._total = 0
+
+    def _report(self):
+        self._done += 1
+        if self.progress_callback:
+            self.progress_callback(self._done, self._total)
+
+    def run(self, paths: List[str]) -> Dict:
+        """
+        Process dropped files/folders and return one consolidated result
+
+        Returns:
+            dict: success, items (each tagged with source_file), files
+                  (per-image status) and duplicates
+        """
+        image_paths = collect_image_paths(paths)
+        unique, duplicates = dedupe_images(image_paths)
+        jobs = [(digest, path) for digest, path in unique.items()]
+
+        self._done = 0
+        self._total = len(jobs)
+        results: Dict[str, Dict] = {}
+
+        if self.engine == 'gemini' and self.api_key:
+            results.update(self._run_ai(jobs))
+            failed = [(d, p) for d, p in jobs if not results[d].get('success')]
+            if failed:
+                logger.info(f"AI OCR failed for {len(failed)} images, falling back to Tesseract")
+                for digest, result in self._run_tesseract(failed, report=False).items():
+                    if result.get('success'):
+                        results[digest] = result
+        else:
+            results.update(self._run_tesseract(jobs))
+
+        items = []
+        files = []
+        for digest, path in jobs:
+            result = results.get(digest, {"success": False, "error": "Not processed"})
+            file_items = result.get('items', []) if result.get('success') else []
+            for item in file_items:
+                item['source_file'] = os.path.basename(path)
+            items.extend(file_items)
+            files.append({
+                'path': path,
+                'hash': digest,
+                'engine': result.get('engine', self.engine),
+                'success': bool(result.get('success')),
+                'error': result.get('error'),
+                'item_count': len(file_items)
+            })
+
+        return {
+            'success': bool(items),
+            'items': items,
+            'files': files,
+            'duplicates': duplicates,
+            'source': 'batch',
+            'error': None if items else "No items detected in any image"
+        }
+
+    def _run_tesseract(self, jobs: List[Tuple[str, str]], report: bool = True) -> Dict[str, Dict]:
+        texts: Dict[str, str] = {}
+        pending = []
+        for digest, path in jobs:
+            cached = self.cache.get(digest, 'tesseract', TESSERACT_VERSION) if self.cache else None
+            if cached is not None:
+                texts[digest] = cached['text']
+                if report:
+                    self._report()
+            else:
+                pending.append((digest, path))
+
+        errors = {}
+        if pending:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+                futures = {pool.submit(tesseract_extract, path): (digest, path) for digest, path in pending}
+                for future in as_completed(futures):
+                    digest, path = futures[future]
+                    try:
+                        texts[digest] = future.result()
+                        if self.cache:
+                            self.cache.put(digest, 'tesseract', TESSERACT_VERSION, {'text': texts[digest]})
+                    except Exception as e:
+                        logger.error(f"Tesseract failed for {path}: {e}")
+                        errors[digest] = str(e)
+                    if report:
+                        self._report()
+
+        results = {}
+        for digest, _path in jobs:
+            if digest in errors:
+                results[digest] = {'success': False, 'error': errors[digest], 'engine': 'tesseract'}
+                continue
+            items = text_to_items(texts.get(digest, ''))
+            results[digest] = {'success': bool(items), 'items': items, 'engine': 'tesseract',
+                               'error': None if items else "No text recognised"}
+        return results
+
+    def _run_ai(self, jobs: List[Tuple[str, str]]) -> Dict[str, Dict]:
+        results = {}
+        pending = []
+        for digest, path in jobs:
+            cached = self.cache.get(digest, 'gemini', PROMPT_VERSION) if self.cache else None
+            if cached is not None:
+                results[digest] = dict(cached, engine='gemini')
+                self._report()
+            else:
+                pending.append((digest, path))
+
+        if pending:
+            fresh = asyncio.run(self._ai_batch(pending))
+            if self.cache:
+                for digest, result in fresh.items():
+                    if result.get('success'):
+                        self.cache.put(digest, 'gemini', PROMPT_VERSION, result)
+            results.update(fresh)
+        return results
+
+    async def _ai_batch(self, jobs: List[Tuple[str, str]]) -> Dict[str, Dict]:
+        client = gemini_client(self.api_key)
+        semaphore = asyncio.Semaphore(self.ai_concurrency)
+
+        async def extract(digest, path):
+            result = await gemini_extract_async(client, path, semaphore)
+            result['engine'] = 'gemini'
+            self._report()
+            return digest, result
+
+        pairs = await asyncio.gather(*(extract(d, p) for d, p in jobs))
+        return dict(pairs)
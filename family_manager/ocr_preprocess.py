@@ -0,0 +1,138 @@
+"""
+OCR Image Preprocessing for Family Household Manager
+Decodes a photo once, downscales it to an OCR-friendly size, converts it to
+grayscale and straightens small rotations before it reaches an OCR engine
+"""
+
+import io
+import logging
+from typing import Tuple
+
+try:
+    import cv2
+    import numpy as np
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Long side in pixels; phone photos of a page land near 300 DPI at this size
+OCR_MAX_SIDE = 2000
+# The AI model reads text fine from a much smaller image
+AI_MAX_SIDE = 1280
+AI_JPEG_QUALITY = 80
+# Only rotations up to this angle are treated as skew (not a sideways photo)
+MAX_SKEW_DEGREES = 5.0
+SKEW_STEP_DEGREES = 0.5
+
+# Part of the OCR cache key: bump whenever preprocessing output changes
+PREPROCESS_VERSION = "gray-deskew-v1" if CV2_AVAILABLE else "gray-v1"
+
+
+def decode_grayscale(path: str):
+    """Decode an image file straight to a single grayscale channel"""
+    if CV2_AVAILABLE:
+        data = np.fromfile(path, dtype=np.uint8)
+        image = cv2.imdecode(data, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            raise ValueError(f"Could not decode image: {path}")
+        return image
+
+    from PIL import Image, ImageOps
+    with Image.open(path) as image:
+        return ImageOps.exif_transpose(image).convert('L')
+
+
+def downscale(image, max_side: int):
+    """Shrink an image so its longest side is at most max_side (never upscales)"""
+    if CV2_AVAILABLE:
+        height, width = image.shape[:2]
+        scale = max_side / float(max(height, width))
+        if scale >= 1.0:
+            return image
+        return cv2.resize(image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+
+    if max(image.size) <= max_side:
+        return image
+    image = image.copy()
+    image.thumbnail((max_side, max_side))
+    return image
+
+
+def estimate_skew(gray) -> float:
+    """
+    Estimate the text skew angle in degrees using a projection profile
+
+    Candidate rotations are applied to a small binarized copy; the angle
+    whose row sums vary the most lines text rows up with pixel rows.
+    """
+    if not CV2_AVAILABLE:
+        return 0.0
+
+    small = downscale(gray, 800)
+    _, binary = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    height, width = binary.shape
+    center = (width / 2.0, height / 2.0)
+
+    best_angle, best_score = 0.0, -1.0
+    steps = int(MAX_SKEW_DEGREES / SKEW_STEP_DEGREES)
+    for i in range(-steps, steps + 1):
+        angle = i * SKEW_STEP_DEGREES
+        matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
+        rotated = cv2.warpAffine(binary, matrix, (width, height), flags=cv2.INTER_NEAREST)
+        score = float(np.var(rotated.sum(axis=1, dtype=np.float64)))
+        if score > best_score:
+            best_angle, best_score = angle, score
+    return best_angle
+
+
+def deskew(gray, angle: float):
+    """Rotate an image by angle degrees, filling uncovered corners with white"""
+    if not CV2_AVAILABLE or abs(angle) < SKEW_STEP_DEGREES:
+        return gray
+    height, width = gray.shape
+    matrix = cv2.getRotationMatrix2D((width / 2.0, height / 2.0), angle, 1.0)
+    return cv2.warpAffine(gray, matrix, (width, height), flags=cv2.INTER_LINEAR,
+                          borderMode=cv2.BORDER_CONSTANT, borderValue=255)
+
+
+def preprocess_image(path: str, max_side: int = OCR_MAX_SIDE, straighten: bool = True):
+    """
+    Decode, downscale, grayscale and deskew an image for OCR
+
+    Returns:
+        A grayscale numpy array (OpenCV available) or PIL image, either of
+        which pytesseract accepts directly
+    """
+    image = downscale(decode_grayscale(path), max_side)
+    if straighten:
+        angle = estimate_skew(image)
+        if angle:
+            logger.debug(f"Deskewing {path} by {angle:.1f} degrees")
+            image = deskew(image, angle)
+    return image
+
+
+def encode_jpeg(image, quality: int = AI_JPEG_QUALITY) -> bytes:
+    """Encode a preprocessed image as JPEG bytes"""
+    if CV2_AVAILABLE:
+        ok, buffer = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError("JPEG encoding failed")
+        return buffer.tobytes()
+
+    output = io.BytesIO()
+    image.save(output, format='JPEG', quality=quality, optimize=True)
+    return output.getvalue()
+
+
+def prepare_for_ai(path: str) -> Tuple[bytes, str]:
+    """
+    Build a compact image payload for the AI OCR path
+
+    Returns:
+        tuple: (image bytes, mime type)
+    """
+    return encode_jpeg(preprocess_image(path, max_side=AI_MAX_SIDE)), 'image/jpeg'
@@ -0,0 +1,287 @@
+"""
+Password key derivation for Family Household Manager
+Pluggable KDFs (scrypt and PBKDF2 from hashlib, bcrypt when installed) with
+self-describing hashes, so cost parameters can be raised over time and old
+hashes upgraded on the next successful login.
+
+Encoded hashes look like:
+    $scrypt$n=32768,r=8,p=1$<salt hex>$<key hex>
+    $pbkdf2-sha256$i=600000$<salt hex>$<key hex>
+    $2b$12$...                                   (bcrypt's own format)
+Anything else is the original iterated SHA-256 scheme, verified with the
+separate salt column.
+"""
+
+import os
+import json
+import time
+import hashlib
+import hmac
+import logging
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+try:
+    import bcrypt
+    BCRYPT_AVAILABLE = True
+except ImportError:
+    BCRYPT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+# Written by benchmarks/password_kdf_benchmark.py --write
+KDF_CONFIG_PATH = os.environ.get(
+    'PASSWORD_KDF_CONFIG', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'password_kdf.json')
+)
+
+# Concurrent hashes; each scrypt call holds 128 * n * r bytes
+KDF_WORKERS = 4
+
+
+class KDF:
+    """A password hashing scheme with fixed cost parameters"""
+
+    name = ''
+
+    def __init__(self, **params):
+        self.params = {**self.default_params(), **params}
+
+    @staticmethod
+    def default_params() -> Dict:
+        return {}
+
+    def hash(self, password: str) -> str:
+        """Return the encoded hash of a password under the current parameters"""
+        raise NotImplementedError
+
+    def verify(self, password: str, encoded: str) -> bool:
+        raise NotImplementedError
+
+    def identifies(self, encoded: str) -> bool:
+        """True if an encoded hash was produced by this scheme"""
+        return encoded.startswith(f"${self.name}$")
+
+    def parse_params(self, encoded: str) -> Dict:
+        fields = encoded.split('$')[2]
+        return {key: int(value) for key, value in (part.split('=') for part in fields.split(','))}
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """True if a hash uses another scheme or weaker parameters than configured"""
+        if not self.identifies(encoded):
+            return True
+        stored = self.parse_params(encoded)
+        return any(stored.get(key, 0) < value for key, value in self.params.items())
+
+    def _encode(self, salt: bytes, key: bytes) -> str:
+        fields = ','.join(f"{k}={v}" for k, v in self.params.items())
+        return f"${self.name}${fields}${salt.hex()}${key.hex()}"
+
+    def _verify_derived(self, password: str, encoded: str, derive: Callable[[str, bytes, Dict], bytes]) -> bool:
+        try:
+            _, _, _, salt_hex, key_hex = encoded.split('$')
+            key = derive(password, bytes.fromhex(salt_hex), self.parse_params(encoded))
+        except (ValueError, TypeError):
+            return False
+        return hmac.compare_digest(key.hex(), key_hex)
+
+
+class ScryptKDF(KDF):
+    """Memory-hard scrypt from hashlib (the default)"""
+
+    name = 'scrypt'
+
+    @staticmethod
+    def default_params() -> Dict:
+        return {'n': 2 ** 15, 'r': 8, 'p': 1}
+
+    @staticmethod
+    def _derive(password: str, salt: bytes, params: Dict) -> bytes:
+        n, r, p = params['n'], params['r'], params['p']
+        return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+                              maxmem=256 * n * r * p + 1024 * 1024, dklen=KEY_BYTES)
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(SALT_BYTES)
+        return self._encode(salt, self._derive(password, salt, self.params))
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return self._verify_derived(password, encoded, self._derive)
+
+
+class PBKDF2KDF(KDF):
+    """PBKDF2-HMAC-SHA256 from hashlib"""
+
+    name = 'pbkdf2-sha256'
+
+    @staticmethod
+    def default_params() -> Dict:
+        return {'i': 600000}
+
+    @staticmethod
+    def _derive(password: str, salt: bytes, params: Dict) -> bytes:
+        return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, params['i'], dklen=KEY_BYTES)
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(SALT_BYTES)
+        return self._encode(salt, self._derive(password, salt, self.params))
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return self._verify_derived(password, encoded, self._derive)
+
+
+class BcryptKDF(KDF):
+    """bcrypt, when the bcrypt package is installed"""
+
+    name = 'bcrypt'
+
+    @staticmethod
+    def default_params() -> Dict:
+        return {'rounds': 12}
+
+    def identifies(self, encoded: str) -> bool:
+        return encoded[:4] in ('$2a$', '$2b$', '$2y$')
+
+    def parse_params(self, encoded: str) -> Dict:
+        return {'rounds': int(encoded.split('$')[2])}
+
+    def hash(self, password: str) -> str:
+        if not BCRYPT_AVAILABLE:
+            raise RuntimeError("bcrypt is not installed. Install with: pip install bcrypt")
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.params['rounds'])).decode('ascii')
+
+    def verify(self, password: str, encoded: str) -> bool:
+        if not BCRYPT_AVAILABLE:
+            logger.error("Cannot verify bcrypt hash: bcrypt is not installed")
+            return False
+        return bcrypt.checkpw(password.encode('utf-8'), encoded.encode('ascii'))
+
+
+KDFS = {kdf.name: kdf for kdf in (ScryptKDF, PBKDF2KDF, BcryptKDF)}
+
+
+def legacy_sha256(password: str, salt: str) -> str:
+    """The original scheme: 10,000 rounds of SHA-256 over password + salt"""
+    password_bytes = (password + salt).encode('utf-8')
+    for _ in range(10000):
+        password_bytes = hashlib.sha256(password_bytes).digest()
+    return hashlib.sha256(password_bytes).hexdigest()
+
+
+def scheme_for(encoded: str) -> Optional[KDF]:
+    """The KDF that produced an encoded hash, or None for legacy hashes"""
+    for kdf_class in KDFS.values():
+        kdf = kdf_class()
+        if kdf.identifies(encoded):
+            return kdf
+    return None
+
+
+def load_kdf(path: str = KDF_CONFIG_PATH) -> KDF:
+    """
+    Build the configured KDF
+
+    Reads {"kdf": name, "params": {...}} from path; PASSWORD_KDF overrides
+    the scheme. Falls back to scrypt with default parameters.
+
+    Returns:
+        KDF: Scheme used for new hashes
+    """
+    config = {}
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Ignoring unreadable KDF config {path}: {e}")
+    name = os.environ.get('PASSWORD_KDF', config.get('kdf', ScryptKDF.name))
+    if name not in KDFS or (name == BcryptKDF.name and not BCRYPT_AVAILABLE):
+        logger.warning(f"Password KDF {name!r} unavailable, using scrypt")
+        return ScryptKDF()
+    params = config.get('params', {}) if config.get('kdf', name) == name else {}
+    return KDFS[name](**params)
+
+
+def calibrate(name: str, target_ms: float, time_func: Callable[[], float] = time.perf_counter) -> Dict:
+    """
+    Find the cheapest parameters whose hash takes at least target_ms here
+
+    Args:
+        name: KDF name from KDFS
+        target_ms: Desired hashing latency in milliseconds
+
+    Returns:
+        dict: Parameters for KDFS[name]
+    """
+    def measure(kdf):
+        start = time_func()
+        kdf.hash('calibration-password')
+        return (time_func() - start) * 1000
+
+    if name == ScryptKDF.name:
+        n = 2 ** 12
+        while measure(ScryptKDF(n=n)) < target_ms and n < 2 ** 20:
+            n *= 2
+        return {**ScryptKDF.default_params(), 'n': n}
+    if name == PBKDF2KDF.name:
+        probe = 50000
+        elapsed = max(measure(PBKDF2KDF(i=probe)), 0.001)
+        # Cost is linear in iterations; round up to a tidy figure
+        iterations = int(probe * target_ms / elapsed)
+        return {'i': max(100000, -(-iterations // 10000) * 10000)}
+    if name == BcryptKDF.name:
+        rounds = 10
+        while measure(BcryptKDF(rounds=rounds)) < target_ms and rounds < 16:
+            rounds += 1
+        return {'rounds': rounds}
+    raise ValueError(f"Unknown KDF: {name}")
+
+
+def save_kdf_config(name: str, params: Dict, path: str = KDF_CONFIG_PATH):
+    with open(path, 'w') as f:
+        json.dump({'kdf': name, 'params': params}, f, indent=2)
+
+
+class PasswordHasher:
+    """
+    Hashes and verifies passwords on a bounded thread pool
+
+    hashlib's scrypt and PBKDF2 release the GIL, so request threads keep
+    running while a hash is computed, and at most `workers` hashes (and their
+    scrypt memory) are in flight at once.
+    """
+
+    def __init__(self, kdf: Optional[KDF] = None, workers: int = KDF_WORKERS):
+        self.kdf = kdf or load_kdf()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='PasswordKDF')
+
+    def hash(self, password: str) -> str:
+        return self._executor.submit(self.kdf.hash, password).result()
+
+    def verify(self, password: str, encoded: str, legacy_salt: Optional[str] = None) -> bool:
+        """
+        Check a password against any supported encoded hash
+
+        Args:
+            password: Candidate password
+            encoded: Stored password_hash
+            legacy_salt: users.salt, only used by legacy SHA-256 hashes
+        """
+        return self._executor.submit(self._verify, password, encoded, legacy_salt).result()
+
+    def _verify(self, password: str, encoded: str, legacy_salt: Optional[str]) -> bool:
+        kdf = scheme_for(encoded)
+        if kdf is not None:
+            return kdf.verify(password, encoded)
+        if legacy_salt is None:
+            return False
+        return hmac.compare_digest(legacy_sha256(password, legacy_salt), encoded)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return self.kdf.needs_rehash(encoded)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
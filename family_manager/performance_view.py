@@ -0,0 +1,95 @@
+"""
+Performance View for Family Household Manager
+Shows the latency percentiles collected by the instrumentation module for
+database queries, AI calls, UI refreshes and MCP tools, plus the startup trace.
+"""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import (
+    QDialog, QHBoxLayout, QHeaderView, QLabel, QTabWidget, QTableWidget, QTableWidgetItem, QVBoxLayout
+)
+from PyQt6.QtCore import Qt, QTimer
+
+try:
+    from .components import ModernButton
+    from .instrumentation import AI, DB, MCP, UI, MetricsRegistry, get_registry
+except ImportError:
+    from components import ModernButton
+    from instrumentation import AI, DB, MCP, UI, MetricsRegistry, get_registry
+
+CATEGORY_TITLES = {DB: "Database", AI: "AI Calls", UI: "UI Refreshes", MCP: "MCP Tools"}
+COLUMNS = ["Operation", "Count", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)"]
+SUMMARY_KEYS = ['count', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms']
+REFRESH_INTERVAL_MS = 2000
+
+
+class PerformanceDialog(QDialog):
+    """Live latency tables, one tab per instrumentation category"""
+
+    def __init__(self, parent=None, registry: Optional[MetricsRegistry] = None, startup_summary: str = ""):
+        super().__init__(parent)
+        self.registry = registry or get_registry()
+        self.setWindowTitle("Performance")
+        self.resize(760, 480)
+
+        layout = QVBoxLayout(self)
+        if startup_summary:
+            startup_label = QLabel(f"Startup: {startup_summary}")
+            startup_label.setWordWrap(True)
+            layout.addWidget(startup_label)
+
+        self.tabs = QTabWidget()
+        self.tables = {}
+        for category, title in CATEGORY_TITLES.items():
+            self.add_category_tab(category, title)
+        layout.addWidget(self.tabs)
+
+        buttons = QHBoxLayout()
+        reset_btn = ModernButton("Reset", variant="secondary", size="sm")
+        reset_btn.clicked.connect(self.reset_metrics)
+        close_btn = ModernButton("Close", variant="primary", size="sm")
+        close_btn.clicked.connect(self.accept)
+        buttons.addWidget(reset_btn)
+        buttons.addStretch()
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+        self.refresh()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(REFRESH_INTERVAL_MS)
+
+    def add_category_tab(self, category: str, title: str) -> QTableWidget:
+        table = QTableWidget(0, len(COLUMNS))
+        table.setHorizontalHeaderLabels(COLUMNS)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSortingEnabled(False)
+        self.tables[category] = table
+        self.tabs.addTab(table, title)
+        return table
+
+    def refresh(self):
+        """Reload every table from the registry (slowest p95 first)"""
+        snapshot = self.registry.snapshot()
+        for category, operations in snapshot.items():
+            table = self.tables.get(category)
+            if table is None:
+                # Categories recorded by other code get a tab of their own
+                table = self.add_category_tab(category, category.title())
+            table.setRowCount(len(operations))
+            for row, (name, summary) in enumerate(operations.items()):
+                table.setItem(row, 0, QTableWidgetItem(name))
+                for column, key in enumerate(SUMMARY_KEYS, start=1):
+                    value = summary[key]
+                    item = QTableWidgetItem(str(value) if key == 'count' else f"{value:.1f}")
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                    table.setItem(row, column, item)
+        for category, table in self.tables.items():
+            if category not in snapshot:
+                table.setRowCount(0)
+
+    def reset_metrics(self):
+        self.registry.reset()
+        self.refresh()
@@ -0,0 +1,164 @@
+"""
+AI Provider Transport for Family Household Manager
+Every request to an AI or recipe provider goes through the shared transport,
+so the live endpoints can be redirected to a local stand-in (mock_ai_server.py)
+or replaced in-process for offline latency, error and rate-limit testing.
+Set AI_PROVIDER_BASE_URL (e.g. http://127.0.0.1:8765) to redirect all
+providers, and AI_PROVIDER_RECORD to a file to capture live responses for
+the stand-in to replay.
+"""
+
+import os
+import json
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+try:
+    from .instrumentation import AI, span
+except ImportError:
+    from instrumentation import AI, span
+
+logger = logging.getLogger(__name__)
+
+# Provider names; redirected requests go to <base url>/<provider>/<original path>
+GEMINI = 'gemini'
+OPENAI = 'openai'
+HUGGINGFACE = 'huggingface'
+OPENCODE_ZEN = 'opencode-zen'
+AIMLAPI = 'aimlapi'
+SCITELY = 'scitely'
+SPOONACULAR = 'spoonacular'
+
+# Default API roots of the SDK-based providers, used to build redirected roots
+SDK_ROOTS = {
+    OPENAI: 'https://api.openai.com/v1',
+    SPOONACULAR: 'https://api.spoonacular.com/',
+}
+
+
+def recording_key(provider: str, url: str) -> str:
+    """Key a response is recorded and replayed under, e.g. 'aimlapi/v1/chat/completions'"""
+    return f"{provider}{urlsplit(url).path}"
+
+
+class ProviderTransport:
+    """
+    Sends provider requests with requests.post
+
+    Args:
+        base_url: Send every provider to this server instead of its live endpoint
+        record_path: Append each response to this JSON recordings file
+    """
+
+    def __init__(self, base_url: Optional[str] = None, record_path: Optional[str] = None):
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.record_path = record_path
+        self._record_lock = threading.Lock()
+
+    def url(self, provider: str, url: str) -> str:
+        """The URL a request to `url` is actually sent to"""
+        if not self.base_url:
+            return url
+        parts = urlsplit(url)
+        return f"{self.base_url}/{provider}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+    def sdk_base_url(self, provider: str) -> Optional[str]:
+        """API root for an SDK client, or None to keep the SDK's own endpoint"""
+        if not self.base_url:
+            return None
+        return self.url(provider, SDK_ROOTS.get(provider, '/')).rstrip('/') + '/'
+
+    def post(self, provider: str, url: str, headers: Optional[Dict] = None, json: Optional[Dict] = None,
+             timeout: float = 30):
+        """
+        POST a JSON request to a provider
+
+        Args:
+            provider: Provider name, e.g. HUGGINGFACE
+            url: The provider's live URL
+            headers: Request headers
+            json: Request body
+            timeout: Seconds before requests gives up
+
+        Returns:
+            requests.Response (or an object with status_code, headers, text and json())
+        """
+        with span(f"{provider} POST", AI):
+            response = self._send(provider, url, headers or {}, json, timeout)
+        if self.record_path:
+            self._record(provider, url, response)
+        return response
+
+    def _send(self, provider, url, headers, body, timeout):
+        import requests
+
+        return requests.post(self.url(provider, url), headers=headers, json=body, timeout=timeout)
+
+    def _record(self, provider, url, response):
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        with self._record_lock:
+            try:
+                with open(self.record_path, encoding='utf-8') as f:
+                    recordings = json.load(f)
+            except (OSError, ValueError):
+                recordings = {}
+            recordings.setdefault(recording_key(provider, url), []).append(
+                {'status': response.status_code, 'body': body})
+            try:
+                with open(self.record_path, 'w', encoding='utf-8') as f:
+                    json.dump(recordings, f, indent=2)
+            except OSError as e:
+                logger.error(f"Failed to record {provider} response to {self.record_path}: {e}")
+
+
+_transport = ProviderTransport(os.environ.get('AI_PROVIDER_BASE_URL'), os.environ.get('AI_PROVIDER_RECORD'))
+if _transport.base_url:
+    logger.info(f"AI providers redirected to {_transport.base_url}")
+
+
+def get_transport() -> ProviderTransport:
+    """Transport every provider request is sent with"""
+    return _transport
+
+
+def set_transport(transport: ProviderTransport) -> ProviderTransport:
+    """Replace the shared transport (e.g. with mock_ai_server.ReplayTransport); returns the previous one"""
+    global _transport
+    previous, _transport = _transport, transport
+    return previous
+
+
+def gemini_client(api_key: str):
+    """google.genai Client, pointed at the stand-in server when redirected"""
+    import google.genai as genai
+
+    base_url = _transport.sdk_base_url(GEMINI)
+    if base_url:
+        return genai.Client(api_key=api_key, http_options={'base_url': base_url})
+    return genai.Client(api_key=api_key)
+
+
+def openai_client(api_key: str):
+    """openai.OpenAI client, pointed at the stand-in server when redirected"""
+    import openai
+
+    base_url = _transport.sdk_base_url(OPENAI)
+    if base_url:
+        return openai.OpenAI(api_key=api_key, base_url=base_url)
+    return openai.OpenAI(api_key=api_key)
+
+
+def spoonacular_api(api_key: str):
+    """spoonacular.API client, pointed at the stand-in server when redirected"""
+    from spoonacular import API
+
+    api = API(api_key=api_key)
+    base_url = _transport.sdk_base_url(SPOONACULAR)
+    if base_url:
+        api.api_root = base_url
+    return api
@@ -0,0 +1,261 @@
+"""
+Query Plan Auditor for Family Household Manager
+Runs EXPLAIN QUERY PLAN over the app's registered hot queries (and any
+statements replayed from the slow-query log), flags full scans of large
+tables and recommends the indexes that turn them into index searches.
+
+Usage:
+    python query_audit.py [--db family_manager.db] [--min-rows 1000]
+                          [--slow-log slow_queries.jsonl] [--apply] [--verbose]
+"""
+
+import re
+import sys
+import json
+import sqlite3
+import logging
+import argparse
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_ROWS = 1000
+
+# Indexes recommended by this audit; ensure_query_indexes() creates them at
+# startup. Indexes other modules already create (idx_meals_date,
+# idx_expenses_date, idx_notifications_feed, ...) are referenced by name only.
+QUERY_INDEXES: Dict[str, str] = {
+    'idx_meals_date_type': "CREATE INDEX IF NOT EXISTS idx_meals_date_type ON meals(date, meal_type)",
+    'idx_meals_type_generated':
+        "CREATE INDEX IF NOT EXISTS idx_meals_type_generated ON meals(meal_type, generation_date)",
+    # Matches the strftime('%Y-%m', date) = ? filters used by the finance views
+    'idx_expenses_month': "CREATE INDEX IF NOT EXISTS idx_expenses_month ON expenses(strftime('%Y-%m', date))",
+    'idx_shopping_list_checked': "CREATE INDEX IF NOT EXISTS idx_shopping_list_checked ON shopping_list(checked)",
+    'idx_shopping_list_item': "CREATE INDEX IF NOT EXISTS idx_shopping_list_item ON shopping_list(item)",
+    'idx_shopping_list_item_lower':
+        "CREATE INDEX IF NOT EXISTS idx_shopping_list_item_lower ON shopping_list(LOWER(item))",
+}
+
+
+class RegisteredQuery(NamedTuple):
+    """A query the app runs often enough that its plan matters"""
+    name: str
+    sql: str
+    params: Sequence = ()
+    index: Optional[str] = None         # index expected to serve it
+    expected_scans: Tuple[str, ...] = ()  # tables it reads in full by design
+
+
+class Finding(NamedTuple):
+    """A full table scan of a large table"""
+    query: str
+    table: str
+    rows: int
+    detail: str
+    recommendation: str
+
+
+REGISTERED_QUERIES: List[RegisteredQuery] = [
+    # meals
+    RegisteredQuery('meals_for_date', "SELECT * FROM meals WHERE date = ?", ('2024-01-01',), 'idx_meals_date'),
+    RegisteredQuery('meal_for_slot', "SELECT id FROM meals WHERE date = ? AND meal_type = ?",
+                    ('2024-01-01', 'Dinner'), 'idx_meals_date_type'),
+    RegisteredQuery('meals_in_range', "SELECT * FROM meals WHERE date BETWEEN ? AND ? ORDER BY date",
+                    ('2024-01-01', '2024-01-07'), 'idx_meals_date'),
+    RegisteredQuery('recent_generated_meals',
+                    "SELECT name FROM meals WHERE meal_type = ? AND generation_date > date('now', '-7 days')",
+                    ('Dinner',), 'idx_meals_type_generated'),
+    # expenses
+    RegisteredQuery('expenses_month_total', "SELECT SUM(amount) FROM expenses WHERE strftime('%Y-%m', date) = ?",
+                    ('2024-01',), 'idx_expenses_month'),
+    RegisteredQuery('expenses_month_by_category',
+                    "SELECT category, SUM(amount) FROM expenses WHERE strftime('%Y-%m', date) = ? GROUP BY category",
+                    ('2024-01',), 'idx_expenses_month'),
+    RegisteredQuery('expenses_for_date', "SELECT * FROM expenses WHERE date = ?", ('2024-01-01',),
+                    'idx_expenses_date'),
+    RegisteredQuery('expenses_since', "SELECT date, amount, category FROM expenses WHERE date >= ?",
+                    ('2024-01-01',), 'idx_expenses_date'),
+    # notifications
+    RegisteredQuery('notification_feed',
+                    "SELECT * FROM notifications WHERE recipient_id = ? AND is_read = 0"
+                    " AND (expires_at IS NULL OR expires_at > datetime('now'))"
+                    " ORDER BY created_at DESC, id DESC LIMIT ?",
+                    (1, 50), 'idx_notifications_feed'),
+    RegisteredQuery('notification_stream',
+                    "SELECT * FROM notifications WHERE recipient_id = ? AND id > ?"
+                    " AND (expires_at IS NULL OR expires_at > datetime('now')) ORDER BY id LIMIT ?",
+                    (1, 0, 50), 'idx_notifications_feed'),
+    # shopping_list
+    RegisteredQuery('shopping_unchecked_count', "SELECT COUNT(*) FROM shopping_list WHERE checked = 0", (),
+                    'idx_shopping_list_checked'),
+    RegisteredQuery('shopping_price_update', "UPDATE shopping_list SET price = ? WHERE item = ?", (1.0, 'milk'),
+                    'idx_shopping_list_item'),
+    RegisteredQuery('inventory_usage_history',
+                    "SELECT i.name, COUNT(sl.id) FROM inventory i"
+                    " LEFT JOIN shopping_list sl ON LOWER(i.name) = LOWER(sl.item) AND sl.checked = 1"
+                    " GROUP BY i.name",
+                    (), 'idx_shopping_list_item_lower', expected_scans=('inventory',)),
+    RegisteredQuery('inventory_on_hand', "SELECT SUM(i.qty) FROM inventory i WHERE LOWER(i.name) = ?", ('milk',),
+                    'idx_inventory_name_lower'),
+]
+
+
+def register_query(name: str, sql: str, params: Sequence = (), index: Optional[str] = None,
+                   expected_scans: Tuple[str, ...] = ()):
+    """Add a query to the audit"""
+    REGISTERED_QUERIES.append(RegisteredQuery(name, sql, params, index, expected_scans))
+
+
+def ensure_query_indexes(cursor: sqlite3.Cursor):
+    """Create the recommended indexes whose tables and columns exist"""
+    for name, statement in QUERY_INDEXES.items():
+        try:
+            cursor.execute(statement)
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Skipped index {name}: {e}")
+
+
+_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS (\w+))?(.*)$')
+_TABLE_REF = re.compile(r'\b(?:FROM|JOIN|UPDATE|INTO)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE)
+_NOT_ALIASES = {'WHERE', 'SET', 'ON', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'CROSS', 'NATURAL', 'JOIN', 'GROUP',
+                'ORDER', 'LIMIT', 'USING', 'VALUES', 'HAVING', 'UNION', 'SELECT', 'DEFAULT'}
+
+
+def table_aliases(sql: str) -> Dict[str, str]:
+    """Map every table name and alias in a statement to its table"""
+    aliases = {}
+    for table, alias in _TABLE_REF.findall(sql):
+        aliases[table] = table
+        if alias and alias.upper() not in _NOT_ALIASES:
+            aliases[alias] = table
+    return aliases
+
+
+def explain(conn: sqlite3.Connection, sql: str, params: Sequence = ()) -> List[str]:
+    """EXPLAIN QUERY PLAN detail lines for a statement"""
+    if isinstance(params, str) or (not isinstance(params, dict) and len(params) != sql.count('?')):
+        # Summarised or mismatched parameters: the plan does not depend on the values
+        params = [None] * sql.count('?')
+    return [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+
+
+def full_scans(sql: str, plan: Sequence[str]) -> List[Tuple[str, str]]:
+    """(table, detail) for every plan step that reads a table without an index"""
+    aliases = table_aliases(sql)
+    scans = []
+    for detail in plan:
+        match = _SCAN.match(detail)
+        if match and 'INDEX' not in match.group(3):
+            name = match.group(1)
+            scans.append((aliases.get(name, name), detail))
+    return scans
+
+
+def _recommendation(query: RegisteredQuery) -> str:
+    if query.index in QUERY_INDEXES:
+        return QUERY_INDEXES[query.index]
+    if query.index:
+        return f"{query.index} is missing; run the app's schema setup to create it"
+    return "no index registered for this query"
+
+
+def audit(conn: sqlite3.Connection, queries: Sequence[RegisteredQuery],
+          min_rows: int = DEFAULT_MIN_ROWS) -> Tuple[List[Finding], List[Tuple[str, str]]]:
+    """
+    Flag full scans of tables with at least min_rows rows
+
+    Args:
+        conn: Connection to the database to audit
+        queries: Queries to explain
+        min_rows: Smallest table worth flagging
+
+    Returns:
+        tuple: (findings, [(query name, error)] for queries that could not be explained)
+    """
+    row_counts: Dict[str, int] = {}
+
+    def rows(table):
+        if table not in row_counts:
+            try:
+                row_counts[table] = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            except sqlite3.OperationalError:
+                row_counts[table] = 0
+        return row_counts[table]
+
+    findings, errors = [], []
+    for query in queries:
+        try:
+            plan = explain(conn, query.sql, query.params)
+        except sqlite3.Error as e:
+            errors.append((query.name, str(e)))
+            continue
+        for table, detail in full_scans(query.sql, plan):
+            if table in query.expected_scans or rows(table) < min_rows:
+                continue
+            findings.append(Finding(query.name, table, rows(table), detail, _recommendation(query)))
+    return findings, errors
+
+
+def queries_from_slow_log(path: str) -> List[RegisteredQuery]:
+    """Distinct statements from a slow-query log written by instrumentation.SlowQueryLog"""
+    queries, seen = [], set()
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            sql = entry.get('sql', '')
+            if not sql or sql in seen:
+                continue
+            seen.add(sql)
+            queries.append(RegisteredQuery(f"slow@{entry.get('site', 'unknown')}", sql, entry.get('params') or ()))
+    return queries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit query plans for full table scans")
+    parser.add_argument('--db', default='family_manager.db', help="Database to audit")
+    parser.add_argument('--min-rows', type=int, default=DEFAULT_MIN_ROWS, help="Only flag tables at least this big")
+    parser.add_argument('--slow-log', help="Also audit statements from a slow-query log (JSON lines)")
+    parser.add_argument('--apply', action='store_true', help="Create the recommended indexes, then re-audit")
+    parser.add_argument('--verbose', action='store_true', help="Print every query plan")
+    args = parser.parse_args(argv)
+
+    queries = list(REGISTERED_QUERIES)
+    if args.slow_log:
+        queries += queries_from_slow_log(args.slow_log)
+
+    conn = sqlite3.connect(args.db)
+    try:
+        if args.verbose:
+            for query in queries:
+                try:
+                    plan = explain(conn, query.sql, query.params)
+                except sqlite3.Error as e:
+                    plan = [f"error: {e}"]
+                print(f"{query.name}:")
+                for detail in plan:
+                    print(f"    {detail}")
+
+        findings, errors = audit(conn, queries, args.min_rows)
+        if args.apply and findings:
+            for statement in sorted({f.recommendation for f in findings if f.recommendation.startswith('CREATE')}):
+                print(f"Applying: {statement}")
+                conn.execute(statement)
+            conn.commit()
+            findings, errors = audit(conn, queries, args.min_rows)
+    finally:
+        conn.close()
+
+    for name, error in errors:
+        print(f"SKIPPED {name}: {error}")
+    for finding in findings:
+        print(f"SCAN {finding.table} ({finding.rows} rows) in {finding.query}: {finding.detail}")
+        print(f"    recommend: {finding.recommendation}")
+    print(f"{len(queries)} queries audited, {len(findings)} full scans of tables with >= {args.min_rows} rows")
+    return 1 if findings else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
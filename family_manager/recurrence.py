@@ -0,0 +1,216 @@
+"""
+Recurrence expansion for recurring events
+Expands a pattern into occurrence dates for a requested [start, end) window
+by stepping arithmetically, so nothing outside the window is generated.
+"""
+
+import time
+import logging
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
+DEFAULT_EVENT_TIME = '09:00'
+
+# Recently expanded windows kept by occurrences()
+EXPANSION_CACHE_SIZE = 512
+
+_LAST_DATE = date.max - timedelta(days=366)
+
+
+class RecurrenceRule(NamedTuple):
+    """Hashable snapshot of a recurring_events row joined with its recurring_patterns row"""
+    pattern_type: str
+    start_date: date
+    end_date: Optional[date] = None
+    frequency: int = 1
+    byday: Optional[str] = None
+    bymonthday: Optional[int] = None
+    bymonth: Optional[int] = None
+    count: Optional[int] = None
+
+
+def rule_from_row(row) -> RecurrenceRule:
+    """
+    Build a RecurrenceRule from a joined event/pattern row
+
+    Args:
+        row: Mapping with pattern_type, start_date, end_date and the pattern
+             columns (frequency, byday, bymonthday, bymonth, count)
+
+    Returns:
+        RecurrenceRule: Rule for occurrences()
+    """
+    return RecurrenceRule(
+        pattern_type=row['pattern_type'],
+        start_date=datetime.strptime(row['start_date'], '%Y-%m-%d').date(),
+        end_date=datetime.strptime(row['end_date'], '%Y-%m-%d').date() if row['end_date'] else None,
+        frequency=max(int(row['frequency'] or 1), 1),
+        byday=row['byday'] or None,
+        bymonthday=row['bymonthday'] or None,
+        bymonth=row['bymonth'] or None,
+        count=row['count'] or None,
+    )
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in a month (month 1-12)"""
+    if month == 12:
+        return 31
+    return (date(year, month + 1, 1) - timedelta(days=1)).day
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def _iter_daily(rule: RecurrenceRule, first: date, until: date) -> Iterator[date]:
+    step = rule.frequency
+    k = max(0, _ceil_div((first - rule.start_date).days, step))
+    last = (until - rule.start_date).days
+    for offset in range(k * step, last, step):
+        yield rule.start_date + timedelta(days=offset)
+
+
+def _iter_weekly(rule: RecurrenceRule, first: date, until: date) -> Iterator[date]:
+    days = sorted({WEEKDAYS[d.strip()] for d in (rule.byday or '').split(',') if d.strip() in WEEKDAYS})
+    if not days:
+        days = [rule.start_date.weekday()]
+    # Weeks are counted from the Monday of the start week, every `frequency` weeks
+    week0 = rule.start_date - timedelta(days=rule.start_date.weekday())
+    week = max(0, (first - week0).days // 7)
+    week = _ceil_div(week, rule.frequency) * rule.frequency
+    while True:
+        monday = week0 + timedelta(weeks=week)
+        if monday >= until:
+            return
+        for day in days:
+            current = monday + timedelta(days=day)
+            if current >= until:
+                return
+            if current >= first:
+                yield current
+        week += rule.frequency
+
+
+def _iter_monthly(rule: RecurrenceRule, first: date, until: date, frequency: Optional[int] = None,
+                  target_day: Optional[int] = None) -> Iterator[date]:
+    frequency = frequency or rule.frequency
+    target_day = target_day or rule.bymonthday or rule.start_date.day
+    month0 = rule.start_date.year * 12 + rule.start_date.month - 1
+    k = max(0, _ceil_div(first.year * 12 + first.month - 1 - month0, frequency))
+    while True:
+        year, month = divmod(month0 + k * frequency, 12)
+        month += 1
+        if date(year, month, 1) >= until:
+            return
+        # Short months clamp to their last day
+        current = date(year, month, min(target_day, _days_in_month(year, month)))
+        if current >= until:
+            return
+        if current >= first:
+            yield current
+        k += 1
+
+
+def _iter_yearly(rule: RecurrenceRule, first: date, until: date) -> Iterator[date]:
+    month = rule.bymonth or rule.start_date.month
+    day = rule.bymonthday or rule.start_date.day
+    year = rule.start_date.year + max(0, _ceil_div(first.year - rule.start_date.year, rule.frequency)) * rule.frequency
+    while year <= until.year:
+        try:
+            current = date(year, month, day)
+        except ValueError:
+            # e.g. 29 February outside leap years: no occurrence that year
+            current = None
+        if current is not None:
+            if current >= until:
+                return
+            if current >= first:
+                yield current
+        year += rule.frequency
+
+
+def _iter_occurrences(rule: RecurrenceRule, first: date, until: date) -> Iterator[date]:
+    """Occurrences in [first, until) ignoring end_date and count; first must be >= start_date"""
+    if rule.pattern_type == 'daily':
+        return _iter_daily(rule, first, until)
+    if rule.pattern_type == 'weekly':
+        return _iter_weekly(rule, first, until)
+    if rule.pattern_type == 'monthly':
+        return _iter_monthly(rule, first, until)
+    if rule.pattern_type == 'yearly':
+        return _iter_yearly(rule, first, until)
+    # Custom RRULEs are not parsed yet; treat them as monthly on the start day
+    return _iter_monthly(rule, first, until, frequency=1, target_day=rule.start_date.day)
+
+
+@lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def _count_limit(rule: RecurrenceRule) -> Optional[date]:
+    """Day after the last occurrence allowed by COUNT, or None when the rule has no count"""
+    if not rule.count:
+        return None
+    last = None
+    for n, current in enumerate(_iter_occurrences(rule, rule.start_date, _LAST_DATE), start=1):
+        last = current
+        if n >= rule.count:
+            break
+    return last + timedelta(days=1) if last else rule.start_date
+
+
+@lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def occurrences(rule: RecurrenceRule, window_start: date, window_end: date) -> Tuple[date, ...]:
+    """
+    Occurrence dates of a rule inside [window_start, window_end)
+
+    Results are memoized per (rule, window); a changed pattern is a different
+    rule, so edits never see stale expansions.
+
+    Args:
+        rule: Recurrence rule
+        window_start: First date of the window (inclusive)
+        window_end: End of the window (exclusive)
+
+    Returns:
+        tuple: Dates in ascending order
+    """
+    first = max(window_start, rule.start_date)
+    until = min(window_end, _LAST_DATE)
+    if rule.end_date is not None:
+        until = min(until, rule.end_date + timedelta(days=1))
+    count_limit = _count_limit(rule)
+    if count_limit is not None:
+        until = min(until, count_limit)
+    if first >= until:
+        return ()
+    return tuple(_iter_occurrences(rule, first, until))
+
+
+def expand_batch(rules: List[Tuple[int, RecurrenceRule]], window_end: date) -> List[Tuple[int, List[str], float]]:
+    """
+    Expand many rules from their start dates up to window_end
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        rules: (recurring_event_id, rule) pairs
+        window_end: End of the window (exclusive)
+
+    Returns:
+        list: (recurring_event_id, ISO dates, seconds spent) per rule
+    """
+    results = []
+    for event_id, rule in rules:
+        start = time.perf_counter()
+        dates = [day.isoformat() for day in occurrences(rule, rule.start_date, window_end)]
+        results.append((event_id, dates, time.perf_counter() - start))
+    return results
+
+
+def expansion_cache_info() -> Dict:
+    """Hit/miss statistics of the window cache"""
+    info = occurrences.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max_size': info.maxsize}
@@ -3,14 +3,37 @@ Recurring Events Manager - Pattern generation and event instance management
 Handles RRULE-compatible pattern creation and expansion for calendar events
 """
 
+import os
 import sqlite3
 import logging
-from datetime import datetime, timedelta, time
+import time as timer
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, time
 from typing import List, Dict, Optional, Tuple
 import json
 
+try:
+    from .instrumentation import connect
+    from .recurrence import DEFAULT_EVENT_TIME, expand_batch, occurrences, rule_from_row
+except ImportError:
+    from instrumentation import connect
+    from recurrence import DEFAULT_EVENT_TIME, expand_batch, occurrences, rule_from_row
+
 logger = logging.getLogger(__name__)
 
+# regenerate_all expands in worker processes from this many events up;
+# below it, process start-up costs more than the expansion
+PARALLEL_EXPANSION_THRESHOLD = 500
+
+# Event columns and pattern columns in one row, as rule_from_row() expects
+_EVENT_WITH_PATTERN = '''
+    SELECT re.id, re.title, re.color, re.category, re.created_by, re.is_active,
+           re.pattern_type, re.start_date, re.end_date, re.rrule_string,
+           rp.frequency, rp.byday, rp.bymonthday, rp.bymonth, rp.count
+    FROM recurring_events re
+    LEFT JOIN recurring_patterns rp ON rp.recurring_event_id = re.id
+'''
+
 
 class RecurringEventManager:
     """Manages recurring event patterns and instance generation."""
@@ -22,6 +45,20 @@ class RecurringEventManager:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Index stored instances by (event, date) so window lookups and exception upserts are seeks"""
+        try:
+            conn = connect(self.db_path)
+            conn.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_recurring_instances_event_date
+                ON recurring_event_instances(recurring_event_id, event_date)
+            ''')
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Skipped recurring instance index: {e}")
 
     def create_pattern(self, 
                       title: str,
@@ -79,7 +116,7 @@ class RecurringEventManager:
             # Build RRULE string
             rrule = self._build_rrule(pattern_type, frequency, byday, bymonthday, bymonth, count)
 
-            conn = sqlite3.connect(self.db_path)
+            conn = connect(self.db_path)
             cursor = conn.cursor()
 
             # Insert recurring event
@@ -117,7 +154,8 @@ class RecurringEventManager:
         """Generate individual event instances from a recurring pattern.
         
         Expands a recurring event pattern into individual calendar instances.
-        Instances within the next `months_ahead` months are generated.
+        Instances from the start date up to `months_ahead` months from today are
+        generated. Prefer get_occurrences() for a specific window.
         
         Args:
             recurring_event_id: ID of the recurring event to expand
@@ -127,63 +165,12 @@ class RecurringEventManager:
             List[Dict]: List of generated instances with dates and times
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            # Get recurring event details
-            cursor.execute('SELECT * FROM recurring_events WHERE id = ?', (recurring_event_id,))
-            event = cursor.fetchone()
-
-            if not event:
-                raise ValueError(f"Recurring event {recurring_event_id} not found")
-
-            # Get pattern details
-            cursor.execute('SELECT * FROM recurring_patterns WHERE recurring_event_id = ?', 
-                          (recurring_event_id,))
-            pattern = cursor.fetchone()
-
-            conn.close()
-
-            # Parse dates
-            start_date = datetime.strptime(event['start_date'], '%Y-%m-%d').date()
-            end_date = None
-            if event['end_date']:
-                end_date = datetime.strptime(event['end_date'], '%Y-%m-%d').date()
-
-            # Calculate generation window
-            today = datetime.now().date()
-            window_end = today + timedelta(days=30 * months_ahead)
-
-            # Generate instances based on pattern type
-            instances = []
-            pattern_type = event['pattern_type']
+            event = self._load_event(recurring_event_id)
+            rule = rule_from_row(event)
+            window_end = datetime.now().date() + timedelta(days=30 * months_ahead + 1)
 
-            if pattern_type == 'daily':
-                instances = self._generate_daily_instances(
-                    start_date, end_date, window_end, pattern['frequency'])
-
-            elif pattern_type == 'weekly':
-                instances = self._generate_weekly_instances(
-                    start_date, end_date, window_end, pattern['frequency'], pattern['byday'])
-
-            elif pattern_type == 'monthly':
-                instances = self._generate_monthly_instances(
-                    start_date, end_date, window_end, pattern['frequency'], pattern['bymonthday'])
-
-            elif pattern_type == 'yearly':
-                instances = self._generate_yearly_instances(
-                    start_date, end_date, window_end, pattern['frequency'], 
-                    pattern['bymonthday'], pattern['bymonth'])
-
-            elif pattern_type == 'custom':
-                if event['rrule_string']:
-                    instances = self._generate_rrule_instances(
-                        event['rrule_string'], start_date, end_date, window_end)
-
-            # Apply count limit if specified
-            if pattern['count']:
-                instances = instances[:pattern['count']]
+            instances = [{'event_date': day.isoformat(), 'event_time': DEFAULT_EVENT_TIME}
+                         for day in occurrences(rule, rule.start_date, window_end)]
 
             logger.info(f"Generated {len(instances)} instances for recurring event {recurring_event_id}")
             return instances
@@ -192,38 +179,294 @@ class RecurringEventManager:
             logger.error(f"Failed to generate instances for event {recurring_event_id}: {e}")
             raise
 
-    def save_instances(self, recurring_event_id: int, instances: List[Dict]) -> None:
-        """Save generated instances to database.
+    def _load_event(self, recurring_event_id: int) -> Dict:
+        """Fetch one event joined with its pattern"""
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            row = conn.execute(_EVENT_WITH_PATTERN + ' WHERE re.id = ?', (recurring_event_id,)).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            raise ValueError(f"Recurring event {recurring_event_id} not found")
+        return dict(row)
+
+    def get_occurrences(self, recurring_event_id: int, window_start: date, window_end: date) -> List[Dict]:
+        """Expand one recurring event over [window_start, window_end).
+        
+        Occurrences are computed on demand; only exceptions (completed or
+        overridden instances) live in recurring_event_instances and are
+        merged in.
         
         Args:
             recurring_event_id: ID of the recurring event
-            instances: List of instance dictionaries with event_date and event_time
+            window_start: First date of the window (inclusive)
+            window_end: End of the window (exclusive)
+            
+        Returns:
+            List[Dict]: Occurrences in date order (see get_all_occurrences)
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Clear existing instances for this event
-            cursor.execute('DELETE FROM recurring_event_instances WHERE recurring_event_id = ?',
-                          (recurring_event_id,))
+        event = self._load_event(recurring_event_id)
+        return self._expand([event], window_start, window_end)
 
-            # Insert new instances
-            for instance in instances:
-                cursor.execute('''
-                    INSERT INTO recurring_event_instances
-                    (recurring_event_id, event_date, event_time, is_completed)
-                    VALUES (?, ?, ?, 0)
-                ''', (recurring_event_id, instance['event_date'], instance['event_time']))
+    def get_all_occurrences(self, window_start: date, window_end: date,
+                            active_only: bool = True) -> List[Dict]:
+        """Expand every recurring event over [window_start, window_end) for calendar views.
+        
+        Args:
+            window_start: First date of the window (inclusive)
+            window_end: End of the window (exclusive)
+            active_only: Skip events with is_active = 0
+            
+        Returns:
+            List[Dict]: Occurrences ordered by date then event. Each has
+                recurring_event_id, title, color, category, created_by,
+                event_date, event_time, instance_id (None unless stored),
+                is_completed, is_overridden and any override_* / completion_*
+                fields of the stored exception.
+        """
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            query = _EVENT_WITH_PATTERN + (' WHERE re.is_active = 1' if active_only else '')
+            events = [dict(row) for row in conn.execute(query)]
+        finally:
+            conn.close()
+        return sorted(self._expand(events, window_start, window_end),
+                      key=lambda o: (o['event_date'], o['recurring_event_id']))
+
+    def _expand(self, events: List[Dict], window_start: date, window_end: date) -> List[Dict]:
+        """Expand joined event rows and overlay stored exceptions in the window"""
+        if not events:
+            return []
+        exceptions = self._load_exceptions([e['id'] for e in events], window_start, window_end)
+
+        result = []
+        for event in events:
+            for day in occurrences(rule_from_row(event), window_start, window_end):
+                event_date = day.isoformat()
+                occurrence = {
+                    'recurring_event_id': event['id'],
+                    'title': event['title'],
+                    'color': event['color'],
+                    'category': event['category'],
+                    'created_by': event['created_by'],
+                    'event_date': event_date,
+                    'event_time': DEFAULT_EVENT_TIME,
+                    'instance_id': None,
+                    'is_completed': 0,
+                    'is_overridden': 0,
+                }
+                stored = exceptions.get((event['id'], event_date))
+                if stored:
+                    occurrence.update({k: v for k, v in stored.items()
+                                       if k not in ('id', 'recurring_event_id') and v is not None})
+                    occurrence['instance_id'] = stored['id']
+                result.append(occurrence)
+        return result
+
+    def _load_exceptions(self, event_ids: List[int], window_start: date,
+                         window_end: date) -> Dict[Tuple[int, str], Dict]:
+        """Stored instance rows for the given events inside the window, keyed by (event, date)"""
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            placeholders = ','.join('?' for _ in event_ids)
+            rows = conn.execute(f'''
+                SELECT * FROM recurring_event_instances
+                WHERE recurring_event_id IN ({placeholders})
+                AND event_date >= ? AND event_date < ?
+            ''', (*event_ids, window_start.isoformat(), window_end.isoformat())).fetchall()
+        finally:
+            conn.close()
+        return {(row['recurring_event_id'], row['event_date']): dict(row) for row in rows}
 
+    def materialize_instance(self, recurring_event_id: int, event_date: str,
+                             event_time: str = DEFAULT_EVENT_TIME) -> int:
+        """Store an occurrence so it can be completed or overridden.
+        
+        Args:
+            recurring_event_id: ID of the recurring event
+            event_date: ISO date of the occurrence
+            event_time: Time of the occurrence
+            
+        Returns:
+            int: recurring_event_instances id (existing or new)
+        """
+        conn = connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR IGNORE INTO recurring_event_instances
+                (recurring_event_id, event_date, event_time, is_completed)
+                VALUES (?, ?, ?, 0)
+            ''', (recurring_event_id, event_date, event_time))
+            cursor.execute('''
+                SELECT id FROM recurring_event_instances
+                WHERE recurring_event_id = ? AND event_date = ?
+            ''', (recurring_event_id, event_date))
+            instance_id = cursor.fetchone()[0]
             conn.commit()
+            return instance_id
+        finally:
             conn.close()
 
-            logger.info(f"Saved {len(instances)} instances for recurring event {recurring_event_id}")
+    def save_instances(self, recurring_event_id: int, instances: List[Dict]) -> Dict[str, int]:
+        """Save generated instances to database.
+        
+        Only the difference against the stored rows is written: dates that are
+        new are inserted, dates that dropped out of the pattern are deleted,
+        and changed times are updated, all in one transaction. Completed or
+        overridden instances are never deleted, so regeneration keeps them.
+        
+        Args:
+            recurring_event_id: ID of the recurring event
+            instances: List of instance dictionaries with event_date and event_time
+            
+        Returns:
+            Dict[str, int]: Counts of inserted, updated, deleted and kept rows
+        """
+        try:
+            conn = connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            try:
+                cursor = conn.cursor()
+                existing = self._stored_instances(cursor, [recurring_event_id]).get(recurring_event_id, {})
+                wanted = {instance['event_date']: instance.get('event_time') or DEFAULT_EVENT_TIME
+                          for instance in instances}
+                summary = self._apply_instance_diff(cursor, recurring_event_id, existing, wanted)
+                conn.commit()
+            finally:
+                conn.close()
+
+            logger.info(f"Saved instances for recurring event {recurring_event_id}: {summary}")
+            return summary
 
         except Exception as e:
             logger.error(f"Failed to save instances: {e}")
             raise
 
+    def _stored_instances(self, cursor, event_ids: Optional[List[int]] = None) -> Dict[int, Dict[str, sqlite3.Row]]:
+        """Stored instance rows grouped by event, then keyed by date (all events when event_ids is None)"""
+        query = '''
+            SELECT id, recurring_event_id, event_date, event_time,
+                   COALESCE(is_completed, 0) OR COALESCE(is_overridden, 0) AS is_exception
+            FROM recurring_event_instances
+        '''
+        if event_ids is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query + f" WHERE recurring_event_id IN ({','.join('?' for _ in event_ids)})", event_ids)
+        stored: Dict[int, Dict[str, sqlite3.Row]] = {}
+        for row in cursor.fetchall():
+            stored.setdefault(row['recurring_event_id'], {})[row['event_date']] = row
+        return stored
+
+    def _apply_instance_diff(self, cursor, recurring_event_id: int, existing: Dict[str, sqlite3.Row],
+                             wanted: Dict[str, str]) -> Dict[str, int]:
+        """Insert, update and delete only the rows that differ; the caller commits"""
+        inserts = [(recurring_event_id, event_date, event_time)
+                   for event_date, event_time in wanted.items() if event_date not in existing]
+        updates = [(event_time, existing[event_date]['id'])
+                   for event_date, event_time in wanted.items()
+                   if event_date in existing and existing[event_date]['event_time'] != event_time]
+        deletes = [(row['id'],) for event_date, row in existing.items()
+                   if event_date not in wanted and not row['is_exception']]
+
+        cursor.executemany('''
+            INSERT INTO recurring_event_instances
+            (recurring_event_id, event_date, event_time, is_completed)
+            VALUES (?, ?, ?, 0)
+        ''', inserts)
+        cursor.executemany('''
+            UPDATE recurring_event_instances SET event_time = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', updates)
+        cursor.executemany('DELETE FROM recurring_event_instances WHERE id = ?', deletes)
+
+        return {
+            'inserted': len(inserts),
+            'updated': len(updates),
+            'deleted': len(deletes),
+            'kept': len(existing) - len(deletes) - len(updates),
+        }
+
+    def regenerate_all(self, months_ahead: int = 24, max_workers: Optional[int] = None,
+                       parallel_threshold: int = PARALLEL_EXPANSION_THRESHOLD) -> Dict:
+        """Regenerate the stored instances of every active recurring event in one pass.
+        
+        Events and patterns are read with one join, expanded (in a process
+        pool once there are at least `parallel_threshold` events) and written
+        as a diff in a single transaction.
+        
+        Args:
+            months_ahead: Number of months from today to generate (as generate_instances)
+            max_workers: Worker processes for parallel expansion (defaults to CPU count)
+            parallel_threshold: Event count from which expansion runs in worker processes
+            
+        Returns:
+            Dict: events, instances, inserted/updated/deleted/kept totals,
+                parallel flag, expand/write/total seconds and a by_pattern
+                breakdown of events, instances and expansion seconds
+        """
+        started = timer.perf_counter()
+        window_end = datetime.now().date() + timedelta(days=30 * months_ahead + 1)
+
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_EVENT_WITH_PATTERN + ' WHERE re.is_active = 1')
+            events = [dict(row) for row in cursor.fetchall()]
+            pattern_types = {event['id']: event['pattern_type'] for event in events}
+            rules = [(event['id'], rule_from_row(event)) for event in events]
+
+            expand_started = timer.perf_counter()
+            parallel = len(rules) >= parallel_threshold
+            if parallel:
+                workers = max_workers or os.cpu_count() or 1
+                chunk_size = max(1, len(rules) // (workers * 4))
+                chunks = [rules[i:i + chunk_size] for i in range(0, len(rules), chunk_size)]
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    expanded = [item for batch in pool.map(expand_batch, chunks, [window_end] * len(chunks))
+                                for item in batch]
+            else:
+                expanded = expand_batch(rules, window_end)
+            expand_seconds = timer.perf_counter() - expand_started
+
+            write_started = timer.perf_counter()
+            stored = self._stored_instances(cursor)
+            totals = {'inserted': 0, 'updated': 0, 'deleted': 0, 'kept': 0}
+            by_pattern: Dict[str, Dict] = {}
+            for event_id, dates, seconds in expanded:
+                wanted = {event_date: DEFAULT_EVENT_TIME for event_date in dates}
+                summary = self._apply_instance_diff(cursor, event_id, stored.get(event_id, {}), wanted)
+                for key, value in summary.items():
+                    totals[key] += value
+
+                stats = by_pattern.setdefault(pattern_types[event_id], {'events': 0, 'instances': 0, 'seconds': 0.0})
+                stats['events'] += 1
+                stats['instances'] += len(dates)
+                stats['seconds'] += seconds
+            conn.commit()
+            write_seconds = timer.perf_counter() - write_started
+        finally:
+            conn.close()
+
+        report = {
+            'events': len(events),
+            'instances': sum(stats['instances'] for stats in by_pattern.values()),
+            **totals,
+            'parallel': parallel,
+            'expand_seconds': expand_seconds,
+            'write_seconds': write_seconds,
+            'total_seconds': timer.perf_counter() - started,
+            'by_pattern': by_pattern,
+        }
+        logger.info(f"Regenerated {report['events']} recurring events ({report['instances']} instances) "
+                    f"in {report['total_seconds']:.2f}s")
+        return report
+
     def modify_single_instance(self, 
                               instance_id: int,
                               title: Optional[str] = None,
@@ -240,7 +483,7 @@ class RecurringEventManager:
             notes: Completion or modification notes
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = connect(self.db_path)
             cursor = conn.cursor()
 
             # Update instance with overrides
@@ -285,7 +528,7 @@ class RecurringEventManager:
             notes: Optional completion notes
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = connect(self.db_path)
             cursor = conn.cursor()
 
             cursor.execute('''
@@ -311,7 +554,7 @@ class RecurringEventManager:
             recurring_event_id: ID of the recurring event to delete
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = connect(self.db_path)
             cursor = conn.cursor()
 
             # Delete instances first (foreign key constraint)
@@ -436,120 +679,3 @@ class RecurringEventManager:
             desc += f" in {month_map.get(bymonth, str(bymonth))}"
 
         return desc
-
-    def _generate_daily_instances(self, start_date, end_date, window_end, frequency: int) -> List[Dict]:
-        """Generate daily recurring instances."""
-        instances = []
-        current = start_date
-        count = 0
-
-        while current <= window_end and (end_date is None or current <= end_date):
-            if current >= start_date:
-                instances.append({
-                    'event_date': current.isoformat(),
-                    'event_time': '09:00'
-                })
-            current += timedelta(days=frequency)
-
-        return instances
-
-    def _generate_weekly_instances(self, start_date, end_date, window_end, frequency: int,
-                                  byday: Optional[str]) -> List[Dict]:
-        """Generate weekly recurring instances."""
-        instances = []
-
-        # Parse byday string (MO,TU,WE,TH,FR,SA,SU)
-        day_map = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
-        target_days = set()
-
-        if byday:
-            for day in byday.split(','):
-                day = day.strip()
-                if day in day_map:
-                    target_days.add(day_map[day])
-        else:
-            # Default to start date's day of week
-            target_days.add(start_date.weekday())
-
-        current = start_date
-        while current <= window_end and (end_date is None or current <= end_date):
-            if current.weekday() in target_days:
-                instances.append({
-                    'event_date': current.isoformat(),
-                    'event_time': '09:00'
-                })
-            current += timedelta(days=1)
-
-        return instances
-
-    def _generate_monthly_instances(self, start_date, end_date, window_end, frequency: int,
-                                   bymonthday: Optional[int]) -> List[Dict]:
-        """Generate monthly recurring instances."""
-        instances = []
-        current = start_date
-        month_count = 0
-
-        target_day = bymonthday if bymonthday else start_date.day
-
-        while month_count < 240:  # Arbitrary limit
-            if current > window_end or (end_date and current > end_date):
-                break
-
-            # Calculate next month
-            try:
-                instance_date = current.replace(day=min(target_day, self._days_in_month(current)))
-                if instance_date >= start_date:
-                    instances.append({
-                        'event_date': instance_date.isoformat(),
-                        'event_time': '09:00'
-                    })
-            except ValueError:
-                pass
-
-            # Add months
-            month_count += frequency
-            year = current.year + (current.month + frequency - 1) // 12
-            month = ((current.month + frequency - 1) % 12) + 1
-            current = current.replace(year=year, month=month)
-
-        return instances
-
-    def _generate_yearly_instances(self, start_date, end_date, window_end, frequency: int,
-                                 bymonthday: Optional[int], bymonth: Optional[int]) -> List[Dict]:
-        """Generate yearly recurring instances."""
-        instances = []
-        year = start_date.year
-
-        target_day = bymonthday if bymonthday else start_date.day
-        target_month = bymonth if bymonth else start_date.month
-
-        while year <= window_end.year:
-            try:
-                instance_date = datetime(year, target_month, target_day).date()
-                if instance_date >= start_date and instance_date <= window_end:
-                    if end_date is None or instance_date <= end_date:
-                        instances.append({
-                            'event_date': instance_date.isoformat(),
-                            'event_time': '09:00'
-                        })
-            except ValueError:
-                pass
-
-            year += frequency
-
-        return instances
-
-    def _generate_rrule_instances(self, rrule_string: str, start_date, end_date,
-                                 window_end) -> List[Dict]:
-        """Generate instances from a custom RRULE string (simplified implementation)."""
-        # This is a simplified version - a full implementation would use the rrule library
-        # For now, treat it as a custom pattern and default to monthly
-        return self._generate_monthly_instances(start_date, end_date, window_end, 1, None)
-
-    def _days_in_month(self, date) -> int:
-        """Get number of days in a month."""
-        if date.month == 12:
-            next_month = date.replace(year=date.year + 1, month=1, day=1)
-        else:
-            next_month = date.replace(month=date.month + 1, day=1)
-        return (next_month - timedelta(days=1)).day
@@ -0,0 +1,165 @@
+"""
+Reminder Scheduler for Family Household Manager
+Fires notification reminders when they fall due from an in-memory heap,
+instead of polling notification_reminders on an interval, and periodically
+sweeps expired notifications so unread counts stay a single-row read.
+"""
+
+import time
+import heapq
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Seconds between expired-notification sweeps
+CLEANUP_INTERVAL = 15 * 60
+
+
+def _timestamp(reminder_time: Union[str, datetime]) -> float:
+    """Epoch seconds for a stored reminder_time (naive local ISO datetime)"""
+    if isinstance(reminder_time, str):
+        reminder_time = datetime.fromisoformat(reminder_time)
+    return reminder_time.timestamp()
+
+
+class ReminderScheduler:
+    """
+    Min-heap of pending reminders keyed by due time
+
+    Loaded once from notification_reminders, then kept in sync by
+    NotificationManager.create_reminder and dismiss_reminder. A single
+    thread sleeps until the earliest reminder is due, so nothing touches the
+    database between firings. Reminders that fell due while the app was down
+    fire immediately on start, oldest first.
+
+    The same thread runs NotificationManager.cleanup_expired_notifications
+    every cleanup_interval seconds (and on start), which also moves each
+    unread counter's next_expiry forward.
+    """
+
+    def __init__(self, manager, time_func=time.time, cleanup_interval: float = CLEANUP_INTERVAL):
+        self.manager = manager
+        self._time = time_func
+        self.cleanup_interval = cleanup_interval
+        self._next_cleanup = 0.0
+        self._heap: List[Tuple[float, int]] = []
+        # reminder_id -> due time of its live heap entry; entries that no
+        # longer match (cancelled or rescheduled) are skipped when popped
+        self._due: Dict[int, float] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def load(self) -> int:
+        """
+        Schedule every unsent, undismissed reminder from the database
+
+        Returns:
+            int: Number of reminders scheduled
+        """
+        reminders = self.manager.get_pending_reminders()
+        for reminder in reminders:
+            self.schedule(reminder['id'], reminder['reminder_time'])
+        logger.info(f"Loaded {len(reminders)} pending reminders")
+        return len(reminders)
+
+    def schedule(self, reminder_id: int, reminder_time: Union[str, datetime]):
+        """Add or move a reminder"""
+        due = _timestamp(reminder_time)
+        with self._condition:
+            self._due[reminder_id] = due
+            heapq.heappush(self._heap, (due, reminder_id))
+            # Wake the worker in case this is now the earliest reminder
+            self._condition.notify()
+
+    def cancel(self, reminder_id: int):
+        """Forget a reminder (its heap entry is discarded lazily)"""
+        with self._condition:
+            self._due.pop(reminder_id, None)
+
+    def pending(self) -> int:
+        """Number of reminders waiting to fire"""
+        with self._condition:
+            return len(self._due)
+
+    def next_due(self) -> Optional[float]:
+        """Epoch seconds of the earliest live reminder, or None"""
+        with self._condition:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def _discard_stale(self):
+        """Pop cancelled or superseded entries off the top of the heap (lock held)"""
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def run_pending(self) -> List[int]:
+        """
+        Send every reminder that is due now
+
+        Returns:
+            list: IDs of reminders that were sent
+        """
+        now = self._time()
+        due_ids = []
+        with self._condition:
+            self._discard_stale()
+            while self._heap and self._heap[0][0] <= now:
+                _, reminder_id = heapq.heappop(self._heap)
+                del self._due[reminder_id]
+                due_ids.append(reminder_id)
+                self._discard_stale()
+
+        return [reminder_id for reminder_id in due_ids if self.manager.send_reminder(reminder_id)]
+
+    def run_cleanup(self) -> int:
+        """
+        Delete expired notifications and schedule the next sweep
+
+        Returns:
+            int: Number of notifications deleted
+        """
+        with self._condition:
+            self._next_cleanup = self._time() + self.cleanup_interval
+        return self.manager.cleanup_expired_notifications()
+
+    def start(self):
+        """Load pending reminders and start the worker thread"""
+        if self._running:
+            return
+        self.load()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='ReminderScheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running:
+                    self._discard_stale()
+                    now = self._time()
+                    if (self._heap and self._heap[0][0] <= now) or self._next_cleanup <= now:
+                        break
+                    wake = min(self._heap[0][0], self._next_cleanup) if self._heap else self._next_cleanup
+                    self._condition.wait(wake - now)
+                if not self._running:
+                    return
+                cleanup_due = self._next_cleanup <= self._time()
+            try:
+                self.run_pending()
+                if cleanup_due:
+                    self.run_cleanup()
+            except Exception as e:
+                logger.error(f"Reminder scheduler error: {e}")
@@ -0,0 +1,184 @@
+"""
+Session caching for authenticated requests
+Keeps recently validated sessions in memory by token hash, and coalesces
+last_activity updates so they are written in periodic batches instead of
+once per request.
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# How long a validated session is trusted before user_sessions is consulted
+# again; bounds how late a logout from another process is noticed
+SESSION_CACHE_TTL_SECONDS = 60.0
+SESSION_CACHE_MAX_ENTRIES = 10000
+
+# last_activity is written at most this often per process
+ACTIVITY_FLUSH_SECONDS = 30.0
+# Flush early once this many sessions have pending activity
+ACTIVITY_BATCH_SIZE = 500
+
+
+class CachedSession(NamedTuple):
+    """A user_sessions row that was found active"""
+    session_id: int
+    user_id: int
+    expires_at: str
+    cached_until: float
+
+
+class SessionCache:
+    """TTL-bounded LRU of active sessions keyed by token hash"""
+
+    def __init__(self, ttl: float = SESSION_CACHE_TTL_SECONDS, max_entries: int = SESSION_CACHE_MAX_ENTRIES,
+                 time_func: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._time = time_func
+        self._sessions: 'OrderedDict[str, CachedSession]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token_hash: str) -> Optional[CachedSession]:
+        """
+        Return the cached session for a token hash
+
+        Entries past their cache TTL or their session expires_at are dropped.
+
+        Args:
+            token_hash: SHA-256 hex digest of the access token
+
+        Returns:
+            CachedSession or None on a miss
+        """
+        with self._lock:
+            session = self._sessions.get(token_hash)
+            if session is None:
+                return None
+            if session.cached_until <= self._time() or session.expires_at <= datetime.utcnow().isoformat():
+                del self._sessions[token_hash]
+                return None
+            self._sessions.move_to_end(token_hash)
+            return session
+
+    def put(self, token_hash: str, session_id: int, user_id: int, expires_at: str) -> CachedSession:
+        """Cache a session that was just validated against the database"""
+        session = CachedSession(session_id, user_id, expires_at, self._time() + self.ttl)
+        with self._lock:
+            self._sessions[token_hash] = session
+            self._sessions.move_to_end(token_hash)
+            while len(self._sessions) > self.max_entries:
+                self._sessions.popitem(last=False)
+        return session
+
+    def invalidate(self, token_hash: str):
+        """Forget one token (logout, refresh)"""
+        with self._lock:
+            self._sessions.pop(token_hash, None)
+
+    def invalidate_user(self, user_id: int):
+        """Forget every token of a user (password change, removal from family)"""
+        with self._lock:
+            for token_hash in [h for h, s in self._sessions.items() if s.user_id == user_id]:
+                del self._sessions[token_hash]
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+
+class ActivityRecorder:
+    """
+    Coalesces last_activity updates for user_sessions
+
+    touch() only records the latest time per session in memory; flush()
+    writes them all with one executemany, from a background thread every
+    flush_interval seconds or as soon as batch_size sessions are pending.
+    """
+
+    def __init__(self, connect: Callable, flush_interval: float = ACTIVITY_FLUSH_SECONDS,
+                 batch_size: int = ACTIVITY_BATCH_SIZE):
+        self._connect = connect
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._pending: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def touch(self, session_id: int, when: Optional[str] = None):
+        """Record activity on a session without writing it"""
+        with self._lock:
+            self._pending[session_id] = when or datetime.utcnow().isoformat()
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def discard(self, session_id: int):
+        """Drop pending activity for a session whose row was just written anyway"""
+        with self._lock:
+            self._pending.pop(session_id, None)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write all pending last_activity values
+
+        Returns:
+            int: Number of sessions written
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return 0
+
+        try:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    'UPDATE user_sessions SET last_activity = ? WHERE id = ?',
+                    [(when, session_id) for session_id, when in batch.items()]
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Failed to flush session activity: {e}")
+            # Put the batch back unless newer activity arrived meanwhile
+            with self._lock:
+                for session_id, when in batch.items():
+                    self._pending.setdefault(session_id, when)
+            return 0
+        return len(batch)
+
+    def start(self):
+        """Start the periodic flush thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='SessionActivityFlush', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the flush thread and write whatever is still pending"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
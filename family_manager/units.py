@@ -0,0 +1,288 @@
+"""
+Unit Conversion Engine for Family Household Manager
+Maps quantity units onto canonical base units (grams, millilitres, each)
+so inventory and shopping math compares like with like
+"""
+
+import sqlite3
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class Dimension:
+    """Physical dimension constants and their base units"""
+    MASS = "mass"
+    VOLUME = "volume"
+    COUNT = "count"
+
+
+BASE_UNITS = {
+    Dimension.MASS: "g",
+    Dimension.VOLUME: "ml",
+    Dimension.COUNT: "each",
+}
+
+# canonical unit -> (dimension, factor to base unit)
+UNIT_REGISTRY: Dict[str, Tuple[str, float]] = {
+    # Mass (base: grams)
+    'mg': (Dimension.MASS, 0.001),
+    'g': (Dimension.MASS, 1.0),
+    'kg': (Dimension.MASS, 1000.0),
+    'oz': (Dimension.MASS, 28.349523125),
+    'lb': (Dimension.MASS, 453.59237),
+    # Volume (base: millilitres)
+    'ml': (Dimension.VOLUME, 1.0),
+    'l': (Dimension.VOLUME, 1000.0),
+    'tsp': (Dimension.VOLUME, 4.92892159375),
+    'tbsp': (Dimension.VOLUME, 14.78676478125),
+    'fl oz': (Dimension.VOLUME, 29.5735295625),
+    'cup': (Dimension.VOLUME, 236.5882365),
+    'pint': (Dimension.VOLUME, 473.176473),
+    'quart': (Dimension.VOLUME, 946.352946),
+    'gal': (Dimension.VOLUME, 3785.411784),
+    # Count (base: each)
+    'each': (Dimension.COUNT, 1.0),
+    'pair': (Dimension.COUNT, 2.0),
+    'dozen': (Dimension.COUNT, 12.0),
+}
+
+# Spelling variants -> canonical unit
+UNIT_ALIASES: Dict[str, str] = {
+    'milligram': 'mg', 'milligrams': 'mg',
+    'gram': 'g', 'grams': 'g', 'gr': 'g',
+    'kilogram': 'kg', 'kilograms': 'kg', 'kgs': 'kg', 'kilo': 'kg', 'kilos': 'kg',
+    'ounce': 'oz', 'ounces': 'oz',
+    'lbs': 'lb', 'pound': 'lb', 'pounds': 'lb',
+    'milliliter': 'ml', 'milliliters': 'ml', 'millilitre': 'ml', 'millilitres': 'ml',
+    'liter': 'l', 'liters': 'l', 'litre': 'l', 'litres': 'l', 'ltr': 'l',
+    'teaspoon': 'tsp', 'teaspoons': 'tsp', 'tsps': 'tsp',
+    'tablespoon': 'tbsp', 'tablespoons': 'tbsp', 'tbsps': 'tbsp', 'tbs': 'tbsp',
+    'floz': 'fl oz', 'fl. oz': 'fl oz', 'fluid ounce': 'fl oz', 'fluid ounces': 'fl oz',
+    'cups': 'cup', 'c': 'cup',
+    'pints': 'pint', 'pt': 'pint',
+    'quarts': 'quart', 'qt': 'quart',
+    'gallon': 'gal', 'gallons': 'gal',
+    'ea': 'each', 'pc': 'each', 'pcs': 'each', 'piece': 'each', 'pieces': 'each',
+    'count': 'each', 'ct': 'each', 'unit': 'each', 'units': 'each', 'item': 'each', 'items': 'each',
+    'pairs': 'pair', 'doz': 'dozen', 'dozens': 'dozen',
+}
+
+# Friendly display steps per dimension, largest first
+_DISPLAY_UNITS = {
+    Dimension.MASS: [('kg', 1000.0), ('g', 1.0)],
+    Dimension.VOLUME: [('l', 1000.0), ('ml', 1.0)],
+    Dimension.COUNT: [('each', 1.0)],
+}
+
+
+def normalize_unit(unit: Optional[str]) -> str:
+    """Return the canonical spelling of a unit ('Lbs.' -> 'lb'); unknown units are lower-cased"""
+    if not unit:
+        return 'each'
+    key = ' '.join(str(unit).lower().strip().rstrip('.').split())
+    if key in UNIT_REGISTRY:
+        return key
+    return UNIT_ALIASES.get(key, key)
+
+
+def unit_info(unit: Optional[str]) -> Optional[Tuple[str, float]]:
+    """Return (dimension, factor) for a unit, or None if it is not registered"""
+    return UNIT_REGISTRY.get(normalize_unit(unit))
+
+
+def to_base(qty: float, unit: Optional[str]) -> Tuple[float, str]:
+    """
+    Convert a quantity into its canonical base unit
+
+    Unregistered units (e.g. 'box', 'bag') are kept as their own base so
+    they still aggregate with identical units but never with others.
+
+    Returns:
+        tuple: (base_qty, base_unit)
+    """
+    canonical = normalize_unit(unit)
+    info = UNIT_REGISTRY.get(canonical)
+    if info is None:
+        return float(qty or 0), canonical
+    dimension, factor = info
+    return float(qty or 0) * factor, BASE_UNITS[dimension]
+
+
+def are_compatible(unit_a: Optional[str], unit_b: Optional[str]) -> bool:
+    """Check whether two units can be converted into each other"""
+    return to_base(1, unit_a)[1] == to_base(1, unit_b)[1]
+
+
+def convert(qty: float, from_unit: Optional[str], to_unit: Optional[str]) -> float:
+    """
+    Convert a quantity between two compatible units
+
+    Raises:
+        ValueError: If the units measure different dimensions
+    """
+    base_qty, base_unit = to_base(qty, from_unit)
+    target_base, target_unit = to_base(1, to_unit)
+    if base_unit != target_unit:
+        raise ValueError(f"Cannot convert {from_unit!r} to {to_unit!r}")
+    return base_qty / target_base
+
+
+def to_base_many(quantities: Iterable[float], units: Iterable[Optional[str]]):
+    """
+    Vectorized conversion for bulk operations
+
+    Units are resolved once per distinct spelling and the multiplication is
+    done as a single NumPy operation when NumPy is available.
+
+    Returns:
+        tuple: (base quantities, base units) - an ndarray when NumPy is available, else a list
+    """
+    units = list(units)
+    resolved = {}
+    for unit in set(units):
+        canonical = normalize_unit(unit)
+        info = UNIT_REGISTRY.get(canonical)
+        resolved[unit] = (info[1], BASE_UNITS[info[0]]) if info else (1.0, canonical)
+
+    factors = [resolved[unit][0] for unit in units]
+    base_units = [resolved[unit][1] for unit in units]
+
+    if NUMPY_AVAILABLE:
+        qty_array = np.asarray(list(quantities), dtype=float)
+        return np.nan_to_num(qty_array) * np.asarray(factors, dtype=float), base_units
+
+    return [float(q or 0) * f for q, f in zip(quantities, factors)], base_units
+
+
+def format_quantity(base_qty: float, base_unit: str) -> str:
+    """Format a base quantity with a readable unit (1500 g -> '1.5 kg')"""
+    for dimension, base in BASE_UNITS.items():
+        if base == base_unit:
+            for display_unit, factor in _DISPLAY_UNITS[dimension]:
+                if abs(base_qty) >= factor:
+                    return f"{base_qty / factor:g} {display_unit}"
+            return f"{base_qty:g} {base_unit}"
+    return f"{base_qty:g} {base_unit}"
+
+
+def _sql_unit_key(column: str) -> str:
+    """SQL expression normalising a unit column exactly as normalize_unit() does before the alias lookup"""
+    key = f"LOWER(COALESCE(NULLIF({column}, ''), 'each'))"
+    for control in (9, 10, 11, 12, 13):
+        key = f"REPLACE({key}, CHAR({control}), ' ')"
+    key = f"TRIM(RTRIM(TRIM({key}), '.'))"
+    # Four passes collapse runs of up to 16 spaces, far more than any real unit has
+    for _ in range(4):
+        key = f"REPLACE({key}, '  ', ' ')"
+    return key
+
+
+def ensure_unit_schema(cursor: sqlite3.Cursor) -> None:
+    """
+    Add base-quantity columns to inventory and shopping_list and keep them in sync
+
+    A unit_registry table mirrors UNIT_REGISTRY/UNIT_ALIASES so SQLite
+    triggers can compute base_qty/base_unit on every insert or update,
+    whichever code path writes the row.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS unit_registry (
+            alias TEXT PRIMARY KEY,
+            unit TEXT NOT NULL,
+            dimension TEXT NOT NULL,
+            base_unit TEXT NOT NULL,
+            factor REAL NOT NULL
+        )
+    ''')
+    registry_rows = []
+    for alias in list(UNIT_REGISTRY) + list(UNIT_ALIASES):
+        canonical = normalize_unit(alias)
+        dimension, factor = UNIT_REGISTRY[canonical]
+        registry_rows.append((alias, canonical, dimension, BASE_UNITS[dimension], factor))
+    cursor.executemany('''
+        INSERT OR REPLACE INTO unit_registry (alias, unit, dimension, base_unit, factor)
+        VALUES (?, ?, ?, ?, ?)
+    ''', registry_rows)
+
+    for table in ('inventory', 'shopping_list'):
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+        if not cursor.fetchone():
+            continue
+
+        cursor.execute(f"PRAGMA table_info({table})")
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'unit' not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN unit TEXT DEFAULT 'each'")
+        if 'base_qty' not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN base_qty REAL")
+        if 'base_unit' not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN base_unit TEXT")
+
+        # SQL mirror of to_base(): unknown units are their own base
+        unit_key = _sql_unit_key('NEW.unit')
+        sync_sql = f'''
+            UPDATE {table} SET
+                base_qty = COALESCE(NEW.qty, 0) * COALESCE(
+                    (SELECT factor FROM unit_registry WHERE alias = {unit_key}), 1),
+                base_unit = COALESCE(
+                    (SELECT base_unit FROM unit_registry WHERE alias = {unit_key}), {unit_key})
+            WHERE id = NEW.id;
+        '''
+        triggers = {
+            f"trg_{table}_base_qty_insert": f"AFTER INSERT ON {table}",
+            f"trg_{table}_base_qty_update": f"AFTER UPDATE OF qty, unit ON {table}",
+        }
+        outdated = False
+        for name, event in triggers.items():
+            statement = f"CREATE TRIGGER {name} {event} BEGIN {sync_sql} END"
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,))
+            existing = cursor.fetchone()
+            if existing and existing[0] == statement:
+                continue
+            # Triggers from older versions only lower-cased and trimmed the unit
+            outdated = outdated or existing is not None
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(statement)
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_base_unit ON {table}(base_unit)")
+
+        if outdated:
+            cursor.execute(f"UPDATE {table} SET base_unit = NULL")
+
+        backfill_base_quantities(cursor, table)
+
+
+def backfill_base_quantities(cursor: sqlite3.Cursor, table: str) -> int:
+    """Compute base_qty/base_unit for rows written before the triggers existed"""
+    cursor.execute(f"SELECT id, qty, unit FROM {table} WHERE base_unit IS NULL")
+    rows = cursor.fetchall()
+    if not rows:
+        return 0
+
+    ids = [row[0] for row in rows]
+    base_qtys, base_units = to_base_many([row[1] for row in rows], [row[2] for row in rows])
+    cursor.executemany(
+        f"UPDATE {table} SET base_qty = ?, base_unit = ? WHERE id = ?",
+        [(float(q), u, i) for q, u, i in zip(base_qtys, base_units, ids)]
+    )
+    logger.info(f"Backfilled base quantities for {len(rows)} {table} rows")
+    return len(rows)
+
+
+def sum_by_base_unit(rows: Iterable[Tuple[float, Optional[str]]]) -> List[Tuple[float, str]]:
+    """Sum (qty, unit) pairs into one total per base unit"""
+    rows = list(rows)
+    if not rows:
+        return []
+    base_qtys, base_units = to_base_many([r[0] for r in rows], [r[1] for r in rows])
+    totals: Dict[str, float] = {}
+    for qty, base_unit in zip(base_qtys, base_units):
+        totals[base_unit] = totals.get(base_unit, 0.0) + float(qty)
+    return [(total, unit) for unit, total in totals.items()]
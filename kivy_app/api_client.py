@@ -20,6 +20,99 @@ logger = logging.getLogger(__name__)
 REQUEST_TIMEOUT = 8  # Increased to 8 seconds for slower connections
 CONNECT_TIMEOUT = 5   # Connection attempt timeout
 RETRY_DELAY = 2       # Delay between retries (seconds)
+STREAM_READ_TIMEOUT = 45  # Server sends a keep-alive every 15 seconds
+STREAM_MAX_BACKOFF = 60   # Longest wait between stream reconnects (seconds)
+
+
+class NotificationStream:
+    """
+    Holds one server-sent events connection to /api/notifications/stream
+    Replaces the notification and unread-count polling loops; reconnects with
+    backoff and resumes from the last notification id it saw.
+    """
+
+    def __init__(self, api_client: 'APIClient', recipient_id: int = 1,
+                 on_notification=None, on_unread_count=None, on_status=None):
+        self.api_client = api_client
+        self.recipient_id = recipient_id
+        self.on_notification = on_notification
+        self.on_unread_count = on_unread_count
+        self.on_status = on_status
+        self.connected = False
+        self.last_event_id = None
+        self._running = False
+        self._response = None
+
+    def start(self):
+        """Start streaming on a background thread"""
+        if not self._running:
+            self._running = True
+            Thread(target=self._run, daemon=True).start()
+
+    def stop(self):
+        """Stop streaming and close the connection"""
+        self._running = False
+        if self._response is not None:
+            self._response.close()
+
+    def _set_connected(self, connected: bool):
+        if connected != self.connected:
+            self.connected = connected
+            self.api_client.is_online = connected
+            if self.on_status:
+                self.on_status(connected)
+
+    def _run(self):
+        backoff = RETRY_DELAY
+        while self._running:
+            try:
+                headers = {'Accept': 'text/event-stream'}
+                if self.last_event_id is not None:
+                    headers['Last-Event-ID'] = str(self.last_event_id)
+                self._response = self.api_client.session.get(
+                    f"{self.api_client.base_url}/api/notifications/stream",
+                    params={'recipient_id': self.recipient_id}, headers=headers,
+                    stream=True, timeout=(CONNECT_TIMEOUT, STREAM_READ_TIMEOUT)
+                )
+                self._response.raise_for_status()
+                self._set_connected(True)
+                backoff = RETRY_DELAY
+                self._consume(self._response.iter_lines(decode_unicode=True))
+            except Exception as e:
+                if self._running:
+                    logger.warning(f"Notification stream dropped: {e}")
+            finally:
+                self._response = None
+            self._set_connected(False)
+            if self._running:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, STREAM_MAX_BACKOFF)
+
+    def _consume(self, lines):
+        """Parse SSE frames and dispatch them"""
+        data = []
+        for line in lines:
+            if not self._running:
+                return
+            if line:
+                if line.startswith('data:'):
+                    data.append(line[5:].strip())
+                elif line.startswith('id:'):
+                    self.last_event_id = int(line[3:].strip())
+                continue
+            if data:
+                self._dispatch(json.loads('\n'.join(data)))
+                data = []
+
+    def _dispatch(self, event: Dict):
+        if event.get('type') == 'notification':
+            # Cached feed pages are stale once something new arrives
+            self.api_client.invalidate_cache('notifications')
+            if self.on_notification:
+                self.on_notification(event['notification'])
+        elif event.get('type') == 'unread_count':
+            if self.on_unread_count:
+                self.on_unread_count(event['unread_count'])
 
 
 class APIClient:
@@ -35,6 +128,7 @@ class APIClient:
         self.lock = Lock()
         self.is_online = False
         self.last_sync = None
+        self.notification_stream = None
 
         # Initialize cache database
         self._init_cache_db()
@@ -81,6 +175,10 @@ class APIClient:
     def _check_connectivity(self):
         """Periodically check server connectivity"""
         while True:
+            # An open notification stream already proves the server is reachable
+            if self.notification_stream is not None and self.notification_stream.connected:
+                time.sleep(30)
+                continue
             try:
                 response = self.session.get(
                     f"{self.base_url}/api/inventory",
@@ -169,6 +267,16 @@ class APIClient:
         except Exception as e:
             logger.error(f"Cache write error: {e}")
 
+    def invalidate_cache(self, endpoint_prefix: str):
+        """Drop cached responses for endpoints starting with a prefix"""
+        try:
+            conn = sqlite3.connect(self.cache_db)
+            conn.execute('DELETE FROM api_cache WHERE endpoint LIKE ?', (endpoint_prefix + '%',))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Cache invalidation error: {e}")
+
     def get_with_cache(self, endpoint: str, params: Optional[Dict] = None, cache_ttl: int = 60) -> Optional[Dict]:
         """GET request with automatic caching"""
         cache_key = self._get_cache_key(endpoint, params)
@@ -500,9 +608,12 @@ class APIClient:
     # NOTIFICATIONS ENDPOINTS
     # ==========================================
 
-    def get_notifications(self, unread_only: bool = False) -> List[Dict]:
-        """Get notifications"""
+    def get_notifications(self, unread_only: bool = False, before: Optional[Dict] = None) -> List[Dict]:
+        """Get notifications, newest first; pass the last item of a page as `before` for the next page"""
         params = {'unread_only': 'true' if unread_only else 'false'}
+        if before:
+            params['before_created_at'] = before.get('created_at')
+            params['before_id'] = before.get('id')
         result = self.get_with_cache('notifications', params=params, cache_ttl=10)
         return result if isinstance(result, list) else []
 
@@ -516,6 +627,20 @@ class APIClient:
         result = self.get_with_cache('notifications/unread-count', cache_ttl=5)
         return result.get('unread_count', 0) if result else 0
 
+    def open_notification_stream(self, recipient_id: int = 1, on_notification=None,
+                                 on_unread_count=None, on_status=None) -> NotificationStream:
+        """
+        Start pushing notifications and unread counts instead of polling
+
+        Callbacks run on the stream's background thread.
+        """
+        if self.notification_stream is not None:
+            self.notification_stream.stop()
+        self.notification_stream = NotificationStream(self, recipient_id, on_notification,
+                                                      on_unread_count, on_status)
+        self.notification_stream.start()
+        return self.notification_stream
+
     def clear_notification(self, notification_id: int) -> bool:
         """Delete notification"""
         return self.request('DELETE', f'notifications/{notification_id}', require_sync=True) is not None
@@ -125,13 +125,17 @@ class OfflineIndicator(Label):
         self.padding = dp(8)
         self.is_online = True
         
-        # Start monitoring connectivity
-        Clock.schedule_interval(self._check_connectivity, 5)  # Check every 5 seconds
+        # Check once; after that the notification stream reports status changes
+        Clock.schedule_once(self._check_connectivity, 0)
     
     def _check_connectivity(self, dt):
-        """Periodically check connectivity"""
+        """Check connectivity once at startup"""
+        self.set_online(ConnectivityManager.is_online())
+    
+    def set_online(self, is_online: bool):
+        """Update the indicator (call on the main thread)"""
         was_online = self.is_online
-        self.is_online = ConnectivityManager.is_online()
+        self.is_online = is_online
         
         if self.is_online:
             self.text = '🟢 Online'
@@ -252,7 +256,10 @@ class DashboardScreen(Screen):
         self.family_card.children[0].children[1].text = f"{len(family)} members"
         
         # Get unread notifications
-        unread = self.api_client.get_unread_count()
+        self.set_unread_count(self.api_client.get_unread_count())
+    
+    def set_unread_count(self, unread: int):
+        """Update the notifications card (pushed by the notification stream)"""
         self.notifications_card.children[0].children[1].text = f"{unread} unread"
     
     def _go_to_inventory(self):
@@ -614,6 +621,15 @@ class NotificationsScreen(Screen):
             notif_card = self._create_notification_card(notif)
             self.notif_layout.add_widget(notif_card)
     
+    def add_notification(self, notif: dict):
+        """Show a pushed notification at the top of the list"""
+        if not self.notif_layout.children:
+            return  # Not loaded yet; on_enter fetches the full list
+        if len(self.notif_layout.children) == 1 and isinstance(self.notif_layout.children[0], Label):
+            self.notif_layout.clear_widgets()  # Replace the "No notifications" placeholder
+        self.notif_layout.add_widget(self._create_notification_card(notif),
+                                     index=len(self.notif_layout.children))
+    
     def _create_notification_card(self, notif: dict) -> ModernCard:
         """Create notification card"""
         card = ModernCard(size_hint_y=None, height=dp(100))
@@ -1299,12 +1315,14 @@ class FamilyManagerApp(App):
         sm = ScreenManager(transition=FadeTransition())
         
         # Add all screens (10 total)
-        sm.add_widget(DashboardScreen(self.api_client))
+        self.dashboard = DashboardScreen(self.api_client)
+        self.notifications_screen = NotificationsScreen(self.api_client)
+        sm.add_widget(self.dashboard)
         sm.add_widget(InventoryScreen(self.api_client))
         sm.add_widget(ShoppingScreen(self.api_client))
         sm.add_widget(ChoresScreen(self.api_client))
         sm.add_widget(TasksScreen(self.api_client))
-        sm.add_widget(NotificationsScreen(self.api_client))
+        sm.add_widget(self.notifications_screen)
         sm.add_widget(BillsScreen(self.api_client))
         sm.add_widget(MealsScreen(self.api_client))
         sm.add_widget(FamilyScreen(self.api_client))
@@ -1313,7 +1331,22 @@ class FamilyManagerApp(App):
         # Set initial screen
         sm.current = 'dashboard'
         
+        # One pushed stream replaces the notification and connectivity polling
+        self.api_client.open_notification_stream(
+            on_notification=lambda notif: Clock.schedule_once(
+                lambda dt: self.notifications_screen.add_notification(notif), 0),
+            on_unread_count=lambda count: Clock.schedule_once(
+                lambda dt: self.dashboard.set_unread_count(count), 0),
+            on_status=lambda online: Clock.schedule_once(
+                lambda dt: self.dashboard.offline_indicator.set_online(online), 0),
+        )
+        
         return sm
+    
+    def on_stop(self):
+        """Close the notification stream"""
+        if self.api_client.notification_stream is not None:
+            self.api_client.notification_stream.stop()
 
 
 if __name__ == '__main__':
@@ -97,6 +97,70 @@ def mock_ai_config():
         }
     }
 
+# Tables used by the notification, trigger and reminder modules
+NOTIFICATION_SCHEMA = '''
+    CREATE TABLE family_members (id INTEGER PRIMARY KEY, name TEXT, role TEXT);
+    CREATE TABLE notification_settings (
+        id INTEGER PRIMARY KEY, user_id INTEGER UNIQUE,
+        reminder_enabled INTEGER DEFAULT 1, alert_enabled INTEGER DEFAULT 1,
+        task_assigned_enabled INTEGER DEFAULT 1, chore_due_enabled INTEGER DEFAULT 1,
+        event_upcoming_enabled INTEGER DEFAULT 1, bill_due_enabled INTEGER DEFAULT 1,
+        inventory_low_enabled INTEGER DEFAULT 1, recurring_event_enabled INTEGER DEFAULT 1,
+        advance_warning_hours INTEGER DEFAULT 24, notification_method TEXT DEFAULT 'in-app',
+        quiet_hours_enabled INTEGER DEFAULT 0, quiet_hours_start TEXT, quiet_hours_end TEXT,
+        updated_at TEXT
+    );
+    CREATE TABLE notifications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, notification_type TEXT, recipient_id INTEGER,
+        title TEXT, message TEXT, priority TEXT DEFAULT 'normal',
+        source_entity_type TEXT, source_entity_id INTEGER, action_url TEXT,
+        scheduled_for TEXT, expires_at TEXT, is_read INTEGER DEFAULT 0, read_at TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE notification_reminders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, recipient_id INTEGER, event_type TEXT,
+        event_id INTEGER, event_title TEXT, event_date TEXT, event_time TEXT,
+        reminder_time TEXT, is_sent INTEGER DEFAULT 0, sent_at TEXT,
+        is_dismissed INTEGER DEFAULT 0, dismissed_at TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE chores (id INTEGER PRIMARY KEY, name TEXT, assignee_id INTEGER,
+                         status TEXT, due_date TEXT, due_time TEXT);
+    CREATE TABLE projects (id INTEGER PRIMARY KEY, name TEXT);
+    CREATE TABLE tasks (id INTEGER PRIMARY KEY, title TEXT, project_id INTEGER, status TEXT,
+                        due_date TEXT, assigned_to_id INTEGER, priority INTEGER);
+    CREATE TABLE bills (id INTEGER PRIMARY KEY, name TEXT, amount REAL, due_date TEXT, paid INTEGER DEFAULT 0);
+    CREATE TABLE inventory (id INTEGER PRIMARY KEY, name TEXT, qty REAL);
+    CREATE TABLE recurring_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, color TEXT, category TEXT,
+        pattern_type TEXT, start_date TEXT, end_date TEXT, rrule_string TEXT, created_by INTEGER,
+        is_active INTEGER DEFAULT 1
+    );
+    CREATE TABLE recurring_patterns (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, recurring_event_id INTEGER, frequency INTEGER DEFAULT 1,
+        byday TEXT, bymonthday INTEGER, bymonth INTEGER, count INTEGER, interval_description TEXT
+    );
+    CREATE TABLE recurring_event_instances (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, recurring_event_id INTEGER, event_date TEXT, event_time TEXT,
+        is_completed INTEGER DEFAULT 0, completion_date TEXT, completion_notes TEXT,
+        is_overridden INTEGER DEFAULT 0, override_title TEXT, override_description TEXT,
+        override_color TEXT, override_notes TEXT, updated_at TEXT
+    );
+'''
+
+@pytest.fixture
+def notification_db_path(tmp_path):
+    """Database with the notification schema, two admins and one member, all with default settings"""
+    db_path = str(tmp_path / 'notifications.db')
+    conn = sqlite3.connect(db_path)
+    conn.executescript(NOTIFICATION_SCHEMA)
+    conn.executemany("INSERT INTO family_members (id, name, role) VALUES (?, ?, ?)",
+                     [(1, 'Alex', 'admin'), (2, 'Sam', 'admin'), (3, 'Kid', 'member')])
+    conn.executemany("INSERT INTO notification_settings (user_id) VALUES (?)", [(1,), (2,), (3,)])
+    conn.commit()
+    conn.close()
+    return db_path
+
 @pytest.fixture(autouse=True)
 def setup_test_environment(monkeypatch):
     """Setup test environment variables and configurations"""
@@ -0,0 +1,71 @@
+"""
+Unit tests for the memoized analytics service
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from analytics_service import AnalyticsService
+
+
+def make_db(tmp_path):
+    path = str(tmp_path / 'analytics.db')
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE expenses (id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL,
+                               description TEXT NOT NULL, amount REAL NOT NULL, category TEXT);
+        CREATE TABLE budgets (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, category TEXT, amount REAL,
+                              period TEXT, start_date TEXT, end_date TEXT, is_active INTEGER DEFAULT 1);
+        CREATE TABLE inventory (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, total_cost REAL);
+        CREATE TABLE bills (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, amount REAL, paid INTEGER);
+        INSERT INTO expenses (date, description, amount, category) VALUES
+            ('2024-01-05', 'Groceries', 80, 'Food'), ('2024-01-20', 'Gas', 40, 'Fuel'),
+            ('2024-02-03', 'Takeaway', 25, 'Food');
+        INSERT INTO budgets (name, category, amount, period) VALUES ('Food budget', 'Food', 100, 'monthly');
+        INSERT INTO bills (name, amount, paid) VALUES ('Rent', 900, 0), ('Power', 60, 1);
+    ''')
+    conn.commit()
+    conn.close()
+    return path
+
+
+def add_expense(path, date, amount, category):
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO expenses (date, description, amount, category) VALUES (?, 'x', ?, ?)",
+                 (date, amount, category))
+    conn.commit()
+    conn.close()
+
+
+class TestAnalyticsService:
+    """Test memoization per snapshot and the shared figures"""
+
+    def test_results_are_shared_until_a_commit(self, tmp_path):
+        path = make_db(tmp_path)
+        service = AnalyticsService(path)
+
+        assert service.monthly_totals('2024-01-01', '2024-02-29') == [('2024-01', 120.0, 2), ('2024-02', 25.0, 1)]
+        # A second dialog asking for the same frame is served from the cache
+        service.monthly_totals('2024-01-01', '2024-02-29')
+        assert service.cache_info()['hits'] == 1 and service.cache_info()['misses'] == 1
+
+        add_expense(path, '2024-02-10', 10, 'Fuel')
+        assert service.month_total('2024-02') == (35.0, 2)
+        assert service.monthly_totals('2024-01-01', '2024-02-29')[-1] == ('2024-02', 35.0, 2)
+        assert service.cache_info()['misses'] == 3
+        service.close()
+
+    def test_callers_cannot_mutate_shared_results(self, tmp_path):
+        service = AnalyticsService(make_db(tmp_path))
+        budgets = service.budget_performance('2024-01')
+        assert budgets[0]['spent'] == 80 and budgets[0]['remaining'] == 20
+        budgets[0]['spent'] = 0
+        budgets.clear()
+        assert service.budget_performance('2024-01')[0]['spent'] == 80
+
+        assert service.bills_summary() == {'total': 960, 'count': 2, 'unpaid': 900}
+        assert service.inventory_value() == 0
+        service.close()
@@ -0,0 +1,135 @@
+"""
+Unit tests for background dialog loading
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('PyQt6')
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from PyQt6.QtCore import QCoreApplication, QObject
+
+import dialog_loader
+from dialog_loader import DialogLoader, wait_for_workers
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def loader(app):
+    parent = QObject()
+    loader = DialogLoader(parent)
+    done = []
+    loader.all_loaded.connect(done.append)
+    loader.done = done
+    yield loader
+    loader.cancel()
+    wait_for_workers()
+    app.processEvents()
+
+
+def run_until(app, condition, timeout=5.0):
+    """Process queued signals until condition() holds"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the loader"
+        app.processEvents()
+        time.sleep(0.005)
+
+
+class TestDialogLoader:
+    """Test generations, cancellation, derived sections and shutdown"""
+
+    def test_reload_drops_stale_result(self, app, loader):
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                release.wait(5)
+                return 'stale'
+            return 'fresh'
+
+        applied = []
+        loader.add('totals', compute, applied.append)
+        loader.start()
+        run_until(app, lambda: calls)
+        loader.start(['totals'])
+        run_until(app, lambda: loader.done)
+
+        release.set()
+        wait_for_workers()
+        app.processEvents()
+        assert applied == ['fresh']
+        assert loader.results == {'totals': 'fresh'} and loader.done == [True]
+
+    def test_cancel_ignores_late_results(self, app, loader):
+        release = threading.Event()
+        applied = []
+        loader.add('totals', lambda: release.wait(5) and 'late', applied.append)
+        loader.start()
+        assert loader.is_loading
+
+        loader.cancel()
+        release.set()
+        wait_for_workers()
+        app.processEvents()
+        assert applied == [] and loader.results == {} and loader.done == []
+        assert not loader.is_loading
+
+    def test_derived_section_gets_requires_in_order(self, app, loader):
+        order = []
+        loader.add('summary', apply=lambda expenses, income: order.append(('summary', expenses, income)),
+                   requires=('expenses', 'income'))
+        loader.add('income', lambda: 300, lambda value: order.append(('income', value)))
+        loader.add('expenses', lambda: 120, lambda value: order.append(('expenses', value)))
+        loader.start()
+        run_until(app, lambda: loader.done)
+
+        assert order[-1] == ('summary', 120, 300)
+        assert loader.results['summary'] == (120, 300) and loader.done == [True]
+
+        # Reloading a required section reloads what is derived from it
+        order.clear()
+        loader.start(['income'])
+        run_until(app, lambda: len(loader.done) == 2)
+        assert order == [('income', 300), ('summary', 120, 300)]
+
+    def test_failed_requirement_fails_derived_section(self, app, loader):
+        def broken():
+            raise ValueError("database is locked")
+
+        failures = []
+        loader.section_failed.connect(lambda key, error: failures.append(key))
+        loader.add('expenses', broken)
+        loader.add('income', lambda: 300)
+        loader.add('summary', apply=lambda *values: None, requires=('expenses', 'income'))
+        loader.start()
+        run_until(app, lambda: loader.done)
+
+        assert loader.errors == {'expenses': 'database is locked', 'summary': 'expenses unavailable'}
+        assert sorted(failures) == ['expenses', 'summary']
+        assert loader.results == {'income': 300} and loader.done == [False]
+
+    def test_wait_for_workers_cancels_and_joins(self, app, loader):
+        applied = []
+        loader.add('slow', lambda: time.sleep(0.2) or 'done', applied.append)
+        loader.start()
+        with dialog_loader._active_workers_lock:
+            workers = [worker for worker in dialog_loader._active_workers if worker.key == 'slow']
+        assert len(workers) == 1
+
+        wait_for_workers(timeout_ms=2000)
+        assert workers[0].isFinished() and workers[0].token.cancelled
+        app.processEvents()
+        assert applied == []
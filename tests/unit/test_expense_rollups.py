@@ -0,0 +1,115 @@
+"""
+Unit tests for trigger-maintained expense rollups
+"""
+
+import sys
+import random
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from expense_rollups import (
+    category_totals, ensure_expense_rollups, month_category_totals, monthly_totals,
+    rebuild_expense_rollups, spending_anomalies, total_spent, weekday_totals, weekly_totals
+)
+
+
+def make_db(expenses=()):
+    conn = sqlite3.connect(':memory:')
+    conn.execute('''
+        CREATE TABLE expenses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL, description TEXT NOT NULL,
+            amount REAL NOT NULL, category TEXT
+        )
+    ''')
+    conn.executemany("INSERT INTO expenses (date, description, amount, category) VALUES (?, 'x', ?, ?)", expenses)
+    ensure_expense_rollups(conn.cursor())
+    return conn
+
+
+def rollups(conn):
+    return conn.execute(
+        "SELECT period, period_start, category, ROUND(total, 2), count FROM expense_rollups ORDER BY 1, 2, 3"
+    ).fetchall()
+
+
+class TestExpenseRollups:
+    """Test trigger maintenance and range queries against raw GROUP BYs"""
+
+    def test_triggers_match_rebuild(self):
+        conn = make_db([('2024-01-31', 10.0, 'Food'), ('2024-02-01', 5.0, None)])
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO expenses (date, description, amount, category) VALUES ('2024-02-05', 'x', 7.5, 'Food')")
+        cursor.execute("UPDATE expenses SET category = 'Fuel', amount = 12 WHERE id = 1")
+        cursor.execute("UPDATE expenses SET date = '2024-03-10' WHERE id = 3")
+        cursor.execute("DELETE FROM expenses WHERE id = 2")
+
+        incremental = rollups(conn)
+        rebuild_expense_rollups(cursor)
+        assert incremental == rollups(conn)
+        assert ('month', '2024-01-01', 'Fuel', 12.0, 1) in incremental
+        # Emptied rows are pruned, not left at zero
+        assert not any(row[4] == 0 for row in incremental)
+
+    def test_weeks_start_monday_and_weekdays(self):
+        # 2024-01-07 is a Sunday, 2024-01-08 a Monday
+        conn = make_db([('2024-01-07', 4.0, 'A'), ('2024-01-08', 6.0, 'A'), ('2024-01-09', 1.0, 'B')])
+        cursor = conn.cursor()
+        assert weekly_totals(cursor, '2024-01-01', '2024-01-31') == [('2024-01-01', 4.0, 1), ('2024-01-08', 7.0, 2)]
+        assert weekday_totals(cursor, '2024-01-01', '2024-01-31') == [(0, 4.0, 1), (1, 6.0, 1), (2, 1.0, 1)]
+
+    def test_ranges_match_raw_aggregation(self):
+        rng = random.Random(7)
+        start = date(2021, 1, 1)
+        expenses = [((start + timedelta(days=rng.randrange(3 * 365))).isoformat(), round(rng.uniform(1, 200), 2),
+                     rng.choice(['Food', 'Fuel', 'Fun', None])) for _ in range(2000)]
+        conn = make_db(expenses)
+        cursor = conn.cursor()
+
+        for date_from, date_to in [('2021-03-15', '2023-10-04'), ('2022-02-01', '2022-02-28'),
+                                   ('2022-05-10', '2022-05-20'), ('2020-01-01', '2030-12-31')]:
+            raw_total, raw_count = cursor.execute(
+                "SELECT SUM(amount), COUNT(*) FROM expenses WHERE date BETWEEN ? AND ?", (date_from, date_to)
+            ).fetchone()
+            total, count = total_spent(cursor, date_from, date_to)
+            assert count == raw_count and round(total, 2) == round(raw_total, 2)
+
+            raw_months = cursor.execute(
+                "SELECT strftime('%Y-%m', date), ROUND(SUM(amount), 2), COUNT(*) FROM expenses "
+                "WHERE date BETWEEN ? AND ? GROUP BY 1 ORDER BY 1", (date_from, date_to)
+            ).fetchall()
+            assert [(m, round(t, 2), n) for m, t, n in monthly_totals(cursor, date_from, date_to)] == raw_months
+
+            raw_categories = dict(cursor.execute(
+                "SELECT category, COUNT(*) FROM expenses WHERE date BETWEEN ? AND ? GROUP BY category",
+                (date_from, date_to)
+            ).fetchall())
+            assert {c: n for c, _, n in category_totals(cursor, date_from, date_to)} == raw_categories
+            assert sum(row[3] for row in month_category_totals(cursor, date_from, date_to)) == raw_count
+
+    def test_multi_year_range_reads_month_rows(self):
+        conn = make_db([((date(2020, 1, 1) + timedelta(days=i)).isoformat(), 1.0, 'Food') for i in range(4 * 365)])
+        statements = []
+        conn.set_trace_callback(statements.append)
+        # 2020-01-15 .. 2023-06-10: day rows only for the two ragged months
+        assert total_spent(conn.cursor(), '2020-01-15', '2023-06-10') == (1243.0, 1243)
+        assert len(statements) == 1
+        plan = conn.execute("EXPLAIN QUERY PLAN " + statements[0].replace('?', "'2020-01-01'")).fetchall()
+        assert all('SCAN' not in row[3] for row in plan)
+
+    def test_spending_anomalies_against_category_history(self):
+        history = [(f'2024-0{month}-10', 50.0, 'Food') for month in range(1, 6)]
+        history += [(f'2024-0{month}-12', 20.0, None) for month in range(1, 6)]
+        conn = make_db(history + [('2024-06-03', 60.0, 'Food'), ('2024-06-04', 150.0, 'Food'),
+                                  ('2024-06-05', 45.0, None), ('2024-06-06', 200.0, 'Travel'),
+                                  ('2024-06-07', 30.0, 'Travel')])
+
+        anomalies = spending_anomalies(conn.cursor(), '2024-06-01', '2024-01-01')
+        assert [(a['date'], a['type'], round(a['deviation'])) for a in anomalies] == [
+            ('2024-06-06', 'new_category', 471),  # overall average expense is 35
+            ('2024-06-04', 'high_amount', 200),
+            ('2024-06-05', 'high_amount', 125),
+        ]
+        assert spending_anomalies(conn.cursor(), '2024-01-01', '2023-06-01') == []
@@ -0,0 +1,91 @@
+"""
+Unit tests for vectorized expense forecasting
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from forecasting import (
+    ExpenseSeries, forecast_all, forecast_matrix, interval_confidence, month_over_month_change, skip_months
+)
+
+
+class TestForecasting:
+    """Test the series matrix, trend/seasonal fit and prediction intervals"""
+
+    def test_rows_and_expenses_build_the_same_matrix(self):
+        series = ExpenseSeries.from_expenses(
+            ['2024-01-05', '2024-01-20', '2024-03-02', '2024-03-09'], [80, 40, 25, 5], ['Food', 'Fuel', 'Food', None]
+        )
+        assert series.months == ['2024-01', '2024-02', '2024-03']
+        assert series.categories == ['Food', 'Fuel', 'Uncategorized']
+        # February had no spending but still gets a column
+        assert series.monthly_total.tolist() == [120, 0, 30]
+
+        from_rows = ExpenseSeries.from_rows([('2024-01', 'Food', 80, 1), ('2024-01', 'Fuel', 40, 1),
+                                             ('2024-03', 'Food', 25, 1), ('2024-03', None, 5, 1)])
+        assert np.array_equal(from_rows.totals, series.totals)
+        assert np.array_equal(from_rows.counts, series.counts)
+        assert month_over_month_change(series) == 0.0
+
+    def test_linear_trend_is_projected_exactly(self):
+        rows = [(f"2024-{m:02d}", 'Food', 100 + 10 * m, 1) for m in range(1, 7)]
+        forecast = forecast_all(ExpenseSeries.from_rows(rows), horizon=2)
+        food = forecast['categories']['Food']
+        assert food.months == ['2024-07', '2024-08']
+        assert np.allclose(food.predicted, [170, 180])
+        assert food.slope == 10 and not food.seasonal
+        # A perfect fit leaves no residual spread
+        assert np.allclose(food.lower, food.upper) and np.allclose(interval_confidence(food), 1)
+
+    def test_seasonality_and_intervals(self):
+        rng = np.random.default_rng(3)
+        months = np.arange('2021-01', '2024-01', dtype='datetime64[M]')
+        december = np.array([m.astype(object).month == 12 for m in months])
+        totals = 500 + 5 * np.arange(len(months)) + 300 * december + rng.normal(0, 10, len(months))
+        series = ExpenseSeries.from_rows([(str(m), 'Gifts', t, 1) for m, t in zip(months, totals)])
+
+        forecast = forecast_all(series, horizon=12)['total']
+        assert forecast.seasonal
+        # Next December stands out from the months around it
+        assert forecast.months[11] == '2024-12'
+        assert forecast.predicted[11] > forecast.predicted[10] + 200
+        assert np.all(forecast.lower <= forecast.predicted) and np.all(forecast.predicted <= forecast.upper)
+        # Intervals widen further out
+        widths = forecast.upper - forecast.lower
+        assert widths[-1] > widths[0]
+
+    def test_empty_series(self):
+        forecast = forecast_all(ExpenseSeries.from_rows([]))
+        assert forecast['categories'] == {} and forecast['total'].months == []
+
+    def test_series_through_last_complete_month(self):
+        rows = [('2024-01', 'Food', 100, 2), ('2024-02', 'Food', 110, 2), ('2024-04', 'Food', 15, 1)]
+        # A partial April is dropped and a quiet month before it is kept as zero
+        series = ExpenseSeries.from_rows(rows[:2] + [('2024-03', 'Fuel', 0.0, 0)] + rows[2:], through='2024-03')
+        assert series.months == ['2024-01', '2024-02', '2024-03']
+        assert series.monthly_total.tolist() == [100, 110, 0]
+
+        padded = ExpenseSeries.from_rows(rows[:2], through='2024-04')
+        assert padded.months == ['2024-01', '2024-02', '2024-03', '2024-04']
+        assert padded.counts.tolist() == [[2, 2, 0, 0]]
+
+        forecast = skip_months(forecast_all(ExpenseSeries.from_rows(rows[:2], through='2024-02'), 3)['total'], 1)
+        assert forecast.months == ['2024-04', '2024-05']
+        assert len(forecast.predicted) == len(forecast.lower) == len(forecast.upper) == 2
+
+    def test_interval_built_before_clipping(self):
+        # A steep decline projects below zero
+        y = np.array([[300.0, 200.0, 90.0, 10.0]])
+        result = forecast_matrix(y, horizon=2)
+        # Shifting the history up moves the fit but not the interval width
+        shifted = forecast_matrix(y + 1000, horizon=2)
+        assert np.all(shifted['predicted'] - 1000 < 0)
+
+        assert np.all(result['predicted'] == 0)
+        assert np.allclose(result['upper'], np.maximum(shifted['upper'] - 1000, 0))
+        assert np.allclose(result['upper'], 0) and np.all(result['lower'] == 0)
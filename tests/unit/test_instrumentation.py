@@ -0,0 +1,179 @@
+"""
+Unit tests for latency instrumentation
+"""
+
+import io
+import sys
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+import instrumentation
+from instrumentation import (
+    DB, LatencyHistogram, MetricsRegistry, connect, get_registry, span, statement_name, timed
+)
+
+
+@pytest.fixture
+def registry():
+    get_registry().reset()
+    yield get_registry()
+    get_registry().reset()
+
+
+class TestLatencyHistogram:
+    """Test percentile estimates from log buckets"""
+
+    def test_percentiles_within_bucket_resolution(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.add(ms / 1000)
+
+        assert histogram.count == 100
+        assert histogram.percentile(50) == pytest.approx(0.050, rel=0.1)
+        assert histogram.percentile(95) == pytest.approx(0.095, rel=0.1)
+        assert histogram.percentile(99) == pytest.approx(0.099, rel=0.1)
+        assert histogram.percentile(100) == 0.1
+
+    def test_summary_in_milliseconds(self):
+        histogram = LatencyHistogram()
+        assert histogram.summary()['p99_ms'] == 0.0
+        histogram.add(0.002)
+        summary = histogram.summary()
+        assert summary['count'] == 1
+        assert summary['p50_ms'] == summary['max_ms'] == 2.0
+
+
+class TestSpans:
+    """Test spans, the decorator and the registry snapshot"""
+
+    def test_span_records_even_when_raising(self, registry):
+        with pytest.raises(ValueError):
+            with span('broken', 'ai'):
+                raise ValueError()
+        assert registry.histogram('ai', 'broken').count == 1
+
+    def test_timed_uses_qualified_name(self, registry):
+        class Planner:
+            @timed(category='ai')
+            def run(self):
+                return 'done'
+
+        assert Planner().run() == 'done'
+        assert 'TestSpans.test_timed_uses_qualified_name.<locals>.Planner.run' in registry.snapshot('ai')['ai']
+
+    def test_snapshot_orders_slowest_first(self):
+        registry = MetricsRegistry()
+        registry.record('ui', 'fast', 0.001)
+        registry.record('ui', 'slow', 0.5)
+        assert list(registry.snapshot()['ui']) == ['slow', 'fast']
+        registry.reset()
+        assert registry.snapshot() == {}
+
+
+class TestTimedConnection:
+    """Test that statements on the shared connection type are timed"""
+
+    def test_statement_name(self):
+        assert statement_name("SELECT SUM(amount) FROM expenses WHERE date >= ?") == 'SELECT expenses'
+        assert statement_name("  insert into bills (name) values (?)") == 'INSERT bills'
+        assert statement_name("UPDATE inventory SET qty = 1") == 'UPDATE inventory'
+        assert statement_name("PRAGMA data_version") == 'PRAGMA'
+
+    def test_connection_and_cursor_execute_are_recorded(self, registry):
+        conn = connect(':memory:')
+        conn.row_factory = sqlite3.Row
+        conn.execute("CREATE TABLE expenses (amount REAL)")
+        conn.executemany("INSERT INTO expenses (amount) VALUES (?)", [(1.0,), (2.5,)])
+        cursor = conn.cursor()
+        cursor.execute("SELECT amount FROM expenses")
+        assert [row['amount'] for row in cursor.fetchall()] == [1.0, 2.5]
+        conn.close()
+
+        db = registry.snapshot(DB)[DB]
+        assert db['SELECT expenses']['count'] == 1
+        assert db['INSERT expenses']['count'] == 1
+        assert db['CREATE expenses']['count'] == 1
+
+    def test_slow_spans_are_logged(self, registry, monkeypatch, caplog):
+        monkeypatch.setattr(instrumentation, 'SLOW_SPAN_SECONDS', 0.0)
+        with caplog.at_level('INFO', logger='instrumentation'):
+            with span('refresh_bills', 'ui'):
+                pass
+        assert 'Slow ui span refresh_bills' in caplog.text
+
+
+class TestSlowQueryLog:
+    """Test the opt-in slow-query log"""
+
+    def test_records_slow_statements_with_call_site(self, registry, tmp_path, monkeypatch):
+        monkeypatch.setattr('builtins.open', io.open)
+        path = tmp_path / 'slow.jsonl'
+        instrumentation.enable_slow_query_log(threshold_ms=0, path=str(path))
+        try:
+            conn = connect(':memory:')
+            conn.execute("CREATE TABLE bills (name TEXT)")
+            conn.execute("SELECT * FROM bills WHERE name = ?", ('rent',))
+            conn.executemany("INSERT INTO bills VALUES (?)", [('a',), ('b',)])
+            conn.close()
+        finally:
+            instrumentation.disable_slow_query_log()
+
+        entries = [json.loads(line) for line in path.read_text().splitlines()]
+        select = next(e for e in entries if e['sql'].startswith('SELECT'))
+        assert select['params'] == ['rent']
+        assert select['site'].startswith('test_instrumentation.py:')
+        assert select['site'].endswith('test_records_slow_statements_with_call_site')
+        assert entries[-1]['params'] == '<2 parameter sets>'
+        assert instrumentation.slow_queries() == []
+
+    def test_notification_queries_are_logged(self, registry, notification_db_path):
+        from notification_manager import NotificationManager
+        from notification_triggers import NotificationTriggers
+
+        manager = NotificationManager(notification_db_path)
+        triggers = NotificationTriggers(notification_db_path, manager)
+        instrumentation.enable_slow_query_log(threshold_ms=0, path=None)
+        try:
+            manager.get_unread_count(3)
+            triggers.check_low_inventory()
+            sites = [entry['site'] for entry in instrumentation.slow_queries()]
+        finally:
+            instrumentation.disable_slow_query_log()
+
+        assert any(site.startswith('notification_manager.py:') and site.endswith('in get_unread_count')
+                   for site in sites)
+        assert any(site.startswith('notification_triggers.py:') for site in sites)
+
+    def test_main_window_queries_are_logged(self, registry, tmp_path, monkeypatch):
+        pytest.importorskip('PyQt6')
+        import main
+
+        monkeypatch.chdir(tmp_path)
+        conn = sqlite3.connect(main.DB_PATH)
+        conn.execute("CREATE TABLE inventory (name TEXT, category TEXT, qty REAL, unit TEXT, exp_date TEXT, "
+                     "location TEXT, purchase_price REAL)")
+        conn.execute("INSERT INTO inventory (name, qty) VALUES ('Rice', 2)")
+        conn.commit()
+        conn.close()
+
+        instrumentation.enable_slow_query_log(threshold_ms=0, path=None)
+        try:
+            inventory = main.FamilyManagerApp.get_inventory_data(None)
+            entries = instrumentation.slow_queries()
+        finally:
+            instrumentation.disable_slow_query_log()
+
+        assert inventory[0]['name'] == 'Rice'
+        assert any(e['site'].startswith('main.py:') and e['site'].endswith('in get_inventory_data')
+                   for e in entries)
+
+    def test_disabled_by_default(self, registry):
+        conn = connect(':memory:')
+        conn.execute("SELECT 1")
+        conn.close()
+        assert instrumentation.slow_queries() == []
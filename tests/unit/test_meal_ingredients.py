@@ -0,0 +1,125 @@
+"""
+Unit tests for the normalized meal_ingredients index
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from meal_ingredients import (
+    parse_ingredient_text, parse_ingredients, ensure_meal_ingredients_table,
+    insert_meal, ingredient_usage, aggregate_ingredients
+)
+
+
+class TestIngredientParsing:
+    """Test free-text and JSON ingredient parsing"""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("chicken breast (4 oz)", ("chicken breast", 4.0, "oz")),
+        ("2 cups flour", ("flour", 2.0, "cups")),
+        ("1 1/2 cups milk", ("milk", 1.5, "cups")),
+        ("1/2 lb butter", ("butter", 0.5, "lb")),
+        ("500g pasta", ("pasta", 500.0, "g")),
+        ("2 large eggs", ("large eggs", 2.0, "each")),
+        ("Salt", ("Salt", 1.0, "each")),
+    ])
+    def test_parse_ingredient_text(self, text, expected):
+        assert parse_ingredient_text(text) == expected
+
+    def test_parse_comma_separated(self):
+        parsed = parse_ingredients("Greek yogurt, almonds,  Honey ")
+        assert [p['name_key'] for p in parsed] == ['greek yogurt', 'almonds', 'honey']
+
+    def test_parse_json_strings_and_objects(self):
+        parsed = parse_ingredients('["rice (2 cups)", {"name": "Beans", "quantity": "3", "unit": "Cans"}]')
+        assert parsed[0] == {'name': 'rice', 'name_key': 'rice', 'qty': 2.0, 'unit': 'cups'}
+        assert parsed[1] == {'name': 'Beans', 'name_key': 'beans', 'qty': 3.0, 'unit': 'cans'}
+
+    def test_parse_empty(self):
+        assert parse_ingredients(None) == []
+        assert parse_ingredients('') == []
+
+
+class TestMealIngredientsTable:
+    """Test population, backfill and aggregation of meal_ingredients"""
+
+    @pytest.fixture
+    def cursor(self):
+        conn = sqlite3.connect(':memory:')
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE meals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL, meal_type TEXT, name TEXT NOT NULL,
+                ingredients TEXT, recipe TEXT
+            )
+        ''')
+        cursor.execute('CREATE TABLE inventory (id INTEGER PRIMARY KEY, name TEXT, qty REAL)')
+        yield cursor
+        conn.close()
+
+    def test_backfill_existing_meals(self, cursor):
+        cursor.execute("INSERT INTO meals (date, name, ingredients) VALUES ('2024-01-01', 'Toast', 'bread, butter')")
+        assert ensure_meal_ingredients_table(cursor) == 1
+        cursor.execute("SELECT name_key FROM meal_ingredients ORDER BY id")
+        assert [row[0] for row in cursor.fetchall()] == ['bread', 'butter']
+        # Second run finds nothing left to backfill
+        assert ensure_meal_ingredients_table(cursor) == 0
+
+    def test_triggers_clear_rows_on_update_and_delete(self, cursor):
+        ensure_meal_ingredients_table(cursor)
+        meal_id = insert_meal(cursor, {'date': '2024-01-01', 'name': 'Salad', 'ingredients': 'lettuce, tomato'})
+        cursor.execute("UPDATE meals SET ingredients = 'kale' WHERE id = ?", (meal_id,))
+        cursor.execute("SELECT COUNT(*) FROM meal_ingredients")
+        assert cursor.fetchone()[0] == 0
+
+        insert_meal(cursor, {'date': '2024-01-02', 'name': 'Soup', 'ingredients': 'broth'})
+        cursor.execute("DELETE FROM meals")
+        cursor.execute("SELECT COUNT(*) FROM meal_ingredients")
+        assert cursor.fetchone()[0] == 0
+
+    def test_usage_and_aggregation(self, cursor):
+        ensure_meal_ingredients_table(cursor)
+        cursor.execute("INSERT INTO inventory (name, qty) VALUES ('Eggs', 6)")
+        insert_meal(cursor, {'date': '2024-01-01', 'name': 'Omelette', 'ingredients': '["2 eggs", "1 cup milk"]'})
+        insert_meal(cursor, {'date': '2024-01-02', 'name': 'Cake', 'ingredients': '["3 Eggs", "2 cups flour"]'})
+
+        usage = {row[1]: row for row in ingredient_usage(cursor, '2024-01-01')}
+        assert usage['eggs'][2] == 2
+        assert usage['eggs'][3] == 6
+        assert usage['milk'][3] is None
+
+        required = aggregate_ingredients(cursor, '2024-01-01', '2024-01-02')
+        assert required[('Eggs', 'each')] == (5.0, 'each')
+        assert required[('flour', 'ml')] == (2.0, 'cups')
+
+
+class TestShoppingListConsolidation:
+    """Test that meal plan ingredients consolidate per ingredient and dimension"""
+
+    def test_incompatible_units_match_inventory(self):
+        pytest.importorskip('PyQt6')
+        from ai_providers import SmartShoppingListGenerator
+
+        generator = SmartShoppingListGenerator()
+        required = generator.extract_ingredients_from_meals({
+            'Breakfast': {'ingredients': ['2 eggs', '1 cup milk']},
+            'Lunch': {'ingredients': ['milk (8 oz)', '100 g eggs']},
+            'Dinner': {'ingredients': ['3 eggs', '50 g eggs']},
+        })
+        assert required[('eggs', 'each')] == (5.0, 'each')
+        assert required[('eggs', 'g')] == (150.0, 'g')
+        assert required[('milk', 'ml')] == (1.0, 'cup')
+        assert required[('milk', 'g')] == (8.0, 'oz')
+
+        inventory = [{'name': 'Eggs', 'qty': 100, 'unit': 'g', 'category': 'Dairy'},
+                     {'name': 'Eggs', 'qty': 4, 'unit': 'each', 'category': 'Dairy'}]
+        shortages = generator.analyze_inventory_shortages(required, inventory)
+        assert shortages['eggs']['shortage'] == 1.0
+        assert shortages['eggs (g)']['shortage'] == 50.0
+        assert shortages['eggs (g)']['category'] == 'Dairy'
@@ -0,0 +1,133 @@
+"""
+Unit tests for the provider transport and the AI provider stand-in
+"""
+
+import io
+import sys
+import json
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+import provider_transport
+from provider_transport import HUGGINGFACE, ProviderTransport, get_transport, set_transport
+from mock_ai_server import FaultProfile, MockProviderServer, ReplayEngine, ReplayResponse, ReplayTransport
+
+CHAT_URL = "https://router.huggingface.co/v1/chat/completions"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProviderTransport:
+    """Test URL redirection and recording"""
+
+    def test_redirects_to_base_url(self):
+        transport = ProviderTransport('http://127.0.0.1:8765/')
+        assert transport.url(HUGGINGFACE, CHAT_URL) == 'http://127.0.0.1:8765/huggingface/v1/chat/completions'
+        assert transport.sdk_base_url('openai') == 'http://127.0.0.1:8765/openai/v1/'
+        assert transport.sdk_base_url('gemini') == 'http://127.0.0.1:8765/gemini/'
+        assert ProviderTransport().url(HUGGINGFACE, CHAT_URL) == CHAT_URL
+        assert ProviderTransport().sdk_base_url('gemini') is None
+
+    def test_records_responses_for_replay(self, tmp_path, monkeypatch):
+        monkeypatch.setattr('builtins.open', io.open)
+        path = tmp_path / 'recordings.json'
+        transport = ReplayTransport(ReplayEngine(), sleep=lambda seconds: None)
+        transport.record_path = str(path)
+        transport.post(HUGGINGFACE, CHAT_URL, json={'messages': []})
+
+        recordings = json.loads(path.read_text())
+        assert recordings['huggingface/v1/chat/completions'][0]['status'] == 200
+
+        replayed = ReplayEngine(recordings).respond(HUGGINGFACE, '/v1/chat/completions')
+        assert replayed.body['choices'][0]['message']['content'] == '{}'
+
+    def test_set_transport_returns_previous(self):
+        replay = ReplayTransport(ReplayEngine())
+        previous = set_transport(replay)
+        try:
+            assert provider_transport.get_transport() is replay
+        finally:
+            set_transport(previous)
+        assert get_transport() is previous
+
+
+class TestReplayEngine:
+    """Test replay order, injected faults and rate limiting"""
+
+    def test_replays_recordings_in_turn(self):
+        engine = ReplayEngine({
+            'aimlapi/v1/chat/completions': [{'status': 200, 'body': {'n': 1}}, {'status': 500, 'body': {'n': 2}}],
+            'scitely': [{'body': {'any': True}}],
+        })
+        assert [engine.respond('aimlapi', '/v1/chat/completions').body['n'] for _ in range(3)] == [1, 2, 1]
+        assert engine.respond('scitely', '/v1/responses').body == {'any': True}
+        assert engine.respond('gemini', '/v1beta/models/gemini-2.5-flash:generateContent').status == 200
+        assert engine.respond('unknown', '/v1/embeddings').status == 404
+        assert engine.stats()['aimlapi'] == {'requests': 3, 'ok': 2, 'errors': 1, 'rate_limited': 0}
+
+    def test_faults_are_reproducible(self):
+        profile = FaultProfile(latency_ms=100, jitter_ms=50, error_rate=0.3, seed=7)
+
+        def replies():
+            engine = ReplayEngine(profile=profile)
+            return [engine.respond(HUGGINGFACE, '/v1/chat/completions') for _ in range(50)]
+
+        first, second = replies(), replies()
+        assert [(r.status, r.delay) for r in first] == [(r.status, r.delay) for r in second]
+        assert {r.status for r in first} == {200, 503}
+        assert all(0.05 <= r.delay <= 0.15 for r in first)
+
+    def test_rate_limit_returns_429_with_retry_after(self):
+        clock = FakeClock()
+        engine = ReplayEngine(profile=FaultProfile(rate_limit=2, burst=2), clock=clock)
+        statuses = [engine.respond(HUGGINGFACE, '/v1/chat/completions').status for _ in range(3)]
+        assert statuses == [200, 200, 429]
+        limited = engine.respond(HUGGINGFACE, '/v1/chat/completions')
+        assert limited.headers['Retry-After'] == '1'
+        # Another provider has its own budget
+        assert engine.respond('aimlapi', '/v1/chat/completions').status == 200
+        clock.now = 0.5
+        assert engine.respond(HUGGINGFACE, '/v1/chat/completions').status == 200
+        assert engine.stats()[HUGGINGFACE]['rate_limited'] == 2
+
+    def test_transport_waits_and_times_out(self):
+        waits = []
+        transport = ReplayTransport(ReplayEngine(profile=FaultProfile(latency_ms=250)), sleep=waits.append)
+        response = transport.post(HUGGINGFACE, CHAT_URL, timeout=30)
+        assert isinstance(response, ReplayResponse) and response.ok
+        assert waits == [0.25]
+        with pytest.raises(TimeoutError):
+            transport.post(HUGGINGFACE, CHAT_URL, timeout=0.1)
+
+
+class TestMockProviderServer:
+    """Test the stand-in over HTTP"""
+
+    def test_serves_providers_and_stats(self):
+        engine = ReplayEngine(profile=FaultProfile(rate_limit=1, burst=1))
+        with MockProviderServer(engine) as server:
+            request = urllib.request.Request(f"{server.url}/huggingface/v1/chat/completions",
+                                             data=json.dumps({'messages': []}).encode(), method='POST',
+                                             headers={'Content-Type': 'application/json'})
+            with urllib.request.urlopen(request, timeout=5) as response:
+                assert json.load(response)['object'] == 'chat.completion'
+
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(request, timeout=5)
+            assert error.value.code == 429
+            assert error.value.headers['Retry-After'] == '1'
+
+            with urllib.request.urlopen(f"{server.url}/_mock/stats", timeout=5) as response:
+                assert json.load(response)['huggingface'] == {'requests': 2, 'ok': 1, 'errors': 0,
+                                                              'rate_limited': 1}
@@ -0,0 +1,165 @@
+"""
+Unit tests for notification settings caching and batch creation
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+import notification_manager
+from notification_manager import NotificationManager
+
+
+def count_settings_queries(monkeypatch):
+    """Count SELECTs against notification_settings on connections opened from now on"""
+    queries = []
+    original_connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        conn = original_connect(*args, **kwargs)
+        conn.set_trace_callback(
+            lambda sql: queries.append(sql) if sql.lstrip().upper().startswith('SELECT')
+            and 'notification_settings' in sql else None
+        )
+        return conn
+
+    monkeypatch.setattr(notification_manager.sqlite3, 'connect', tracing_connect)
+    return queries
+
+
+class TestSettingsCache:
+    """Test that preference checks are served from memory"""
+
+    def test_repeat_lookups_hit_cache(self, notification_db_path, monkeypatch):
+        manager = NotificationManager(notification_db_path)
+        queries = count_settings_queries(monkeypatch)
+
+        for _ in range(5):
+            assert manager._should_notify_user(3, 'chore_due')
+        assert manager.get_settings(3)['chore_due_enabled'] == 1
+        assert len(queries) == 1
+
+    def test_update_settings_invalidates(self, notification_db_path):
+        manager = NotificationManager(notification_db_path)
+        assert manager._should_notify_user(3, 'bill_due')
+
+        assert manager.update_settings(3, bill_due_enabled=0)
+        assert not manager._should_notify_user(3, 'bill_due')
+        assert manager.create_notification(3, 'bill_due', 'Rent', 'Rent is due') is None
+
+    def test_unknown_user_defaults_to_notify(self, notification_db_path):
+        manager = NotificationManager(notification_db_path)
+        assert manager._should_notify_user(99, 'task_assigned')
+
+
+class TestCreateNotifications:
+    """Test batched notification inserts"""
+
+    def test_batch_skips_suppressed_recipients(self, notification_db_path, monkeypatch):
+        manager = NotificationManager(notification_db_path)
+        manager.update_settings(2, chore_due_enabled=0)
+        queries = count_settings_queries(monkeypatch)
+
+        ids = manager.create_notifications([
+            {'recipient_id': user_id, 'notification_type': 'chore_due',
+             'title': 'Chore Due', 'message': f"Chore for {user_id}"}
+            for user_id in (1, 2, 3)
+        ])
+
+        assert ids[1] is None
+        assert all(isinstance(notification_id, int) for notification_id in (ids[0], ids[2]))
+        assert len(queries) == 1
+
+        conn = sqlite3.connect(notification_db_path)
+        rows = conn.execute("SELECT recipient_id FROM notifications ORDER BY id").fetchall()
+        conn.close()
+        assert rows == [(1,), (3,)]
+
+    def test_empty_batch(self, notification_db_path):
+        assert NotificationManager(notification_db_path).create_notifications([]) == []
+
+
+class TestUnreadCounterAndFeed:
+    """Test the trigger-maintained unread counter and keyset-paged feed"""
+
+    def test_counter_follows_inserts_reads_and_deletes(self, notification_db_path):
+        manager = NotificationManager(notification_db_path)
+        ids = manager.create_notifications([
+            {'recipient_id': 3, 'notification_type': 'alert', 'title': f"Alert {i}", 'message': 'm'}
+            for i in range(4)
+        ])
+        assert manager.get_unread_count(3) == 4
+
+        manager.mark_as_read(ids[0])
+        manager.mark_as_read(ids[0])
+        manager.delete_notification(ids[1])
+        assert manager.get_unread_count(3) == 2
+
+        manager.mark_all_as_read(3)
+        assert manager.get_unread_count(3) == 0
+        conn = sqlite3.connect(notification_db_path)
+        assert conn.execute("SELECT next_expiry FROM notification_unread_counts WHERE recipient_id = 3"
+                            ).fetchone() == (None,)
+        conn.close()
+        assert manager.get_unread_count(1) == 0
+
+    def test_counter_backfilled_and_expired_rows_dropped(self, notification_db_path):
+        conn = sqlite3.connect(notification_db_path)
+        conn.executemany(
+            "INSERT INTO notifications (notification_type, recipient_id, title, message, expires_at) "
+            "VALUES ('alert', 3, 't', 'm', ?)",
+            [('2000-01-01T00:00:00',), ('2999-01-01T00:00:00',), (None,)]
+        )
+        conn.commit()
+        conn.close()
+
+        manager = NotificationManager(notification_db_path)
+        assert manager.get_unread_count(3) == 2
+        assert len(manager.get_notifications(3)) == 2
+
+        # Counting leaves the expired row for cleanup_expired_notifications
+        conn = sqlite3.connect(notification_db_path)
+        assert conn.execute("SELECT COUNT(*) FROM notifications").fetchone()[0] == 3
+        conn.close()
+        assert manager.cleanup_expired_notifications() == 1
+        assert manager.get_unread_count(3) == 2
+
+        conn = sqlite3.connect(notification_db_path)
+        counter = conn.execute("SELECT unread_count, next_expiry FROM notification_unread_counts "
+                               "WHERE recipient_id = 3").fetchone()
+        conn.close()
+        assert counter == (2, '2999-01-01T00:00:00')
+
+    def test_keyset_pages_do_not_overlap(self, notification_db_path):
+        manager = NotificationManager(notification_db_path)
+        conn = sqlite3.connect(notification_db_path)
+        # Same created_at for all rows so paging must tie-break on id
+        conn.executemany(
+            "INSERT INTO notifications (notification_type, recipient_id, title, message, created_at) "
+            "VALUES ('alert', 1, ?, 'm', '2030-01-01 00:00:00')",
+            [(f"N{i}",) for i in range(7)]
+        )
+        conn.commit()
+        conn.close()
+
+        seen, before = [], None
+        while True:
+            page = manager.get_notifications(1, limit=3, before=before)
+            if not page:
+                break
+            seen.extend(n['id'] for n in page)
+            before = (page[-1]['created_at'], page[-1]['id'])
+        assert seen == sorted(seen, reverse=True) and len(seen) == 7
+
+    def test_feed_uses_index_order(self, notification_db_path):
+        NotificationManager(notification_db_path)
+        conn = sqlite3.connect(notification_db_path)
+        plan = ' '.join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM notifications WHERE recipient_id = 1 AND is_read = 0 "
+            "AND (expires_at IS NULL OR expires_at > datetime('now')) ORDER BY created_at DESC, id DESC LIMIT 50"
+        ))
+        conn.close()
+        assert 'idx_notifications_feed' in plan
+        assert 'TEMP B-TREE' not in plan
@@ -0,0 +1,105 @@
+"""
+Unit tests for push notification delivery
+"""
+
+import sys
+import json
+import sqlite3
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from notification_manager import NotificationManager
+from notification_stream import NotificationBroker, format_sse, stream_notifications
+
+
+def parse(frame):
+    """Return the decoded data of an SSE frame, or None for a keep-alive"""
+    for line in frame.splitlines():
+        if line.startswith('data: '):
+            return json.loads(line[6:])
+    return None
+
+
+class TestNotificationBroker:
+    """Test fan-out and queue limits"""
+
+    def test_publish_reaches_only_subscribers(self):
+        broker = NotificationBroker()
+        first, second = broker.subscribe(1), broker.subscribe(1)
+        other = broker.subscribe(2)
+
+        broker.publish(1, {'type': 'unread_count', 'unread_count': 3})
+        assert first.get_nowait() == second.get_nowait() == {'type': 'unread_count', 'unread_count': 3}
+        assert other.empty()
+
+        broker.unsubscribe(1, first)
+        broker.unsubscribe(1, second)
+        assert not broker.has_subscribers(1)
+
+    def test_full_queue_drops_oldest(self):
+        broker = NotificationBroker(queue_size=2)
+        events = broker.subscribe(1)
+        for count in range(3):
+            broker.publish(1, {'type': 'unread_count', 'unread_count': count})
+        assert [events.get_nowait()['unread_count'] for _ in range(2)] == [1, 2]
+
+    def test_notification_frames_carry_id(self):
+        frame = format_sse({'type': 'notification', 'notification': {'id': 7, 'title': 'Hi'}})
+        assert frame.startswith('id: 7\nevent: notification\n')
+        assert frame.endswith('\n\n')
+
+
+class TestNotificationStream:
+    """Test the server-sent events generator"""
+
+    def test_created_notifications_are_pushed(self, notification_db_path):
+        broker = NotificationBroker()
+        manager = NotificationManager(notification_db_path, broker=broker)
+        stream = stream_notifications(manager, broker, 3, heartbeat=0.05)
+
+        assert parse(next(stream)) == {'type': 'unread_count', 'unread_count': 0}
+
+        manager.create_notification(3, 'alert', 'Smoke alarm', 'Battery low')
+        pushed = parse(next(stream))
+        assert pushed['type'] == 'notification' and pushed['notification']['title'] == 'Smoke alarm'
+        assert parse(next(stream)) == {'type': 'unread_count', 'unread_count': 1}
+
+        manager.mark_all_as_read(3)
+        assert parse(next(stream)) == {'type': 'unread_count', 'unread_count': 0}
+
+        stream.close()
+        assert not broker.has_subscribers(3)
+
+    def test_other_process_inserts_found_on_heartbeat(self, notification_db_path):
+        broker = NotificationBroker()
+        manager = NotificationManager(notification_db_path, broker=broker)
+        stream = stream_notifications(manager, broker, 3, heartbeat=0.01)
+        next(stream)
+
+        assert next(stream) == ': keep-alive\n\n'
+
+        # Written without the manager, as the desktop app or trigger sweep would
+        conn = sqlite3.connect(notification_db_path)
+        conn.execute("INSERT INTO notifications (notification_type, recipient_id, title, message) "
+                     "VALUES ('alert', 3, 'Elsewhere', 'm')")
+        conn.commit()
+        conn.close()
+
+        assert parse(next(stream))['notification']['title'] == 'Elsewhere'
+        assert parse(next(stream)) == {'type': 'unread_count', 'unread_count': 1}
+        stream.close()
+
+    def test_reconnect_replays_after_last_event_id(self, notification_db_path):
+        broker = NotificationBroker()
+        manager = NotificationManager(notification_db_path, broker=broker)
+        ids = manager.create_notifications([
+            {'recipient_id': 3, 'notification_type': 'alert', 'title': f"N{i}", 'message': 'm'}
+            for i in range(3)
+        ])
+
+        stream = stream_notifications(manager, broker, 3, last_event_id=ids[0])
+        replayed = [parse(next(stream)) for _ in range(3)]
+        assert [event['notification']['id'] for event in replayed[:2]] == ids[1:]
+        assert replayed[2] == {'type': 'unread_count', 'unread_count': 3}
+        stream.close()
@@ -0,0 +1,125 @@
+"""
+Unit tests for set-based notification triggers
+"""
+
+import sys
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from notification_manager import NotificationManager
+from notification_stream import NotificationBroker
+from notification_triggers import NotificationTriggers
+
+@pytest.fixture
+def db_path(notification_db_path):
+    conn = sqlite3.connect(notification_db_path)
+    conn.execute("UPDATE notification_settings SET bill_due_enabled = 0 WHERE user_id = 2")
+    conn.commit()
+    conn.close()
+    return notification_db_path
+
+
+def rows(db_path, sql, params=()):
+    conn = sqlite3.connect(db_path)
+    result = conn.execute(sql, params).fetchall()
+    conn.close()
+    return result
+
+
+class TestNotificationTriggers:
+    """Test INSERT ... SELECT triggers honour settings and dedupe"""
+
+    def test_chores_respect_settings_and_dedupe(self, db_path):
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        conn = sqlite3.connect(db_path)
+        conn.executemany("INSERT INTO chores (name, assignee_id, status, due_date, due_time) VALUES (?, ?, ?, ?, ?)",
+                         [('Dishes', 3, 'pending', tomorrow, '18:00'), ('Laundry', 2, 'pending', tomorrow, None),
+                          ('Trash', 3, 'done', tomorrow, None)])
+        conn.execute("UPDATE notification_settings SET chore_due_enabled = 0 WHERE user_id = 2")
+        conn.commit()
+        conn.close()
+
+        triggers = NotificationTriggers(db_path, NotificationManager(db_path))
+        assert triggers.check_upcoming_chores() == 1
+        assert rows(db_path, "SELECT recipient_id, message FROM notifications") == [
+            (3, f"Your chore 'Dishes' is due on {tomorrow} at 18:00")
+        ]
+        # A second sweep finds the existing notification
+        assert triggers.check_upcoming_chores() == 0
+
+    def test_bills_fan_out_to_enabled_admins(self, db_path):
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        conn = sqlite3.connect(db_path)
+        conn.executemany("INSERT INTO bills (name, amount, due_date) VALUES (?, ?, ?)",
+                         [('Rent', 1200, tomorrow), ('Water', 45.5, tomorrow)])
+        conn.commit()
+        conn.close()
+
+        triggers = NotificationTriggers(db_path, NotificationManager(db_path))
+        assert triggers.check_upcoming_bills() == 2
+        assert rows(db_path, "SELECT DISTINCT recipient_id FROM notifications") == [(1,)]
+        assert rows(db_path, "SELECT priority, message FROM notifications ORDER BY source_entity_id") == [
+            ('high', f"Bill 'Rent' for $1200.00 is due on {tomorrow}"),
+            ('normal', f"Bill 'Water' for $45.50 is due on {tomorrow}"),
+        ]
+        assert triggers.check_upcoming_bills() == 0
+
+    def test_low_inventory_summary(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.executemany("INSERT INTO inventory (name, qty) VALUES (?, ?)",
+                         [(f"Item {i}", 1) for i in range(7)] + [('Plenty', 10)])
+        conn.commit()
+        conn.close()
+
+        assert NotificationTriggers(db_path, NotificationManager(db_path)).check_low_inventory() == 2
+        title, message = rows(db_path, "SELECT title, message FROM notifications LIMIT 1")[0]
+        assert title == "Low Inventory Alert: 7 Item(s)"
+        assert message.endswith("Item 0, Item 1, Item 2, Item 3, Item 4 and 2 more")
+
+    def test_overdue_alerts(self, db_path):
+        last_week = (date.today() - timedelta(days=7)).isoformat()
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO tasks (title, status, due_date, assigned_to_id, priority) VALUES (?, ?, ?, ?, ?)",
+                     ('Taxes', 'pending', last_week, 1, 5))
+        conn.execute("INSERT INTO bills (name, amount, due_date) VALUES (?, ?, ?)", ('Power', 80, last_week))
+        conn.commit()
+        conn.close()
+
+        triggers = NotificationTriggers(db_path, NotificationManager(db_path))
+        assert triggers.check_overdue_items() == 3
+        assert triggers.check_overdue_items() == 0
+
+    def test_nothing_created_without_manager(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO bills (name, amount, due_date) VALUES (?, ?, ?)",
+                     ('Power', 80, (date.today() - timedelta(days=7)).isoformat()))
+        conn.commit()
+        conn.close()
+
+        assert NotificationTriggers(db_path).check_overdue_items() == 0
+        assert rows(db_path, "SELECT COUNT(*) FROM notifications") == [(0,)]
+
+    def test_created_notifications_are_published(self, db_path):
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO chores (name, assignee_id, status, due_date) VALUES ('Dishes', 3, 'pending', ?)",
+                     (tomorrow,))
+        conn.execute("INSERT INTO chores (name, assignee_id, status, due_date) VALUES ('Mow', 1, 'pending', ?)",
+                     (tomorrow,))
+        conn.commit()
+        conn.close()
+
+        broker = NotificationBroker()
+        events = broker.subscribe(3)
+        triggers = NotificationTriggers(db_path, NotificationManager(db_path, broker=broker))
+        assert triggers.check_upcoming_chores() == 2
+
+        pushed = events.get_nowait()
+        assert pushed['type'] == 'notification' and pushed['notification']['title'] == 'Chore Due: Dishes'
+        assert events.get_nowait() == {'type': 'unread_count', 'unread_count': 1}
+        assert events.empty()
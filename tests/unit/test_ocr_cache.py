@@ -0,0 +1,77 @@
+"""
+Unit tests for the content-addressed OCR result cache
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from ocr_cache import OCRResultCache
+from ocr_pipeline import BatchOCRPipeline, TESSERACT_VERSION, cached_tesseract_text, hash_image_file
+import ocr_pipeline
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return OCRResultCache(db_path=str(tmp_path / 'cache.db'), max_entries=3)
+
+
+class TestOCRResultCache:
+    """Test lookups, LRU eviction and stats"""
+
+    def test_roundtrip_keyed_by_engine_and_version(self, cache):
+        cache.put('abc', 'gemini', 'v1', {'success': True, 'items': [{'name': 'Milk'}]})
+        assert cache.get('abc', 'gemini', 'v1')['items'][0]['name'] == 'Milk'
+        assert cache.get('abc', 'gemini', 'v2') is None
+        assert cache.get('abc', 'tesseract', 'v1') is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_lru_eviction(self, cache):
+        for key in ('a', 'b', 'c'):
+            cache.put(key, 'tesseract', 'v1', {'text': key})
+        cache.get('a', 'tesseract', 'v1')  # 'b' is now least recently used
+        cache.put('d', 'tesseract', 'v1', {'text': 'd'})
+
+        assert cache.get('b', 'tesseract', 'v1') is None
+        assert cache.get('a', 'tesseract', 'v1') == {'text': 'a'}
+        assert cache.get_stats()['total_cached'] == 3
+
+    def test_size_cap(self, tmp_path):
+        cache = OCRResultCache(db_path=str(tmp_path / 'cache.db'), max_bytes=40)
+        cache.put('a', 'tesseract', 'v1', {'text': 'x' * 20})
+        cache.put('b', 'tesseract', 'v1', {'text': 'y' * 20})
+        stats = cache.get_stats()
+        assert stats['total_cached'] == 1
+        assert stats['total_bytes'] <= 40
+
+
+class TestCachedExtraction:
+    """Test that cached results bypass the OCR engine"""
+
+    @pytest.fixture(autouse=True)
+    def real_open(self, monkeypatch):
+        # The shared conftest replaces open(); hashing needs the real file contents
+        monkeypatch.setattr('builtins.open', io.open)
+
+    def test_repeat_import_hits_cache(self, cache, tmp_path, monkeypatch):
+        image = tmp_path / 'receipt.jpg'
+        image.write_bytes(b'receipt-bytes')
+        calls = []
+        monkeypatch.setattr(ocr_pipeline, 'tesseract_extract', lambda path: calls.append(path) or 'Bread 2.49')
+
+        assert cached_tesseract_text(str(image), cache) == 'Bread 2.49'
+        assert cached_tesseract_text(str(image), cache) == 'Bread 2.49'
+        assert len(calls) == 1
+
+    def test_batch_uses_cached_text(self, cache, tmp_path):
+        image = tmp_path / 'receipt.jpg'
+        image.write_bytes(b'receipt-bytes')
+        cache.put(hash_image_file(str(image)), 'tesseract', TESSERACT_VERSION, {'text': 'Eggs 3.99'})
+
+        # No Tesseract installed here: a cache miss would fail the image
+        result = BatchOCRPipeline(engine='tesseract', cache=cache).run([str(tmp_path)])
+        assert [item['name'] for item in result['items']] == ['Eggs']
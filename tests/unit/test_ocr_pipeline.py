@@ -0,0 +1,117 @@
+"""
+Unit tests for the batch OCR pipeline
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from ocr_pipeline import (
+    BatchOCRPipeline, collect_image_paths, dedupe_images, gemini_api_key, parse_ai_response, text_to_items
+)
+
+
+@pytest.fixture(autouse=True)
+def real_open(monkeypatch):
+    """The shared conftest replaces open(); hashing needs the real file contents"""
+    monkeypatch.setattr('builtins.open', io.open)
+
+
+@pytest.fixture
+def receipt_folder(tmp_path):
+    (tmp_path / 'a.jpg').write_bytes(b'receipt-one')
+    (tmp_path / 'copy_of_a.jpg').write_bytes(b'receipt-one')
+    (tmp_path / 'notes.txt').write_text('not an image')
+    sub = tmp_path / 'march'
+    sub.mkdir()
+    (sub / 'b.PNG').write_bytes(b'receipt-two')
+    return tmp_path
+
+
+class TestBatchInputs:
+    """Test folder expansion and content-hash dedupe"""
+
+    def test_collect_image_paths(self, receipt_folder):
+        paths = collect_image_paths([str(receipt_folder)])
+        assert [Path(p).name for p in paths] == ['a.jpg', 'copy_of_a.jpg', 'b.PNG']
+
+    def test_dedupe_identical_images(self, receipt_folder):
+        unique, duplicates = dedupe_images(collect_image_paths([str(receipt_folder)]))
+        assert len(unique) == 2
+        assert [(Path(d).name, Path(o).name) for d, o in duplicates] == [('copy_of_a.jpg', 'a.jpg')]
+
+
+class TestResultParsing:
+    """Test conversion of OCR output into review items"""
+
+    def test_text_to_items(self):
+        items = text_to_items("WHOLE MILK 1 gal  3.49\n2 lb Bananas 1.18\nSUBTOTAL 4.67\n----\n")
+        assert [(i['name'], i['quantity'], i['unit'], i['price']) for i in items] == [
+            ('WHOLE MILK 1 gal', '1', 'each', '3.49'),
+            ('Bananas', '2', 'lb', '1.18'),
+        ]
+
+    def test_parse_ai_response_strips_fences(self):
+        assert parse_ai_response('```json\n{"success": true, "items": []}\n```') == {"success": True, "items": []}
+        assert parse_ai_response('not json')['success'] is False
+
+
+class TestBatchOCRPipeline:
+    """Test consolidation of per-image results"""
+
+    def test_run_processes_each_image_once(self, receipt_folder, monkeypatch):
+        seen = []
+
+        def fake_tesseract(self, jobs, report=True):
+            seen.extend(path for _, path in jobs)
+            return {digest: {'success': True, 'engine': 'tesseract',
+                             'items': [{'name': Path(path).stem}]} for digest, path in jobs}
+
+        monkeypatch.setattr(BatchOCRPipeline, '_run_tesseract', fake_tesseract)
+        result = BatchOCRPipeline(engine='tesseract').run([str(receipt_folder)])
+
+        assert len(seen) == 2
+        assert result['success']
+        assert sorted(i['source_file'] for i in result['items']) == ['a.jpg', 'b.PNG']
+        assert len(result['duplicates']) == 1
+
+    def test_ai_failures_fall_back_to_tesseract(self, receipt_folder, monkeypatch):
+        def fake_ai(self, jobs):
+            return {digest: {'success': False, 'error': 'quota', 'engine': 'gemini'} for digest, _ in jobs}
+
+        def fake_tesseract(self, jobs, report=True):
+            return {digest: {'success': True, 'engine': 'tesseract', 'items': [{'name': 'x'}]}
+                    for digest, _ in jobs}
+
+        monkeypatch.setattr(BatchOCRPipeline, '_run_ai', fake_ai)
+        monkeypatch.setattr(BatchOCRPipeline, '_run_tesseract', fake_tesseract)
+        result = BatchOCRPipeline(engine='gemini', api_key='key').run([str(receipt_folder)])
+
+        assert all(f['engine'] == 'tesseract' and f['success'] for f in result['files'])
+
+
+class TestGeminiApiKey:
+    """Test that the Gemini key comes from the environment or config, never a default"""
+
+    def test_environment_then_config(self, tmp_path, monkeypatch):
+        config = tmp_path / 'ai_meal_config.json'
+        monkeypatch.delenv('GEMINI_API_KEY', raising=False)
+        assert gemini_api_key(str(config)) is None
+
+        config.write_text('{"gemini_key": "from-config"}')
+        assert gemini_api_key(str(config)) == 'from-config'
+
+        monkeypatch.setenv('GEMINI_API_KEY', 'from-env')
+        assert gemini_api_key(str(config)) == 'from-env'
+
+    def test_empty_or_invalid_config(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('GEMINI_API_KEY', raising=False)
+        config = tmp_path / 'ai_meal_config.json'
+        config.write_text('{"gemini_key": ""}')
+        assert gemini_api_key(str(config)) is None
+        config.write_text('not json')
+        assert gemini_api_key(str(config)) is None
@@ -0,0 +1,60 @@
+"""
+Unit tests for OCR image preprocessing
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from ocr_preprocess import downscale, estimate_skew, deskew, prepare_for_ai, preprocess_image
+
+
+def make_page(width=1200, height=1600, angle=0.0):
+    """White page with dark horizontal text-like bars, optionally rotated"""
+    page = np.full((height, width), 255, dtype=np.uint8)
+    for y in range(100, height - 100, 60):
+        cv2.rectangle(page, (100, y), (width - 100, y + 15), 0, -1)
+    if angle:
+        matrix = cv2.getRotationMatrix2D((width / 2.0, height / 2.0), angle, 1.0)
+        page = cv2.warpAffine(page, matrix, (width, height), borderValue=255)
+    return page
+
+
+@pytest.fixture(autouse=True)
+def real_open(monkeypatch):
+    """The shared conftest replaces open(); image files need real reads"""
+    monkeypatch.setattr('builtins.open', io.open)
+
+
+class TestPreprocessing:
+    """Test downscaling, deskew and payload size"""
+
+    def test_downscale_keeps_aspect_and_never_upscales(self):
+        page = make_page(4000, 3000)
+        assert downscale(page, 2000).shape == (1500, 2000)
+        assert downscale(page, 5000) is page
+
+    def test_skew_is_recovered(self):
+        skewed = make_page(angle=3.0)
+        angle = estimate_skew(skewed)
+        assert angle == pytest.approx(-3.0, abs=0.5)
+        assert estimate_skew(deskew(skewed, angle)) == pytest.approx(0.0, abs=0.5)
+
+    def test_ai_payload_is_smaller(self, tmp_path):
+        path = tmp_path / 'page.png'
+        color = cv2.cvtColor(make_page(3000, 4000, angle=2.0), cv2.COLOR_GRAY2BGR)
+        cv2.imwrite(str(path), color)
+
+        processed = preprocess_image(str(path))
+        assert processed.ndim == 2 and max(processed.shape) <= 2000
+
+        payload, mime_type = prepare_for_ai(str(path))
+        assert mime_type == 'image/jpeg'
+        assert len(payload) < path.stat().st_size
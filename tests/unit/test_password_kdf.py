@@ -0,0 +1,87 @@
+"""
+Unit tests for the pluggable password KDF
+"""
+
+import io
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from password_kdf import PBKDF2KDF, PasswordHasher, ScryptKDF, calibrate, legacy_sha256, load_kdf, scheme_for
+
+
+@pytest.fixture(autouse=True)
+def real_open(monkeypatch):
+    """The shared conftest replaces open(); the config file needs the real one"""
+    monkeypatch.setattr('builtins.open', io.open)
+
+
+class TestKDFs:
+    """Test self-describing hashes and rehash detection"""
+
+    def test_hashes_record_parameters_and_verify(self):
+        scrypt = ScryptKDF(n=2 ** 10)
+        encoded = scrypt.hash('correct horse')
+        assert encoded.startswith('$scrypt$n=1024,r=8,p=1$')
+        assert scrypt.verify('correct horse', encoded)
+        assert not scrypt.verify('wrong horse', encoded)
+        # Verification uses the stored parameters, not the configured ones
+        assert ScryptKDF(n=2 ** 11).verify('correct horse', encoded)
+
+        pbkdf2 = PBKDF2KDF(i=1000)
+        assert scheme_for(pbkdf2.hash('pw')).name == 'pbkdf2-sha256'
+        assert scheme_for('deadbeef') is None
+
+    def test_needs_rehash_for_weaker_or_other_schemes(self):
+        current = ScryptKDF(n=2 ** 11)
+        assert not current.needs_rehash(ScryptKDF(n=2 ** 11).hash('pw'))
+        assert current.needs_rehash(ScryptKDF(n=2 ** 10).hash('pw'))
+        assert current.needs_rehash(PBKDF2KDF(i=1000).hash('pw'))
+        assert current.needs_rehash(legacy_sha256('pw', 'salt'))
+
+    def test_hasher_verifies_legacy_hashes_on_pool(self):
+        hasher = PasswordHasher(PBKDF2KDF(i=1000), workers=2)
+        try:
+            legacy = legacy_sha256('hunter22', 'abc')
+            assert hasher.verify('hunter22', legacy, 'abc')
+            assert not hasher.verify('hunter23', legacy, 'abc')
+            assert hasher.needs_rehash(legacy)
+            assert hasher.verify('hunter22', hasher.hash('hunter22'))
+        finally:
+            hasher.shutdown()
+
+
+class TestConfiguration:
+    """Test calibration and the config file"""
+
+    def test_calibrate_scales_to_target(self, monkeypatch):
+        # Fake clock: every hash appears to take n / 1024 ms
+        class Clock:
+            now = 0.0
+
+            def __call__(self):
+                return self.now
+
+        clock = Clock()
+
+        def timed_hash(kdf, password):
+            clock.now += kdf.params['n'] / 1024 / 1000
+            return ''
+
+        monkeypatch.setattr(ScryptKDF, 'hash', timed_hash)
+        assert calibrate('scrypt', target_ms=20, time_func=clock)['n'] == 2 ** 15
+
+    def test_load_kdf_reads_config(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('PASSWORD_KDF', raising=False)
+        path = tmp_path / 'kdf.json'
+        path.write_text(json.dumps({'kdf': 'pbkdf2-sha256', 'params': {'i': 123000}}))
+        kdf = load_kdf(str(path))
+        assert kdf.name == 'pbkdf2-sha256' and kdf.params == {'i': 123000}
+
+        assert load_kdf(str(tmp_path / 'missing.json')).name == 'scrypt'
+        monkeypatch.setenv('PASSWORD_KDF', 'bogus')
+        assert load_kdf(str(path)).name == 'scrypt'
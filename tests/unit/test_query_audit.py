@@ -0,0 +1,92 @@
+"""
+Unit tests for the query plan auditor
+"""
+
+import io
+import sys
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from query_audit import (
+    REGISTERED_QUERIES, audit, ensure_query_indexes, full_scans, main, queries_from_slow_log, table_aliases
+)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.executescript('''
+        CREATE TABLE meals (id INTEGER PRIMARY KEY, date TEXT, meal_type TEXT, name TEXT,
+                            generation_date TEXT DEFAULT '');
+        CREATE TABLE expenses (id INTEGER PRIMARY KEY, date TEXT, description TEXT, amount REAL, category TEXT);
+        CREATE TABLE shopping_list (id INTEGER PRIMARY KEY, item TEXT, qty REAL, price REAL, checked INTEGER);
+        CREATE TABLE inventory (id INTEGER PRIMARY KEY, name TEXT, qty REAL);
+        CREATE INDEX idx_meals_date ON meals(date);
+        CREATE INDEX idx_expenses_date ON expenses(date);
+        CREATE INDEX idx_inventory_name_lower ON inventory(LOWER(name));
+    ''')
+    conn.executemany("INSERT INTO meals (date, meal_type, name) VALUES (?, 'Dinner', 'Soup')",
+                     [(f"2024-01-{day:02d}",) for day in range(1, 29)])
+    conn.executemany("INSERT INTO expenses (date, description, amount) VALUES (?, 'x', 1.0)",
+                     [(f"2024-01-{day:02d}",) for day in range(1, 29)])
+    conn.executemany("INSERT INTO shopping_list (item, qty, checked) VALUES (?, 1, 0)",
+                     [(f"item {i}",) for i in range(30)])
+    conn.executemany("INSERT INTO inventory (name, qty) VALUES (?, 1)", [(f"item {i}",) for i in range(30)])
+    yield conn
+    conn.close()
+
+
+class TestQueryAudit:
+    """Test scan detection and that the recommended indexes remove the scans"""
+
+    def test_aliases_resolve_to_tables(self):
+        aliases = table_aliases("SELECT 1 FROM inventory i LEFT JOIN shopping_list AS sl ON 1 WHERE i.qty > 0")
+        assert aliases['i'] == 'inventory'
+        assert aliases['sl'] == 'shopping_list'
+        assert 'WHERE' not in aliases
+        assert full_scans("SELECT * FROM inventory i", ['SCAN i']) == [('inventory', 'SCAN i')]
+        assert full_scans("SELECT * FROM meals", ['SCAN meals USING INDEX idx_meals_date']) == []
+
+    def test_flags_scans_until_indexes_exist(self, conn):
+        findings, errors = audit(conn, REGISTERED_QUERIES, min_rows=10)
+        flagged = {finding.query for finding in findings}
+        assert {'expenses_month_total', 'recent_generated_meals', 'shopping_price_update'} <= flagged
+        # date = ? AND meal_type = ? is already served by idx_meals_date
+        assert not {'meals_for_date', 'meal_for_slot'} & flagged
+        assert all(f.table != 'inventory' for f in findings if f.query == 'inventory_usage_history')
+        month = next(f for f in findings if f.query == 'expenses_month_total')
+        assert month.table == 'expenses' and month.rows == 28
+        assert 'idx_expenses_month' in month.recommendation
+        # No notifications table in this database
+        assert 'notification_feed' in {name for name, _ in errors}
+
+        ensure_query_indexes(conn.cursor())
+        findings, _ = audit(conn, REGISTERED_QUERIES, min_rows=10)
+        assert findings == []
+
+    def test_small_tables_are_not_flagged(self, conn):
+        findings, _ = audit(conn, REGISTERED_QUERIES, min_rows=1000)
+        assert findings == []
+
+    def test_slow_log_replay_and_cli(self, conn, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr('builtins.open', io.open)
+        log = tmp_path / 'slow_queries.jsonl'
+        entry = {'sql': "SELECT * FROM expenses WHERE description = ?", 'params': ['x'], 'site': 'main.py:10 in f'}
+        log.write_text(json.dumps(entry) + '\n' + json.dumps(entry) + '\n')
+        queries = queries_from_slow_log(str(log))
+        assert [q.name for q in queries] == ['slow@main.py:10 in f']
+
+        db = tmp_path / 'family_manager.db'
+        conn.commit()
+        conn.execute("VACUUM INTO ?", (str(db),))
+        assert main(['--db', str(db), '--min-rows', '10', '--slow-log', str(log), '--apply']) == 1
+        output = capsys.readouterr().out
+        assert 'Applying: CREATE INDEX IF NOT EXISTS idx_expenses_month' in output
+        # Only the replayed query, which has no registered index, is still scanning
+        assert 'SCAN expenses (28 rows) in slow@main.py:10 in f' in output
+        assert 'in expenses_month_total' not in output.split('Applying')[-1]
@@ -0,0 +1,176 @@
+"""
+Unit tests for windowed recurrence expansion
+"""
+
+import io
+import sys
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from recurrence import RecurrenceRule, occurrences
+from recurring_events_manager import RecurringEventManager
+from notification_manager import NotificationManager
+from notification_triggers import NotificationTriggers
+
+
+def window(rule, start, end):
+    return [d.isoformat() for d in occurrences(rule, start, end)]
+
+
+class TestOccurrences:
+    """Test arithmetic stepping for each pattern type"""
+
+    def test_daily_window_only(self):
+        rule = RecurrenceRule('daily', date(2024, 1, 1), frequency=3)
+        assert window(rule, date(2024, 1, 5), date(2024, 1, 14)) == ['2024-01-07', '2024-01-10', '2024-01-13']
+
+    def test_weekly_byday_and_interval(self):
+        # 2024-01-03 is a Wednesday; every other week on Monday and Friday
+        rule = RecurrenceRule('weekly', date(2024, 1, 3), frequency=2, byday='MO,FR')
+        assert window(rule, date(2024, 1, 1), date(2024, 1, 30)) == [
+            '2024-01-05', '2024-01-15', '2024-01-19', '2024-01-29'
+        ]
+
+    def test_monthly_clamps_short_months(self):
+        rule = RecurrenceRule('monthly', date(2024, 1, 31))
+        assert window(rule, date(2024, 1, 1), date(2024, 5, 1)) == [
+            '2024-01-31', '2024-02-29', '2024-03-31', '2024-04-30'
+        ]
+
+    def test_yearly_skips_missing_leap_day(self):
+        rule = RecurrenceRule('yearly', date(2024, 2, 29))
+        assert window(rule, date(2024, 1, 1), date(2033, 1, 1)) == ['2024-02-29', '2028-02-29', '2032-02-29']
+
+    def test_count_and_end_date_bound_far_windows(self):
+        counted = RecurrenceRule('daily', date(2024, 1, 1), count=10)
+        assert window(counted, date(2024, 1, 8), date(2030, 1, 1)) == ['2024-01-08', '2024-01-09', '2024-01-10']
+
+        ended = RecurrenceRule('weekly', date(2024, 1, 1), end_date=date(2024, 1, 15))
+        assert window(ended, date(2024, 1, 1), date(2025, 1, 1)) == ['2024-01-01', '2024-01-08', '2024-01-15']
+
+    def test_far_future_window_is_cheap(self):
+        rule = RecurrenceRule('daily', date(2000, 1, 1))
+        assert len(occurrences(rule, date(2090, 3, 1), date(2090, 3, 8))) == 7
+
+
+def add_event(db_path, title, pattern_type, start_date, created_by=3, **pattern):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.execute(
+        "INSERT INTO recurring_events (title, color, category, pattern_type, start_date, created_by, is_active) "
+        "VALUES (?, '#3498db', 'general', ?, ?, ?, 1)", (title, pattern_type, start_date, created_by)
+    )
+    event_id = cursor.lastrowid
+    conn.execute(
+        "INSERT INTO recurring_patterns (recurring_event_id, frequency, byday, bymonthday, bymonth, count) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (event_id, pattern.get('frequency', 1), pattern.get('byday'), pattern.get('bymonthday'),
+         pattern.get('bymonth'), pattern.get('count'))
+    )
+    conn.commit()
+    conn.close()
+    return event_id
+
+
+class TestRecurringEventManagerWindows:
+    """Test exception overlay and trigger integration"""
+
+    def test_exceptions_overlay_computed_occurrences(self, notification_db_path):
+        event_id = add_event(notification_db_path, 'Bins', 'weekly', '2024-01-01')
+        manager = RecurringEventManager(notification_db_path)
+
+        instance_id = manager.materialize_instance(event_id, '2024-01-08')
+        assert manager.materialize_instance(event_id, '2024-01-08') == instance_id
+        manager.mark_instance_complete(instance_id, 'done early')
+        manager.modify_single_instance(manager.materialize_instance(event_id, '2024-01-15'), title='Bins + recycling')
+
+        result = manager.get_occurrences(event_id, date(2024, 1, 1), date(2024, 1, 22))
+        assert [o['event_date'] for o in result] == ['2024-01-01', '2024-01-08', '2024-01-15']
+        assert [o['instance_id'] is not None for o in result] == [False, True, True]
+        assert result[1]['is_completed'] == 1 and result[1]['completion_notes'] == 'done early'
+        assert result[2]['override_title'] == 'Bins + recycling'
+
+        conn = sqlite3.connect(notification_db_path)
+        assert conn.execute("SELECT COUNT(*) FROM recurring_event_instances").fetchone()[0] == 2
+        conn.close()
+
+    def test_triggers_use_expander(self, notification_db_path):
+        tomorrow = date.today() + timedelta(days=1)
+        add_event(notification_db_path, 'Piano lesson', 'daily', (tomorrow - timedelta(days=10)).isoformat())
+        completed_id = add_event(notification_db_path, 'Vet', 'daily', tomorrow.isoformat(), count=1)
+        manager = RecurringEventManager(notification_db_path)
+        manager.mark_instance_complete(manager.materialize_instance(completed_id, tomorrow.isoformat()))
+
+        triggers = NotificationTriggers(notification_db_path, NotificationManager(notification_db_path))
+        assert triggers.check_upcoming_recurring_events() == 1
+        assert triggers.check_upcoming_recurring_events() == 0
+
+        conn = sqlite3.connect(notification_db_path)
+        title, message = conn.execute("SELECT title, message FROM notifications").fetchone()
+        conn.close()
+        assert title == 'Upcoming Event: Piano lesson'
+        assert tomorrow.isoformat() in message
+
+
+class TestSaveInstances:
+    """Test diff-based persistence of materialized instances"""
+
+    def test_only_changes_are_written_and_exceptions_survive(self, notification_db_path):
+        event_id = add_event(notification_db_path, 'Swim', 'weekly', '2024-01-01')
+        manager = RecurringEventManager(notification_db_path)
+        first = [{'event_date': f"2024-01-{day:02d}", 'event_time': '09:00'} for day in (1, 8, 15, 22)]
+        assert manager.save_instances(event_id, first)['inserted'] == 4
+
+        conn = sqlite3.connect(notification_db_path)
+        ids = dict(conn.execute("SELECT event_date, id FROM recurring_event_instances").fetchall())
+        conn.close()
+        manager.mark_instance_complete(ids['2024-01-08'])
+        manager.modify_single_instance(ids['2024-01-15'], title='Gala')
+
+        # Pattern edit: the 8th and 15th drop out, the 22nd moves to the evening, the 29th is new
+        second = [{'event_date': '2024-01-01', 'event_time': '09:00'},
+                  {'event_date': '2024-01-22', 'event_time': '18:00'},
+                  {'event_date': '2024-01-29', 'event_time': '09:00'}]
+        summary = manager.save_instances(event_id, second)
+        assert summary == {'inserted': 1, 'updated': 1, 'deleted': 0, 'kept': 3}
+
+        conn = sqlite3.connect(notification_db_path)
+        rows = conn.execute("SELECT id, event_date, event_time, is_completed, override_title "
+                            "FROM recurring_event_instances ORDER BY event_date").fetchall()
+        conn.close()
+        assert [row[1] for row in rows] == ['2024-01-01', '2024-01-08', '2024-01-15', '2024-01-22', '2024-01-29']
+        # Rows that were already there keep their ids and state
+        assert rows[0][0] == ids['2024-01-01'] and rows[3][0] == ids['2024-01-22']
+        assert rows[1][3] == 1 and rows[2][4] == 'Gala' and rows[3][2] == '18:00'
+
+        # Dropping the 1st again deletes just that plain row
+        assert manager.save_instances(event_id, second[1:])['deleted'] == 1
+
+
+class TestRegenerateAll:
+    """Test the single-pass regeneration of every recurring event"""
+
+    @pytest.fixture(autouse=True)
+    def real_open(self, monkeypatch):
+        """The shared conftest replaces open(); worker processes need the real one"""
+        monkeypatch.setattr('builtins.open', io.open)
+
+    def test_parallel_matches_inline_and_reports_per_pattern(self, notification_db_path):
+        for i in range(6):
+            add_event(notification_db_path, f"Daily {i}", 'daily', '2024-01-01', count=5)
+            add_event(notification_db_path, f"Monthly {i}", 'monthly', '2024-01-15', count=3)
+        manager = RecurringEventManager(notification_db_path)
+
+        inline = manager.regenerate_all(parallel_threshold=10 ** 6)
+        assert not inline['parallel']
+        assert inline['events'] == 12 and inline['inserted'] == inline['instances'] == 48
+        assert inline['by_pattern']['daily']['instances'] == 30
+        assert inline['by_pattern']['monthly']['events'] == 6
+
+        parallel = manager.regenerate_all(parallel_threshold=1, max_workers=2)
+        assert parallel['parallel']
+        assert parallel['instances'] == 48 and parallel['inserted'] == 0 and parallel['kept'] == 48
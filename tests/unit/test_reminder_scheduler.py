@@ -0,0 +1,134 @@
+"""
+Unit tests for the heap-based reminder scheduler
+"""
+
+import sys
+import time
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from notification_manager import NotificationManager
+from reminder_scheduler import ReminderScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+def add_reminder(db_path, reminder_time, title='Dentist', is_sent=0):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.execute(
+        "INSERT INTO notification_reminders (recipient_id, event_type, event_id, event_title, event_date, "
+        "reminder_time, is_sent) VALUES (3, 'chore', 1, ?, '2030-01-01', ?, ?)",
+        (title, reminder_time.isoformat(), is_sent)
+    )
+    conn.commit()
+    conn.close()
+    return cursor.lastrowid
+
+
+def notification_titles(db_path):
+    conn = sqlite3.connect(db_path)
+    titles = [row[0] for row in conn.execute("SELECT title FROM notifications ORDER BY id")]
+    conn.close()
+    return titles
+
+
+class TestReminderScheduler:
+    """Test firing order, sync with create/dismiss and downtime catch-up"""
+
+    def test_catch_up_fires_overdue_oldest_first(self, notification_db_path):
+        now = datetime.now()
+        add_reminder(notification_db_path, now - timedelta(hours=1), 'Late')
+        add_reminder(notification_db_path, now - timedelta(hours=5), 'Later')
+        add_reminder(notification_db_path, now - timedelta(hours=2), 'Sent', is_sent=1)
+        add_reminder(notification_db_path, now + timedelta(hours=1), 'Future')
+
+        manager = NotificationManager(notification_db_path)
+        scheduler = ReminderScheduler(manager)
+        assert scheduler.load() == 3
+        assert len(scheduler.run_pending()) == 2
+        assert notification_titles(notification_db_path) == ['Reminder: Later', 'Reminder: Late']
+        assert scheduler.pending() == 1
+
+    def test_fires_only_when_due_without_queries(self, notification_db_path, monkeypatch):
+        clock = FakeClock()
+        manager = NotificationManager(notification_db_path)
+        scheduler = ReminderScheduler(manager, time_func=clock)
+        manager.reminder_scheduler = scheduler
+
+        event = datetime.fromtimestamp(clock.now).replace(microsecond=0) + timedelta(hours=3)
+        reminder_id = manager.create_reminder(3, 'chore', 1, 'Trash', event.date().isoformat(),
+                                              event.strftime('%H:%M:%S'), advance_hours=1)
+        assert scheduler.next_due() == (event - timedelta(hours=1)).timestamp()
+
+        queries = []
+        original_connect = sqlite3.connect
+        monkeypatch.setattr(sqlite3, 'connect', lambda *a, **k: queries.append(a) or original_connect(*a, **k))
+        assert scheduler.run_pending() == []
+        assert queries == []
+
+        clock.now = scheduler.next_due()
+        assert scheduler.run_pending() == [reminder_id]
+        assert scheduler.pending() == 0
+
+    def test_dismissed_reminders_never_fire(self, notification_db_path):
+        clock = FakeClock()
+        manager = NotificationManager(notification_db_path)
+        manager.reminder_scheduler = ReminderScheduler(manager, time_func=clock)
+
+        reminder_id = manager.create_reminder(3, 'bill', 2, 'Rent', '2000-01-01', advance_hours=0)
+        manager.dismiss_reminder(reminder_id)
+        assert manager.reminder_scheduler.pending() == 0
+        assert manager.reminder_scheduler.run_pending() == []
+        assert manager.send_reminder(reminder_id) is False
+        assert notification_titles(notification_db_path) == []
+
+    def test_worker_thread_sends_reminder(self, notification_db_path):
+        manager = NotificationManager(notification_db_path)
+        scheduler = manager.start_reminder_scheduler()
+        try:
+            soon = datetime.now() + timedelta(seconds=0.2)
+            manager.create_reminder(3, 'task', 4, 'Call plumber', soon.date().isoformat(),
+                                    soon.time().isoformat(), advance_hours=0)
+            deadline = time.time() + 5
+            while scheduler.pending() and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            manager.stop_reminder_scheduler()
+
+        assert notification_titles(notification_db_path) == ['Reminder: Call plumber']
+
+    def test_worker_thread_sweeps_expired_notifications(self, notification_db_path):
+        conn = sqlite3.connect(notification_db_path)
+        conn.executemany(
+            "INSERT INTO notifications (notification_type, recipient_id, title, message, expires_at) "
+            "VALUES ('alert', 3, ?, 'm', ?)",
+            [('Expired', '2000-01-01T00:00:00'), ('Current', '2999-01-01T00:00:00')]
+        )
+        conn.commit()
+        conn.close()
+
+        manager = NotificationManager(notification_db_path)
+        scheduler = manager.start_reminder_scheduler()
+        try:
+            deadline = time.time() + 5
+            while notification_titles(notification_db_path) != ['Current'] and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            manager.stop_reminder_scheduler()
+
+        assert notification_titles(notification_db_path) == ['Current']
+        conn = sqlite3.connect(notification_db_path)
+        next_expiry = conn.execute("SELECT next_expiry FROM notification_unread_counts WHERE recipient_id = 3")
+        assert next_expiry.fetchone() == ('2999-01-01T00:00:00',)
+        conn.close()
+        # Nothing is left to sweep
+        assert scheduler.run_cleanup() == 0
@@ -0,0 +1,96 @@
+"""
+Unit tests for the session cache and batched last_activity writes
+"""
+
+import sys
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from session_cache import SessionCache, ActivityRecorder
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def future(hours=1):
+    return (datetime.utcnow() + timedelta(hours=hours)).isoformat()
+
+
+class TestSessionCache:
+    """Test TTL, session expiry, LRU bound and invalidation"""
+
+    def test_ttl_and_session_expiry(self):
+        clock = FakeClock()
+        cache = SessionCache(ttl=60, time_func=clock)
+        cache.put('a', 1, 7, future())
+        cache.put('expired', 2, 7, (datetime.utcnow() - timedelta(seconds=1)).isoformat())
+
+        assert cache.get('a').user_id == 7
+        assert cache.get('expired') is None
+        clock.now += 60
+        assert cache.get('a') is None
+        assert len(cache) == 0
+
+    def test_invalidation_and_lru_bound(self):
+        cache = SessionCache(max_entries=2)
+        cache.put('a', 1, 7, future())
+        cache.put('b', 2, 7, future())
+        cache.get('a')
+        cache.put('c', 3, 8, future())
+        assert cache.get('b') is None and cache.get('a') is not None
+
+        cache.invalidate('c')
+        assert cache.get('c') is None
+        cache.put('d', 4, 8, future())
+        cache.invalidate_user(7)
+        assert cache.get('a') is None and cache.get('d').session_id == 4
+
+
+class TestActivityRecorder:
+    """Test that activity is coalesced and written in batches"""
+
+    def make_db(self, tmp_path, sessions=3):
+        path = str(tmp_path / 'auth.db')
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE user_sessions (id INTEGER PRIMARY KEY, last_activity TEXT)")
+        conn.executemany("INSERT INTO user_sessions (id) VALUES (?)", [(i,) for i in range(1, sessions + 1)])
+        conn.commit()
+        conn.close()
+        return path
+
+    def test_touches_coalesce_until_flush(self, tmp_path):
+        path = self.make_db(tmp_path)
+        connects = []
+        recorder = ActivityRecorder(lambda: connects.append(1) or sqlite3.connect(path))
+
+        for when in ('2024-01-01T10:00:00', '2024-01-01T10:05:00'):
+            recorder.touch(1, when)
+            recorder.touch(2, when)
+        assert connects == [] and recorder.pending() == 2
+
+        assert recorder.flush() == 2
+        assert len(connects) == 1 and recorder.flush() == 0
+        conn = sqlite3.connect(path)
+        rows = conn.execute("SELECT id, last_activity FROM user_sessions ORDER BY id").fetchall()
+        conn.close()
+        assert rows == [(1, '2024-01-01T10:05:00'), (2, '2024-01-01T10:05:00'), (3, None)]
+
+    def test_batch_size_flushes_early_and_failures_are_retried(self, tmp_path):
+        path = self.make_db(tmp_path)
+        recorder = ActivityRecorder(lambda: sqlite3.connect(path), batch_size=2)
+        recorder.touch(1)
+        recorder.touch(2)
+        assert recorder.pending() == 0
+
+        broken = ActivityRecorder(lambda: sqlite3.connect(str(tmp_path / 'missing' / 'x.db')))
+        broken.touch(3)
+        assert broken.flush() == 0
+        assert broken.pending() == 1
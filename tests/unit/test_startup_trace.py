@@ -0,0 +1,50 @@
+"""
+Unit tests for the startup trace
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from startup_trace import StartupTrace
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStartupTrace:
+    """Test phase timing, milestones and the summary line"""
+
+    def test_phases_and_marks(self):
+        clock = FakeClock()
+        trace = StartupTrace(started=9.5, clock=clock)
+        trace.record('imports', trace.elapsed())
+
+        with trace.phase('schema'):
+            clock.now += 0.04
+        with pytest.raises(RuntimeError):
+            with trace.phase('first_tab'):
+                clock.now += 0.1
+                raise RuntimeError("tab failed")
+        clock.now += 0.06
+        assert trace.mark('first_window') == pytest.approx(0.7)
+
+        assert [name for name, _ in trace.phases] == ['imports', 'schema', 'first_tab']
+        assert trace.mark_time('first_window') == pytest.approx(0.7)
+        assert trace.mark_time('missing') is None
+        assert trace.summary() == "first_window 700 ms | imports 500 ms, schema 40 ms, first_tab 100 ms"
+
+    def test_log(self, caplog):
+        trace = StartupTrace(clock=FakeClock())
+        with caplog.at_level('INFO', logger='startup_trace'):
+            trace.mark('first_window')
+            trace.log()
+        assert "Startup: first_window 0 ms" in caplog.text
@@ -0,0 +1,53 @@
+"""
+Unit tests for the synthetic household benchmark data
+"""
+
+import sys
+import sqlite3
+import hashlib
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'benchmarks'))
+
+from synthetic_household import PRESETS, build_household
+
+TODAY = date(2024, 6, 15)
+
+
+def table_digests(db_path):
+    """{table: (row count, sha256 of its sorted rows)} for every table in the database"""
+    conn = sqlite3.connect(db_path)
+    try:
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+        digests = {}
+        for table in tables:
+            rows = sorted(repr(row) for row in conn.execute(f'SELECT * FROM "{table}"'))
+            digests[table] = (len(rows), hashlib.sha256('\n'.join(rows).encode()).hexdigest())
+        return digests
+    finally:
+        conn.close()
+
+
+class TestSyntheticHousehold:
+    """Test that a seed reproduces the same database"""
+
+    def test_same_seed_same_content(self, tmp_path):
+        first_counts = build_household(str(tmp_path / 'first.db'), PRESETS['small'], seed=7, today=TODAY)
+        second_counts = build_household(str(tmp_path / 'second.db'), PRESETS['small'], seed=7, today=TODAY)
+        assert first_counts == second_counts
+
+        first = table_digests(tmp_path / 'first.db')
+        assert first == table_digests(tmp_path / 'second.db')
+        for table, count in first_counts.items():
+            assert first[table][0] == count
+
+    def test_different_seed_different_content(self, tmp_path):
+        build_household(str(tmp_path / 'first.db'), PRESETS['small'], seed=7, today=TODAY)
+        build_household(str(tmp_path / 'other.db'), PRESETS['small'], seed=8, today=TODAY)
+
+        first, other = table_digests(tmp_path / 'first.db'), table_digests(tmp_path / 'other.db')
+        assert first.keys() == other.keys()
+        changed = [table for table in first if first[table][1] != other[table][1]]
+        assert {'inventory', 'expenses', 'meals'} <= set(changed)
@@ -0,0 +1,107 @@
+"""
+Unit tests for the unit conversion engine
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'family_manager'))
+
+from units import (
+    normalize_unit, to_base, convert, are_compatible, to_base_many,
+    format_quantity, ensure_unit_schema, sum_by_base_unit
+)
+
+
+class TestUnitConversion:
+    """Test unit normalization and conversion"""
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("Lbs.", "lb"), ("ounces", "oz"), ("Liters", "l"), ("pcs", "each"),
+        (None, "each"), ("box", "box"),
+    ])
+    def test_normalize_unit(self, raw, expected):
+        assert normalize_unit(raw) == expected
+
+    def test_pounds_and_ounces_are_equal(self):
+        assert to_base(2, 'lbs')[0] == pytest.approx(to_base(32, 'oz')[0])
+        assert convert(2, 'lb', 'oz') == pytest.approx(32)
+
+    def test_incompatible_units(self):
+        assert not are_compatible('kg', 'cup')
+        assert are_compatible('box', 'box')
+        with pytest.raises(ValueError):
+            convert(1, 'kg', 'cup')
+
+    def test_to_base_many(self):
+        quantities, units = to_base_many([1, 2, 3], ['kg', 'dozen', 'bag'])
+        assert list(quantities) == pytest.approx([1000, 24, 3])
+        assert units == ['g', 'each', 'bag']
+
+    def test_format_and_sum(self):
+        assert format_quantity(1500, 'g') == '1.5 kg'
+        totals = dict((unit, qty) for qty, unit in sum_by_base_unit([(1, 'l'), (500, 'ml'), (2, 'each')]))
+        assert totals['ml'] == pytest.approx(1500)
+        assert totals['each'] == pytest.approx(2)
+
+
+class TestUnitSchema:
+    """Test base_qty columns maintained by triggers"""
+
+    def test_triggers_and_backfill(self):
+        conn = sqlite3.connect(':memory:')
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE inventory (id INTEGER PRIMARY KEY, name TEXT, qty REAL, unit TEXT)")
+        cursor.execute("CREATE TABLE shopping_list (id INTEGER PRIMARY KEY, item TEXT, qty REAL)")
+        cursor.execute("INSERT INTO inventory (name, qty, unit) VALUES ('Flour', 2, 'lbs')")
+
+        ensure_unit_schema(cursor)
+        cursor.execute("SELECT base_qty, base_unit FROM inventory")
+        base_qty, base_unit = cursor.fetchone()
+        assert base_unit == 'g' and base_qty == pytest.approx(907.18474)
+
+        cursor.execute("INSERT INTO inventory (name, qty, unit) VALUES ('Milk', 1, 'Gallon')")
+        cursor.execute("UPDATE inventory SET qty = 32, unit = 'oz' WHERE name = 'Flour'")
+        cursor.execute("SELECT name, base_qty, base_unit FROM inventory ORDER BY name")
+        rows = cursor.fetchall()
+        assert rows[0][1] == pytest.approx(907.18474)
+        assert rows[1][2] == 'ml'
+
+        cursor.execute("INSERT INTO shopping_list (item, qty) VALUES ('Eggs', 2)")
+        cursor.execute("SELECT base_qty, base_unit FROM shopping_list")
+        assert cursor.fetchone() == (2, 'each')
+        conn.close()
+
+    @pytest.mark.parametrize('unit', ['Lbs.', ' LB ', 'lb .', 'Fl. Oz', 'fl   oz.', 'TBSP.', 'Kg\t', 'Box.',
+                                      '  bag  of  10 ', '', None])
+    def test_trigger_matches_to_base(self, unit):
+        conn = sqlite3.connect(':memory:')
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE inventory (id INTEGER PRIMARY KEY, name TEXT, qty REAL, unit TEXT)")
+        ensure_unit_schema(cursor)
+        cursor.execute("INSERT INTO inventory (name, qty, unit) VALUES ('Flour', 2, ?)", (unit,))
+        base_qty, base_unit = cursor.execute("SELECT base_qty, base_unit FROM inventory").fetchone()
+        expected_qty, expected_unit = to_base(2, unit)
+        assert base_unit == expected_unit
+        assert base_qty == pytest.approx(expected_qty)
+        conn.close()
+
+    def test_outdated_triggers_are_replaced_and_rows_recomputed(self):
+        conn = sqlite3.connect(':memory:')
+        cursor = conn.cursor()
+        cursor.executescript('''
+            CREATE TABLE inventory (id INTEGER PRIMARY KEY, name TEXT, qty REAL, unit TEXT,
+                                    base_qty REAL, base_unit TEXT);
+            CREATE TRIGGER trg_inventory_base_qty_insert AFTER INSERT ON inventory
+            BEGIN UPDATE inventory SET base_qty = NEW.qty, base_unit = LOWER(TRIM(NEW.unit)) WHERE id = NEW.id; END;
+            INSERT INTO inventory (name, qty, unit) VALUES ('Flour', 2, 'Lbs.');
+        ''')
+        assert cursor.execute("SELECT base_unit FROM inventory").fetchone() == ('lbs.',)
+
+        ensure_unit_schema(cursor)
+        base_qty, base_unit = cursor.execute("SELECT base_qty, base_unit FROM inventory").fetchone()
+        assert base_unit == 'g' and base_qty == pytest.approx(907.18474)
+        conn.close()